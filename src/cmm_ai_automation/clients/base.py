@@ -1,27 +1,55 @@
 """Base HTTP client with rate limiting and common configuration.
 
 Provides shared functionality for all API clients:
-- Rate limiting with configurable delay
+- Rate limiting with configurable delay, shared per host (see rate_limit.py)
+- Adaptive pacing: 429/503 responses are retried with jittered exponential
+  backoff (honouring Retry-After) and slow the host down (AIMD)
 - Session management with custom User-Agent
 - Common GET/POST methods with timeout handling
+- Optional persistent response cache (see cache.py)
+- Optional record/replay of all exchanges to a cassette (see cassette.py)
+- Coalescing of identical concurrent requests (see single_flight.py)
+- Per-endpoint request metrics (see metrics.py)
+- Asyncio counterparts (aiohttp) with per-host concurrency limits
 - Generic Result/Error dataclass pattern
 
 All clients should inherit from HTTPClientBase to reduce boilerplate.
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
+from urllib.parse import urlsplit
 
+import aiohttp
 import requests
+from requests.structures import CaseInsensitiveDict
+
+from cmm_ai_automation.clients.cache import ResponseCache, get_default_cache, make_cache_key
+from cmm_ai_automation.clients.cassette import Cassette, get_default_cassette
+from cmm_ai_automation.clients.metrics import MetricsRegistry, endpoint_label, get_metrics
+from cmm_ai_automation.clients.rate_limit import (
+    DEFAULT_MAX_RETRIES,
+    THROTTLE_STATUS_CODES,
+    TokenBucket,
+    backoff_delay,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from cmm_ai_automation.clients.session import DEFAULT_USER_AGENT, make_session
+from cmm_ai_automation.clients.single_flight import SingleFlight, get_single_flight
 
 logger = logging.getLogger(__name__)
 
 # Default configuration
 DEFAULT_RATE_LIMIT_DELAY = 0.2  # seconds between requests
 DEFAULT_TIMEOUT = 30.0  # request timeout in seconds
-DEFAULT_USER_AGENT = "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)"
+DEFAULT_MAX_CONCURRENCY = 8  # in-flight async requests per host
+
+# Query parameters may be a mapping or a list of (key, value) pairs for repeated keys
+Params = dict[str, Any] | list[tuple[str, Any]]
 
 
 @dataclass
@@ -57,17 +85,72 @@ class ClientResult(Generic[T]):
     query: str
 
 
+def _host_of(url: str) -> str:
+    """Return the network location (host[:port]) of a URL."""
+    return urlsplit(url).netloc
+
+
+def _stringify_params(params: Params | None) -> list[tuple[str, str]] | None:
+    """Convert query parameters to string pairs accepted by aiohttp."""
+    if params is None:
+        return None
+    items = params.items() if isinstance(params, dict) else params
+    result = []
+    for key, value in items:
+        if isinstance(value, bool):
+            value = str(value).lower()
+        result.append((key, str(value)))
+    return result
+
+
+def build_response(
+    url: str,
+    status_code: int,
+    content: bytes,
+    headers: dict[str, str] | None = None,
+    reason: str | None = None,
+) -> requests.Response:
+    """Build a requests.Response from raw response parts.
+
+    Lets responses that did not come from a requests.Session (aiohttp, caches)
+    flow through the same parsing and error handling code as sync responses.
+
+    Args:
+        url: Request URL
+        status_code: HTTP status code
+        content: Raw response body
+        headers: Response headers
+        reason: HTTP reason phrase
+
+    Returns:
+        Response object
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.reason = reason or ""
+    return response
+
+
 class HTTPClientBase:
     """Base class for HTTP API clients with rate limiting.
 
     Provides:
     - Session management with custom User-Agent
-    - Rate limiting between requests
+    - Rate limiting between requests, shared by all clients hitting the same host
     - GET/POST methods with timeout handling
     - JSON response parsing
+    - Async ``aget_json``/``apost_json`` with a per-host semaphore
+    - Single-flight: identical requests in flight at the same time (from
+      threads or asyncio tasks, across client instances) share one request
+
+    Async calls raise the same ``requests`` exception types as the sync
+    methods, so subclasses can share error handling between the two paths.
 
     Subclasses should:
-    - Set BASE_URL class attribute
+    - Set BASE_URL class attribute (instances may override it with ``base_url``)
     - Override rate_limit_delay if needed
     - Add domain-specific methods
 
@@ -94,6 +177,14 @@ class HTTPClientBase:
         rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY,
         timeout: float = DEFAULT_TIMEOUT,
         user_agent: str | None = None,
+        headers: dict[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        metrics: MetricsRegistry | None = None,
+        base_url: str | None = None,
+        cassette: Cassette | None = None,
     ):
         """Initialize the client.
 
@@ -101,26 +192,209 @@ class HTTPClientBase:
             rate_limit_delay: Seconds to wait between requests
             timeout: Request timeout in seconds
             user_agent: Custom User-Agent string (uses default if not provided)
+            headers: Extra headers sent with every request (e.g., API keys)
+            max_concurrency: Maximum in-flight async requests per host
+            cache: Response cache (defaults to the cache set with set_default_cache(), if any)
+            single_flight: Request coalescer (defaults to the process-wide one)
+            max_retries: Retries for throttled (429/503) requests before giving up
+            metrics: Registry recording requests (defaults to the process-wide one)
+            base_url: Override BASE_URL for this instance, e.g. to point the
+                client at a mirror or a local fake server (see fake_server.py)
+            cassette: Cassette to record to or replay from (defaults to the one set
+                with set_default_cassette(), if any)
         """
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
-        self._last_request_time: float = 0
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": user_agent or DEFAULT_USER_AGENT,
-            }
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.cache = cache if cache is not None else get_default_cache()
+        self.single_flight = single_flight if single_flight is not None else get_single_flight()
+        self.metrics = metrics if metrics is not None else get_metrics()
+        self.cassette = cassette if cassette is not None else get_default_cassette()
+        self._headers: dict[str, str] = {
+            "Accept": "application/json",
+            "User-Agent": user_agent or DEFAULT_USER_AGENT,
+            **(headers or {}),
+        }
+        # Keep-alive session with tuned connection pools (see clients.session)
+        self._session = make_session(self._headers)
+
+        # Async state is bound to the event loop it was created on
+        self._async_session: aiohttp.ClientSession | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _rate_limiter(self, url: str) -> TokenBucket:
+        """Get the process-wide token bucket for the URL's host."""
+        return get_rate_limiter(_host_of(url), self.rate_limit_delay)
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        """Wait if needed to respect the rate limit of the URL's host."""
+        waited = self._rate_limiter(url).acquire()
+        if waited:
+            self.metrics.record_rate_limit_wait(*self._metric_labels(url), waited)
+
+    def _metric_labels(self, url: str) -> tuple[str, str, str]:
+        """(client, host, endpoint) labels for a request URL."""
+        return type(self).__name__, _host_of(url), endpoint_label(url, self.BASE_URL)
+
+    def _record_response(self, url: str, response: requests.Response, started: float) -> None:
+        """Record a response received for a request sent at ``started`` (time.monotonic())."""
+        self.metrics.record_response(
+            *self._metric_labels(url), response.status_code, len(response.content), time.monotonic() - started
         )
 
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+    def _retry_delay(self, url: str, response: requests.Response, attempt: int) -> float | None:
+        """Report a response to its host's rate controller and decide whether to retry.
+
+        Args:
+            url: Requested URL (selects the host's bucket)
+            response: Response to the request
+            attempt: Zero-based number of the attempt that produced it
+
+        Returns:
+            Seconds to wait before retrying, or None to keep this response
+        """
+        limiter = self._rate_limiter(url)
+        if response.status_code not in THROTTLE_STATUS_CODES:
+            limiter.record_success()
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        limiter.record_throttle(retry_after)
+        if attempt >= self.max_retries:
+            logger.warning(f"Giving up on {url} after {attempt + 1} throttled attempts")
+            return None
+        delay = backoff_delay(attempt, retry_after)
+        self.metrics.record_retry(*self._metric_labels(url))
+        logger.warning(
+            f"Throttled ({response.status_code}) by {_host_of(url)}, "
+            f"retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})"
+        )
+        return delay
+
+    def _cache_key(
+        self,
+        method: str,
+        url: str,
+        params: Params | None = None,
+        data: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> str | None:
+        """Cache key for a request, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        return make_cache_key(method, url, params, data, json_data)
+
+    def _from_cache(self, key: str | None) -> requests.Response | None:
+        """Return the cached response for a key, if any."""
+        if key is None or self.cache is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        logger.debug(f"Cache hit for {cached.url}")
+        return build_response(cached.url, cached.status_code, cached.content, cached.headers)
+
+    def _store_in_cache(self, key: str | None, method: str, response: requests.Response) -> None:
+        """Store a response in the cache (the cache decides whether it is cacheable)."""
+        if key is None or self.cache is None:
+            return
+        self.cache.put(key, method, response.url, response.status_code, dict(response.headers), response.content)
+
+    def _replay(
+        self,
+        method: str,
+        url: str,
+        params: Params | None,
+        data: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+    ) -> requests.Response | None:
+        """Return the recorded response when replaying a cassette, else None.
+
+        Raises:
+            CassetteMiss: If replaying and the request was never recorded
+        """
+        if self.cassette is None or not self.cassette.replaying:
+            return None
+        recorded = self.cassette.replay(method, url, params, data, json_data)
+        return build_response(recorded.url, recorded.status_code, recorded.content, recorded.headers)
 
-    def _get(self, url: str, params: dict[str, Any] | None = None) -> requests.Response:
+    def _record(
+        self,
+        method: str,
+        url: str,
+        response: requests.Response,
+        params: Params | None,
+        data: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+    ) -> None:
+        """Write the response to the cassette when recording."""
+        if self.cassette is not None:
+            self.cassette.record(method, url, response, params, data, json_data)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: Params | None = None,
+        data: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> requests.Response:
+        """Make a request, served from the cache when possible.
+
+        Cache hits skip the rate limiter and the network entirely. Cache
+        misses identical to a request already in flight wait for its
+        response instead of sending another one. Throttled requests are
+        retried (see _retry_delay()). When replaying a cassette, the
+        recorded response is returned before any of this happens.
+
+        Raises:
+            requests.RequestException: On network errors or 4xx/5xx responses
+        """
+        replayed = self._replay(method, url, params, data, json_data)
+        if replayed is not None:
+            replayed.raise_for_status()
+            return replayed
+
+        key = self._cache_key(method, url, params, data, json_data)
+        response = self._from_cache(key)
+        if key is not None:
+            self.metrics.record_cache(
+                *self._metric_labels(url), hits=int(response is not None), misses=int(response is None)
+            )
+        if response is None:
+
+            def send() -> requests.Response:
+                attempt = 0
+                while True:
+                    self._wait_for_rate_limit(url)
+                    logger.debug(f"{method} {url} params={params}")
+                    started = time.monotonic()
+                    try:
+                        sent = self._session.request(
+                            method, url, params=params, data=data, json=json_data, timeout=self.timeout
+                        )
+                    except requests.RequestException as e:
+                        self.metrics.record_error(*self._metric_labels(url), e)
+                        raise
+                    self._record_response(url, sent, started)
+                    delay = self._retry_delay(url, sent, attempt)
+                    if delay is None:
+                        break
+                    time.sleep(delay)
+                    attempt += 1
+                self._store_in_cache(key, method, sent)
+                return sent
+
+            flight_key = key or make_cache_key(method, url, params, data, json_data)
+            response = self.single_flight.do(flight_key, send)
+        self._record(method, url, response, params, data, json_data)
+        response.raise_for_status()
+        return response
+
+    def _get(self, url: str, params: Params | None = None) -> requests.Response:
         """Make a GET request with rate limiting.
 
         Args:
@@ -133,13 +407,9 @@ class HTTPClientBase:
         Raises:
             requests.RequestException: On network errors
         """
-        self._wait_for_rate_limit()
-        logger.debug(f"GET {url} params={params}")
-        response = self._session.get(url, params=params, timeout=self.timeout)
-        response.raise_for_status()
-        return response
+        return self._request("GET", url, params=params)
 
-    def _get_json(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    def _get_json(self, url: str, params: Params | None = None) -> dict[str, Any]:
         """Make a GET request and return parsed JSON.
 
         Args:
@@ -176,11 +446,7 @@ class HTTPClientBase:
         Raises:
             requests.RequestException: On network errors
         """
-        self._wait_for_rate_limit()
-        logger.debug(f"POST {url}")
-        response = self._session.post(url, data=data, json=json_data, timeout=self.timeout)
-        response.raise_for_status()
-        return response
+        return self._request("POST", url, data=data, json_data=json_data)
 
     def _post_json(
         self,
@@ -206,10 +472,173 @@ class HTTPClientBase:
         result: dict[str, Any] = response.json()
         return result
 
+    def _bind_async_state(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session for the running loop, creating it if needed.
+
+        asyncio primitives and aiohttp sessions cannot be shared between event
+        loops, so all async state is rebuilt when the client is used from a new
+        loop (e.g., successive ``asyncio.run`` calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_loop is not loop or self._async_session.closed:
+            if self._async_session is not None and not self._async_session.closed:
+                logger.debug("Discarding aiohttp session bound to a previous event loop")
+            self._async_session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._async_loop = loop
+            self._host_semaphores = {}
+        return self._async_session
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding in-flight async requests to a host."""
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+        return self._host_semaphores[host]
+
+    async def _arequest(
+        self,
+        method: str,
+        url: str,
+        params: Params | None = None,
+        data: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> requests.Response:
+        """Make an async request with per-host concurrency and rate limiting.
+
+        Served from a replayed cassette or the response cache when possible
+        and coalesced with identical in-flight requests, like _request().
+
+        Args:
+            method: HTTP method ("GET" or "POST")
+            url: Full URL
+            params: Query parameters
+            data: Form data
+            json_data: JSON body data
+
+        Returns:
+            Response object (body fully read)
+
+        Raises:
+            requests.HTTPError: On 4xx/5xx responses
+            requests.Timeout: On request timeout
+            requests.ConnectionError: On other network errors
+        """
+        replayed = self._replay(method, url, params, data, json_data)
+        if replayed is not None:
+            replayed.raise_for_status()
+            return replayed
+
+        key = self._cache_key(method, url, params, data, json_data)
+        cached = self._from_cache(key)
+        if key is not None:
+            self.metrics.record_cache(
+                *self._metric_labels(url), hits=int(cached is not None), misses=int(cached is None)
+            )
+        if cached is not None:
+            self._record(method, url, cached, params, data, json_data)
+            cached.raise_for_status()
+            return cached
+
+        async def send_once() -> requests.Response:
+            session = self._bind_async_state()
+            async with self._host_semaphore(_host_of(url)):
+                waited = await self._rate_limiter(url).aacquire()
+                if waited:
+                    self.metrics.record_rate_limit_wait(*self._metric_labels(url), waited)
+                logger.debug(f"{method} {url} params={params} (async)")
+                started = time.monotonic()
+                try:
+                    async with session.request(
+                        method, url, params=_stringify_params(params), data=data, json=json_data
+                    ) as resp:
+                        content = await resp.read()
+                        sent = build_response(str(resp.url), resp.status, content, dict(resp.headers), resp.reason)
+                except TimeoutError as e:
+                    error: requests.RequestException = requests.Timeout(f"Timed out after {self.timeout}s: {url}")
+                    self.metrics.record_error(*self._metric_labels(url), error)
+                    raise error from e
+                except aiohttp.ClientError as e:
+                    error = requests.ConnectionError(str(e))
+                    self.metrics.record_error(*self._metric_labels(url), error)
+                    raise error from e
+            self._record_response(url, sent, started)
+            return sent
+
+        async def send() -> requests.Response:
+            attempt = 0
+            while True:
+                sent = await send_once()
+                delay = self._retry_delay(url, sent, attempt)
+                if delay is None:
+                    break
+                # Sleep outside the host semaphore so other requests can proceed
+                await asyncio.sleep(delay)
+                attempt += 1
+            self._store_in_cache(key, method, sent)
+            return sent
+
+        flight_key = key or make_cache_key(method, url, params, data, json_data)
+        response: requests.Response = await self.single_flight.ado(flight_key, send)
+        self._record(method, url, response, params, data, json_data)
+        response.raise_for_status()
+        return response
+
+    async def aget_json(self, url: str, params: Params | None = None) -> dict[str, Any]:
+        """Async GET request returning parsed JSON.
+
+        Args:
+            url: Full URL to fetch
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response as dict
+
+        Raises:
+            requests.RequestException: On network errors
+            json.JSONDecodeError: If response is not valid JSON
+        """
+        response = await self._arequest("GET", url, params=params)
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def apost_json(
+        self,
+        url: str,
+        data: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async POST request returning parsed JSON.
+
+        Args:
+            url: Full URL to post to
+            data: Form data
+            json_data: JSON body data
+
+        Returns:
+            Parsed JSON response as dict
+
+        Raises:
+            requests.RequestException: On network errors
+            json.JSONDecodeError: If response is not valid JSON
+        """
+        response = await self._arequest("POST", url, data=data, json_data=json_data)
+        result: dict[str, Any] = response.json()
+        return result
+
     def close(self) -> None:
         """Close the underlying session."""
         self._session.close()
 
+    async def aclose(self) -> None:
+        """Close the sync session and the async session, if one was opened."""
+        self.close()
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_loop = None
+
     def __enter__(self) -> "HTTPClientBase":
         """Context manager entry."""
         return self
@@ -217,3 +646,11 @@ class HTTPClientBase:
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit - close session."""
         self.close()
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit - close sessions."""
+        await self.aclose()
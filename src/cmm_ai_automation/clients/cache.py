@@ -0,0 +1,317 @@
+"""Persistent HTTP response cache shared by all API clients.
+
+Responses are stored in a single SQLite file, keyed by a hash of the request
+method, URL and canonicalized query parameters/body. HTTPClientBase consults
+the cache before rate limiting and sending a request, so a warm cache makes
+repeated runs over the same inputs free of network calls.
+
+Policy:
+- 2xx responses are cached for ``ttl`` seconds, except 202 Accepted, which
+  means the result is not ready yet (e.g., a PubChem ListKey to poll).
+- "Not found" responses (404/410) are cached for ``negative_ttl`` seconds so
+  known misses are not re-queried on every run. Other errors (429, 5xx,
+  other 4xx) are never cached.
+- When the stored bodies exceed ``max_bytes``, least recently used entries
+  are evicted.
+
+A hit does not write to the file on every lookup: access times are only
+refreshed when older than ``access_resolution`` (an hour by default), and those refreshes are queued
+and committed in batches (before evicting, every ACCESS_FLUSH_SIZE hits, and
+on close()). The total size of the stored bodies is kept in memory, so
+storing a response does not scan the table.
+
+Both GET and POST are cached: every POST sent by the clients in this package
+is a read-only query (e.g., PubChem CID lists, NodeNorm CURIE batches).
+
+Example:
+    >>> from pathlib import Path
+    >>> from cmm_ai_automation.clients.pubchem import PubChemClient
+    >>> set_default_cache(ResponseCache(Path("cache/http_cache.sqlite")))
+    >>> client = PubChemClient()  # picks up the default cache
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 30 * 24 * 3600.0  # 30 days
+DEFAULT_NEGATIVE_TTL = 24 * 3600.0  # 1 day
+DEFAULT_MAX_BYTES = 1024**3  # 1 GiB
+ACCESS_RESOLUTION = 3600.0  # access times (for LRU eviction) are kept to the hour
+ACCESS_FLUSH_SIZE = 256  # queued access-time refreshes committed at once
+
+# Status codes cached as negative results
+NEGATIVE_STATUS_CODES = frozenset({404, 410})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A response read back from the cache.
+
+    Attributes:
+        url: Request URL the response was stored for
+        status_code: HTTP status code
+        headers: Response headers
+        content: Raw response body
+    """
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+
+def make_cache_key(
+    method: str,
+    url: str,
+    params: dict[str, Any] | list[tuple[str, Any]] | None = None,
+    data: dict[str, Any] | None = None,
+    json_data: Any = None,
+) -> str:
+    """Build a stable cache key for a request.
+
+    Query parameters from the URL and from ``params`` are merged and sorted,
+    so ``?a=1&b=2`` and ``params={"b": 2, "a": 1}`` share a key. Booleans are
+    lowercased the way the APIs expect them.
+
+    Args:
+        method: HTTP method
+        url: Request URL (may contain a query string)
+        params: Query parameters
+        data: Form body
+        json_data: JSON body
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params is not None:
+        query.extend(params.items() if isinstance(params, dict) else params)
+    canonical_query = sorted((str(k), _param_str(v)) for k, v in query)
+    canonical_form = sorted((str(k), _param_str(v)) for k, v in data.items()) if data is not None else None
+    payload = [
+        method.upper(),
+        urlunsplit((parts.scheme, parts.netloc, parts.path, "", "")),
+        canonical_query,
+        canonical_form,
+        json_data,
+    ]
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _param_str(value: Any) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+class ResponseCache:
+    """SQLite-backed HTTP response cache with TTL and LRU size cap.
+
+    Safe to share between threads of one process; WAL mode lets several
+    processes read and write the same file. Each process tracks the total
+    body size from what it stores and evicts, so with several writers the
+    size cap is approximate until the file is reopened.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float | None = DEFAULT_TTL,
+        negative_ttl: float | None = DEFAULT_NEGATIVE_TTL,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        access_resolution: float = ACCESS_RESOLUTION,
+    ):
+        """Open (or create) a cache file.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds a successful response stays fresh (None: forever)
+            negative_ttl: Seconds a 404/410 stays fresh (None: forever, 0: don't cache)
+            max_bytes: Maximum total size of stored bodies (None: unbounded)
+            access_resolution: Seconds before a hit refreshes an entry's access time
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self.access_resolution = access_resolution
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._touched: dict[str, float] = {}  # key -> access time not yet written
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._size: int = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up a fresh response.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            CachedResponse, or None on a miss or an expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, size, created, accessed FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            url, status, headers, body, size, created, accessed = row
+            if self._expired(status, created, now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._size -= size
+                self._touched.pop(key, None)
+                self.misses += 1
+                return None
+            if now - accessed > self.access_resolution:
+                self._touched[key] = now
+                if len(self._touched) >= ACCESS_FLUSH_SIZE:
+                    self._flush_touched()
+                    self._conn.commit()
+            self.hits += 1
+        return CachedResponse(url=url, status_code=status, headers=json.loads(headers), content=body)
+
+    def put(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: dict[str, str],
+        content: bytes,
+    ) -> bool:
+        """Store a response if the cache policy allows it.
+
+        Args:
+            key: Key from make_cache_key()
+            method: HTTP method
+            url: Request URL
+            status_code: HTTP status code
+            headers: Response headers
+            content: Raw response body
+
+        Returns:
+            True if the response was stored
+        """
+        if not self.is_cacheable(status_code):
+            return False
+        now = time.time()
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, method, url, status, headers, body, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, method.upper(), url, status_code, json.dumps(headers), content, len(content), now, now),
+            )
+            self._size += len(content) - (replaced[0] if replaced else 0)
+            self._touched.pop(key, None)
+            self._evict()
+            self._conn.commit()
+        return True
+
+    def is_cacheable(self, status_code: int) -> bool:
+        """Whether a response with this status code may be stored."""
+        if 200 <= status_code < 300 and status_code != 202:
+            return self.ttl is None or self.ttl > 0
+        if status_code in NEGATIVE_STATUS_CODES:
+            return self.negative_ttl is None or self.negative_ttl > 0
+        return False
+
+    def _expired(self, status_code: int, created: float, now: float) -> bool:
+        ttl = self.negative_ttl if status_code in NEGATIVE_STATUS_CODES else self.ttl
+        return ttl is not None and now - created > ttl
+
+    def _flush_touched(self) -> None:
+        """Write queued access times (without committing). Caller holds the lock."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?", [(t, k) for k, t in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes. Caller holds the lock."""
+        if self.max_bytes is None or self._size <= self.max_bytes:
+            return
+        self._flush_touched()
+        victims: list[tuple[str]] = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+            if self._size <= self.max_bytes:
+                break
+            victims.append((key,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        logger.debug(f"Evicted {len(victims)} cached responses to stay under {self.max_bytes} bytes")
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return count
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._size = 0
+            self._touched.clear()
+
+    def close(self) -> None:
+        """Write queued access times and close the database connection."""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+_default_cache: ResponseCache | None = None
+
+
+def set_default_cache(cache: ResponseCache | None) -> None:
+    """Set the cache used by clients created without an explicit cache.
+
+    Args:
+        cache: ResponseCache to share, or None to disable caching by default
+    """
+    global _default_cache
+    _default_cache = cache
+
+
+def get_default_cache() -> ResponseCache | None:
+    """Get the cache used by clients created without an explicit cache."""
+    return _default_cache
@@ -8,18 +8,20 @@ References:
     - API signup: https://www.cas.org/services/commonchemistry-api
 """
 
+import asyncio
 import contextlib
 import json
 import logging
 import os
 import re
-import time
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import quote
 
 import requests
 
+from cmm_ai_automation.clients.base import HTTPClientBase
+
 logger = logging.getLogger(__name__)
 
 # CAS API base URL
@@ -90,7 +92,7 @@ class CASLookupError:
     error_message: str
 
 
-class CASClient:
+class CASClient(HTTPClientBase):
     """Client for CAS Common Chemistry API.
 
     Requires an API key, obtained from:
@@ -107,6 +109,8 @@ class CASClient:
         CAS RN: 50-99-7
     """
 
+    BASE_URL = BASE_URL
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -129,44 +133,12 @@ class CASClient:
                 "CAS API key required. Set CAS_API_KEY environment variable or pass api_key to constructor."
             )
 
-        self.rate_limit_delay = rate_limit_delay
-        self.timeout = timeout
-        self._last_request_time: float = 0
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "X-API-KEY": self.api_key,
-                "User-Agent": "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)",
-            }
+        super().__init__(
+            rate_limit_delay=rate_limit_delay,
+            timeout=timeout,
+            headers={"X-API-KEY": self.api_key},
         )
 
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
-
-    def _get(self, url: str) -> dict[str, Any]:
-        """Make a GET request with rate limiting.
-
-        Args:
-            url: Full URL to fetch
-
-        Returns:
-            Parsed JSON response
-
-        Raises:
-            requests.RequestException: On network errors
-        """
-        self._wait_for_rate_limit()
-        logger.debug(f"GET {url}")
-        response = self._session.get(url, timeout=self.timeout)
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
-
     def search_by_name(self, name: str) -> list[CASResult] | CASLookupError:
         """Search for compounds by name.
 
@@ -176,48 +148,28 @@ class CASClient:
         Returns:
             List of CASResult on success (may be empty), CASLookupError on failure
         """
-        encoded_name = quote(name)
-        url = f"{BASE_URL}/search?q={encoded_name}"
-
         try:
-            data = self._get(url)
-        except requests.HTTPError as e:
-            try:
-                error_data = e.response.json()
-                return CASLookupError(
-                    name_queried=name,
-                    error_code=str(e.response.status_code),
-                    error_message=error_data.get("message", str(e)),
-                )
-            except (json.JSONDecodeError, AttributeError):
-                return CASLookupError(
-                    name_queried=name,
-                    error_code="HTTP_ERROR",
-                    error_message=str(e),
-                )
+            data = self._get_json(f"{self.BASE_URL}/search?q={quote(name)}")
         except requests.RequestException as e:
-            return CASLookupError(
-                name_queried=name,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
-
-        # Parse search results
-        results = data.get("results", [])
-        if not results:
-            return []
+            return _lookup_error(name, e)
 
         # Fetch details for each result
-        cas_results = []
-        for item in results:
-            rn = item.get("rn")
-            if rn:
-                detail = self.get_by_rn(rn)
-                if isinstance(detail, CASResult):
-                    detail.name_queried = name
-                    cas_results.append(detail)
+        rns = _parse_search_rns(data)
+        return _collect_details(name, [self.get_by_rn(rn) for rn in rns])
+
+    async def asearch_by_name(self, name: str) -> list[CASResult] | CASLookupError:
+        """Async version of search_by_name().
+
+        Details for all search hits are fetched concurrently.
+        """
+        try:
+            data = await self.aget_json(f"{self.BASE_URL}/search?q={quote(name)}")
+        except requests.RequestException as e:
+            return _lookup_error(name, e)
 
-        return cas_results
+        rns = _parse_search_rns(data)
+        details = await asyncio.gather(*(self.aget_by_rn(rn) for rn in rns))
+        return _collect_details(name, list(details))
 
     def get_by_rn(self, rn: str) -> CASResult | CASLookupError:
         """Get compound details by CAS Registry Number.
@@ -228,57 +180,93 @@ class CASClient:
         Returns:
             CASResult on success, CASLookupError on failure
         """
-        url = f"{BASE_URL}/detail?cas_rn={rn}"
+        try:
+            data = self._get_json(f"{self.BASE_URL}/detail?cas_rn={rn}")
+        except requests.RequestException as e:
+            return _lookup_error(rn, e)
+
+        return _parse_detail(rn, data)
 
+    async def aget_by_rn(self, rn: str) -> CASResult | CASLookupError:
+        """Async version of get_by_rn()."""
         try:
-            data = self._get(url)
-        except requests.HTTPError as e:
-            try:
-                error_data = e.response.json()
-                return CASLookupError(
-                    name_queried=rn,
-                    error_code=str(e.response.status_code),
-                    error_message=error_data.get("message", str(e)),
-                )
-            except (json.JSONDecodeError, AttributeError):
-                return CASLookupError(
-                    name_queried=rn,
-                    error_code="HTTP_ERROR",
-                    error_message=str(e),
-                )
+            data = await self.aget_json(f"{self.BASE_URL}/detail?cas_rn={rn}")
         except requests.RequestException as e:
+            return _lookup_error(rn, e)
+
+        return _parse_detail(rn, data)
+
+
+def _lookup_error(query: str, error: requests.RequestException) -> CASLookupError:
+    """Convert a request exception into a CASLookupError.
+
+    CAS returns a JSON body with a "message" on HTTP errors; use it when present.
+    """
+    if isinstance(error, requests.HTTPError):
+        try:
+            error_data = error.response.json()
             return CASLookupError(
-                name_queried=rn,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
+                name_queried=query,
+                error_code=str(error.response.status_code),
+                error_message=error_data.get("message", str(error)),
             )
+        except (json.JSONDecodeError, AttributeError):
+            return CASLookupError(
+                name_queried=query,
+                error_code="HTTP_ERROR",
+                error_message=str(error),
+            )
+    return CASLookupError(
+        name_queried=query,
+        error_code="REQUEST_ERROR",
+        error_message=str(error),
+    )
 
-        # Parse detail response
-        # CAS API returns HTML-formatted formulas (e.g., "C<sub>6</sub>H<sub>12</sub>O<sub>6</sub>")
-        # Strip HTML tags to get plain formula (e.g., "C6H12O6")
-        raw_formula = data.get("molecularFormula")
-        formula = HTML_TAG_PATTERN.sub("", raw_formula) if raw_formula else None
-        is_mixture = formula == "Unspecified" or formula is None
-
-        # Extract molecular mass
-        mass_str = data.get("molecularMass")
-        mass = None
-        if mass_str and mass_str != "Unspecified":
-            with contextlib.suppress(ValueError, TypeError):
-                mass = float(mass_str)
-
-        return CASResult(
-            rn=data.get("rn", rn),
-            name=data.get("name", ""),
-            name_queried=rn,
-            molecular_formula=formula if formula != "Unspecified" else None,
-            molecular_mass=mass,
-            inchi=data.get("inchi"),
-            inchikey=data.get("inchiKey"),
-            smiles=data.get("smile"),
-            synonyms=data.get("synonyms"),
-            is_mixture=is_mixture,
-        )
+
+def _parse_search_rns(data: dict[str, Any]) -> list[str]:
+    """Get the registry numbers of all search hits."""
+    return [item["rn"] for item in data.get("results", []) if item.get("rn")]
+
+
+def _collect_details(name: str, details: list[CASResult | CASLookupError]) -> list[CASResult]:
+    """Keep successful detail lookups, tagging them with the queried name."""
+    cas_results = []
+    for detail in details:
+        if isinstance(detail, CASResult):
+            detail.name_queried = name
+            cas_results.append(detail)
+    return cas_results
+
+
+def _parse_detail(rn: str, data: dict[str, Any]) -> CASResult:
+    """Parse a detail response into a CASResult.
+
+    CAS API returns HTML-formatted formulas (e.g., "C<sub>6</sub>H<sub>12</sub>O<sub>6</sub>").
+    Strip HTML tags to get plain formula (e.g., "C6H12O6").
+    """
+    raw_formula = data.get("molecularFormula")
+    formula = HTML_TAG_PATTERN.sub("", raw_formula) if raw_formula else None
+    is_mixture = formula == "Unspecified" or formula is None
+
+    # Extract molecular mass
+    mass_str = data.get("molecularMass")
+    mass = None
+    if mass_str and mass_str != "Unspecified":
+        with contextlib.suppress(ValueError, TypeError):
+            mass = float(mass_str)
+
+    return CASResult(
+        rn=data.get("rn", rn),
+        name=data.get("name", ""),
+        name_queried=rn,
+        molecular_formula=formula if formula != "Unspecified" else None,
+        molecular_mass=mass,
+        inchi=data.get("inchi"),
+        inchikey=data.get("inchiKey"),
+        smiles=data.get("smile"),
+        synonyms=data.get("synonyms"),
+        is_mixture=is_mixture,
+    )
 
 
 def get_cas_client() -> CASClient | None:
@@ -0,0 +1,238 @@
+"""Record/replay of HTTP exchanges ("cassettes") for deterministic runs.
+
+A cassette is a directory of gzip-compressed JSON files, one per distinct
+request, named by the request's cache key (see make_cache_key()) and fanned
+out by its first two hex digits: ``<dir>/ab/ab12...ef.json.gz``. Content
+addressing means re-recording a request overwrites its file, and cassettes
+from different runs can be merged by copying directories together.
+
+Modes:
+- ``record``: requests are served as usual (network or response cache) and
+  every final response (after throttling retries) is written to the cassette.
+- ``replay``: requests are answered from the cassette only. A request that
+  was never recorded raises CassetteMiss (a ``requests.ConnectionError``), so
+  a replayed run never touches the network and skips rate limiting
+  entirely. Files are decompressed once and then served from memory.
+
+Replaying a recorded pipeline run gives end-to-end timings that measure the
+pipeline's own overhead, independent of API latency. HTTPClientBase uses the
+process-wide cassette set with set_default_cassette(); so do the NCBI
+E-utilities helpers.
+
+Example:
+    >>> set_default_cassette(Cassette(Path("cassettes/enrich"), mode="record"))
+    >>> PubChemClient().get_cids_by_name("glucose")  # recorded
+    >>> set_default_cassette(Cassette(Path("cassettes/enrich"), mode="replay"))
+    >>> PubChemClient().get_cids_by_name("glucose")  # replayed, no network
+
+Only response status, body and a few headers are stored (see
+RECORDED_HEADERS); request headers, and therefore API keys sent as headers,
+never reach the cassette. Callers that pass secrets as query parameters
+(NCBI's ``api_key``) must leave them out of the recorded parameters.
+"""
+
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Literal
+
+import requests
+
+from cmm_ai_automation.clients.cache import CachedResponse, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+CassetteMode = Literal["record", "replay"]
+CASSETTE_MODES: tuple[CassetteMode, ...] = ("record", "replay")
+
+# Response headers kept in recordings; everything else (cookies, dates, ...) is dropped
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+# Query parameters, form fields or JSON bodies: whatever make_cache_key() accepts
+_Params = dict[str, Any] | list[tuple[str, Any]] | None
+
+
+class CassetteMiss(requests.ConnectionError):
+    """A replayed request was not found in the cassette."""
+
+
+class Cassette:
+    """Directory of recorded HTTP exchanges, in record or replay mode.
+
+    Thread-safe; several clients (and threads) may share one cassette.
+
+    Attributes:
+        path: Cassette directory
+        mode: "record" or "replay"
+        recorded: Exchanges written in this session
+        replayed: Requests answered from the cassette
+        misses: Replayed requests that were not in the cassette
+    """
+
+    def __init__(self, path: Path, mode: CassetteMode = "replay"):
+        """Open a cassette directory.
+
+        Args:
+            path: Cassette directory (created when recording)
+            mode: "record" or "replay"
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {', '.join(CASSETTE_MODES)}")
+        self.path = path
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Exchanges seen in this session (loaded or recorded); None marks a known miss
+        self._memory: dict[str, CachedResponse | None] = {}
+        if mode == "record":
+            path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def recording(self) -> bool:
+        """Whether responses are being recorded."""
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        """Whether requests are answered from the cassette."""
+        return self.mode == "replay"
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json.gz"
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        response: requests.Response,
+        params: _Params = None,
+        data: dict[str, Any] | None = None,
+        json_data: Any = None,
+    ) -> None:
+        """Write the response to a request (a no-op unless recording).
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            response: Response to store
+            params: Query parameters, as sent (minus any secrets)
+            data: Form body
+            json_data: JSON body
+        """
+        if not self.recording:
+            return
+        key = make_cache_key(method, url, params, data, json_data)
+        headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+        exchange = CachedResponse(url=url, status_code=response.status_code, headers=headers, content=response.content)
+        with self._lock:
+            previous = self._memory.get(key)
+            if previous is not None and previous == exchange:
+                return  # e.g. the same response reached several coalesced callers
+            self._memory[key] = exchange
+            self.recorded += 1
+        _write_exchange(self._file(key), method, exchange)
+
+    def replay(
+        self,
+        method: str,
+        url: str,
+        params: _Params = None,
+        data: dict[str, Any] | None = None,
+        json_data: Any = None,
+    ) -> CachedResponse:
+        """Answer a request from the cassette.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            data: Form body
+            json_data: JSON body
+
+        Returns:
+            The recorded response (which may be an error status)
+
+        Raises:
+            CassetteMiss: If the request was never recorded
+        """
+        key = make_cache_key(method, url, params, data, json_data)
+        with self._lock:
+            if key in self._memory:
+                exchange = self._memory[key]
+            else:
+                exchange = self._memory[key] = _read_exchange(self._file(key))
+            if exchange is None:
+                self.misses += 1
+            else:
+                self.replayed += 1
+        if exchange is None:
+            raise CassetteMiss(f"{method} {url} params={params} is not in cassette {self.path}")
+        return exchange
+
+    def __len__(self) -> int:
+        """Number of exchanges stored on disk."""
+        return sum(1 for _ in self.path.glob("*/*.json.gz")) if self.path.exists() else 0
+
+
+def _write_exchange(path: Path, method: str, exchange: CachedResponse) -> None:
+    """Write one exchange atomically."""
+    try:
+        body: dict[str, str] = {"body": exchange.content.decode("utf-8")}
+    except UnicodeDecodeError:
+        body = {"body_b64": base64.b64encode(exchange.content).decode("ascii")}
+    record = {
+        "method": method.upper(),
+        "url": exchange.url,
+        "status": exchange.status_code,
+        "headers": exchange.headers,
+        **body,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    # mtime=0 keeps the file bytes a pure function of the exchange
+    with tmp.open("wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+        f.write(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+    tmp.replace(path)
+
+
+def _read_exchange(path: Path) -> CachedResponse | None:
+    """Read one exchange, or None if it is missing or unreadable."""
+    try:
+        with gzip.open(path, "rb") as f:
+            record = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cassette entry {path}: {e}")
+        return None
+    content = base64.b64decode(record["body_b64"]) if "body_b64" in record else record.get("body", "").encode("utf-8")
+    return CachedResponse(
+        url=record["url"], status_code=record["status"], headers=record.get("headers", {}), content=content
+    )
+
+
+_default_cassette: Cassette | None = None
+
+
+def set_default_cassette(cassette: Cassette | None) -> None:
+    """Set the cassette used by clients created without an explicit one.
+
+    Args:
+        cassette: Cassette to record to or replay from, or None for live requests
+    """
+    global _default_cassette
+    _default_cassette = cassette
+
+
+def get_default_cassette() -> Cassette | None:
+    """Get the cassette used by clients created without an explicit one."""
+    return _default_cassette
@@ -14,19 +14,31 @@ References:
     - API schema: https://www.ebi.ac.uk/chebi/backend/api/schema/
 """
 
+import asyncio
 import logging
 import re
-import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import requests
 
+from cmm_ai_automation.clients.base import HTTPClientBase
+
+if TYPE_CHECKING:
+    from cmm_ai_automation.clients.chebi_local import ChEBILocalBackend
+
 logger = logging.getLogger(__name__)
 
 # Rate limit: be conservative with external API
 DEFAULT_RATE_LIMIT_DELAY = 0.2
 
+# Compound lookups in flight at once during a batch (the shared rate limit still applies).
+# The 2.0 API has no multi-ID compound endpoint, so batches fan out one request per ID.
+BATCH_MAX_WORKERS = 4
+
 
 @dataclass
 class ChEBIRole:
@@ -178,7 +190,7 @@ class ChEBILookupError:
     error_message: str
 
 
-class ChEBIClient:
+class ChEBIClient(HTTPClientBase):
     """Client for ChEBI 2.0 REST API.
 
     ChEBI is the authoritative source for ChEBI term information,
@@ -196,47 +208,37 @@ class ChEBIClient:
         >>> results = client.search("glucose")
         >>> for r in results[:5]:
         ...     print(f"{r.chebi_id}: {r.ascii_name}")
+
+        >>> # Answer get_compound/search_exact from a local DuckDB build
+        >>> client = ChEBIClient(local_db=Path("data/chebi.duckdb"))
     """
 
     BASE_URL = "https://www.ebi.ac.uk/chebi/backend/api"
 
+    local: "ChEBILocalBackend | None"
+
     def __init__(
         self,
         rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY,
         timeout: float = 30.0,
+        local_db: Path | None = None,
+        base_url: str | None = None,
     ):
         """Initialize ChEBI client.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 0.2)
             timeout: Request timeout in seconds (default: 30)
+            local_db: DuckDB file built by ChEBILocalBackend.build(); if given,
+                get_compound() and search_exact() are answered offline
+            base_url: API base URL override (e.g., a local fake server)
         """
-        self.rate_limit_delay = rate_limit_delay
-        self.timeout = timeout
-        self._last_request_time: float = 0
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)",
-            }
-        )
+        super().__init__(rate_limit_delay=rate_limit_delay, timeout=timeout, base_url=base_url)
+        self.local = None
+        if local_db is not None:
+            from cmm_ai_automation.clients.chebi_local import ChEBILocalBackend
 
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
-
-    def _get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a GET request with rate limiting."""
-        self._wait_for_rate_limit()
-        logger.debug(f"GET {url} params={params}")
-        response = self._session.get(url, params=params, timeout=self.timeout)
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+            self.local = ChEBILocalBackend(local_db)
 
     def get_compound(self, chebi_id: str | int) -> ChEBICompound | ChEBILookupError:
         """Get complete compound information by ChEBI ID.
@@ -249,32 +251,25 @@ class ChEBIClient:
         Returns:
             ChEBICompound on success, ChEBILookupError on failure
         """
-        # Normalize the ChEBI ID
-        chebi_str = str(chebi_id).upper()
-        chebi_numeric = chebi_str.split(":")[1] if chebi_str.startswith("CHEBI:") else chebi_str
+        if self.local is not None:
+            return self.local.get_compound(chebi_id)
+        chebi_numeric = _chebi_numeric(chebi_id)
+        try:
+            data = self._get_json(f"{self.BASE_URL}/public/compound/{chebi_numeric}/")
+        except requests.RequestException as e:
+            return _compound_error(chebi_numeric, e)
 
-        url = f"{self.BASE_URL}/public/compound/{chebi_numeric}/"
+        return self._parse_compound(data)
 
+    async def aget_compound(self, chebi_id: str | int) -> ChEBICompound | ChEBILookupError:
+        """Async version of get_compound()."""
+        if self.local is not None:
+            return self.local.get_compound(chebi_id)
+        chebi_numeric = _chebi_numeric(chebi_id)
         try:
-            data = self._get(url)
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
-                return ChEBILookupError(
-                    query=f"CHEBI:{chebi_numeric}",
-                    error_code="NOT_FOUND",
-                    error_message=f"ChEBI compound CHEBI:{chebi_numeric} not found",
-                )
-            return ChEBILookupError(
-                query=f"CHEBI:{chebi_numeric}",
-                error_code="HTTP_ERROR",
-                error_message=str(e),
-            )
+            data = await self.aget_json(f"{self.BASE_URL}/public/compound/{chebi_numeric}/")
         except requests.RequestException as e:
-            return ChEBILookupError(
-                query=f"CHEBI:{chebi_numeric}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _compound_error(chebi_numeric, e)
 
         return self._parse_compound(data)
 
@@ -294,47 +289,28 @@ class ChEBIClient:
         Returns:
             List of ChEBISearchResult on success, ChEBILookupError on failure
         """
-        url = f"{self.BASE_URL}/public/es_search/"
-        params = {
-            "term": query,
-            "page": page,
-            "size": size,
-        }
-
+        params = {"term": query, "page": page, "size": size}
         try:
-            data = self._get(url, params)
-        except requests.HTTPError as e:
-            # Extract HTTP status code if available
-            status_code = e.response.status_code if e.response is not None else None
-            return ChEBILookupError(
-                query=query,
-                error_code=str(status_code) if status_code else "HTTP_ERROR",
-                error_message=str(e),
-            )
+            data = self._get_json(f"{self.BASE_URL}/public/es_search/", params)
         except requests.RequestException as e:
-            return ChEBILookupError(
-                query=query,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _search_error(query, e)
 
-        results = []
-        for hit in data.get("results", []):
-            source = hit.get("_source", {})
-            results.append(
-                ChEBISearchResult(
-                    chebi_id=source.get("chebi_accession", ""),
-                    name=source.get("name", ""),
-                    ascii_name=source.get("ascii_name"),
-                    definition=source.get("definition"),
-                    stars=source.get("stars"),
-                    formula=source.get("formula"),
-                    mass=source.get("mass"),
-                    score=hit.get("_score", 0.0),
-                )
-            )
+        return _parse_search_results(data)
+
+    async def asearch(
+        self,
+        query: str,
+        page: int = 1,
+        size: int = 20,
+    ) -> list[ChEBISearchResult] | ChEBILookupError:
+        """Async version of search()."""
+        params = {"term": query, "page": page, "size": size}
+        try:
+            data = await self.aget_json(f"{self.BASE_URL}/public/es_search/", params)
+        except requests.RequestException as e:
+            return _search_error(query, e)
 
-        return results
+        return _parse_search_results(data)
 
     def search_exact(self, name: str) -> ChEBISearchResult | None | ChEBILookupError:
         """Search for an exact name match.
@@ -346,57 +322,85 @@ class ChEBIClient:
             ChEBISearchResult if found with exact match, None if not found,
             ChEBILookupError on failure (network errors, API errors, etc., but not "not found")
         """
+        if self.local is not None:
+            return self.local.search_exact(name)
+
         # Try searching with the exact name first
         results = self.search(name, size=20)
         if isinstance(results, ChEBILookupError):
             # If it's a 404 "not found", treat as None (no results)
-            if results.error_code == "404":
-                return None
-            # Other errors (network, API) should be returned as errors
-            return results
-
-        # Look for exact match (case-insensitive)
-        name_lower = name.lower()
-        for result in results:
-            if result.ascii_name and result.ascii_name.lower() == name_lower:
-                return result
-            if result.name and _strip_html(result.name).lower() == name_lower:
-                return result
+            return _none_if_not_found(results)
+
+        match = _find_exact_match(results, name)
+        if match is not None:
+            return match
 
         # If no exact match found with specific term, try a broader search
         # by removing stereochemistry prefixes (D-, L-, etc.)
         if name.startswith(("D-", "L-", "d-", "l-")):
-            broader_name = name[2:]
-            results = self.search(broader_name, size=20)
+            results = self.search(name[2:], size=20)
+            if isinstance(results, ChEBILookupError):
+                return _none_if_not_found(results)
+            return _find_exact_match(results, name)
+
+        return None
+
+    async def asearch_exact(self, name: str) -> ChEBISearchResult | ChEBILookupError | None:
+        """Async version of search_exact()."""
+        if self.local is not None:
+            return self.local.search_exact(name)
+
+        results = await self.asearch(name, size=20)
+        if isinstance(results, ChEBILookupError):
+            return _none_if_not_found(results)
+
+        match = _find_exact_match(results, name)
+        if match is not None:
+            return match
+
+        if name.startswith(("D-", "L-", "d-", "l-")):
+            results = await self.asearch(name[2:], size=20)
             if isinstance(results, ChEBILookupError):
-                # Again, treat 404 as no results
-                if results.error_code == "404":
-                    return None
-                return results
-
-            # Look for exact match in broader results
-            for result in results:
-                if result.ascii_name and result.ascii_name.lower() == name_lower:
-                    return result
-                if result.name and _strip_html(result.name).lower() == name_lower:
-                    return result
+                return _none_if_not_found(results)
+            return _find_exact_match(results, name)
 
         return None
 
-    def get_compounds_batch(self, chebi_ids: list[str | int]) -> dict[str, ChEBICompound | ChEBILookupError]:
-        """Get multiple compounds (makes individual requests).
+    def get_compounds_batch(
+        self,
+        chebi_ids: Iterable[str | int],
+        max_workers: int = BATCH_MAX_WORKERS,
+    ) -> dict[str, ChEBICompound | ChEBILookupError]:
+        """Get multiple compounds.
+
+        IDs are normalized and deduplicated first, so "17634", 17634 and
+        "CHEBI:17634" cost a single request. The remaining lookups run on a
+        small thread pool; all threads draw from the shared per-host rate
+        limiter.
 
         Args:
-            chebi_ids: List of ChEBI IDs
+            chebi_ids: ChEBI IDs (any accepted form)
+            max_workers: Maximum concurrent requests (default: 4)
 
         Returns:
-            Dict mapping each ID to its result
+            Dict mapping each normalized ID (e.g., "CHEBI:17634") to its result
+        """
+        unique_ids = _unique_chebi_ids(chebi_ids)
+        if len(unique_ids) <= 1 or max_workers <= 1 or self.local is not None:
+            return {chebi_id: self.get_compound(chebi_id) for chebi_id in unique_ids}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            results = executor.map(self.get_compound, unique_ids)
+            return dict(zip(unique_ids, results, strict=True))
+
+    async def aget_compounds_batch(self, chebi_ids: Iterable[str | int]) -> dict[str, ChEBICompound | ChEBILookupError]:
+        """Async version of get_compounds_batch().
+
+        Concurrency is bounded by the client's per-host ``max_concurrency``.
         """
-        results = {}
-        for chebi_id in chebi_ids:
-            normalized = _normalize_chebi_id(chebi_id)
-            results[normalized] = self.get_compound(chebi_id)
-        return results
+        unique_ids = _unique_chebi_ids(chebi_ids)
+        results = await asyncio.gather(*(self.aget_compound(chebi_id) for chebi_id in unique_ids))
+        return dict(zip(unique_ids, results, strict=True))
 
     def _parse_compound(self, data: dict[str, Any]) -> ChEBICompound:
         """Parse API response into ChEBICompound."""
@@ -409,6 +413,9 @@ class ChEBIClient:
         monoisotopic_mass = _to_float(chem_data.get("monoisotopic_mass"))
         charge = chem_data.get("charge")
 
+        # Parse the default structure
+        structure = data.get("default_structure") or {}
+
         # Parse names/synonyms
         synonyms = []
         names_data = data.get("names") or {}
@@ -485,6 +492,9 @@ class ChEBIClient:
             mass=mass,
             monoisotopic_mass=monoisotopic_mass,
             charge=charge,
+            inchi=structure.get("standard_inchi"),
+            inchikey=structure.get("standard_inchi_key"),
+            smiles=structure.get("smiles"),
             synonyms=list(set(synonyms)),  # dedupe
             secondary_ids=data.get("secondary_ids", []),
             roles=roles,
@@ -517,3 +527,88 @@ def _normalize_chebi_id(chebi_id: str | int) -> str:
     if chebi_str.startswith("CHEBI:"):
         return chebi_str
     return f"CHEBI:{chebi_str}"
+
+
+def _unique_chebi_ids(chebi_ids: Iterable[str | int]) -> list[str]:
+    """Normalize ChEBI IDs and drop duplicates, keeping first-seen order."""
+    return list(dict.fromkeys(_normalize_chebi_id(chebi_id) for chebi_id in chebi_ids))
+
+
+def _chebi_numeric(chebi_id: str | int) -> str:
+    """Get the numeric part of a ChEBI ID (accepts "CHEBI:17634", "17634" or 17634)."""
+    chebi_str = str(chebi_id).upper()
+    return chebi_str.split(":")[1] if chebi_str.startswith("CHEBI:") else chebi_str
+
+
+def _compound_error(chebi_numeric: str, error: requests.RequestException) -> ChEBILookupError:
+    """Convert a compound lookup exception into a ChEBILookupError."""
+    if isinstance(error, requests.HTTPError):
+        if error.response.status_code == 404:
+            return ChEBILookupError(
+                query=f"CHEBI:{chebi_numeric}",
+                error_code="NOT_FOUND",
+                error_message=f"ChEBI compound CHEBI:{chebi_numeric} not found",
+            )
+        return ChEBILookupError(
+            query=f"CHEBI:{chebi_numeric}",
+            error_code="HTTP_ERROR",
+            error_message=str(error),
+        )
+    return ChEBILookupError(
+        query=f"CHEBI:{chebi_numeric}",
+        error_code="REQUEST_ERROR",
+        error_message=str(error),
+    )
+
+
+def _search_error(query: str, error: requests.RequestException) -> ChEBILookupError:
+    """Convert a search exception into a ChEBILookupError keyed by HTTP status."""
+    if isinstance(error, requests.HTTPError):
+        # Extract HTTP status code if available
+        status_code = error.response.status_code if error.response is not None else None
+        return ChEBILookupError(
+            query=query,
+            error_code=str(status_code) if status_code else "HTTP_ERROR",
+            error_message=str(error),
+        )
+    return ChEBILookupError(
+        query=query,
+        error_code="REQUEST_ERROR",
+        error_message=str(error),
+    )
+
+
+def _none_if_not_found(error: ChEBILookupError) -> ChEBILookupError | None:
+    """Treat a 404 search response as "no results"; other errors pass through."""
+    return None if error.error_code == "404" else error
+
+
+def _parse_search_results(data: dict[str, Any]) -> list[ChEBISearchResult]:
+    """Parse an es_search response into search results."""
+    results = []
+    for hit in data.get("results", []):
+        source = hit.get("_source", {})
+        results.append(
+            ChEBISearchResult(
+                chebi_id=source.get("chebi_accession", ""),
+                name=source.get("name", ""),
+                ascii_name=source.get("ascii_name"),
+                definition=source.get("definition"),
+                stars=source.get("stars"),
+                formula=source.get("formula"),
+                mass=source.get("mass"),
+                score=hit.get("_score", 0.0),
+            )
+        )
+    return results
+
+
+def _find_exact_match(results: list[ChEBISearchResult], name: str) -> ChEBISearchResult | None:
+    """Find the first result whose name matches exactly (case-insensitive)."""
+    name_lower = name.lower()
+    for result in results:
+        if result.ascii_name and result.ascii_name.lower() == name_lower:
+            return result
+        if result.name and _strip_html(result.name).lower() == name_lower:
+            return result
+    return None
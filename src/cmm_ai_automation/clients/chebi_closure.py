@@ -0,0 +1,283 @@
+"""Precomputed ChEBI ancestor/role closure for offline ontology queries.
+
+Answers "all ancestors of X", "is X a descendant of Y" and "which roles does
+X have" without walking the ontology (or calling OLS) at query time. The
+closure over is_a edges, and the has_role targets inherited along them, are
+computed once and stored in compressed sparse row form:
+
+    nodes          sorted ChEBI numbers
+    anc_offsets    ancestors of nodes[i] are ancestors[anc_offsets[i]:anc_offsets[i + 1]]
+    ancestors      sorted ChEBI numbers, one run per node
+    role_offsets   (same layout for roles)
+    roles
+
+All arrays are int32. Lookups binary-search ``nodes`` and then the node's run,
+so every query is O(log n). Saved indexes are memory-mapped, so loading is
+instant and the pages are shared between processes.
+
+Example:
+    >>> index = ChEBIClosureIndex.from_obo(Path("downloads/chebi.obo.gz"))
+    >>> index.save(Path("data/chebi_closure.bin"))
+    >>> index = ChEBIClosureIndex.load(Path("data/chebi_closure.bin"))
+    >>> index.is_descendant_of("CHEBI:78675", BIOLOGICAL_ROLE_ID)
+    True
+"""
+
+import gzip
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+import duckdb
+
+from cmm_ai_automation.clients.chebi import _chebi_numeric
+from cmm_ai_automation.clients.chebi_local import BIOLOGICAL_ROLE_ID, CHEMICAL_ROLE_ID
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"CHEBICL1"
+# magic, byte order flag, then node/ancestor/role counts
+_HEADER = struct.Struct("<8sI3I")
+
+Edge = tuple[int, int]
+
+
+class ChEBIClosureIndex:
+    """Transitive is_a closure and inherited has_role sets over ChEBI.
+
+    Build with from_obo() or from_duckdb(), persist with save(), reopen with
+    load(). IDs may be given as "CHEBI:17634", "17634" or 17634; unknown IDs
+    have no ancestors and no roles.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[int],
+        anc_offsets: Sequence[int],
+        ancestors: Sequence[int],
+        role_offsets: Sequence[int],
+        roles: Sequence[int],
+    ):
+        """Wrap prebuilt CSR arrays (use from_edges(), from_obo(), from_duckdb() or load())."""
+        self._nodes = nodes
+        self._anc_offsets = anc_offsets
+        self._ancestors = ancestors
+        self._role_offsets = role_offsets
+        self._roles = roles
+        self._mmap: mmap.mmap | None = None
+        self._views: list[memoryview] = []
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @classmethod
+    def from_edges(cls, is_a: Iterable[Edge], has_role: Iterable[Edge]) -> "ChEBIClosureIndex":
+        """Compute the closure from (subject, object) ChEBI number pairs.
+
+        Args:
+            is_a: (child, parent) pairs
+            has_role: (entity, role) pairs
+
+        Returns:
+            In-memory index
+        """
+        parents: defaultdict[int, set[int]] = defaultdict(set)
+        direct_roles: defaultdict[int, set[int]] = defaultdict(set)
+        node_set: set[int] = set()
+        for child, parent in is_a:
+            parents[child].add(parent)
+            node_set.update((child, parent))
+        for entity, role in has_role:
+            direct_roles[entity].add(role)
+            node_set.update((entity, role))
+
+        nodes = array("i", sorted(node_set))
+        anc_offsets, ancestors = array("i", [0]), array("i")
+        role_offsets, roles = array("i", [0]), array("i")
+        for node in nodes:
+            node_ancestors = _walk_up(node, parents)
+            ancestors.extend(sorted(node_ancestors))
+            anc_offsets.append(len(ancestors))
+
+            node_roles = set(direct_roles.get(node, ()))
+            for ancestor in node_ancestors:
+                node_roles.update(direct_roles.get(ancestor, ()))
+            roles.extend(sorted(node_roles))
+            role_offsets.append(len(roles))
+
+        logger.info(f"Built ChEBI closure: {len(nodes)} terms, {len(ancestors)} ancestor and {len(roles)} role entries")
+        return cls(nodes, anc_offsets, ancestors, role_offsets, roles)
+
+    @classmethod
+    def from_obo(cls, obo_path: Path) -> "ChEBIClosureIndex":
+        """Build from chebi.obo (plain or gzipped); obsolete terms are skipped."""
+        is_a, has_role = _read_obo_edges(obo_path)
+        return cls.from_edges(is_a, has_role)
+
+    @classmethod
+    def from_duckdb(cls, db_path: Path) -> "ChEBIClosureIndex":
+        """Build from the relations table of a ChEBILocalBackend database."""
+        with duckdb.connect(str(db_path), read_only=True) as conn:
+            is_a = conn.execute("SELECT subject_id, object_id FROM relations WHERE type = 'is a'").fetchall()
+            has_role = conn.execute("SELECT subject_id, object_id FROM relations WHERE type = 'has role'").fetchall()
+        return cls.from_edges(is_a, has_role)
+
+    def save(self, path: Path) -> None:
+        """Write the index as a single binary file for load()."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC, sys.byteorder == "little", len(self._nodes), len(self._ancestors), len(self._roles)
+                )
+            )
+            for values in (self._nodes, self._anc_offsets, self._ancestors, self._role_offsets, self._roles):
+                array("i", values).tofile(f)
+
+    @classmethod
+    def load(cls, path: Path) -> "ChEBIClosureIndex":
+        """Memory-map an index written by save()."""
+        with path.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, little_endian, n_nodes, n_ancestors, n_roles = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a ChEBI closure index")
+        if bool(little_endian) != (sys.byteorder == "little"):
+            raise ValueError(f"{path} was written on a machine with different byte order; rebuild it")
+
+        body = memoryview(mapped)[_HEADER.size :]
+        ints = body.cast("i")
+        arrays = []
+        start = 0
+        for size in (n_nodes, n_nodes + 1, n_ancestors, n_nodes + 1, n_roles):
+            arrays.append(ints[start : start + size])
+            start += size
+        index = cls(*arrays)
+        index._mmap = mapped
+        index._views = [*arrays, ints, body]
+        return index
+
+    def ancestors(self, chebi_id: str | int) -> list[str]:
+        """All is_a ancestors of a term (excluding the term itself), as CURIEs."""
+        return [f"CHEBI:{n}" for n in self._run(chebi_id, self._anc_offsets, self._ancestors)]
+
+    def is_descendant_of(self, chebi_id: str | int, ancestor_id: str | int) -> bool:
+        """Whether ``ancestor_id`` is a (transitive) is_a ancestor of ``chebi_id``."""
+        run = self._run(chebi_id, self._anc_offsets, self._ancestors)
+        return _contains(run, _to_int(ancestor_id))
+
+    def roles_of(self, chebi_id: str | int) -> list[str]:
+        """has_role targets of a term, including those inherited from its ancestors, as CURIEs."""
+        return [f"CHEBI:{n}" for n in self._run(chebi_id, self._role_offsets, self._roles)]
+
+    def classify_roles(self, chebi_id: str | int) -> tuple[list[str], list[str]]:
+        """Split a term's roles into (biological roles, chemical roles)."""
+        roles = self._run(chebi_id, self._role_offsets, self._roles)
+        biological = [f"CHEBI:{r}" for r in roles if self.is_descendant_of(r, BIOLOGICAL_ROLE_ID)]
+        chemical = [f"CHEBI:{r}" for r in roles if self.is_descendant_of(r, CHEMICAL_ROLE_ID)]
+        return biological, chemical
+
+    def __contains__(self, chebi_id: object) -> bool:
+        if not isinstance(chebi_id, str | int):
+            return False
+        return self._position(chebi_id) is not None
+
+    def close(self) -> None:
+        """Release the memory map of a loaded index."""
+        if self._mmap is not None:
+            # Views into the map must be released before it can be closed
+            for view in self._views:
+                view.release()
+            self._views = []
+            self._mmap.close()
+            self._mmap = None
+
+    def _position(self, chebi_id: str | int) -> int | None:
+        number = _to_int(chebi_id)
+        i = bisect_left(self._nodes, number)
+        return i if i < len(self._nodes) and self._nodes[i] == number else None
+
+    def _run(self, chebi_id: str | int, offsets: Sequence[int], values: Sequence[int]) -> Sequence[int]:
+        i = self._position(chebi_id)
+        if i is None:
+            return ()
+        return values[offsets[i] : offsets[i + 1]]
+
+
+def _to_int(chebi_id: str | int) -> int:
+    if isinstance(chebi_id, int):
+        return chebi_id
+    numeric = _chebi_numeric(chebi_id)
+    return int(numeric) if numeric.isdigit() else -1
+
+
+def _contains(run: Sequence[int], value: int) -> bool:
+    i = bisect_left(run, value)
+    return i < len(run) and run[i] == value
+
+
+def _walk_up(node: int, parents: dict[int, set[int]]) -> set[int]:
+    """All is_a ancestors of ``node`` (cycle-safe)."""
+    seen: set[int] = set()
+    stack = list(parents.get(node, ()))
+    while stack:
+        parent = stack.pop()
+        if parent in seen or parent == node:
+            continue
+        seen.add(parent)
+        stack.extend(parents.get(parent, ()))
+    return seen
+
+
+def _read_obo_edges(obo_path: Path) -> tuple[list[Edge], list[Edge]]:
+    """Collect is_a and has_role edges between ChEBI terms from an OBO file."""
+    is_a: list[Edge] = []
+    has_role: list[Edge] = []
+    for term_id, tags in _obo_terms(obo_path):
+        if ("is_obsolete", "true") in tags:
+            continue
+        for tag, value in tags:
+            if tag == "is_a":
+                target = _obo_chebi_number(value.split()[0])
+                if target is not None:
+                    is_a.append((term_id, target))
+            elif tag == "relationship":
+                relation, _, rest = value.partition(" ")
+                target = _obo_chebi_number(rest.split()[0]) if rest else None
+                if relation == "has_role" and target is not None:
+                    has_role.append((term_id, target))
+    return is_a, has_role
+
+
+def _obo_terms(obo_path: Path) -> Iterator[tuple[int, list[tuple[str, str]]]]:
+    """Yield (ChEBI number, [(tag, value), ...]) for each [Term] stanza."""
+    opener = gzip.open if obo_path.suffix == ".gz" else open
+    term_id: int | None = None
+    tags: list[tuple[str, str]] = []
+    in_term = False
+    with opener(obo_path, "rt", encoding="utf-8") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if line.startswith("["):
+                if in_term and term_id is not None:
+                    yield term_id, tags
+                in_term, term_id, tags = line == "[Term]", None, []
+            elif in_term and ": " in line:
+                tag, value = line.split(": ", 1)
+                if tag == "id":
+                    term_id = _obo_chebi_number(value)
+                else:
+                    tags.append((tag, value.split(" !")[0].strip()))
+    if in_term and term_id is not None:
+        yield term_id, tags
+
+
+def _obo_chebi_number(curie: str) -> int | None:
+    prefix, _, number = curie.partition(":")
+    return int(number) if prefix == "CHEBI" and number.isdigit() else None
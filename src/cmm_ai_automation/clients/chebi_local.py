@@ -0,0 +1,481 @@
+"""Local ChEBI backend built from the ChEBI flat file release.
+
+Answers the same questions as ChEBIClient (compound details, exact name
+search, roles and parents) from a DuckDB file instead of the ChEBI REST API,
+so lookups are fast, repeatable and work without network access.
+
+The database is built once from the tab-delimited release files
+(https://ftp.ebi.ac.uk/pub/databases/chebi/Flat_file_tab_delimited/):
+
+    compounds.tsv            compound IDs, names, definitions, stars
+    names.tsv                synonyms, IUPAC names, INNs, ...
+    relation.tsv             ontology relations (is_a, has_role, ...)
+    database_accession.tsv   cross-references (CAS, KEGG, ...)
+    chemical_data.tsv        formula, mass, charge, monoisotopic mass
+    structures.tsv           SMILES, InChI, InChIKey (and mol blocks, not loaded)
+
+Files may be gzipped (e.g., ``compounds.tsv.gz``).
+
+Example:
+    >>> from pathlib import Path
+    >>> ChEBILocalBackend.build(Path("downloads/chebi"), Path("data/chebi.duckdb"))
+    >>> client = ChEBIClient(local_db=Path("data/chebi.duckdb"))
+    >>> client.get_compound("CHEBI:17634")
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from cmm_ai_automation.clients.chebi import (
+    ChEBICompound,
+    ChEBIDatabaseRef,
+    ChEBILookupError,
+    ChEBIRelation,
+    ChEBIRole,
+    ChEBISearchResult,
+    _chebi_numeric,
+    _strip_html,
+    _to_float,
+)
+
+logger = logging.getLogger(__name__)
+
+# Release file for each table, and the columns read from it (first match wins)
+FLAT_FILES: dict[str, str] = {
+    "compounds": "compounds.tsv",
+    "names": "names.tsv",
+    "relations": "relation.tsv",
+    "accessions": "database_accession.tsv",
+    "chemical_data": "chemical_data.tsv",
+    "structures": "structures.tsv",
+}
+
+_COLUMNS: dict[str, dict[str, tuple[str, ...]]] = {
+    "compounds": {
+        "id": ("id",),
+        "name": ("name",),
+        "ascii_name": ("ascii_name", "name"),
+        "definition": ("definition",),
+        "stars": ("star", "stars"),
+        "parent_id": ("parent_id",),
+    },
+    "names": {
+        "compound_id": ("compound_id",),
+        "type": ("type",),
+        "name": ("ascii_name", "name"),
+    },
+    "relations": {
+        "type": ("type",),
+        "init_id": ("init_id",),
+        "final_id": ("final_id",),
+    },
+    "accessions": {
+        "compound_id": ("compound_id",),
+        "type": ("type",),
+        "accession": ("accession_number",),
+        "source": ("source",),
+    },
+    "chemical_data": {
+        "compound_id": ("compound_id",),
+        "type": ("type",),
+        "value": ("chemical_data",),
+        "source": ("source",),
+    },
+    "structures": {
+        "compound_id": ("compound_id",),
+        "type": ("type",),
+        "structure": ("structure",),
+        "is_default": ("default_structure",),
+    },
+}
+
+# Role classes under which a has_role target is a biological role, chemical role or application
+BIOLOGICAL_ROLE_ID = 24432
+CHEMICAL_ROLE_ID = 51086
+APPLICATION_ID = 33232
+
+# Accession types renamed to the keys the REST API uses
+_ACCESSION_TYPES = {"CAS Registry Number": "CAS"}
+
+_INDEXES = """
+CREATE INDEX compounds_id ON compounds (id);
+CREATE INDEX names_compound ON names (compound_id);
+CREATE INDEX relations_subject ON relations (subject_id);
+CREATE INDEX relations_object ON relations (object_id);
+CREATE INDEX accessions_compound ON accessions (compound_id);
+CREATE INDEX chemical_data_compound ON chemical_data (compound_id);
+CREATE INDEX structures_compound ON structures (compound_id);
+"""
+
+_ROLES_QUERY = f"""
+WITH RECURSIVE ancestors(role_id, ancestor_id) AS (
+    SELECT object_id, object_id FROM relations WHERE subject_id = ? AND type = 'has role'
+    UNION
+    SELECT a.role_id, r.object_id
+    FROM ancestors a JOIN relations r ON r.subject_id = a.ancestor_id AND r.type = 'is a'
+)
+SELECT
+    a.role_id,
+    c.name,
+    c.definition,
+    bool_or(a.ancestor_id = {BIOLOGICAL_ROLE_ID}),
+    bool_or(a.ancestor_id = {CHEMICAL_ROLE_ID}),
+    bool_or(a.ancestor_id = {APPLICATION_ID})
+FROM ancestors a JOIN compounds c ON c.id = a.role_id
+GROUP BY ALL
+ORDER BY a.role_id
+"""
+
+
+class ChEBILocalBackend:
+    """ChEBI lookups against a DuckDB file built by build().
+
+    Returns the same ChEBICompound/ChEBIRole/ChEBISearchResult types as
+    ChEBIClient, and ChEBILookupError with error_code "NOT_FOUND" for unknown
+    IDs. Secondary IDs resolve to their primary compound.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open a database built by build().
+
+        Args:
+            db_path: DuckDB file
+        """
+        if not db_path.exists():
+            raise FileNotFoundError(f"ChEBI database not found: {db_path} (build it with load_chebi_duckdb)")
+        self.db_path = db_path
+        self._conn = duckdb.connect(str(db_path), read_only=True)
+        # DuckDB connections must not run queries from several threads at once
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, source_dir: Path, db_path: Path) -> "ChEBILocalBackend":
+        """Load the ChEBI flat files into a new DuckDB file.
+
+        Args:
+            source_dir: Directory containing the release files (optionally gzipped)
+            db_path: DuckDB file to create (replaced if it exists)
+
+        Returns:
+            Backend opened on the new database
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        db_path.unlink(missing_ok=True)
+        with duckdb.connect(str(db_path)) as conn:
+            for table, file_name in FLAT_FILES.items():
+                path = _find_flat_file(source_dir, file_name)
+                logger.info(f"Loading {path} into {table}")
+                conn.execute(f"CREATE TABLE raw_{table} AS SELECT * FROM {_read_tsv(path)}")
+                columns = _pick_columns(conn, table)
+                conn.execute(_CREATE_TABLE[table].format(**columns))
+                conn.execute(f"DROP TABLE raw_{table}")
+            conn.execute(_INDEXES)
+            count = conn.execute("SELECT COUNT(*) FROM compounds").fetchone()
+            logger.info(f"Built {db_path} with {count[0] if count else 0} compounds")
+        return cls(db_path)
+
+    def get_compound(self, chebi_id: str | int) -> ChEBICompound | ChEBILookupError:
+        """Get complete compound information by ChEBI ID.
+
+        Args:
+            chebi_id: ChEBI ID (e.g., "CHEBI:17634", "17634", or 17634)
+
+        Returns:
+            ChEBICompound on success, ChEBILookupError if the ID is unknown
+        """
+        chebi_numeric = _chebi_numeric(chebi_id)
+        with self._lock:
+            primary_id = self._primary_id(chebi_numeric)
+            if primary_id is None:
+                return _not_found(chebi_numeric)
+            row = self._conn.execute(
+                "SELECT id, name, ascii_name, definition, stars FROM compounds WHERE id = ?", [primary_id]
+            ).fetchone()
+            if row is None:
+                return _not_found(chebi_numeric)
+            return self._compound(row)
+
+    def search_exact(self, name: str) -> ChEBISearchResult | None:
+        """Find the compound whose primary name matches exactly (case-insensitive).
+
+        Args:
+            name: Exact name to search for
+
+        Returns:
+            ChEBISearchResult if found, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT c.id, c.name, c.ascii_name, c.definition, c.stars,
+                    (SELECT value FROM chemical_data d WHERE d.compound_id = c.id AND d.type = 'FORMULA'
+                     ORDER BY d.source = 'ChEBI' DESC LIMIT 1),
+                    (SELECT value FROM chemical_data d WHERE d.compound_id = c.id AND d.type = 'MASS'
+                     ORDER BY d.source = 'ChEBI' DESC LIMIT 1)
+                FROM compounds c
+                WHERE c.parent_id IS NULL AND (lower(c.name) = lower(?) OR lower(c.ascii_name) = lower(?))
+                ORDER BY c.stars DESC NULLS LAST, c.id
+                LIMIT 1
+                """,
+                [name, name],
+            ).fetchone()
+        if row is None:
+            return None
+        compound_id, compound_name, ascii_name, definition, stars, formula, mass = row
+        return ChEBISearchResult(
+            chebi_id=f"CHEBI:{compound_id}",
+            name=compound_name or "",
+            ascii_name=ascii_name,
+            definition=definition,
+            stars=stars,
+            formula=formula,
+            mass=_to_float(mass),
+            score=0.0,
+        )
+
+    def get_roles(self, chebi_id: str | int) -> list[ChEBIRole] | ChEBILookupError:
+        """Get the roles of a compound, classified by their place in the role ontology.
+
+        Args:
+            chebi_id: ChEBI ID
+
+        Returns:
+            List of ChEBIRole, or ChEBILookupError if the ID is unknown
+        """
+        chebi_numeric = _chebi_numeric(chebi_id)
+        with self._lock:
+            primary_id = self._primary_id(chebi_numeric)
+            if primary_id is None:
+                return _not_found(chebi_numeric)
+            return self._roles(primary_id)
+
+    def get_parents(self, chebi_id: str | int) -> list[str] | ChEBILookupError:
+        """Get parent terms of a compound (is_a relationships).
+
+        Args:
+            chebi_id: ChEBI ID
+
+        Returns:
+            List of parent ChEBI IDs, or ChEBILookupError if the ID is unknown
+        """
+        chebi_numeric = _chebi_numeric(chebi_id)
+        with self._lock:
+            primary_id = self._primary_id(chebi_numeric)
+            if primary_id is None:
+                return _not_found(chebi_numeric)
+            rows = self._conn.execute(
+                "SELECT object_id FROM relations WHERE subject_id = ? AND type = 'is a' ORDER BY object_id",
+                [primary_id],
+            ).fetchall()
+        return [f"CHEBI:{object_id}" for (object_id,) in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _primary_id(self, chebi_numeric: str) -> int | None:
+        """Resolve an ID (possibly secondary) to its primary compound ID. Caller holds the lock."""
+        if not chebi_numeric.isdigit():
+            return None
+        row = self._conn.execute(
+            "SELECT COALESCE(parent_id, id) FROM compounds WHERE id = ?", [int(chebi_numeric)]
+        ).fetchone()
+        return int(row[0]) if row else None
+
+    def _compound(self, row: tuple[Any, ...]) -> ChEBICompound:
+        """Assemble a ChEBICompound from its compounds row. Caller holds the lock."""
+        compound_id, name, ascii_name, definition, stars = row
+
+        chemical_data: dict[str, str] = {}
+        for data_type, value in self._conn.execute(
+            "SELECT type, value FROM chemical_data WHERE compound_id = ? ORDER BY source = 'ChEBI'",
+            [compound_id],
+        ).fetchall():
+            chemical_data[data_type] = value  # ChEBI-sourced values sort last and win
+
+        structures: dict[str, str] = {}
+        for structure_type, structure in self._conn.execute(
+            "SELECT type, structure FROM structures WHERE compound_id = ? ORDER BY is_default", [compound_id]
+        ).fetchall():
+            structures[structure_type] = structure  # the default structure sorts last and wins
+
+        synonyms = [
+            synonym
+            for (synonym,) in self._conn.execute(
+                "SELECT DISTINCT name FROM names WHERE compound_id = ? AND name IS NOT NULL", [compound_id]
+            ).fetchall()
+        ]
+        secondary_ids = [
+            f"CHEBI:{secondary_id}"
+            for (secondary_id,) in self._conn.execute(
+                "SELECT id FROM compounds WHERE parent_id = ? ORDER BY id", [compound_id]
+            ).fetchall()
+        ]
+
+        database_refs: dict[str, list[ChEBIDatabaseRef]] = {}
+        for db_type, accession, source in self._conn.execute(
+            "SELECT type, accession, source FROM accessions WHERE compound_id = ? ORDER BY type, accession",
+            [compound_id],
+        ).fetchall():
+            database = _ACCESSION_TYPES.get(db_type, db_type)
+            database_refs.setdefault(database, []).append(
+                ChEBIDatabaseRef(database=database, accession=accession, source=source)
+            )
+
+        outgoing_relations = [
+            ChEBIRelation(relation_type=rel_type, target_chebi_id=f"CHEBI:{target_id}", target_name=target_name)
+            for rel_type, target_id, target_name in self._relations(compound_id, outgoing=True)
+        ]
+        incoming_relations = [
+            ChEBIRelation(relation_type=rel_type, target_chebi_id=f"CHEBI:{target_id}", target_name=target_name)
+            for rel_type, target_id, target_name in self._relations(compound_id, outgoing=False)
+        ]
+        charge = chemical_data.get("CHARGE")
+
+        return ChEBICompound(
+            chebi_id=f"CHEBI:{compound_id}",
+            name=name or "",
+            ascii_name=ascii_name,
+            definition=definition,
+            stars=stars,
+            formula=chemical_data.get("FORMULA"),
+            mass=_to_float(chemical_data.get("MASS")),
+            monoisotopic_mass=_to_float(chemical_data.get("MONOISOTOPIC MASS")),
+            charge=int(charge) if charge and charge.lstrip("+-").isdigit() else None,
+            inchi=structures.get("InChI"),
+            inchikey=structures["InChIKey"].removeprefix("InChIKey=") if "InChIKey" in structures else None,
+            smiles=structures.get("SMILES"),
+            synonyms=synonyms,
+            secondary_ids=secondary_ids,
+            roles=self._roles(compound_id),
+            parents=[r for r in outgoing_relations if r.relation_type == "is a"],
+            has_roles=[r for r in outgoing_relations if r.relation_type == "has role"],
+            database_refs=database_refs,
+            outgoing_relations=outgoing_relations,
+            incoming_relations=incoming_relations,
+        )
+
+    def _relations(self, compound_id: int, outgoing: bool) -> list[tuple[str, int, str]]:
+        """(relation type, other compound ID, other compound name) rows. Caller holds the lock."""
+        this, other = ("subject_id", "object_id") if outgoing else ("object_id", "subject_id")
+        rows = self._conn.execute(
+            f"""
+            SELECT r.type, r.{other}, COALESCE(c.name, '')
+            FROM relations r LEFT JOIN compounds c ON c.id = r.{other}
+            WHERE r.{this} = ?
+            ORDER BY r.type, r.{other}
+            """,
+            [compound_id],
+        ).fetchall()
+        return [(rel_type, other_id, _strip_html(other_name)) for rel_type, other_id, other_name in rows]
+
+    def _roles(self, compound_id: int) -> list[ChEBIRole]:
+        """Classify a compound's has_role targets. Caller holds the lock."""
+        return [
+            ChEBIRole(
+                chebi_id=f"CHEBI:{role_id}",
+                name=_strip_html(name or ""),
+                definition=definition,
+                is_biological_role=bool(is_biological),
+                is_chemical_role=bool(is_chemical),
+                is_application=bool(is_application),
+            )
+            for role_id, name, definition, is_biological, is_chemical, is_application in self._conn.execute(
+                _ROLES_QUERY, [compound_id]
+            ).fetchall()
+        ]
+
+
+# Canonical tables built from the raw_* staging tables. Relation types are
+# normalized to the REST API spelling ("is_a" -> "is a"). In relation.tsv the
+# relation reads "FINAL_ID <type> INIT_ID", so FINAL_ID is the subject.
+_CREATE_TABLE = {
+    "compounds": """
+        CREATE TABLE compounds AS SELECT
+            CAST({id} AS INTEGER) AS id,
+            {name} AS name,
+            regexp_replace({ascii_name}, '<[^>]+>', '', 'g') AS ascii_name,
+            NULLIF({definition}, 'null') AS definition,
+            TRY_CAST({stars} AS INTEGER) AS stars,
+            TRY_CAST(NULLIF({parent_id}, 'null') AS INTEGER) AS parent_id
+        FROM raw_compounds
+    """,
+    "names": """
+        CREATE TABLE names AS SELECT
+            CAST({compound_id} AS INTEGER) AS compound_id,
+            {type} AS type,
+            regexp_replace({name}, '<[^>]+>', '', 'g') AS name
+        FROM raw_names
+    """,
+    "relations": """
+        CREATE TABLE relations AS SELECT
+            CAST({final_id} AS INTEGER) AS subject_id,
+            replace(lower({type}), '_', ' ') AS type,
+            CAST({init_id} AS INTEGER) AS object_id
+        FROM raw_relations
+    """,
+    "accessions": """
+        CREATE TABLE accessions AS SELECT
+            CAST({compound_id} AS INTEGER) AS compound_id,
+            {type} AS type,
+            {accession} AS accession,
+            {source} AS source
+        FROM raw_accessions
+    """,
+    "chemical_data": """
+        CREATE TABLE chemical_data AS SELECT
+            CAST({compound_id} AS INTEGER) AS compound_id,
+            {type} AS type,
+            {value} AS value,
+            {source} AS source
+        FROM raw_chemical_data
+    """,
+    "structures": """
+        CREATE TABLE structures AS SELECT
+            CAST({compound_id} AS INTEGER) AS compound_id,
+            {type} AS type,
+            {structure} AS structure,
+            COALESCE(upper({is_default}) = 'Y', false) AS is_default
+        FROM raw_structures
+        WHERE {type} IN ('SMILES', 'InChI', 'InChIKey')
+    """,
+}
+
+
+def _find_flat_file(source_dir: Path, file_name: str) -> Path:
+    """Locate a release file, plain or gzipped."""
+    for candidate in (source_dir / file_name, source_dir / f"{file_name}.gz"):
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"ChEBI flat file {file_name} not found in {source_dir}")
+
+
+def _read_tsv(path: Path) -> str:
+    """DuckDB table function reading a ChEBI TSV as text (names contain stray quotes, so quoting is off)."""
+    quoted_path = str(path).replace("'", "''")
+    return f"read_csv('{quoted_path}', delim='\t', header=true, quote='', escape='', all_varchar=true)"
+
+
+def _pick_columns(conn: duckdb.DuckDBPyConnection, table: str) -> dict[str, str]:
+    """Map each canonical column to a quoted raw column, matching names case-insensitively."""
+    available = {row[0].lower(): row[0] for row in conn.execute(f"DESCRIBE raw_{table}").fetchall()}
+    columns: dict[str, str] = {}
+    for column, candidates in _COLUMNS[table].items():
+        match = next((available[c] for c in candidates if c in available), None)
+        if match is None:
+            raise ValueError(f"{FLAT_FILES[table]} has no {' or '.join(candidates).upper()} column")
+        columns[column] = f'"{match}"'
+    return columns
+
+
+def _not_found(chebi_numeric: str) -> ChEBILookupError:
+    return ChEBILookupError(
+        query=f"CHEBI:{chebi_numeric}",
+        error_code="NOT_FOUND",
+        error_message=f"ChEBI compound CHEBI:{chebi_numeric} not found",
+    )
@@ -0,0 +1,604 @@
+"""Local stand-in for the PubChem, ChEBI, NodeNorm, OLS and MediaDive APIs.
+
+Serves synthetic (or recorded) JSON on the same URL shapes the clients use,
+so throughput features (caching, coalescing, rate control, concurrency) can
+be exercised and measured offline, e.g. in CI. Each service lives under its
+own path prefix on one aiohttp app; point a client at it with ``base_url``:
+
+    >>> server = FakeApiServer(FaultConfig(latency=0.05, throttle_rate=0.1, seed=1))
+    >>> test_server = TestServer(server.make_app())  # or web.run_app(...)
+    >>> await test_server.start_server()
+    >>> urls = FakeApiServer.base_urls(str(test_server.make_url("")))
+    >>> client = PubChemClient(base_url=urls["pubchem"])
+
+Or run it standalone:
+
+    python -m cmm_ai_automation.clients.fake_server --port 8765 --latency 0.05 --throttle-rate 0.05
+
+Synthetic data is deterministic: every compound name resolves to a compound
+whose CID, ChEBI ID, CAS RN and InChIKey are derived from a hash of the
+name, and IDs looked up first (a CID, a ChEBI ID) get a placeholder compound.
+Once resolved, a compound answers consistently across services, so chains
+like name -> CID -> xrefs -> NodeNorm behave as they would against the real
+APIs. Names or IDs listed in ``FaultConfig.missing`` answer "not found" the
+way each real service does.
+
+Faults are injected per request, in order: fixed plus jittered latency, then
+429 (with Retry-After) at ``throttle_rate``, then 500 at ``error_rate``.
+Recorded responses added with add_response() or load_responses() take
+precedence over the synthetic handlers (but not over fault injection).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import click
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+# Path prefix of each service; a client's base_url is the server root plus this
+SERVICE_PATHS = {
+    "pubchem": "/pubchem/rest/pug",
+    "chebi": "/chebi/backend/api",
+    "nodenorm": "/nodenorm",
+    "ols": "/ols4/api",
+    "mediadive": "/mediadive/rest",
+}
+
+# PubChem PUG-VIEW lives next to PUG-REST, as on the real host
+PUG_VIEW_PATH = f"{SERVICE_PATHS['pubchem']}_view"
+
+# Parent every synthetic ChEBI term hangs under
+ROOT_CHEBI_ID = 24431
+ROOT_CHEBI_LABEL = "chemical entity"
+
+_CHEBI_IRI = re.compile(r"CHEBI_(\d+)")
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclass
+class FaultConfig:
+    """Latency and failure injection for the fake server.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Extra uniformly random latency, up to this many seconds
+        throttle_rate: Fraction of requests answered with 429 Too Many Requests
+        error_rate: Fraction of requests answered with 500 Internal Server Error
+        retry_after: Retry-After header (whole seconds) sent with 429s; None to omit
+        missing: Names, IDs (e.g. "12345") and CURIEs that are "not found"
+        seed: Random seed for reproducible fault patterns
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    retry_after: int | None = 1
+    missing: frozenset[str] = frozenset()
+    seed: int | None = None
+
+
+@dataclass(frozen=True)
+class FakeCompound:
+    """Synthetic compound, shared by all fake services.
+
+    Attributes:
+        name: Preferred name
+        cid: PubChem CID
+        chebi_id: Numeric ChEBI ID
+        cas_rn: CAS Registry Number
+        inchikey: InChIKey
+        formula: Molecular formula
+        mass: Molecular weight
+    """
+
+    name: str
+    cid: int
+    chebi_id: int
+    cas_rn: str
+    inchikey: str
+    formula: str
+    mass: float
+
+    @classmethod
+    def synthesize(cls, name: str, cid: int | None = None, chebi_id: int | None = None) -> "FakeCompound":
+        """Derive a compound deterministically from its name (and any known IDs)."""
+        digest = hashlib.sha256(name.lower().encode()).digest()
+        number = int.from_bytes(digest[:8], "big")
+        letters = "".join(chr(ord("A") + b % 26) for b in digest[8:32])
+        carbons = 1 + number % 20
+        return cls(
+            name=name,
+            cid=cid if cid is not None else 1_000_000 + number % 100_000_000,
+            chebi_id=chebi_id if chebi_id is not None else 100_000 + number % 900_000,
+            cas_rn=_cas_rn(10_000 + number % 9_990_000),
+            inchikey=f"{letters[:14]}-{letters[14:22]}SA-N",
+            formula=f"C{carbons}H{2 * carbons + 2}O{1 + number % 6}",
+            mass=round(12.011 * carbons + 1.008 * (2 * carbons + 2) + 15.999 * (1 + number % 6), 3),
+        )
+
+
+def _cas_rn(number: int) -> str:
+    """Format a number as a CAS RN with a valid check digit."""
+    digits = str(number)
+    check = sum(i * int(d) for i, d in enumerate(reversed(digits), start=1)) % 10
+    return f"{digits[:-2]}-{digits[-2:]}-{check}"
+
+
+class FakeApiServer:
+    """aiohttp application serving the fake APIs.
+
+    Attributes:
+        config: Fault injection settings
+        request_counts: Requests received per service
+        status_counts: Responses sent per status code
+    """
+
+    def __init__(self, config: FaultConfig | None = None, compounds: list[FakeCompound] | None = None):
+        """Initialize the server state.
+
+        Args:
+            config: Fault injection settings (default: no faults)
+            compounds: Compounds to serve instead of synthesized ones (matched by name and IDs)
+        """
+        self.config = config or FaultConfig()
+        self.request_counts: Counter[str] = Counter()
+        self.status_counts: Counter[int] = Counter()
+        self._random = random.Random(self.config.seed)
+        self._responses: dict[tuple[str, str], tuple[int, Any]] = {}
+        self._by_name: dict[str, FakeCompound] = {}
+        self._by_id: dict[str, FakeCompound] = {}
+        for compound in compounds or []:
+            self._register(compound)
+
+    @staticmethod
+    def base_urls(root_url: str) -> dict[str, str]:
+        """Client base URLs for a server running at root_url, keyed by service."""
+        root = root_url.rstrip("/")
+        return {service: f"{root}{path}" for service, path in SERVICE_PATHS.items()}
+
+    def add_response(self, method: str, path: str, body: Any, status: int = 200) -> None:
+        """Serve a recorded JSON body for an exact path (query strings are ignored).
+
+        Args:
+            method: HTTP method, e.g. "GET"
+            path: Full path including the service prefix, e.g. "/mediadive/rest/ingredient/1"
+            body: JSON-serializable response body
+            status: HTTP status code
+        """
+        self._responses[(method.upper(), path)] = (status, body)
+
+    def load_responses(self, path: Path) -> int:
+        """Load recorded responses from a JSON list of {method, path, status, body} objects.
+
+        Returns:
+            Number of responses loaded
+        """
+        with path.open(encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            self.add_response(entry.get("method", "GET"), entry["path"], entry.get("body"), entry.get("status", 200))
+        return len(entries)
+
+    def make_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        pubchem = SERVICE_PATHS["pubchem"]
+        chebi = SERVICE_PATHS["chebi"]
+        ols_terms = f"{SERVICE_PATHS['ols']}/ontologies/chebi/terms/{{iri}}"
+        app.router.add_post(f"{pubchem}/compound/name/cids/JSON", self._pubchem_cids_by_name)
+        app.router.add_post(f"{pubchem}/compound/name/property/{{props}}/JSON", self._pubchem_properties_by_name)
+        app.router.add_get(f"{pubchem}/compound/cid/{{cids}}/property/{{props}}/JSON", self._pubchem_properties)
+        app.router.add_post(f"{pubchem}/compound/cid/property/{{props}}/JSON", self._pubchem_properties)
+        app.router.add_get(f"{pubchem}/compound/cid/{{cids}}/synonyms/JSON", self._pubchem_synonyms)
+        app.router.add_post(f"{pubchem}/compound/cid/synonyms/JSON", self._pubchem_synonyms)
+        app.router.add_get(f"{PUG_VIEW_PATH}/data/compound/{{cid}}/JSON", self._pubchem_view)
+        app.router.add_get(f"{chebi}/public/compound/{{chebi_id}}/", self._chebi_compound)
+        app.router.add_get(f"{chebi}/public/es_search/", self._chebi_search)
+        app.router.add_get(f"{SERVICE_PATHS['nodenorm']}/get_normalized_nodes", self._nodenorm)
+        app.router.add_post(f"{SERVICE_PATHS['nodenorm']}/get_normalized_nodes", self._nodenorm)
+        app.router.add_get(ols_terms, self._ols_term)
+        app.router.add_get(f"{ols_terms}/hierarchicalParents", self._ols_parents)
+        app.router.add_get(f"{SERVICE_PATHS['ols']}/search", self._ols_search)
+        app.router.add_get(f"{SERVICE_PATHS['mediadive']}/ingredient/{{item_id}}", self._mediadive_ingredient)
+        app.router.add_get(f"{SERVICE_PATHS['mediadive']}/solution/{{item_id}}", self._mediadive_solution)
+        return app
+
+    # --- request pipeline ---
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        """Count the request, inject faults, then serve a recorded or synthetic response."""
+        self.request_counts[_service_of(request.path)] += 1
+        response = await self._respond(request, handler)
+        self.status_counts[response.status] += 1
+        return response
+
+    async def _respond(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        config = self.config
+        delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < config.throttle_rate:
+            headers = {"Retry-After": str(config.retry_after)} if config.retry_after is not None else None
+            return web.json_response({"error": "Too Many Requests"}, status=429, headers=headers)
+        if roll < config.throttle_rate + config.error_rate:
+            return web.json_response({"error": "Internal Server Error"}, status=500)
+
+        recorded = self._responses.get((request.method, request.path))
+        if recorded is not None:
+            status, body = recorded
+            return web.json_response(body, status=status)
+        return await handler(request)
+
+    # --- compound catalog ---
+
+    def _register(self, compound: FakeCompound) -> FakeCompound:
+        self._by_name.setdefault(compound.name.lower(), compound)
+        for key in (
+            f"CID:{compound.cid}",
+            f"CHEBI:{compound.chebi_id}",
+            f"CAS:{compound.cas_rn}",
+            f"INCHIKEY:{compound.inchikey}",
+        ):
+            self._by_id.setdefault(key, compound)
+        return compound
+
+    def _is_missing(self, *keys: object) -> bool:
+        return any(str(key) in self.config.missing or str(key).lower() in self.config.missing for key in keys)
+
+    def _named(self, name: str) -> FakeCompound:
+        return self._by_name.get(name.lower()) or self._register(FakeCompound.synthesize(name))
+
+    def _by_compound_name(self, name: str) -> FakeCompound | None:
+        return None if self._is_missing(name) else self._named(name)
+
+    def _by_cid(self, cid: int) -> FakeCompound | None:
+        if self._is_missing(cid, f"CID:{cid}", f"PUBCHEM.COMPOUND:{cid}"):
+            return None
+        return self._by_id.get(f"CID:{cid}") or self._register(FakeCompound.synthesize(f"compound {cid}", cid=cid))
+
+    def _by_chebi_id(self, chebi_id: int) -> FakeCompound | None:
+        if self._is_missing(chebi_id, f"CHEBI:{chebi_id}"):
+            return None
+        return self._by_id.get(f"CHEBI:{chebi_id}") or self._register(
+            FakeCompound.synthesize(f"compound CHEBI:{chebi_id}", chebi_id=chebi_id)
+        )
+
+    def _by_curie(self, curie: str) -> FakeCompound | None:
+        prefix, _, local_id = curie.partition(":")
+        if prefix == "CHEBI" and local_id.isdigit():
+            return self._by_chebi_id(int(local_id))
+        if prefix == "PUBCHEM.COMPOUND" and local_id.isdigit():
+            return self._by_cid(int(local_id))
+        if self._is_missing(curie):
+            return None
+        # CAS RNs and InChIKeys can't be synthesized backwards; only known ones resolve
+        return self._by_id.get(curie)
+
+    # --- PubChem ---
+
+    async def _pubchem_cids_by_name(self, request: web.Request) -> web.Response:
+        compound = self._by_compound_name(str((await request.post()).get("name", "")))
+        if compound is None:
+            return _pubchem_not_found("No CID found")
+        return web.json_response({"IdentifierList": {"CID": [compound.cid]}})
+
+    async def _pubchem_properties_by_name(self, request: web.Request) -> web.Response:
+        compound = self._by_compound_name(str((await request.post()).get("name", "")))
+        if compound is None:
+            return _pubchem_not_found("No CID found")
+        return _property_table([compound], request.match_info["props"])
+
+    async def _pubchem_properties(self, request: web.Request) -> web.Response:
+        compounds = [c for cid in await _pubchem_cids(request) if (c := self._by_cid(cid)) is not None]
+        if not compounds:
+            return _pubchem_not_found("No records found")
+        return _property_table(compounds, request.match_info["props"])
+
+    async def _pubchem_synonyms(self, request: web.Request) -> web.Response:
+        compounds = [c for cid in await _pubchem_cids(request) if (c := self._by_cid(cid)) is not None]
+        if not compounds:
+            return _pubchem_not_found("No records found")
+        information = [{"CID": c.cid, "Synonym": [c.name, c.cas_rn, f"CHEBI:{c.chebi_id}"]} for c in compounds]
+        return web.json_response({"InformationList": {"Information": information}})
+
+    async def _pubchem_view(self, request: web.Request) -> web.Response:
+        compound = self._by_cid(_int_or_zero(request.match_info["cid"]))
+        if compound is None:
+            return _pubchem_not_found("No record data found")
+        identifiers = [
+            ("CAS", compound.cas_rn),
+            ("ChEBI ID", f"CHEBI:{compound.chebi_id}"),
+            ("Wikidata", f"Q{compound.cid}"),
+        ]
+        section = {
+            "TOCHeading": "Names and Identifiers",
+            "Section": [
+                {
+                    "TOCHeading": "Other Identifiers",
+                    "Section": [
+                        {"TOCHeading": heading, "Information": [{"Value": {"StringWithMarkup": [{"String": value}]}}]}
+                        for heading, value in identifiers
+                    ],
+                }
+            ],
+        }
+        record = {"RecordType": "CID", "RecordNumber": compound.cid, "Section": [section]}
+        return web.json_response({"Record": record})
+
+    # --- ChEBI ---
+
+    async def _chebi_compound(self, request: web.Request) -> web.Response:
+        compound = self._by_chebi_id(_int_or_zero(request.match_info["chebi_id"]))
+        if compound is None:
+            return web.json_response({"detail": "Not found."}, status=404)
+        return web.json_response(
+            {
+                "chebi_accession": f"CHEBI:{compound.chebi_id}",
+                "name": compound.name,
+                "ascii_name": compound.name,
+                "definition": f"Synthetic compound {compound.name}.",
+                "stars": 3,
+                "chemical_data": {
+                    "formula": compound.formula,
+                    "mass": str(compound.mass),
+                    "monoisotopic_mass": str(compound.mass),
+                    "charge": 0,
+                },
+                "names": {"SYNONYM": [{"ascii_name": compound.name.upper()}]},
+                "database_accessions": {"CAS": [{"accession_number": compound.cas_rn, "source_name": "ChemIDplus"}]},
+                "ontology_relations": {
+                    "outgoing_relations": [
+                        {"relation_type": "is a", "final_id": ROOT_CHEBI_ID, "final_name": ROOT_CHEBI_LABEL}
+                    ],
+                    "incoming_relations": [],
+                },
+                "secondary_ids": [],
+            }
+        )
+
+    async def _chebi_search(self, request: web.Request) -> web.Response:
+        compound = self._by_compound_name(request.query.get("term", ""))
+        if compound is None:
+            return web.json_response({"results": [], "total": 0})
+        source = {
+            "chebi_accession": f"CHEBI:{compound.chebi_id}",
+            "name": compound.name,
+            "ascii_name": compound.name,
+            "stars": 3,
+            "formula": compound.formula,
+            "mass": compound.mass,
+        }
+        return web.json_response({"results": [{"_source": source, "_score": 1.0}], "total": 1})
+
+    # --- NodeNorm ---
+
+    async def _nodenorm(self, request: web.Request) -> web.Response:
+        if request.method == "POST":
+            curies = (await request.json()).get("curies", [])
+        else:
+            curies = request.query.getall("curie", [])
+        return web.json_response({curie: self._normalized_node(curie) for curie in curies})
+
+    def _normalized_node(self, curie: str) -> dict[str, Any] | None:
+        compound = self._by_curie(curie)
+        if compound is None:
+            return None
+        identifiers = [
+            f"CHEBI:{compound.chebi_id}",
+            f"PUBCHEM.COMPOUND:{compound.cid}",
+            f"CAS:{compound.cas_rn}",
+            f"INCHIKEY:{compound.inchikey}",
+        ]
+        return {
+            "id": {"identifier": identifiers[0], "label": compound.name},
+            "equivalent_identifiers": [{"identifier": i, "label": compound.name} for i in identifiers],
+            "type": ["biolink:SmallMolecule", "biolink:ChemicalEntity", "biolink:NamedThing"],
+        }
+
+    # --- OLS ---
+
+    async def _ols_term(self, request: web.Request) -> web.Response:
+        compound = self._ols_compound(request)
+        if compound is None:
+            return web.json_response({"status": 404, "error": "Not Found"}, status=404)
+        return web.json_response(
+            {
+                "iri": f"http://purl.obolibrary.org/obo/CHEBI_{compound.chebi_id}",
+                "label": compound.name,
+                "description": [f"Synthetic compound {compound.name}."],
+                "synonyms": [compound.name.upper()],
+                "is_obsolete": False,
+                "annotation": {
+                    "inchikey": [compound.inchikey],
+                    "formula": [compound.formula],
+                    "mass": [str(compound.mass)],
+                    "charge": ["0"],
+                    "star": ["3"],
+                    "database_cross_reference": [f"CAS:{compound.cas_rn}"],
+                },
+            }
+        )
+
+    async def _ols_parents(self, request: web.Request) -> web.Response:
+        if self._ols_compound(request) is None:
+            return web.json_response({"status": 404, "error": "Not Found"}, status=404)
+        parent = {"short_form": f"CHEBI_{ROOT_CHEBI_ID}", "label": ROOT_CHEBI_LABEL}
+        return web.json_response({"_embedded": {"terms": [parent]}})
+
+    def _ols_compound(self, request: web.Request) -> FakeCompound | None:
+        match = _CHEBI_IRI.search(request.match_info["iri"])
+        return self._by_chebi_id(int(match.group(1))) if match else None
+
+    async def _ols_search(self, request: web.Request) -> web.Response:
+        compound = self._by_compound_name(request.query.get("q", ""))
+        docs = []
+        if compound is not None:
+            docs.append(
+                {
+                    "iri": f"http://purl.obolibrary.org/obo/CHEBI_{compound.chebi_id}",
+                    "label": compound.name,
+                    "short_form": f"CHEBI_{compound.chebi_id}",
+                    "obo_id": f"CHEBI:{compound.chebi_id}",
+                    "ontology_name": "chebi",
+                    "description": [f"Synthetic compound {compound.name}."],
+                    "is_obsolete": False,
+                }
+            )
+        return web.json_response({"response": {"numFound": len(docs), "start": 0, "docs": docs}})
+
+    # --- MediaDive ---
+
+    async def _mediadive_ingredient(self, request: web.Request) -> web.Response:
+        item_id = _int_or_zero(request.match_info["item_id"])
+        if self._is_missing(item_id, f"ingredient/{item_id}") or not item_id:
+            return web.json_response({"status": 404, "msg": "Ingredient not found"})
+        compound = self._named(f"ingredient {item_id}")
+        return web.json_response(
+            {
+                "status": 200,
+                "data": {
+                    "id": item_id,
+                    "name": compound.name,
+                    "CAS-RN": compound.cas_rn,
+                    "ChEBI": compound.chebi_id,
+                    "PubChem": compound.cid,
+                    "KEGG-Compound": None,
+                    "formula": compound.formula,
+                    "mass": compound.mass,
+                    "complex_compound": 0,
+                    "synonyms": [],
+                    "media": [],
+                },
+            }
+        )
+
+    async def _mediadive_solution(self, request: web.Request) -> web.Response:
+        item_id = _int_or_zero(request.match_info["item_id"])
+        if self._is_missing(item_id, f"solution/{item_id}") or not item_id:
+            return web.json_response({"status": 404, "msg": "Solution not found"})
+        recipe = [
+            {
+                "recipe_order": order,
+                "compound": f"ingredient {compound_id}",
+                "compound_id": compound_id,
+                "amount": 1.0,
+                "unit": "g",
+                "g_l": 1.0,
+            }
+            for order, compound_id in enumerate((item_id, item_id + 1), start=1)
+        ]
+        return web.json_response(
+            {"status": 200, "data": {"id": item_id, "name": f"solution {item_id}", "volume": 1000, "recipe": recipe}}
+        )
+
+
+def _service_of(path: str) -> str:
+    """Service a request path belongs to ("other" if none)."""
+    if path.startswith(PUG_VIEW_PATH):
+        return "pubchem"
+    for service, prefix in SERVICE_PATHS.items():
+        if path.startswith(f"{prefix}/"):
+            return service
+    return "other"
+
+
+def _int_or_zero(value: str) -> int:
+    return int(value) if value.isdigit() else 0
+
+
+async def _pubchem_cids(request: web.Request) -> list[int]:
+    """CIDs of a PubChem request, from the path or the POST body."""
+    raw = request.match_info.get("cids") or str((await request.post()).get("cid", ""))
+    return [int(cid) for cid in raw.split(",") if cid.strip().isdigit()]
+
+
+def _pubchem_not_found(message: str) -> web.Response:
+    return web.json_response({"Fault": {"Code": "PUGREST.NotFound", "Message": message}}, status=404)
+
+
+def _property_table(compounds: list[FakeCompound], props: str) -> web.Response:
+    """PubChem PropertyTable response with the requested properties."""
+    wanted = set(props.split(","))
+    rows = []
+    for compound in compounds:
+        smiles = "C" * (1 + compound.cid % 6) + "O"
+        values = {
+            "MolecularFormula": compound.formula,
+            "MolecularWeight": str(compound.mass),
+            "ConnectivitySMILES": smiles,
+            "SMILES": smiles,
+            "InChI": f"InChI=1S/{compound.formula}",
+            "InChIKey": compound.inchikey,
+            "IUPACName": compound.name,
+            "Title": compound.name,
+            "ExactMass": str(compound.mass),
+            "MonoisotopicMass": str(compound.mass),
+            "Charge": 0,
+            "XLogP": -1.0,
+        }
+        rows.append({"CID": compound.cid, **{k: v for k, v in values.items() if k in wanted}})
+    return web.json_response({"PropertyTable": {"Properties": rows}})
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to bind")
+@click.option("--port", default=8765, show_default=True, help="Port to listen on")
+@click.option("--latency", default=0.0, show_default=True, help="Seconds added to every response")
+@click.option("--jitter", default=0.0, show_default=True, help="Extra random latency, up to this many seconds")
+@click.option("--throttle-rate", default=0.0, show_default=True, help="Fraction of requests answered with 429")
+@click.option("--error-rate", default=0.0, show_default=True, help="Fraction of requests answered with 500")
+@click.option("--retry-after", default=1, show_default=True, help="Retry-After seconds sent with 429s")
+@click.option("--seed", type=int, default=None, help="Random seed for reproducible faults")
+@click.option(
+    "--responses",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="JSON file of recorded responses ([{method, path, status, body}, ...])",
+)
+def main(
+    host: str,
+    port: int,
+    latency: float,
+    jitter: float,
+    throttle_rate: float,
+    error_rate: float,
+    retry_after: int,
+    seed: int | None,
+    responses: Path | None,
+) -> None:
+    """Run the fake API server until interrupted."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    config = FaultConfig(
+        latency=latency,
+        jitter=jitter,
+        throttle_rate=throttle_rate,
+        error_rate=error_rate,
+        retry_after=retry_after,
+        seed=seed,
+    )
+    server = FakeApiServer(config)
+    if responses is not None:
+        logger.info(f"Loaded {server.load_responses(responses)} recorded responses from {responses}")
+    for service, url in FakeApiServer.base_urls(f"http://{host}:{port}").items():
+        logger.info(f"{service}: {url}")
+    web.run_app(server.make_app(), host=host, port=port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Append-only JSON Lines key/value cache.
+
+A dict-like cache persisted as one JSON object per line::
+
+    {"k": "ingredient:1", "v": {...}}
+    {"k": "ingredient:2", "d": true}      # deletion
+
+Each write appends a single line, so persisting an entry costs the same no
+matter how large the cache is, and a crash can at worst truncate the last
+line (which is skipped on load). The file is read lazily on the first
+lookup, and the last line for a key wins.
+
+Overwritten and deleted entries leave stale lines behind. Once they
+outnumber the live entries (and exceed ``compact_min_stale``), the file is
+compacted in a background thread: the live entries are written to a
+temporary file, which atomically replaces the log. Writes made while a
+compaction runs are carried over.
+
+Example:
+    >>> cache = JsonlCache(Path("cache/mediadive.jsonl"))
+    >>> cache["ingredient:1"] = {"id": 1, "name": "Peptone"}
+    >>> "ingredient:1" in cache
+    True
+    >>> cache.close()
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any, TextIO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_MIN_STALE = 1000
+
+
+class JsonlCache(MutableMapping[str, Any]):
+    """Dict-like cache backed by an append-only JSONL file.
+
+    Thread-safe. Call close() (or use it as a context manager) to finish a
+    running compaction and close the file.
+    """
+
+    def __init__(self, path: Path, compact_min_stale: int = DEFAULT_COMPACT_MIN_STALE):
+        """Open a cache file; nothing is read until the first lookup.
+
+        Args:
+            path: JSONL file (created on first write)
+            compact_min_stale: Minimum number of stale lines before a compaction is started
+        """
+        self.path = path
+        self.compact_min_stale = compact_min_stale
+        self._lock = threading.RLock()
+        self._data: dict[str, Any] | None = None
+        self._stale = 0
+        self._file: TextIO | None = None
+        self._compaction: threading.Thread | None = None
+        self._compact_lock = threading.Lock()
+        # Lines appended while a compaction is running, replayed onto the compacted file
+        self._pending: list[str] | None = None
+
+    def _entries(self) -> dict[str, Any]:
+        """Live entries, loading the file on first use. Caller holds the lock."""
+        if self._data is None:
+            self._data, self._stale = _read_log(self.path)
+            logger.debug(f"Loaded {len(self._data)} cached entries from {self.path}")
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            return self._entries()[key]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries())
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries()))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        line = json.dumps({"k": key, "v": value}, separators=(",", ":"))
+        with self._lock:
+            entries = self._entries()
+            if key in entries:
+                self._stale += 1
+            entries[key] = value
+            self._append(line)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            entries = self._entries()
+            del entries[key]
+            self._stale += 2  # the old value and the tombstone
+            self._append(json.dumps({"k": key, "d": True}, separators=(",", ":")))
+
+    def _append(self, line: str) -> None:
+        """Write one line and start a compaction if due. Caller holds the lock."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            torn = _ends_without_newline(self.path)
+            self._file = self.path.open("a", encoding="utf-8")
+            if torn:
+                # Don't glue the first new entry onto a torn last line
+                self._file.write("\n")
+        self._file.write(line + "\n")
+        self._file.flush()
+        if self._pending is not None:
+            self._pending.append(line)
+        elif self._stale >= self.compact_min_stale and self._stale > len(self._entries()):
+            self._pending = []
+            self._compaction = threading.Thread(target=self.compact, name="jsonl-cache-compact", daemon=True)
+            self._compaction.start()
+
+    def compact(self) -> None:
+        """Rewrite the file with only the live entries.
+
+        Runs in a background thread when stale lines pile up; may also be
+        called directly.
+        """
+        with self._compact_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            snapshot = dict(self._entries())
+            if self._pending is None:
+                self._pending = []
+        tmp_path = self.path.with_name(self.path.name + ".compact")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                for key, value in snapshot.items():
+                    f.write(json.dumps({"k": key, "v": value}, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            with self._lock:
+                # Replay writes made during the snapshot, then swap the files
+                with tmp_path.open("a", encoding="utf-8") as f:
+                    for line in self._pending or []:
+                        f.write(line + "\n")
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                tmp_path.replace(self.path)
+                self._stale = len(self._pending or [])
+                logger.debug(f"Compacted {self.path} to {len(snapshot)} entries")
+        except OSError as e:
+            logger.warning(f"Failed to compact cache {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def flush(self) -> None:
+        """Flush buffered writes to the operating system."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Wait for a running compaction and close the file."""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "JsonlCache":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+def _ends_without_newline(path: Path) -> bool:
+    """Whether a non-empty file's last byte is not a newline."""
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    with path.open("rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def _read_log(path: Path) -> tuple[dict[str, Any], int]:
+    """Replay a cache log into (live entries, number of stale lines)."""
+    entries: dict[str, Any] = {}
+    lines = 0
+    if not path.exists():
+        return entries, 0
+    with path.open(encoding="utf-8") as f:
+        for raw_line in f:
+            try:
+                record = json.loads(raw_line)
+                key = record["k"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # A torn write from a crash; everything before it is intact
+                logger.debug(f"Skipping unreadable line in {path}")
+                continue
+            lines += 1
+            if record.get("d"):
+                entries.pop(key, None)
+            else:
+                entries[key] = record.get("v")
+    return entries, lines - len(entries)
@@ -13,13 +13,18 @@ References:
 
 import json
 import logging
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 
+from cmm_ai_automation.clients.base import HTTPClientBase
+from cmm_ai_automation.clients.jsonl_cache import JsonlCache
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
 logger = logging.getLogger(__name__)
 
 # MediaDive API base URL
@@ -137,7 +142,7 @@ class MediaDiveLookupError:
     error_message: str
 
 
-class MediaDiveClient:
+class MediaDiveClient(HTTPClientBase):
     """Client for DSMZ MediaDive REST API.
 
     MediaDive provides information about microbiology cultivation media,
@@ -145,7 +150,11 @@ class MediaDiveClient:
 
     No API key is required.
 
-    Supports optional JSON file caching to avoid redundant API calls.
+    Supports optional file caching to avoid redundant API calls. A ``.json``
+    cache file is loaded whole and rewritten by save_cache(); a ``.jsonl``
+    cache file is append-only: entries are written as they are fetched,
+    the file is read lazily on the first lookup and compacted in the
+    background, so save_cache() is not needed.
 
     Example:
         >>> client = MediaDiveClient()
@@ -158,36 +167,37 @@ class MediaDiveClient:
         >>> client = MediaDiveClient(cache_file=Path("mediadive_cache.json"))
         >>> result = client.get_ingredient(1)  # Fetches from API
         >>> result = client.get_ingredient(1)  # Returns cached result
+
+    Example with incremental caching:
+        >>> with MediaDiveClient(cache_file=Path("mediadive_cache.jsonl")) as client:
+        ...     result = client.get_ingredient(1)  # Persisted immediately
     """
 
+    BASE_URL = BASE_URL
+
     def __init__(
         self,
         rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY,
         timeout: float = 30.0,
         cache_file: Path | None = None,
+        base_url: str | None = None,
     ):
         """Initialize MediaDive client.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 0.25)
             timeout: Request timeout in seconds (default: 30)
-            cache_file: Optional path to JSON cache file
+            cache_file: Optional path to a JSON (``.json``) or append-only
+                JSON Lines (``.jsonl``) cache file
+            base_url: API base URL override (e.g., a local fake server)
         """
-        self.rate_limit_delay = rate_limit_delay
-        self.timeout = timeout
+        super().__init__(rate_limit_delay=rate_limit_delay, timeout=timeout, base_url=base_url)
         self.cache_file = cache_file
-        self._cache: dict[str, Any] = {}
-        self._last_request_time: float = 0
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)",
-            }
-        )
+        self._cache: MutableMapping[str, Any] = {}
 
-        # Load cache from file if provided
-        if cache_file and cache_file.exists():
+        if cache_file and cache_file.suffix == ".jsonl":
+            self._cache = JsonlCache(cache_file)
+        elif cache_file and cache_file.exists():
             self._load_cache()
 
     def _load_cache(self) -> None:
@@ -202,168 +212,158 @@ class MediaDiveClient:
                 self._cache = {}
 
     def save_cache(self) -> None:
-        """Save cache to JSON file."""
-        if self.cache_file:
+        """Save cache to JSON file (JSONL caches are already persisted; this just flushes)."""
+        if isinstance(self._cache, JsonlCache):
+            self._cache.flush()
+        elif self.cache_file:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
             with self.cache_file.open("w", encoding="utf-8") as f:
                 json.dump(self._cache, f, indent=2)
             logger.debug(f"Saved {len(self._cache)} entries to cache: {self.cache_file}")
 
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+    def close(self) -> None:
+        """Close the session and the JSONL cache file, if any."""
+        if isinstance(self._cache, JsonlCache):
+            self._cache.close()
+        super().close()
 
-    def _get(self, endpoint: str) -> dict[str, Any]:
-        """Make a GET request with rate limiting.
+    def _fetch(self, endpoint: str) -> dict[str, Any] | MediaDiveLookupError:
+        """Fetch a record from the cache or the API.
 
         Args:
-            endpoint: API endpoint (relative to BASE_URL)
+            endpoint: API endpoint relative to BASE_URL (e.g., "ingredient/1")
 
         Returns:
-            Parsed JSON response
-
-        Raises:
-            requests.RequestException: On network errors
+            Record data on success, MediaDiveLookupError on failure
         """
-        url = f"{BASE_URL}/{endpoint}"
-        self._wait_for_rate_limit()
-        logger.debug(f"GET {url}")
-        response = self._session.get(url, timeout=self.timeout)
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+        cached = self._cached_record(endpoint)
+        if cached is not None:
+            return cached
 
-    def get_ingredient(self, ingredient_id: int) -> IngredientResult | MediaDiveLookupError:
-        """Get an ingredient by its MediaDive ID.
+        try:
+            data = self._get_json(f"{self.BASE_URL}/{endpoint}")
+        except requests.RequestException as e:
+            return self._cache_error(endpoint, e)
+        return self._cache_response(endpoint, data)
 
-        Results are cached if a cache_file was provided to the client.
+    async def _afetch(self, endpoint: str) -> dict[str, Any] | MediaDiveLookupError:
+        """Async version of _fetch()."""
+        cached = self._cached_record(endpoint)
+        if cached is not None:
+            return cached
 
-        Args:
-            ingredient_id: MediaDive ingredient ID
+        try:
+            data = await self.aget_json(f"{self.BASE_URL}/{endpoint}")
+        except requests.RequestException as e:
+            return self._cache_error(endpoint, e)
+        return self._cache_response(endpoint, data)
+
+    def _cached_record(self, endpoint: str) -> dict[str, Any] | MediaDiveLookupError | None:
+        """Return the cached record or error for an endpoint, or None on a cache miss."""
+        cache_key = _cache_key(endpoint)
+        if cache_key not in self._cache:
+            return None
+        cached: dict[str, Any] = self._cache[cache_key]
+        if cached.get("_error"):
+            return MediaDiveLookupError(
+                query=endpoint,
+                error_code=cached.get("error_code", "CACHED_ERROR"),
+                error_message=cached.get("error_message", "Cached error"),
+            )
+        return cached
 
-        Returns:
-            IngredientResult on success, MediaDiveLookupError on failure
-        """
-        cache_key = f"ingredient:{ingredient_id}"
-
-        # Check cache first
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            if cached.get("_error"):
-                return MediaDiveLookupError(
-                    query=f"ingredient/{ingredient_id}",
-                    error_code=cached.get("error_code", "CACHED_ERROR"),
-                    error_message=cached.get("error_message", "Cached error"),
-                )
-            return self._parse_ingredient(cached)
+    def _cache_error(self, endpoint: str, e: requests.RequestException) -> MediaDiveLookupError:
+        """Convert a request exception into a MediaDiveLookupError.
 
-        try:
-            data = self._get(f"ingredient/{ingredient_id}")
-        except requests.HTTPError as e:
+        HTTP errors are cached to avoid repeated failed lookups; transient
+        network errors are not.
+        """
+        if isinstance(e, requests.HTTPError):
             error = MediaDiveLookupError(
-                query=f"ingredient/{ingredient_id}",
+                query=endpoint,
                 error_code=str(e.response.status_code),
                 error_message=str(e),
             )
-            # Cache errors too (to avoid repeated failed lookups)
-            self._cache[cache_key] = {
-                "_error": True,
-                "error_code": error.error_code,
-                "error_message": error.error_message,
-            }
+            self._store_error(endpoint, error)
             return error
-        except requests.RequestException as e:
-            return MediaDiveLookupError(
-                query=f"ingredient/{ingredient_id}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+        return MediaDiveLookupError(
+            query=endpoint,
+            error_code="REQUEST_ERROR",
+            error_message=str(e),
+        )
 
+    def _cache_response(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any] | MediaDiveLookupError:
+        """Cache an API response and return its record data.
+
+        MediaDive reports missing records as HTTP 200 with ``"status": 404`` in the body.
+        """
         if data.get("status") == 404:
+            kind = endpoint.split("/", 1)[0].capitalize()
             error = MediaDiveLookupError(
-                query=f"ingredient/{ingredient_id}",
+                query=endpoint,
                 error_code="NOT_FOUND",
-                error_message=data.get("msg", "Ingredient not found"),
+                error_message=data.get("msg", f"{kind} not found"),
             )
-            self._cache[cache_key] = {
-                "_error": True,
-                "error_code": error.error_code,
-                "error_message": error.error_message,
-            }
+            self._store_error(endpoint, error)
             return error
 
-        # Cache the successful result
-        ingredient_data = data.get("data", {})
-        self._cache[cache_key] = ingredient_data
+        record: dict[str, Any] = data.get("data", {})
+        self._cache[_cache_key(endpoint)] = record
+        return record
 
-        return self._parse_ingredient(ingredient_data)
+    def _store_error(self, endpoint: str, error: MediaDiveLookupError) -> None:
+        """Cache a failed lookup."""
+        self._cache[_cache_key(endpoint)] = {
+            "_error": True,
+            "error_code": error.error_code,
+            "error_message": error.error_message,
+        }
 
-    def get_solution(self, solution_id: int) -> SolutionResult | MediaDiveLookupError:
-        """Get a solution by its MediaDive ID.
+    def get_ingredient(self, ingredient_id: int) -> IngredientResult | MediaDiveLookupError:
+        """Get an ingredient by its MediaDive ID.
 
         Results are cached if a cache_file was provided to the client.
 
         Args:
-            solution_id: MediaDive solution ID
+            ingredient_id: MediaDive ingredient ID
 
         Returns:
-            SolutionResult on success, MediaDiveLookupError on failure
+            IngredientResult on success, MediaDiveLookupError on failure
         """
-        cache_key = f"solution:{solution_id}"
-
-        # Check cache first
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            if cached.get("_error"):
-                return MediaDiveLookupError(
-                    query=f"solution/{solution_id}",
-                    error_code=cached.get("error_code", "CACHED_ERROR"),
-                    error_message=cached.get("error_message", "Cached error"),
-                )
-            return self._parse_solution(cached)
+        data = self._fetch(f"ingredient/{ingredient_id}")
+        if isinstance(data, MediaDiveLookupError):
+            return data
+        return self._parse_ingredient(data)
+
+    async def aget_ingredient(self, ingredient_id: int) -> IngredientResult | MediaDiveLookupError:
+        """Async version of get_ingredient()."""
+        data = await self._afetch(f"ingredient/{ingredient_id}")
+        if isinstance(data, MediaDiveLookupError):
+            return data
+        return self._parse_ingredient(data)
 
-        try:
-            data = self._get(f"solution/{solution_id}")
-        except requests.HTTPError as e:
-            error = MediaDiveLookupError(
-                query=f"solution/{solution_id}",
-                error_code=str(e.response.status_code),
-                error_message=str(e),
-            )
-            self._cache[cache_key] = {
-                "_error": True,
-                "error_code": error.error_code,
-                "error_message": error.error_message,
-            }
-            return error
-        except requests.RequestException as e:
-            return MediaDiveLookupError(
-                query=f"solution/{solution_id}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+    def get_solution(self, solution_id: int) -> SolutionResult | MediaDiveLookupError:
+        """Get a solution by its MediaDive ID.
 
-        if data.get("status") == 404:
-            error = MediaDiveLookupError(
-                query=f"solution/{solution_id}",
-                error_code="NOT_FOUND",
-                error_message=data.get("msg", "Solution not found"),
-            )
-            self._cache[cache_key] = {
-                "_error": True,
-                "error_code": error.error_code,
-                "error_message": error.error_message,
-            }
-            return error
+        Results are cached if a cache_file was provided to the client.
 
-        # Cache the successful result
-        solution_data = data.get("data", {})
-        self._cache[cache_key] = solution_data
+        Args:
+            solution_id: MediaDive solution ID
 
-        return self._parse_solution(solution_data)
+        Returns:
+            SolutionResult on success, MediaDiveLookupError on failure
+        """
+        data = self._fetch(f"solution/{solution_id}")
+        if isinstance(data, MediaDiveLookupError):
+            return data
+        return self._parse_solution(data)
+
+    async def aget_solution(self, solution_id: int) -> SolutionResult | MediaDiveLookupError:
+        """Async version of get_solution()."""
+        data = await self._afetch(f"solution/{solution_id}")
+        if isinstance(data, MediaDiveLookupError):
+            return data
+        return self._parse_solution(data)
 
     def search_ingredients_by_name(self, name: str) -> list[IngredientResult] | MediaDiveLookupError:
         """Search for ingredients by name.
@@ -441,6 +441,11 @@ class MediaDiveClient:
         )
 
 
+def _cache_key(endpoint: str) -> str:
+    """Cache key for an endpoint, e.g. "ingredient/1" -> "ingredient:1"."""
+    return endpoint.replace("/", ":", 1)
+
+
 # Well-known MediaDive ingredient IDs for common media components
 # These can be used for direct lookups without searching
 KNOWN_INGREDIENTS = {
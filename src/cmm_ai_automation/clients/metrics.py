@@ -0,0 +1,321 @@
+"""In-process request metrics for API clients.
+
+Every request sent through HTTPClientBase (and the NCBI E-utilities helpers)
+is counted in a process-wide registry, labelled by client, host and
+endpoint:
+
+- requests by status code, response bytes and a latency histogram
+- network errors by exception type
+- throttling retries and time spent waiting for the rate limiter
+- response cache hits and misses
+
+Endpoints are path templates relative to the client's BASE_URL, limited to
+two segments with ID-like segments replaced by ``{id}`` (e.g.
+``compound/name``, ``ingredient/{id}``), so the number of series stays
+small however many lookups a run makes.
+
+At the end of a run, dump the registry as JSON or Prometheus text:
+
+    >>> get_metrics().write(Path("metrics.prom"))  # or metrics.json
+"""
+
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf)
+
+# Path segments kept in endpoint labels
+ENDPOINT_SEGMENTS = 2
+
+# Numbers, CURIEs, CAS numbers, ...; not version-like segments such as "ols4" or "v1"
+_ID_SEGMENT = re.compile(r"^\d+$|\d{2,}|:")
+
+
+def endpoint_label(url: str, base_url: str = "") -> str:
+    """Reduce a request URL to a low-cardinality endpoint label.
+
+    Args:
+        url: Request URL
+        base_url: Client base URL; its path is stripped from the label
+
+    Returns:
+        Label such as "compound/name" or "ingredient/{id}" ("/" for the base itself)
+    """
+    path = urlsplit(url).path
+    base_path = urlsplit(base_url).path.rstrip("/") if base_url else ""
+    if base_path and (path == base_path or path.startswith(base_path + "/")):
+        path = path[len(base_path) :]
+    segments = [s for s in path.split("/") if s][:ENDPOINT_SEGMENTS]
+    return "/".join("{id}" if _ID_SEGMENT.search(s) else s for s in segments) or "/"
+
+
+@dataclass
+class Histogram:
+    """Latency histogram with per-bucket (non-cumulative) counts.
+
+    Attributes:
+        bounds: Bucket upper bounds in seconds (the last one is +inf)
+        counts: Observations per bucket
+        total: Sum of all observations
+    """
+
+    bounds: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    total: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        count = self.count
+        if not count:
+            return None
+        rank = q * count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts, strict=True):
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters for one (client, host, endpoint) series.
+
+    Updated through MetricsRegistry, which holds the lock.
+    """
+
+    client: str
+    host: str
+    endpoint: str
+    status_codes: dict[int, int] = field(default_factory=dict)
+    response_bytes: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    errors: dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    rate_limit_wait: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Requests that got a response."""
+        return sum(self.status_codes.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary of the series (JSON-serializable)."""
+        lookups = self.cache_hits + self.cache_misses
+        p50 = self.latency.quantile(0.5)
+        p95 = self.latency.quantile(0.95)
+        return {
+            "client": self.client,
+            "host": self.host,
+            "endpoint": self.endpoint,
+            "requests": self.requests,
+            "status_codes": {str(code): n for code, n in sorted(self.status_codes.items())},
+            "response_bytes": self.response_bytes,
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "rate_limit_wait_seconds": round(self.rate_limit_wait, 6),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": self.cache_hits / lookups if lookups else None,
+            "latency_seconds": {
+                "count": self.latency.count,
+                "sum": round(self.latency.total, 6),
+                "mean": self.latency.total / self.latency.count if self.latency.count else None,
+                "p50": None if p50 is None or math.isinf(p50) else p50,
+                "p95": None if p95 is None or math.isinf(p95) else p95,
+                "buckets": {_format_bound(b): n for b, n in zip(self.latency.bounds, self.latency.counts, strict=True)},
+            },
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe collection of EndpointMetrics, keyed by (client, host, endpoint)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str, str], EndpointMetrics] = {}
+
+    def _get(self, client: str, host: str, endpoint: str) -> EndpointMetrics:
+        """Series for the labels, created if needed. Caller holds the lock."""
+        key = (client, host, endpoint)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = EndpointMetrics(client, host, endpoint)
+        return series
+
+    def record_response(
+        self, client: str, host: str, endpoint: str, status_code: int, nbytes: int, latency: float
+    ) -> None:
+        """Record a response (including error statuses)."""
+        with self._lock:
+            series = self._get(client, host, endpoint)
+            series.status_codes[status_code] = series.status_codes.get(status_code, 0) + 1
+            series.response_bytes += nbytes
+            series.latency.observe(latency)
+
+    def record_error(self, client: str, host: str, endpoint: str, error: BaseException) -> None:
+        """Record a request that failed without a response."""
+        kind = type(error).__name__
+        with self._lock:
+            series = self._get(client, host, endpoint)
+            series.errors[kind] = series.errors.get(kind, 0) + 1
+
+    def record_retry(self, client: str, host: str, endpoint: str) -> None:
+        """Record a retry of a throttled request."""
+        with self._lock:
+            self._get(client, host, endpoint).retries += 1
+
+    def record_rate_limit_wait(self, client: str, host: str, endpoint: str, seconds: float) -> None:
+        """Record time spent waiting for the rate limiter."""
+        with self._lock:
+            self._get(client, host, endpoint).rate_limit_wait += seconds
+
+    def record_cache(self, client: str, host: str, endpoint: str, hits: int = 0, misses: int = 0) -> None:
+        """Record cache lookups."""
+        with self._lock:
+            series = self._get(client, host, endpoint)
+            series.cache_hits += hits
+            series.cache_misses += misses
+
+    def series(self) -> list[EndpointMetrics]:
+        """All series, sorted by labels."""
+        with self._lock:
+            return [self._series[key] for key in sorted(self._series)]
+
+    def total_calls(self) -> int:
+        """API requests sent so far: responses and failed requests (response cache hits are not counted)."""
+        with self._lock:
+            return sum(series.requests + sum(series.errors.values()) for series in self._series.values())
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._series.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """All series plus per-client totals (JSON-serializable)."""
+        with self._lock:
+            endpoints = [self._series[key].to_dict() for key in sorted(self._series)]
+        clients: dict[str, dict[str, Any]] = {}
+        for entry in endpoints:
+            totals = clients.setdefault(
+                entry["client"],
+                {
+                    "requests": 0,
+                    "response_bytes": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "rate_limit_wait_seconds": 0.0,
+                    "cache_hits": 0,
+                    "cache_misses": 0,
+                    "latency_seconds_sum": 0.0,
+                },
+            )
+            totals["requests"] += entry["requests"]
+            totals["response_bytes"] += entry["response_bytes"]
+            totals["errors"] += sum(entry["errors"].values())
+            totals["retries"] += entry["retries"]
+            totals["rate_limit_wait_seconds"] += entry["rate_limit_wait_seconds"]
+            totals["cache_hits"] += entry["cache_hits"]
+            totals["cache_misses"] += entry["cache_misses"]
+            totals["latency_seconds_sum"] += entry["latency_seconds"]["sum"]
+        return {"clients": clients, "endpoints": endpoints}
+
+    def to_json(self) -> str:
+        """Render as indented JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text exposition format."""
+        families: dict[str, tuple[str, str, list[str]]] = {
+            "requests": ("cmm_http_requests_total", "counter", []),
+            "bytes": ("cmm_http_response_bytes_total", "counter", []),
+            "errors": ("cmm_http_errors_total", "counter", []),
+            "retries": ("cmm_http_retries_total", "counter", []),
+            "wait": ("cmm_http_rate_limit_wait_seconds_total", "counter", []),
+            "cache": ("cmm_http_cache_lookups_total", "counter", []),
+            "latency": ("cmm_http_request_duration_seconds", "histogram", []),
+        }
+        for series in self.series():
+            labels = {"client": series.client, "host": series.host, "endpoint": series.endpoint}
+            for code, n in sorted(series.status_codes.items()):
+                families["requests"][2].append(_sample("cmm_http_requests_total", {**labels, "status": str(code)}, n))
+            families["bytes"][2].append(_sample("cmm_http_response_bytes_total", labels, series.response_bytes))
+            for kind, n in sorted(series.errors.items()):
+                families["errors"][2].append(_sample("cmm_http_errors_total", {**labels, "error": kind}, n))
+            families["retries"][2].append(_sample("cmm_http_retries_total", labels, series.retries))
+            families["wait"][2].append(
+                _sample("cmm_http_rate_limit_wait_seconds_total", labels, series.rate_limit_wait)
+            )
+            for result, n in (("hit", series.cache_hits), ("miss", series.cache_misses)):
+                families["cache"][2].append(_sample("cmm_http_cache_lookups_total", {**labels, "result": result}, n))
+            cumulative = 0
+            for bound, n in zip(series.latency.bounds, series.latency.counts, strict=True):
+                cumulative += n
+                families["latency"][2].append(
+                    _sample(
+                        "cmm_http_request_duration_seconds_bucket", {**labels, "le": _format_bound(bound)}, cumulative
+                    )
+                )
+            families["latency"][2].append(
+                _sample("cmm_http_request_duration_seconds_sum", labels, series.latency.total)
+            )
+            families["latency"][2].append(
+                _sample("cmm_http_request_duration_seconds_count", labels, series.latency.count)
+            )
+
+        lines = []
+        for name, kind, samples in families.values():
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Write the metrics to a file: Prometheus text for .prom/.txt, JSON otherwise."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = self.to_prometheus() if path.suffix in (".prom", ".txt") else self.to_json()
+        path.write_text(text, encoding="utf-8")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, labels: dict[str, str], value: float) -> str:
+    rendered = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+    return f"{name}{{{rendered}}} {value}"
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _default_registry
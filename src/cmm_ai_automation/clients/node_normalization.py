@@ -21,18 +21,29 @@ References:
     - GitHub: https://github.com/NCATSTranslator/NodeNormalization
 """
 
+import asyncio
 import logging
-import time
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
 import requests
 
+from cmm_ai_automation.clients.base import HTTPClientBase
+
 logger = logging.getLogger(__name__)
 
 # Rate limit: be conservative with external API
 DEFAULT_RATE_LIMIT_DELAY = 0.2
 
+# CURIEs per POST /get_normalized_nodes request in normalize_batch()
+BATCH_CHUNK_SIZE = 500
+
+# Chunk requests in flight at once (the shared rate limit still applies)
+BATCH_MAX_WORKERS = 4
+
 
 @dataclass
 class NormalizedNode:
@@ -133,9 +144,12 @@ class NormalizationError:
     error_message: str
 
 
-class NodeNormalizationClient:
+class NodeNormalizationClient(HTTPClientBase):
     """Client for NCATS Translator NodeNormalization API.
 
+    normalize_batch() results are memoized per CURIE for the lifetime of the
+    client, including NOT_FOUND answers; request failures are retried.
+
     Example:
         >>> client = NodeNormalizationClient()
         >>> result = client.normalize("CHEBI:32599")
@@ -151,50 +165,18 @@ class NodeNormalizationClient:
         self,
         rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY,
         timeout: float = 30.0,
+        base_url: str | None = None,
     ):
         """Initialize NodeNormalization client.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 0.2)
             timeout: Request timeout in seconds (default: 30)
+            base_url: API base URL override (e.g., a local fake server)
         """
-        self.rate_limit_delay = rate_limit_delay
-        self.timeout = timeout
-        self._last_request_time: float = 0
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)",
-            }
-        )
-
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
-
-    def _get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a GET request with rate limiting.
-
-        Args:
-            url: Full URL to fetch
-            params: Query parameters
-
-        Returns:
-            Parsed JSON response
-
-        Raises:
-            requests.RequestException: On network errors
-        """
-        self._wait_for_rate_limit()
-        logger.debug(f"GET {url} params={params}")
-        response = self._session.get(url, params=params, timeout=self.timeout)
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+        super().__init__(rate_limit_delay=rate_limit_delay, timeout=timeout, base_url=base_url)
+        self._memo: dict[str, NormalizedNode | NormalizationError] = {}
+        self._memo_lock = threading.Lock()
 
     def normalize(self, curie: str) -> NormalizedNode | NormalizationError:
         """Normalize a CURIE to get all equivalent identifiers.
@@ -206,82 +188,121 @@ class NodeNormalizationClient:
         Returns:
             NormalizedNode on success, NormalizationError on failure
         """
-        url = f"{self.BASE_URL}/get_normalized_nodes"
-        params = {"curie": curie}
-
         try:
-            data = self._get(url, params)
-        except requests.HTTPError as e:
-            return NormalizationError(
-                query_id=curie,
-                error_code="HTTP_ERROR",
-                error_message=str(e),
-            )
+            data = self._get_json(f"{self.BASE_URL}/get_normalized_nodes", {"curie": curie})
         except requests.RequestException as e:
-            return NormalizationError(
-                query_id=curie,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _request_error(curie, e)
 
-        # Parse response
-        # Response format: {curie: {id: {...}, equivalent_identifiers: [...], type: [...]}}
-        node_data = data.get(curie)
-        if not node_data:
-            return NormalizationError(
-                query_id=curie,
-                error_code="NOT_FOUND",
-                error_message=f"No normalization found for {curie}",
-            )
+        return self._node_or_not_found(curie, data)
 
-        return self._parse_node(curie, node_data)
+    async def anormalize(self, curie: str) -> NormalizedNode | NormalizationError:
+        """Async version of normalize()."""
+        try:
+            data = await self.aget_json(f"{self.BASE_URL}/get_normalized_nodes", {"curie": curie})
+        except requests.RequestException as e:
+            return _request_error(curie, e)
 
-    def normalize_batch(self, curies: list[str]) -> dict[str, NormalizedNode | NormalizationError]:
-        """Normalize multiple CURIEs in a single request.
+        return self._node_or_not_found(curie, data)
+
+    def normalize_batch(
+        self,
+        curies: Iterable[str],
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        max_workers: int = BATCH_MAX_WORKERS,
+    ) -> dict[str, NormalizedNode | NormalizationError]:
+        """Normalize many CURIEs with chunked POST requests.
+
+        CURIEs are deduplicated and answered from the per-CURIE memo where
+        possible. The rest are split into chunks of ``chunk_size`` and POSTed
+        as ``{"curies": [...]}``, with up to ``max_workers`` chunks in flight.
+        This keeps request size bounded, so whole corpora can be normalized in
+        one call.
 
         Args:
-            curies: List of CURIEs to normalize
+            curies: CURIEs to normalize
+            chunk_size: Maximum CURIEs per request (default: 500)
+            max_workers: Maximum concurrent requests (default: 4)
 
         Returns:
             Dict mapping each CURIE to its result (NormalizedNode or NormalizationError)
         """
-        if not curies:
-            return {}
+        results = self._memoized(curies)
+        chunks = _chunks([c for c, result in results.items() if result is None], chunk_size)
+        logger.debug(f"Normalizing {len(results)} curies ({len(chunks)} requests)")
+
+        if len(chunks) <= 1 or max_workers <= 1:
+            chunk_results = [self._normalize_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                chunk_results = list(executor.map(self._normalize_chunk, chunks))
+
+        return self._merge(results, chunk_results)
+
+    async def anormalize_batch(
+        self,
+        curies: Iterable[str],
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> dict[str, NormalizedNode | NormalizationError]:
+        """Async version of normalize_batch(). Chunks are fetched concurrently."""
+        results = self._memoized(curies)
+        chunks = _chunks([c for c, result in results.items() if result is None], chunk_size)
+        chunk_results = await asyncio.gather(*(self._anormalize_chunk(chunk) for chunk in chunks))
+        return self._merge(results, chunk_results)
+
+    def _normalize_chunk(self, curies: list[str]) -> dict[str, NormalizedNode | NormalizationError]:
+        """POST one chunk of CURIEs to get_normalized_nodes."""
+        try:
+            data = self._post_json(f"{self.BASE_URL}/get_normalized_nodes", json_data={"curies": curies})
+        except requests.RequestException as e:
+            return _batch_request_errors(curies, e)
 
-        url = f"{self.BASE_URL}/get_normalized_nodes"
-        # API accepts multiple curie params
-        params = [("curie", c) for c in curies]
+        return {curie: self._node_or_not_found(curie, data) for curie in curies}
 
+    async def _anormalize_chunk(self, curies: list[str]) -> dict[str, NormalizedNode | NormalizationError]:
+        """Async version of _normalize_chunk()."""
         try:
-            self._wait_for_rate_limit()
-            logger.debug(f"GET {url} with {len(curies)} curies")
-            response = self._session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
+            data = await self.apost_json(f"{self.BASE_URL}/get_normalized_nodes", json_data={"curies": curies})
         except requests.RequestException as e:
-            # Return errors for all curies
-            return {
-                c: NormalizationError(
-                    query_id=c,
-                    error_code="REQUEST_ERROR",
-                    error_message=str(e),
-                )
-                for c in curies
-            }
-
-        results: dict[str, NormalizedNode | NormalizationError] = {}
-        for curie in curies:
-            node_data = data.get(curie)
-            if not node_data:
-                results[curie] = NormalizationError(
-                    query_id=curie,
-                    error_code="NOT_FOUND",
-                    error_message=f"No normalization found for {curie}",
-                )
-            else:
-                results[curie] = self._parse_node(curie, node_data)
-
-        return results
+            return _batch_request_errors(curies, e)
+
+        return {curie: self._node_or_not_found(curie, data) for curie in curies}
+
+    def _memoized(self, curies: Iterable[str]) -> dict[str, NormalizedNode | NormalizationError | None]:
+        """Deduplicate CURIEs, mapping each to its memoized result or None if it needs a request."""
+        with self._memo_lock:
+            return {curie: self._memo.get(curie) for curie in dict.fromkeys(curies)}
+
+    def _merge(
+        self,
+        results: dict[str, NormalizedNode | NormalizationError | None],
+        chunk_results: list[dict[str, NormalizedNode | NormalizationError]],
+    ) -> dict[str, NormalizedNode | NormalizationError]:
+        """Fill fetched chunk results into ``results`` and memoize them.
+
+        Successes and NOT_FOUND answers are memoized; request failures are not,
+        so a later call retries them.
+        """
+        with self._memo_lock:
+            for chunk in chunk_results:
+                for curie, result in chunk.items():
+                    results[curie] = result
+                    if isinstance(result, NormalizedNode) or result.error_code == "NOT_FOUND":
+                        self._memo[curie] = result
+        return {curie: result for curie, result in results.items() if result is not None}
+
+    def _node_or_not_found(self, curie: str, data: dict[str, Any]) -> NormalizedNode | NormalizationError:
+        """Parse one CURIE's entry from a get_normalized_nodes response.
+
+        Response format: {curie: {id: {...}, equivalent_identifiers: [...], type: [...]}}
+        """
+        node_data = data.get(curie)
+        if not node_data:
+            return NormalizationError(
+                query_id=curie,
+                error_code="NOT_FOUND",
+                error_message=f"No normalization found for {curie}",
+            )
+        return self._parse_node(curie, node_data)
 
     def _parse_node(self, query_id: str, node_data: dict[str, Any]) -> NormalizedNode:
         """Parse API response into NormalizedNode."""
@@ -383,3 +404,31 @@ class NodeNormalizationClient:
         """
         curie = f"PUBCHEM.COMPOUND:{cid}"
         return self.normalize(curie)
+
+
+def _chunks(curies: list[str], size: int) -> list[list[str]]:
+    """Split CURIEs into request-sized chunks."""
+    return [curies[i : i + size] for i in range(0, len(curies), size)]
+
+
+def _request_error(curie: str, error: requests.RequestException) -> NormalizationError:
+    """Convert a request exception into a NormalizationError."""
+    return NormalizationError(
+        query_id=curie,
+        error_code="HTTP_ERROR" if isinstance(error, requests.HTTPError) else "REQUEST_ERROR",
+        error_message=str(error),
+    )
+
+
+def _batch_request_errors(
+    curies: list[str], error: requests.RequestException
+) -> dict[str, NormalizedNode | NormalizationError]:
+    """Report a failed batch request as a REQUEST_ERROR for every CURIE."""
+    return {
+        c: NormalizationError(
+            query_id=c,
+            error_code="REQUEST_ERROR",
+            error_message=str(error),
+        )
+        for c in curies
+    }
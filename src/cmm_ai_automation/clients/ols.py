@@ -9,13 +9,17 @@ References:
 """
 
 import logging
-import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 from urllib.parse import quote
 
 import requests
 
+from cmm_ai_automation.clients.base import HTTPClientBase
+from cmm_ai_automation.clients.chebi import ChEBICompound, ChEBILookupError
+from cmm_ai_automation.clients.chebi_local import ChEBILocalBackend
+
 logger = logging.getLogger(__name__)
 
 # Rate limit: be conservative with external API
@@ -121,7 +125,7 @@ class OLSLookupError:
     error_message: str
 
 
-class OLSClient:
+class OLSClient(HTTPClientBase):
     """Client for EBI OLS4 API.
 
     Primary use is for ChEBI lookups, which is the authoritative source
@@ -141,50 +145,22 @@ class OLSClient:
         self,
         rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY,
         timeout: float = 30.0,
+        local_db: Path | None = None,
+        base_url: str | None = None,
     ):
         """Initialize OLS client.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 0.2)
             timeout: Request timeout in seconds (default: 30)
+            local_db: ChEBI DuckDB file built by ChEBILocalBackend.build(); if
+                given, get_chebi_term() and get_chebi_parents() are answered offline
+            base_url: API base URL override (e.g., a local fake server)
         """
-        self.rate_limit_delay = rate_limit_delay
-        self.timeout = timeout
-        self._last_request_time: float = 0
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)",
-            }
-        )
-
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
-
-    def _get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a GET request with rate limiting.
-
-        Args:
-            url: Full URL to fetch
-            params: Query parameters
-
-        Returns:
-            Parsed JSON response
-
-        Raises:
-            requests.RequestException: On network errors
-        """
-        self._wait_for_rate_limit()
-        logger.debug(f"GET {url} params={params}")
-        response = self._session.get(url, params=params, timeout=self.timeout)
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+        super().__init__(rate_limit_delay=rate_limit_delay, timeout=timeout, base_url=base_url)
+        self.local: ChEBILocalBackend | None = None
+        if local_db is not None:
+            self.local = ChEBILocalBackend(local_db)
 
     def get_chebi_term(self, chebi_id: str | int) -> ChEBITerm | OLSLookupError:
         """Look up a ChEBI term by ID.
@@ -197,39 +173,41 @@ class OLSClient:
         Returns:
             ChEBITerm on success, OLSLookupError on failure
         """
-        # Normalize the ChEBI ID
-        chebi_str = str(chebi_id).upper()
-        chebi_numeric = chebi_str.split(":")[1] if chebi_str.startswith("CHEBI:") else chebi_str
-
-        # Construct the IRI for the ChEBI term
-        iri = f"http://purl.obolibrary.org/obo/CHEBI_{chebi_numeric}"
-        encoded_iri = quote(quote(iri, safe=""), safe="")
+        if self.local is not None:
+            return self._local_chebi_term(self.local, chebi_id)
+        chebi_numeric = _chebi_numeric(chebi_id)
+        try:
+            data = self._get_json(self._chebi_term_url(chebi_numeric))
+        except requests.RequestException as e:
+            return _term_error(chebi_numeric, e)
 
-        url = f"{self.BASE_URL}/ontologies/{CHEBI_ONTOLOGY_ID}/terms/{encoded_iri}"
+        return self._parse_chebi_term(f"CHEBI:{chebi_numeric}", data)
 
+    async def aget_chebi_term(self, chebi_id: str | int) -> ChEBITerm | OLSLookupError:
+        """Async version of get_chebi_term()."""
+        if self.local is not None:
+            return self._local_chebi_term(self.local, chebi_id)
+        chebi_numeric = _chebi_numeric(chebi_id)
         try:
-            data = self._get(url)
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
-                return OLSLookupError(
-                    query=f"CHEBI:{chebi_numeric}",
-                    error_code="NOT_FOUND",
-                    error_message=f"ChEBI term CHEBI:{chebi_numeric} not found",
-                )
-            return OLSLookupError(
-                query=f"CHEBI:{chebi_numeric}",
-                error_code="HTTP_ERROR",
-                error_message=str(e),
-            )
+            data = await self.aget_json(self._chebi_term_url(chebi_numeric))
         except requests.RequestException as e:
-            return OLSLookupError(
-                query=f"CHEBI:{chebi_numeric}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _term_error(chebi_numeric, e)
 
         return self._parse_chebi_term(f"CHEBI:{chebi_numeric}", data)
 
+    def _chebi_term_url(self, chebi_numeric: str) -> str:
+        """Build the OLS term URL for a ChEBI ID (the IRI is double-encoded)."""
+        iri = f"http://purl.obolibrary.org/obo/CHEBI_{chebi_numeric}"
+        encoded_iri = quote(quote(iri, safe=""), safe="")
+        return f"{self.BASE_URL}/ontologies/{CHEBI_ONTOLOGY_ID}/terms/{encoded_iri}"
+
+    def _local_chebi_term(self, local: ChEBILocalBackend, chebi_id: str | int) -> ChEBITerm | OLSLookupError:
+        """Build a ChEBITerm from the local ChEBI database."""
+        compound = local.get_compound(chebi_id)
+        if not isinstance(compound, ChEBICompound):
+            return _local_error(compound)
+        return _term_from_compound(compound)
+
     def _parse_chebi_term(self, chebi_id: str, data: dict[str, Any]) -> ChEBITerm:
         """Parse OLS4 response into ChEBITerm."""
         # Get basic info
@@ -317,60 +295,29 @@ class OLSClient:
         Returns:
             List of OLSSearchResult on success, OLSLookupError on failure
         """
-        url = f"{self.BASE_URL}/search"
-        params: dict[str, Any] = {
-            "q": query,
-            "ontology": CHEBI_ONTOLOGY_ID,
-            "rows": rows,
-        }
-
-        if exact:
-            params["exact"] = "true"
+        params = _search_params(query, exact, include_obsolete, rows)
+        try:
+            data = self._get_json(f"{self.BASE_URL}/search", params)
+        except requests.RequestException as e:
+            return _search_error(query, e)
 
-        if not include_obsolete:
-            params["obsoletes"] = "false"
+        return _parse_search_docs(data)
 
+    async def asearch_chebi(
+        self,
+        query: str,
+        exact: bool = False,
+        include_obsolete: bool = False,
+        rows: int = 10,
+    ) -> list[OLSSearchResult] | OLSLookupError:
+        """Async version of search_chebi()."""
+        params = _search_params(query, exact, include_obsolete, rows)
         try:
-            data = self._get(url, params)
-        except requests.HTTPError as e:
-            return OLSLookupError(
-                query=query,
-                error_code="HTTP_ERROR",
-                error_message=str(e),
-            )
+            data = await self.aget_json(f"{self.BASE_URL}/search", params)
         except requests.RequestException as e:
-            return OLSLookupError(
-                query=query,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
-
-        # Parse search results
-        results: list[OLSSearchResult] = []
-        response = data.get("response", {})
-        docs = response.get("docs", [])
-
-        for doc in docs:
-            iri = doc.get("iri", "")
-            label = doc.get("label")
-            short_form = doc.get("short_form", "")
-            ontology = doc.get("ontology_name", "")
-            desc_list = doc.get("description", [])
-            description = desc_list[0] if desc_list else None
-            is_obsolete = doc.get("is_obsolete", False)
-
-            results.append(
-                OLSSearchResult(
-                    iri=iri,
-                    label=label,
-                    short_form=short_form,
-                    ontology_name=ontology,
-                    description=description,
-                    is_obsolete=is_obsolete,
-                )
-            )
+            return _search_error(query, e)
 
-        return results
+        return _parse_search_docs(data)
 
     def search_chebi_exact(self, name: str) -> OLSSearchResult | None | OLSLookupError:
         """Search for an exact ChEBI term match by name.
@@ -395,47 +342,152 @@ class OLSClient:
         Returns:
             List of parent ChEBI IDs, or OLSLookupError on failure
         """
-        # Normalize the ChEBI ID
-        chebi_str = str(chebi_id).upper()
-        chebi_numeric = chebi_str.split(":")[1] if chebi_str.startswith("CHEBI:") else chebi_str
-
-        iri = f"http://purl.obolibrary.org/obo/CHEBI_{chebi_numeric}"
-        encoded_iri = quote(quote(iri, safe=""), safe="")
+        if self.local is not None:
+            return _local_parents(self.local, chebi_id)
+        chebi_numeric = _chebi_numeric(chebi_id)
+        try:
+            data = self._get_json(f"{self._chebi_term_url(chebi_numeric)}/hierarchicalParents")
+        except requests.RequestException as e:
+            return _term_error(chebi_numeric, e)
 
-        url = f"{self.BASE_URL}/ontologies/{CHEBI_ONTOLOGY_ID}/terms/{encoded_iri}/hierarchicalParents"
+        return _parse_parent_terms(data)
 
+    async def aget_chebi_parents(self, chebi_id: str | int) -> list[str] | OLSLookupError:
+        """Async version of get_chebi_parents()."""
+        if self.local is not None:
+            return _local_parents(self.local, chebi_id)
+        chebi_numeric = _chebi_numeric(chebi_id)
         try:
-            data = self._get(url)
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
-                return OLSLookupError(
-                    query=f"CHEBI:{chebi_numeric}",
-                    error_code="NOT_FOUND",
-                    error_message=f"ChEBI term CHEBI:{chebi_numeric} not found",
-                )
-            return OLSLookupError(
-                query=f"CHEBI:{chebi_numeric}",
-                error_code="HTTP_ERROR",
-                error_message=str(e),
-            )
+            data = await self.aget_json(f"{self._chebi_term_url(chebi_numeric)}/hierarchicalParents")
         except requests.RequestException as e:
+            return _term_error(chebi_numeric, e)
+
+        return _parse_parent_terms(data)
+
+
+def _chebi_numeric(chebi_id: str | int) -> str:
+    """Get the numeric part of a ChEBI ID (accepts "CHEBI:17634", "17634" or 17634)."""
+    chebi_str = str(chebi_id).upper()
+    return chebi_str.split(":")[1] if chebi_str.startswith("CHEBI:") else chebi_str
+
+
+def _term_from_compound(compound: ChEBICompound) -> ChEBITerm:
+    """Convert a local ChEBICompound into the ChEBITerm shape OLS lookups return."""
+    xrefs: dict[str, list[str]] = {}
+    for database, refs in compound.database_refs.items():
+        xrefs[database] = [f"{database}:{ref.accession}" for ref in refs]
+    return ChEBITerm(
+        chebi_id=compound.chebi_id,
+        label=compound.ascii_name or compound.name,
+        description=compound.definition,
+        synonyms=compound.synonyms,
+        inchikey=compound.inchikey,
+        inchi=compound.inchi,
+        smiles=compound.smiles,
+        formula=compound.formula,
+        mass=compound.mass,
+        charge=compound.charge,
+        star=compound.stars,
+        parent_ids=[r.target_chebi_id for r in compound.parents],
+        has_role=[r.target_chebi_id for r in compound.has_roles],
+        has_functional_parent=[
+            r.target_chebi_id for r in compound.outgoing_relations if r.relation_type == "has functional parent"
+        ],
+        xrefs=xrefs,
+    )
+
+
+def _local_parents(local: ChEBILocalBackend, chebi_id: str | int) -> list[str] | OLSLookupError:
+    """Get is_a parents from the local ChEBI database."""
+    parents = local.get_parents(chebi_id)
+    return parents if isinstance(parents, list) else _local_error(parents)
+
+
+def _local_error(error: ChEBILookupError) -> OLSLookupError:
+    return OLSLookupError(query=error.query, error_code=error.error_code, error_message=error.error_message)
+
+
+def _term_error(chebi_numeric: str, error: requests.RequestException) -> OLSLookupError:
+    """Convert a term lookup exception into an OLSLookupError."""
+    if isinstance(error, requests.HTTPError):
+        if error.response.status_code == 404:
             return OLSLookupError(
                 query=f"CHEBI:{chebi_numeric}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
+                error_code="NOT_FOUND",
+                error_message=f"ChEBI term CHEBI:{chebi_numeric} not found",
+            )
+        return OLSLookupError(
+            query=f"CHEBI:{chebi_numeric}",
+            error_code="HTTP_ERROR",
+            error_message=str(error),
+        )
+    return OLSLookupError(
+        query=f"CHEBI:{chebi_numeric}",
+        error_code="REQUEST_ERROR",
+        error_message=str(error),
+    )
+
+
+def _search_error(query: str, error: requests.RequestException) -> OLSLookupError:
+    """Convert a search exception into an OLSLookupError."""
+    return OLSLookupError(
+        query=query,
+        error_code="HTTP_ERROR" if isinstance(error, requests.HTTPError) else "REQUEST_ERROR",
+        error_message=str(error),
+    )
+
+
+def _search_params(query: str, exact: bool, include_obsolete: bool, rows: int) -> dict[str, Any]:
+    """Build OLS search parameters restricted to ChEBI."""
+    params: dict[str, Any] = {
+        "q": query,
+        "ontology": CHEBI_ONTOLOGY_ID,
+        "rows": rows,
+    }
+
+    if exact:
+        params["exact"] = "true"
+
+    if not include_obsolete:
+        params["obsoletes"] = "false"
+
+    return params
+
+
+def _parse_search_docs(data: dict[str, Any]) -> list[OLSSearchResult]:
+    """Parse an OLS search response into search results."""
+    results: list[OLSSearchResult] = []
+    response = data.get("response", {})
+    docs = response.get("docs", [])
+
+    for doc in docs:
+        desc_list = doc.get("description", [])
+        results.append(
+            OLSSearchResult(
+                iri=doc.get("iri", ""),
+                label=doc.get("label"),
+                short_form=doc.get("short_form", ""),
+                ontology_name=doc.get("ontology_name", ""),
+                description=desc_list[0] if desc_list else None,
+                is_obsolete=doc.get("is_obsolete", False),
             )
+        )
+
+    return results
+
 
-        # Parse parent terms
-        parents: list[str] = []
-        embedded = data.get("_embedded", {})
-        terms = embedded.get("terms", [])
+def _parse_parent_terms(data: dict[str, Any]) -> list[str]:
+    """Parse a hierarchicalParents response into parent ChEBI IDs."""
+    parents: list[str] = []
+    embedded = data.get("_embedded", {})
+    terms = embedded.get("terms", [])
 
-        for term in terms:
-            short_form = term.get("short_form", "")
-            if short_form.startswith("CHEBI_"):
-                parents.append(short_form.replace("_", ":"))
+    for term in terms:
+        short_form = term.get("short_form", "")
+        if short_form.startswith("CHEBI_"):
+            parents.append(short_form.replace("_", ":"))
 
-        return parents
+    return parents
 
 
 def _get_first(values: list[Any]) -> Any | None:
@@ -7,11 +7,12 @@ References:
     - CHEMINF ontology: https://pmc.ncbi.nlm.nih.gov/articles/PMC3184996/
 """
 
+import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any
-from urllib.parse import quote
 
 import requests
 
@@ -23,6 +24,18 @@ logger = logging.getLogger(__name__)
 # We use 0.25s delay to stay well under limit
 PUBCHEM_RATE_LIMIT_DELAY = 0.25
 
+# CIDs per bulk request. PUG-REST takes comma-separated CID lists in a POST
+# body, which avoids URL length limits; keep chunks small enough to finish
+# well inside PubChem's 30 s per-request time limit.
+CID_CHUNK_SIZE = 200
+
+# PubChem answers slow queries with HTTP 202 and a ListKey to poll for the result
+LISTKEY_POLL_DELAY = 1.0  # seconds between polls
+LISTKEY_MAX_POLLS = 30
+
+# PUG-VIEW (annotations) lives next to PUG-REST on the same host
+PUG_VIEW_URL = "https://pubchem.ncbi.nlm.nih.gov/rest/pug_view"
+
 # Properties to fetch from PubChem
 # See: https://pubchem.ncbi.nlm.nih.gov/docs/pug-rest#section=Compound-Property-Tables
 COMPOUND_PROPERTIES = [
@@ -40,6 +53,10 @@ COMPOUND_PROPERTIES = [
     "Charge",
 ]
 
+# PUG-REST operation paths shared by name, CID and ListKey requests
+CIDS_OPERATION = "cids/JSON"
+PROPERTIES_OPERATION = f"property/{','.join(COMPOUND_PROPERTIES)}/JSON"
+
 
 @dataclass
 class CompoundResult:
@@ -141,56 +158,68 @@ class PubChemClient(HTTPClientBase):
         self,
         rate_limit_delay: float = PUBCHEM_RATE_LIMIT_DELAY,
         timeout: float = 30.0,
+        base_url: str | None = None,
     ):
         """Initialize PubChem client.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 0.25)
             timeout: Request timeout in seconds (default: 30)
+            base_url: PUG-REST base URL override; PUG-VIEW requests go to the
+                sibling ``<base_url>_view`` path
         """
-        super().__init__(rate_limit_delay=rate_limit_delay, timeout=timeout)
+        super().__init__(rate_limit_delay=rate_limit_delay, timeout=timeout, base_url=base_url)
+        self.pug_view_url = PUG_VIEW_URL if base_url is None else f"{self.BASE_URL}_view"
 
     def get_cids_by_name(self, name: str) -> list[int] | LookupError:
         """Get all CIDs matching a compound name.
 
+        The name is sent in a POST body, so names containing "/" or other
+        characters that are awkward in a URL path are resolved correctly.
+
         Args:
             name: Chemical name to search
 
         Returns:
             List of CIDs on success, LookupError on failure
         """
-        encoded_name = quote(name)
-        url = f"{self.BASE_URL}/compound/name/{encoded_name}/cids/JSON"
-
         try:
-            data = self._get_json(url)
-        except requests.HTTPError as e:
-            try:
-                error_data = e.response.json()
-                fault = error_data.get("Fault", {})
-                return LookupError(
-                    name_queried=name,
-                    error_code=fault.get("Code", "UNKNOWN"),
-                    error_message=fault.get("Message", str(e)),
-                )
-            except (json.JSONDecodeError, AttributeError, KeyError):
-                return LookupError(
-                    name_queried=name,
-                    error_code="HTTP_ERROR",
-                    error_message=str(e),
-                )
+            data = self._post_json(self._cids_by_name_url(), data={"name": name})
+            data = self._wait_for_listkey(data, CIDS_OPERATION)
         except requests.RequestException as e:
-            return LookupError(
-                name_queried=name,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _lookup_error(name, e)
+        return _parse_cids(data)
 
+    async def aget_cids_by_name(self, name: str) -> list[int] | LookupError:
+        """Async version of get_cids_by_name()."""
         try:
-            cids: list[int] = data["IdentifierList"]["CID"]
-            return cids
-        except (KeyError, IndexError):
-            return []
+            data = await self.apost_json(self._cids_by_name_url(), data={"name": name})
+            data = await self._await_listkey(data, CIDS_OPERATION)
+        except requests.RequestException as e:
+            return _lookup_error(name, e)
+        return _parse_cids(data)
+
+    def get_cids_by_names(self, names: list[str]) -> dict[str, list[int] | LookupError]:
+        """Resolve many names to CIDs.
+
+        PUG-REST accepts a single name per request, so this issues one POST
+        per distinct name. Prefer aget_cids_by_names(), which runs them
+        concurrently within the rate limit.
+
+        Args:
+            names: Chemical names to search
+
+        Returns:
+            Dict mapping each input name to its CIDs, or to a LookupError if
+            that name failed; one failure does not affect the others
+        """
+        return {name: self.get_cids_by_name(name) for name in dict.fromkeys(names)}
+
+    async def aget_cids_by_names(self, names: list[str]) -> dict[str, list[int] | LookupError]:
+        """Async version of get_cids_by_names(). Names are resolved concurrently."""
+        unique = list(dict.fromkeys(names))
+        results = await asyncio.gather(*(self.aget_cids_by_name(name) for name in unique))
+        return dict(zip(unique, results, strict=True))
 
     def get_compounds_by_name(self, name: str) -> list[CompoundResult] | LookupError:
         """Look up all compounds matching a name.
@@ -207,29 +236,23 @@ class PubChemClient(HTTPClientBase):
             return cids_result
 
         if not cids_result:
-            return LookupError(
-                name_queried=name,
-                error_code="NO_RESULTS",
-                error_message="No compounds found for this name",
-            )
+            return _no_results_error(name)
 
         # Fetch properties for all CIDs
-        results = []
-        for cid in cids_result:
-            result = self.get_compound_by_cid(cid)
-            if isinstance(result, CompoundResult):
-                result.name_queried = name
-                results.append(result)
-
-        return (
-            results
-            if results
-            else LookupError(
-                name_queried=name,
-                error_code="NO_VALID_RESULTS",
-                error_message=f"Found {len(cids_result)} CIDs but could not fetch properties",
-            )
-        )
+        by_cid = self.get_compounds_by_cids(cids_result)
+        return _collect_compounds(name, cids_result, [by_cid[cid] for cid in cids_result])
+
+    async def aget_compounds_by_name(self, name: str) -> list[CompoundResult] | LookupError:
+        """Async version of get_compounds_by_name()."""
+        cids_result = await self.aget_cids_by_name(name)
+        if isinstance(cids_result, LookupError):
+            return cids_result
+
+        if not cids_result:
+            return _no_results_error(name)
+
+        by_cid = await self.aget_compounds_by_cids(cids_result)
+        return _collect_compounds(name, cids_result, [by_cid[cid] for cid in cids_result])
 
     def get_compound_by_name(self, name: str) -> CompoundResult | LookupError:
         """Look up a compound by name (returns first match only).
@@ -242,62 +265,21 @@ class PubChemClient(HTTPClientBase):
         Returns:
             CompoundResult on success, LookupError on failure
         """
-        # URL-encode the name
-        encoded_name = quote(name)
-        properties = ",".join(COMPOUND_PROPERTIES)
-        url = f"{self.BASE_URL}/compound/name/{encoded_name}/property/{properties}/JSON"
-
         try:
-            data = self._get_json(url)
-        except requests.HTTPError as e:
-            # Try to parse PubChem error response
-            try:
-                error_data = e.response.json()
-                fault = error_data.get("Fault", {})
-                return LookupError(
-                    name_queried=name,
-                    error_code=fault.get("Code", "UNKNOWN"),
-                    error_message=fault.get("Message", str(e)),
-                )
-            except (json.JSONDecodeError, AttributeError, KeyError):
-                return LookupError(
-                    name_queried=name,
-                    error_code="HTTP_ERROR",
-                    error_message=str(e),
-                )
+            data = self._post_json(self._properties_by_name_url(), data={"name": name})
+            data = self._wait_for_listkey(data, PROPERTIES_OPERATION)
         except requests.RequestException as e:
-            return LookupError(
-                name_queried=name,
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _lookup_error(name, e)
+        return _parse_first_compound(data, name)
 
-        # Parse successful response
-        # Note: PubChem returns "ConnectivitySMILES" for canonical and "SMILES" for isomeric
+    async def aget_compound_by_name(self, name: str) -> CompoundResult | LookupError:
+        """Async version of get_compound_by_name()."""
         try:
-            props = data["PropertyTable"]["Properties"][0]
-            return CompoundResult(
-                CID=props["CID"],
-                name_queried=name,
-                MolecularFormula=props.get("MolecularFormula"),
-                MolecularWeight=_to_float(props.get("MolecularWeight")),
-                CanonicalSMILES=props.get("ConnectivitySMILES"),
-                IsomericSMILES=props.get("SMILES"),
-                InChI=props.get("InChI"),
-                InChIKey=props.get("InChIKey"),
-                IUPACName=props.get("IUPACName"),
-                Title=props.get("Title"),
-                ExactMass=_to_float(props.get("ExactMass")),
-                MonoisotopicMass=_to_float(props.get("MonoisotopicMass")),
-                Charge=props.get("Charge"),
-                XLogP=_to_float(props.get("XLogP")),
-            )
-        except (KeyError, IndexError) as e:
-            return LookupError(
-                name_queried=name,
-                error_code="PARSE_ERROR",
-                error_message=f"Failed to parse response: {e}",
-            )
+            data = await self.apost_json(self._properties_by_name_url(), data={"name": name})
+            data = await self._await_listkey(data, PROPERTIES_OPERATION)
+        except requests.RequestException as e:
+            return _lookup_error(name, e)
+        return _parse_first_compound(data, name)
 
     def get_compound_by_cid(self, cid: int) -> CompoundResult | LookupError:
         """Look up a compound by PubChem CID.
@@ -308,57 +290,56 @@ class PubChemClient(HTTPClientBase):
         Returns:
             CompoundResult on success, LookupError on failure
         """
-        properties = ",".join(COMPOUND_PROPERTIES)
-        url = f"{self.BASE_URL}/compound/cid/{cid}/property/{properties}/JSON"
-
         try:
-            data = self._get_json(url)
-        except requests.HTTPError as e:
-            try:
-                error_data = e.response.json()
-                fault = error_data.get("Fault", {})
-                return LookupError(
-                    name_queried=f"CID:{cid}",
-                    error_code=fault.get("Code", "UNKNOWN"),
-                    error_message=fault.get("Message", str(e)),
-                )
-            except (json.JSONDecodeError, AttributeError, KeyError):
-                return LookupError(
-                    name_queried=f"CID:{cid}",
-                    error_code="HTTP_ERROR",
-                    error_message=str(e),
-                )
+            data = self._get_json(self._properties_by_cid_url(cid))
         except requests.RequestException as e:
-            return LookupError(
-                name_queried=f"CID:{cid}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _lookup_error(f"CID:{cid}", e)
+        return _parse_first_compound(data, f"CID:{cid}")
 
+    async def aget_compound_by_cid(self, cid: int) -> CompoundResult | LookupError:
+        """Async version of get_compound_by_cid()."""
         try:
-            props = data["PropertyTable"]["Properties"][0]
-            return CompoundResult(
-                CID=props["CID"],
-                name_queried=f"CID:{cid}",
-                MolecularFormula=props.get("MolecularFormula"),
-                MolecularWeight=_to_float(props.get("MolecularWeight")),
-                CanonicalSMILES=props.get("ConnectivitySMILES"),
-                IsomericSMILES=props.get("SMILES"),
-                InChI=props.get("InChI"),
-                InChIKey=props.get("InChIKey"),
-                IUPACName=props.get("IUPACName"),
-                Title=props.get("Title"),
-                ExactMass=_to_float(props.get("ExactMass")),
-                MonoisotopicMass=_to_float(props.get("MonoisotopicMass")),
-                Charge=props.get("Charge"),
-                XLogP=_to_float(props.get("XLogP")),
-            )
-        except (KeyError, IndexError) as e:
-            return LookupError(
-                name_queried=f"CID:{cid}",
-                error_code="PARSE_ERROR",
-                error_message=f"Failed to parse response: {e}",
-            )
+            data = await self.aget_json(self._properties_by_cid_url(cid))
+        except requests.RequestException as e:
+            return _lookup_error(f"CID:{cid}", e)
+        return _parse_first_compound(data, f"CID:{cid}")
+
+    def get_compounds_by_cids(self, cids: list[int]) -> dict[int, CompoundResult | LookupError]:
+        """Look up many compounds by CID using bulk property-table requests.
+
+        CIDs are deduplicated and sent CID_CHUNK_SIZE at a time as a POST body.
+
+        Args:
+            cids: PubChem Compound IDs
+
+        Returns:
+            Dict mapping each CID to a CompoundResult, or a LookupError if
+            PubChem returned no record for it or its chunk failed
+        """
+        results: dict[int, CompoundResult | LookupError] = {}
+        for chunk in _cid_chunks(cids):
+            try:
+                data = self._post_json(self._bulk_properties_url(), data=_cid_form(chunk))
+            except requests.RequestException as e:
+                results.update({cid: _lookup_error(f"CID:{cid}", e) for cid in chunk})
+                continue
+            results.update(_parse_property_table(chunk, data))
+        return results
+
+    async def aget_compounds_by_cids(self, cids: list[int]) -> dict[int, CompoundResult | LookupError]:
+        """Async version of get_compounds_by_cids(). Chunks are fetched concurrently."""
+
+        async def fetch(chunk: list[int]) -> dict[int, CompoundResult | LookupError]:
+            try:
+                data = await self.apost_json(self._bulk_properties_url(), data=_cid_form(chunk))
+            except requests.RequestException as e:
+                return {cid: _lookup_error(f"CID:{cid}", e) for cid in chunk}
+            return _parse_property_table(chunk, data)
+
+        results: dict[int, CompoundResult | LookupError] = {}
+        for chunk_results in await asyncio.gather(*(fetch(chunk) for chunk in _cid_chunks(cids))):
+            results.update(chunk_results)
+        return results
 
     def get_synonyms(self, cid: int) -> list[str] | LookupError:
         """Get all synonyms for a compound by CID.
@@ -369,37 +350,54 @@ class PubChemClient(HTTPClientBase):
         Returns:
             List of synonym strings on success, LookupError on failure
         """
-        url = f"{self.BASE_URL}/compound/cid/{cid}/synonyms/JSON"
-
         try:
-            data = self._get_json(url)
-        except requests.HTTPError as e:
-            try:
-                error_data = e.response.json()
-                fault = error_data.get("Fault", {})
-                return LookupError(
-                    name_queried=f"CID:{cid}",
-                    error_code=fault.get("Code", "UNKNOWN"),
-                    error_message=fault.get("Message", str(e)),
-                )
-            except (json.JSONDecodeError, AttributeError, KeyError):
-                return LookupError(
-                    name_queried=f"CID:{cid}",
-                    error_code="HTTP_ERROR",
-                    error_message=str(e),
-                )
+            data = self._get_json(f"{self.BASE_URL}/compound/cid/{cid}/synonyms/JSON")
         except requests.RequestException as e:
-            return LookupError(
-                name_queried=f"CID:{cid}",
-                error_code="REQUEST_ERROR",
-                error_message=str(e),
-            )
+            return _lookup_error(f"CID:{cid}", e)
+        return _parse_synonyms(data)
 
+    async def aget_synonyms(self, cid: int) -> list[str] | LookupError:
+        """Async version of get_synonyms()."""
         try:
-            synonyms: list[str] = data["InformationList"]["Information"][0]["Synonym"]
-            return synonyms
-        except (KeyError, IndexError):
-            return []
+            data = await self.aget_json(f"{self.BASE_URL}/compound/cid/{cid}/synonyms/JSON")
+        except requests.RequestException as e:
+            return _lookup_error(f"CID:{cid}", e)
+        return _parse_synonyms(data)
+
+    def get_synonyms_many(self, cids: list[int]) -> dict[int, list[str] | LookupError]:
+        """Get synonyms for many compounds using bulk requests.
+
+        Args:
+            cids: PubChem Compound IDs
+
+        Returns:
+            Dict mapping each CID to its synonyms (empty if PubChem has none),
+            or a LookupError if its chunk failed
+        """
+        results: dict[int, list[str] | LookupError] = {}
+        for chunk in _cid_chunks(cids):
+            try:
+                data = self._post_json(f"{self.BASE_URL}/compound/cid/synonyms/JSON", data=_cid_form(chunk))
+            except requests.RequestException as e:
+                results.update({cid: _lookup_error(f"CID:{cid}", e) for cid in chunk})
+                continue
+            results.update(_parse_synonym_table(chunk, data))
+        return results
+
+    async def aget_synonyms_many(self, cids: list[int]) -> dict[int, list[str] | LookupError]:
+        """Async version of get_synonyms_many(). Chunks are fetched concurrently."""
+
+        async def fetch(chunk: list[int]) -> dict[int, list[str] | LookupError]:
+            try:
+                data = await self.apost_json(f"{self.BASE_URL}/compound/cid/synonyms/JSON", data=_cid_form(chunk))
+            except requests.RequestException as e:
+                return {cid: _lookup_error(f"CID:{cid}", e) for cid in chunk}
+            return _parse_synonym_table(chunk, data)
+
+        results: dict[int, list[str] | LookupError] = {}
+        for chunk_results in await asyncio.gather(*(fetch(chunk) for chunk in _cid_chunks(cids))):
+            results.update(chunk_results)
+        return results
 
     def get_xrefs(self, cid: int) -> dict[str, str | None]:
         """Get cross-references (CAS, ChEBI, Wikidata) for a compound.
@@ -412,21 +410,79 @@ class PubChemClient(HTTPClientBase):
         Returns:
             Dictionary with keys 'CAS', 'ChEBI', 'Wikidata' (values may be None)
         """
-        url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/compound/{cid}/JSON"
-
-        result: dict[str, str | None] = {"CAS": None, "ChEBI": None, "Wikidata": None}
+        try:
+            data = self._get_json(f"{self.pug_view_url}/data/compound/{cid}/JSON")
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to fetch xrefs for CID {cid}: {e}")
+            return {"CAS": None, "ChEBI": None, "Wikidata": None}
+        return self._parse_xrefs(cid, data)
 
+    async def aget_xrefs(self, cid: int) -> dict[str, str | None]:
+        """Async version of get_xrefs()."""
         try:
-            self._wait_for_rate_limit()
-            logger.debug(f"GET {url}")
-            response = self._session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
+            data = await self.aget_json(f"{self.pug_view_url}/data/compound/{cid}/JSON")
         except (requests.RequestException, json.JSONDecodeError) as e:
             logger.warning(f"Failed to fetch xrefs for CID {cid}: {e}")
-            return result
+            return {"CAS": None, "ChEBI": None, "Wikidata": None}
+        return self._parse_xrefs(cid, data)
+
+    def _cids_by_name_url(self) -> str:
+        """Build the name -> CIDs URL (the name goes in the POST body)."""
+        return f"{self.BASE_URL}/compound/name/{CIDS_OPERATION}"
+
+    def _properties_by_name_url(self) -> str:
+        """Build the name -> property table URL (the name goes in the POST body)."""
+        return f"{self.BASE_URL}/compound/name/{PROPERTIES_OPERATION}"
+
+    def _listkey_url(self, data: dict[str, Any], operation: str) -> str | None:
+        """Return the URL to poll if PubChem answered with a ListKey, else None.
+
+        Args:
+            data: Parsed response
+            operation: Operation of the original request, e.g. "cids/JSON"
+        """
+        list_key = data.get("Waiting", {}).get("ListKey")
+        if list_key is None:
+            return None
+        return f"{self.BASE_URL}/compound/listkey/{list_key}/{operation}"
 
-        # Parse the nested PUG-VIEW structure
+    def _wait_for_listkey(self, data: dict[str, Any], operation: str) -> dict[str, Any]:
+        """Poll an asynchronous ListKey response until PubChem has the result.
+
+        Raises:
+            requests.Timeout: If the result is not ready after LISTKEY_MAX_POLLS polls
+        """
+        polls = 0
+        while (url := self._listkey_url(data, operation)) is not None:
+            if polls == LISTKEY_MAX_POLLS:
+                raise requests.Timeout(f"PubChem ListKey result not ready after {polls} polls: {url}")
+            polls += 1
+            time.sleep(LISTKEY_POLL_DELAY)
+            data = self._get_json(url)
+        return data
+
+    async def _await_listkey(self, data: dict[str, Any], operation: str) -> dict[str, Any]:
+        """Async version of _wait_for_listkey()."""
+        polls = 0
+        while (url := self._listkey_url(data, operation)) is not None:
+            if polls == LISTKEY_MAX_POLLS:
+                raise requests.Timeout(f"PubChem ListKey result not ready after {polls} polls: {url}")
+            polls += 1
+            await asyncio.sleep(LISTKEY_POLL_DELAY)
+            data = await self.aget_json(url)
+        return data
+
+    def _properties_by_cid_url(self, cid: int) -> str:
+        """Build the CID -> property table URL."""
+        return f"{self.BASE_URL}/compound/cid/{cid}/{PROPERTIES_OPERATION}"
+
+    def _bulk_properties_url(self) -> str:
+        """Build the CID list -> property table URL (CIDs go in the POST body)."""
+        return f"{self.BASE_URL}/compound/cid/{PROPERTIES_OPERATION}"
+
+    def _parse_xrefs(self, cid: int, data: dict[str, Any]) -> dict[str, str | None]:
+        """Parse the nested PUG-VIEW structure for CAS, ChEBI and Wikidata IDs."""
+        result: dict[str, str | None] = {"CAS": None, "ChEBI": None, "Wikidata": None}
         try:
             record = data.get("Record", {})
             sections = record.get("Section", [])
@@ -487,3 +543,157 @@ def _to_float(value: Any) -> float | None:
         return float(value)
     except (ValueError, TypeError):
         return None
+
+
+def _lookup_error(query: str, error: requests.RequestException) -> LookupError:
+    """Convert a request exception into a LookupError.
+
+    PubChem returns a JSON "Fault" body on HTTP errors; use its code and
+    message when present.
+    """
+    if isinstance(error, requests.HTTPError):
+        try:
+            error_data = error.response.json()
+            fault = error_data.get("Fault", {})
+            return LookupError(
+                name_queried=query,
+                error_code=fault.get("Code", "UNKNOWN"),
+                error_message=fault.get("Message", str(error)),
+            )
+        except (json.JSONDecodeError, AttributeError, KeyError):
+            return LookupError(
+                name_queried=query,
+                error_code="HTTP_ERROR",
+                error_message=str(error),
+            )
+    return LookupError(
+        name_queried=query,
+        error_code="REQUEST_ERROR",
+        error_message=str(error),
+    )
+
+
+def _no_results_error(name: str) -> LookupError:
+    """Error for a name that resolved to no CIDs."""
+    return LookupError(
+        name_queried=name,
+        error_code="NO_RESULTS",
+        error_message="No compounds found for this name",
+    )
+
+
+def _collect_compounds(
+    name: str,
+    cids: list[int],
+    results: list[CompoundResult | LookupError],
+) -> list[CompoundResult] | LookupError:
+    """Keep successful per-CID lookups, tagging them with the queried name."""
+    compounds = []
+    for result in results:
+        if isinstance(result, CompoundResult):
+            result.name_queried = name
+            compounds.append(result)
+
+    return (
+        compounds
+        if compounds
+        else LookupError(
+            name_queried=name,
+            error_code="NO_VALID_RESULTS",
+            error_message=f"Found {len(cids)} CIDs but could not fetch properties",
+        )
+    )
+
+
+def _parse_cids(data: dict[str, Any]) -> list[int]:
+    """Parse an IdentifierList response into CIDs."""
+    try:
+        cids: list[int] = data["IdentifierList"]["CID"]
+        return cids
+    except (KeyError, IndexError):
+        return []
+
+
+def _parse_synonyms(data: dict[str, Any]) -> list[str]:
+    """Parse an InformationList response into synonyms."""
+    try:
+        synonyms: list[str] = data["InformationList"]["Information"][0]["Synonym"]
+        return synonyms
+    except (KeyError, IndexError):
+        return []
+
+
+def _parse_properties(props: dict[str, Any], name_queried: str) -> CompoundResult:
+    """Parse one PropertyTable entry into a CompoundResult.
+
+    Note: PubChem returns "ConnectivitySMILES" for canonical and "SMILES" for isomeric.
+    """
+    return CompoundResult(
+        CID=props["CID"],
+        name_queried=name_queried,
+        MolecularFormula=props.get("MolecularFormula"),
+        MolecularWeight=_to_float(props.get("MolecularWeight")),
+        CanonicalSMILES=props.get("ConnectivitySMILES"),
+        IsomericSMILES=props.get("SMILES"),
+        InChI=props.get("InChI"),
+        InChIKey=props.get("InChIKey"),
+        IUPACName=props.get("IUPACName"),
+        Title=props.get("Title"),
+        ExactMass=_to_float(props.get("ExactMass")),
+        MonoisotopicMass=_to_float(props.get("MonoisotopicMass")),
+        Charge=props.get("Charge"),
+        XLogP=_to_float(props.get("XLogP")),
+    )
+
+
+def _cid_chunks(cids: list[int]) -> list[list[int]]:
+    """Deduplicate CIDs (keeping order) and split them into bulk-request chunks."""
+    unique = list(dict.fromkeys(cids))
+    return [unique[i : i + CID_CHUNK_SIZE] for i in range(0, len(unique), CID_CHUNK_SIZE)]
+
+
+def _cid_form(cids: list[int]) -> dict[str, Any]:
+    """POST body for a CID list request."""
+    return {"cid": ",".join(str(cid) for cid in cids)}
+
+
+def _not_found_error(cid: int) -> LookupError:
+    """Error for a CID that a bulk response did not include."""
+    return LookupError(
+        name_queried=f"CID:{cid}",
+        error_code="NOT_FOUND",
+        error_message=f"PubChem returned no record for CID {cid}",
+    )
+
+
+def _parse_property_table(cids: list[int], data: dict[str, Any]) -> dict[int, CompoundResult | LookupError]:
+    """Parse a bulk PropertyTable response, marking requested CIDs that are missing."""
+    results: dict[int, CompoundResult | LookupError] = {}
+    for props in data.get("PropertyTable", {}).get("Properties", []):
+        if "CID" in props:
+            results[props["CID"]] = _parse_properties(props, f"CID:{props['CID']}")
+    for cid in cids:
+        if cid not in results:
+            results[cid] = _not_found_error(cid)
+    return results
+
+
+def _parse_synonym_table(cids: list[int], data: dict[str, Any]) -> dict[int, list[str] | LookupError]:
+    """Parse a bulk InformationList response; CIDs without synonyms map to an empty list."""
+    results: dict[int, list[str] | LookupError] = {cid: [] for cid in cids}
+    for info in data.get("InformationList", {}).get("Information", []):
+        if "CID" in info:
+            results[info["CID"]] = info.get("Synonym", [])
+    return results
+
+
+def _parse_first_compound(data: dict[str, Any], name_queried: str) -> CompoundResult | LookupError:
+    """Parse the first entry of a PropertyTable response."""
+    try:
+        return _parse_properties(data["PropertyTable"]["Properties"][0], name_queried)
+    except (KeyError, IndexError) as e:
+        return LookupError(
+            name_queried=name_queried,
+            error_code="PARSE_ERROR",
+            error_message=f"Failed to parse response: {e}",
+        )
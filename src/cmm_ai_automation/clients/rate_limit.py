@@ -0,0 +1,385 @@
+"""Shared per-host rate limiting for API clients.
+
+Every client that talks to a host draws from the same token bucket, so two
+client instances (or several threads) hitting PubChem together still respect
+PubChem's request budget instead of each pacing itself independently.
+
+Buckets live in a process-wide registry keyed by host. Optionally, the bucket
+state can be kept in a small JSON file guarded by a file lock, which lets
+several worker processes on one machine share a host's budget:
+
+    >>> from pathlib import Path
+    >>> configure_rate_limits(lock_dir=Path(".ratelimits"))
+
+or set the ``CMM_RATE_LIMIT_DIR`` environment variable before starting the
+workers.
+
+The bucket is implemented in its "virtual scheduling" form: instead of
+counting tokens it stores the theoretical arrival time (TAT) of the next
+conforming request. This is equivalent to a token bucket with capacity
+``burst`` refilled at one token per ``interval`` seconds, and needs only a
+single float of state, which keeps the file-backed variant simple: it stores
+the TAT and the host's current (adapted) interval.
+
+Buckets also adapt to server feedback (AIMD): each throttling response
+(429/503) doubles the host's interval and, if the server sent a
+``Retry-After``, holds every caller until then; each healthy response
+shortens the interval additively, back down to the configured one. The
+configured interval is never undercut, so a long run settles just below the
+rate at which the server starts pushing back. backoff_delay() and
+parse_retry_after() give the matching per-request retry schedule.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming a directory for cross-process bucket state
+RATE_LIMIT_DIR_ENV = "CMM_RATE_LIMIT_DIR"
+
+# Responses that mean "slow down"
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# AIMD tuning: a throttled host's interval doubles (at least to
+# THROTTLE_MIN_INTERVAL, at most to THROTTLE_MAX_INTERVAL); each healthy
+# response adds RATE_INCREASE_STEP of the configured rate back.
+THROTTLE_MIN_INTERVAL = 0.1  # seconds
+THROTTLE_MAX_INTERVAL = 60.0  # seconds
+RATE_INCREASE_STEP = 0.02
+
+# Retry schedule for throttled requests
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_CAP = 60.0  # seconds
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Args:
+        value: Header value, or None if absent
+
+    Returns:
+        Seconds to wait (>= 0), or None if absent or unparsable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: float | None = None,
+    base: float = BACKOFF_BASE,
+    cap: float = BACKOFF_CAP,
+) -> float:
+    """Seconds to wait before retrying a throttled request.
+
+    Exponential backoff with "full jitter" (uniform between 0 and
+    ``base * 2**attempt``, capped), so callers throttled together do not
+    retry together. A server-provided Retry-After is a lower bound.
+
+    Args:
+        attempt: Zero-based retry number
+        retry_after: Parsed Retry-After header, if any
+        base: Backoff for the first retry
+        cap: Maximum backoff
+
+    Returns:
+        Delay in seconds
+    """
+    delay = random.uniform(0, min(cap, base * 2**attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all requests to one host.
+
+    Attributes:
+        interval: Current seconds per token (i.e., spacing at steady state)
+        min_interval: Configured interval; adaptation never goes faster
+        burst: Bucket capacity; requests allowed back-to-back after idling
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        """Initialize the bucket.
+
+        Args:
+            interval: Seconds per token; 0 disables limiting
+            burst: Bucket capacity (default: 1, i.e., strict spacing)
+        """
+        self.interval = interval
+        self.min_interval = interval
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tat: float = 0.0
+
+    def _clock(self) -> float:
+        return time.monotonic()
+
+    def _advance(self, tat: float, now: float) -> tuple[float, float]:
+        """Reserve one token given the stored TAT.
+
+        Returns:
+            (new TAT, seconds the caller must wait before sending)
+        """
+        tolerance = (self.burst - 1) * self.interval
+        start = max(now, tat - tolerance)
+        return max(tat, now) + self.interval, start - now
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before using it.
+
+        Reservations are made immediately, so concurrent callers are queued
+        one interval apart rather than all waking at the same moment.
+
+        Returns:
+            Seconds to wait (0 if a token is available now)
+        """
+        if self.interval <= 0:
+            return 0.0
+        with self._lock:
+            self._tat, wait = self._advance(self._tat, self._clock())
+        return wait
+
+    def acquire(self) -> float:
+        """Block the calling thread until a token is available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+    async def aacquire(self) -> float:
+        """Wait (without blocking the event loop) until a token is available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return max(wait, 0.0)
+
+    def slow_down(self, interval: float) -> None:
+        """Raise the configured interval to at least ``interval`` seconds.
+
+        Used when several clients register different delays for one host:
+        the bucket always honours the most conservative one.
+        """
+        with self._lock:
+            if interval > self.min_interval:
+                logger.debug(f"Rate limit interval raised from {self.min_interval}s to {interval}s")
+                self.min_interval = interval
+                self.interval = max(self.interval, interval)
+
+    def record_success(self) -> None:
+        """Additive increase: speed up a throttled host after a healthy response."""
+        with self._lock:
+            self.interval = self._recovered(self.interval)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease after a 429/503, holding all callers for Retry-After.
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if it said
+        """
+        with self._lock:
+            self.interval = self._throttled(self.interval)
+            logger.debug(f"Throttled: rate limit interval now {self.interval:.3f}s")
+        if retry_after:
+            self._defer(retry_after)
+
+    def _recovered(self, interval: float) -> float:
+        """The interval after a healthy response, given the current one."""
+        if interval <= self.min_interval:
+            return interval
+        rate = 1 / interval
+        if self.min_interval > 0:
+            rate += RATE_INCREASE_STEP / self.min_interval
+            return max(self.min_interval, 1 / rate)
+        # Unlimited host: grow geometrically and drop limiting once fast enough
+        interval = 1 / (rate * (1 + RATE_INCREASE_STEP))
+        return self.min_interval if interval < THROTTLE_MIN_INTERVAL / 100 else interval
+
+    @staticmethod
+    def _throttled(interval: float) -> float:
+        """The interval after a throttling response, given the current one."""
+        return min(THROTTLE_MAX_INTERVAL, max(interval * 2, THROTTLE_MIN_INTERVAL))
+
+    def _defer(self, seconds: float) -> None:
+        """Hold the next reservation until at least ``seconds`` from now."""
+        with self._lock:
+            self._tat = max(self._tat, self._clock() + seconds)
+
+
+class FileLockTokenBucket(TokenBucket):
+    """Token bucket whose state is shared between processes through a file.
+
+    The TAT and the adapted interval are stored as JSON in ``state_file`` and
+    read-modify-written under a ``filelock.FileLock``, so a throttle seen by
+    one process slows every process down. Wall-clock time is used so
+    timestamps are comparable across processes.
+    """
+
+    def __init__(self, interval: float, state_file: Path, burst: int = 1):
+        """Initialize the bucket.
+
+        Args:
+            interval: Seconds per token; 0 disables limiting
+            state_file: JSON file holding the shared bucket state
+            burst: Bucket capacity (default: 1)
+        """
+        super().__init__(interval, burst)
+        self.state_file = state_file
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file_lock = FileLock(str(state_file) + ".lock")
+
+    def _clock(self) -> float:
+        return time.time()
+
+    def _read_state(self) -> tuple[float, float]:
+        """(TAT, interval) from the state file; caller holds the file lock."""
+        try:
+            with self.state_file.open(encoding="utf-8") as f:
+                state = json.load(f)
+            tat = float(state.get("tat", 0.0))
+            interval = float(state.get("interval", self.min_interval))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0.0, self.min_interval
+        # Each process enforces its own configured interval (see slow_down())
+        return tat, max(interval, self.min_interval)
+
+    def _write_state(self, tat: float, interval: float) -> None:
+        with self.state_file.open("w", encoding="utf-8") as f:
+            json.dump({"tat": tat, "interval": interval}, f)
+
+    def reserve(self) -> float:
+        """Take a token from the shared bucket, returning how long to wait."""
+        with self._lock, self._file_lock:
+            tat, self.interval = self._read_state()
+            if self.interval <= 0:
+                return 0.0
+            tat, wait = self._advance(tat, self._clock())
+            self._write_state(tat, self.interval)
+        return wait
+
+    async def aacquire(self) -> float:
+        """Wait (without blocking the event loop) until a token is available.
+
+        The file lock is taken on a worker thread, as another process may hold it.
+
+        Returns:
+            Seconds waited
+        """
+        wait = await asyncio.to_thread(self.reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return max(wait, 0.0)
+
+    def record_success(self) -> None:
+        """Additive increase of the shared interval after a healthy response."""
+        with self._lock:
+            # As of this process's last reservation; skips the file lock at the configured rate
+            if self.interval <= self.min_interval:
+                return
+            with self._file_lock:
+                tat, interval = self._read_state()
+                self.interval = self._recovered(interval)
+                self._write_state(tat, self.interval)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease of the shared interval, holding every process for Retry-After.
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if it said
+        """
+        with self._lock, self._file_lock:
+            tat, interval = self._read_state()
+            self.interval = self._throttled(interval)
+            if retry_after:
+                tat = max(tat, self._clock() + retry_after)
+            self._write_state(tat, self.interval)
+        logger.debug(f"Throttled: rate limit interval now {self.interval:.3f}s")
+
+    def _defer(self, seconds: float) -> None:
+        """Hold every process's next reservation until ``seconds`` from now."""
+        with self._lock, self._file_lock:
+            tat, interval = self._read_state()
+            self._write_state(max(tat, self._clock() + seconds), interval)
+
+
+_registry: dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+_lock_dir: Path | None = Path(os.environ[RATE_LIMIT_DIR_ENV]) if os.environ.get(RATE_LIMIT_DIR_ENV) else None
+
+
+def configure_rate_limits(lock_dir: Path | None = None) -> None:
+    """Choose the rate limit backend for this process.
+
+    Clears the registry, so call this before creating clients.
+
+    Args:
+        lock_dir: Directory for file-locked bucket state shared between
+            processes, or None for in-process buckets only
+    """
+    global _lock_dir
+    with _registry_lock:
+        _lock_dir = lock_dir
+        _registry.clear()
+
+
+def get_rate_limiter(host: str, interval: float, burst: int = 1) -> TokenBucket:
+    """Get the shared token bucket for a host, creating it if needed.
+
+    If the host already has a bucket with a shorter interval, the interval is
+    raised so every caller gets the most conservative limit registered.
+
+    Args:
+        host: Network location, e.g. "pubchem.ncbi.nlm.nih.gov"
+        interval: Minimum seconds between requests to this host
+        burst: Bucket capacity for a newly created bucket
+
+    Returns:
+        The host's TokenBucket
+    """
+    with _registry_lock:
+        bucket = _registry.get(host)
+        if bucket is None:
+            if _lock_dir is not None:
+                state_file = _lock_dir / f"{_safe_filename(host)}.json"
+                bucket = FileLockTokenBucket(interval, state_file, burst)
+            else:
+                bucket = TokenBucket(interval, burst)
+            _registry[host] = bucket
+            return bucket
+    bucket.slow_down(interval)
+    return bucket
+
+
+def _safe_filename(host: str) -> str:
+    """Make a host usable as a file name (e.g., "127.0.0.1:8080" -> "127.0.0.1_8080")."""
+    return re.sub(r"[^A-Za-z0-9.-]", "_", host)
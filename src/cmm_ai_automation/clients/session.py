@@ -0,0 +1,115 @@
+"""Shared requests sessions with tuned connection pools.
+
+Every synchronous HTTP call in the package goes through a requests.Session
+built here, so connections are kept alive and reused: a large run pays one
+TCP+TLS handshake per pooled connection rather than one per request.
+
+- make_session(): a new session, e.g. one per API client (carrying its
+  own headers, such as an API key)
+- get_shared_session(): the process-wide session for module-level helpers
+  (NCBI E-utilities, loader scripts)
+- configure_sessions(): change the pool settings of sessions created
+  afterwards
+
+Pools hold up to ``pool_maxsize`` idle keep-alive connections per host.
+Keep it at least as large as the biggest thread pool sending requests to
+one host (e.g. NCBI_MAX_WORKERS, the batch ``max_workers`` arguments);
+otherwise surplus connections are closed after each request and the
+handshakes come back.
+
+Example:
+    >>> configure_sessions(SessionConfig(pool_maxsize=64))
+    >>> session = make_session({"X-API-KEY": key})
+"""
+
+import threading
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_USER_AGENT = "cmm-ai-automation/0.1.0 (https://github.com/turbomam/cmm-ai-automation)"
+DEFAULT_POOL_CONNECTIONS = 10  # hosts whose connection pools are kept
+DEFAULT_POOL_MAXSIZE = 32  # idle keep-alive connections kept per host
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """Connection pool settings for new sessions.
+
+    Attributes:
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Idle connections kept per host
+        pool_block: Wait for a free connection instead of opening a surplus one
+    """
+
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_block: bool = False
+
+
+_config = SessionConfig()
+_shared_session: requests.Session | None = None
+_shared_lock = threading.Lock()
+
+
+def configure_sessions(config: SessionConfig) -> None:
+    """Use ``config`` for sessions created from now on.
+
+    The shared session is rebuilt on its next use; sessions already owned
+    by clients keep their pools.
+    """
+    global _config, _shared_session
+    with _shared_lock:
+        _config = config
+        previous, _shared_session = _shared_session, None
+    if previous is not None:
+        previous.close()
+
+
+def get_session_config() -> SessionConfig:
+    """Get the pool settings used for new sessions."""
+    return _config
+
+
+def make_session(headers: dict[str, str] | None = None, config: SessionConfig | None = None) -> requests.Session:
+    """Create a keep-alive session with tuned connection pools.
+
+    Args:
+        headers: Headers sent with every request (override the defaults)
+        config: Pool settings (defaults to the configure_sessions() ones)
+
+    Returns:
+        New session; close it when done
+    """
+    config = config or _config
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": DEFAULT_USER_AGENT,
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+    )
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Get the process-wide session, creating it on first use.
+
+    Safe to use from several threads: the connection pools are thread-safe.
+    """
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = make_session()
+        return _shared_session
@@ -0,0 +1,157 @@
+"""Coalescing of duplicate in-flight requests ("single-flight").
+
+When several callers ask for the same thing at the same time (e.g., the
+spider resolving one CURIE from many ingredients), only the first caller
+(the leader) runs the request; the others wait for its result instead of
+sending their own. Callers may be threads or asyncio tasks, on any event
+loop: in-flight calls are tracked as ``concurrent.futures.Future`` objects,
+which both kinds of caller can wait on.
+
+Only concurrent duplicates are coalesced. Once a call finishes it is
+forgotten, so a later call runs again (the response cache handles reuse
+over time).
+
+Example:
+    >>> flight = SingleFlight()
+    >>> flight.do("GET https://example.org/a", lambda: fetch("https://example.org/a"))
+    >>> flight.saved  # requests avoided by joining an in-flight call
+    0
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import CancelledError, Future
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Share one in-flight call per key between concurrent callers.
+
+    Thread-safe. If a leader is cancelled, its waiting followers retry
+    (one of them becomes the new leader) rather than being cancelled too.
+
+    Attributes:
+        calls: Calls actually executed
+        saved: Calls avoided by waiting on an identical in-flight call
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, tuple[Future[Any], int]] = {}
+        self.calls = 0
+        self.saved = 0
+
+    def _join(self, key: str, blocking: bool) -> tuple[Future[Any], bool]:
+        """Register as leader for a key, or join its in-flight call.
+
+        Args:
+            key: Call identity
+            blocking: Whether the caller will block its thread while waiting
+
+        Returns:
+            (future to complete or wait on, whether the caller leads)
+        """
+        thread = threading.get_ident()
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is None:
+                future: Future[Any] = Future()
+                self._in_flight[key] = (future, thread)
+                self.calls += 1
+                return future, True
+            future, leader_thread = entry
+            if blocking and leader_thread == thread:
+                # The leader is an async task suspended on this thread's event
+                # loop; blocking on it would deadlock, so run independently.
+                self.calls += 1
+                return Future(), True
+            self.saved += 1
+        logger.debug(f"Joined in-flight request {key}")
+        return future, False
+
+    def _finish(self, key: str, future: Future[Any]) -> None:
+        """Forget a finished call (unless it was an unregistered one)."""
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is not None and entry[0] is future:
+                del self._in_flight[key]
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Call identity (e.g., a request cache key)
+            fn: Function producing the result
+
+        Returns:
+            fn's result (shared with concurrent callers)
+
+        Raises:
+            Exception: Whatever fn raised, in the leader and all followers
+        """
+        while True:
+            future, leader = self._join(key, blocking=True)
+            if not leader:
+                try:
+                    return future.result()
+                except CancelledError:
+                    continue
+            try:
+                result = fn()
+            except BaseException as e:
+                self._finish(key, future)
+                future.set_exception(e)
+                raise
+            self._finish(key, future)
+            future.set_result(result)
+            return result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of do(): await fn(), or the in-flight call with the same key.
+
+        Args:
+            key: Call identity (e.g., a request cache key)
+            fn: Coroutine function producing the result
+
+        Returns:
+            fn's result (shared with concurrent callers)
+
+        Raises:
+            Exception: Whatever fn raised, in the leader and all followers
+        """
+        while True:
+            future, leader = self._join(key, blocking=False)
+            if not leader:
+                try:
+                    # shield: a cancelled follower must not cancel the shared call
+                    return await asyncio.shield(asyncio.wrap_future(future))
+                except asyncio.CancelledError:
+                    if future.cancelled():
+                        continue
+                    raise
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                self._finish(key, future)
+                future.cancel()
+                raise
+            except BaseException as e:
+                self._finish(key, future)
+                future.set_exception(e)
+                raise
+            self._finish(key, future)
+            future.set_result(result)
+            return result
+
+
+_default_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide SingleFlight shared by clients by default."""
+    return _default_single_flight
@@ -17,6 +17,7 @@ import csv
 import json
 import logging
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,7 @@ import click
 from dotenv import load_dotenv
 
 from cmm_ai_automation.clients.cas import CASClient, CASLookupError, get_cas_client
+from cmm_ai_automation.clients.metrics import get_metrics
 from cmm_ai_automation.clients.pubchem import LookupError, PubChemClient
 
 # Load environment variables from .env file
@@ -119,6 +121,12 @@ def setup_logging(verbose: bool) -> None:
     is_flag=True,
     help="Disable CAS lookups even if API key is available",
 )
+@click.option(
+    "--metrics-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write API request metrics to this file on exit (.prom/.txt: Prometheus text, otherwise JSON)",
+)
 def main(
     input_file: Path,
     output_file: Path,
@@ -128,6 +136,7 @@ def main(
     dry_run: bool,
     cas_cache_file: Path,
     no_cas: bool,
+    metrics_out: Path | None,
 ) -> None:
     """Enrich ingredients with PubChem and optionally CAS data.
 
@@ -142,6 +151,10 @@ def main(
     """
     setup_logging(verbose)
 
+    if metrics_out is not None:
+        # Runs however the command exits
+        click.get_current_context().call_on_close(partial(get_metrics().write, metrics_out))
+
     # Read input file
     click.echo(f"Reading ingredients from: {input_file}")
     with input_file.open(newline="", encoding="utf-8") as f:
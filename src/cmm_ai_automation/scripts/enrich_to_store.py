@@ -15,21 +15,33 @@ Usage:
     uv run python -m cmm_ai_automation.scripts.enrich_to_store -i data/private/derived/ingredients.tsv
     uv run python -m cmm_ai_automation.scripts.enrich_to_store --dry-run
     uv run python -m cmm_ai_automation.scripts.enrich_to_store --export-kgx
+    uv run python -m cmm_ai_automation.scripts.enrich_to_store --incremental --ttl-days 90
 """
 
 import csv
 import logging
 import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import click
 from dotenv import load_dotenv
 
+from cmm_ai_automation.clients.cache import ResponseCache, set_default_cache
 from cmm_ai_automation.clients.cas import CASResult, get_cas_client
-from cmm_ai_automation.clients.chebi import ChEBIClient, ChEBICompound, ChEBISearchResult
+from cmm_ai_automation.clients.cassette import CASSETTE_MODES, Cassette, CassetteMode, set_default_cassette
+from cmm_ai_automation.clients.chebi import BATCH_MAX_WORKERS, ChEBIClient, ChEBICompound, ChEBISearchResult
+from cmm_ai_automation.clients.chebi_closure import ChEBIClosureIndex
+from cmm_ai_automation.clients.metrics import get_metrics
 from cmm_ai_automation.clients.node_normalization import NodeNormalizationClient, NormalizedNode
 from cmm_ai_automation.clients.pubchem import CompoundResult, PubChemClient
+from cmm_ai_automation.clients.session import SessionConfig, configure_sessions, get_session_config
+from cmm_ai_automation.store.enrichment_journal import COMPLETED, FAILED, EnrichmentJournal, JournalEntry, row_hash
 from cmm_ai_automation.store.enrichment_store import EnrichmentStore
 
 # Load environment variables
@@ -40,6 +52,8 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 DEFAULT_INPUT = PROJECT_ROOT / "data" / "private" / "derived" / "ingredients.tsv"
 DEFAULT_STORE = PROJECT_ROOT / "data" / "enrichment.duckdb"
 DEFAULT_OUTPUT = PROJECT_ROOT / "output" / "kgx" / "ingredients"
+DEFAULT_HTTP_CACHE = PROJECT_ROOT / "cache" / "http_cache.sqlite"
+DEFAULT_JOURNAL = PROJECT_ROOT / "data" / "enrichment_journal.sqlite"
 
 logger = logging.getLogger(__name__)
 
@@ -81,12 +95,18 @@ def pubchem_to_dict(result: CompoundResult, query: str) -> dict[str, Any]:
     }
 
 
-def chebi_to_dict(result: ChEBISearchResult, compound_data: dict[str, Any] | None = None) -> dict[str, Any]:
+def chebi_to_dict(
+    result: ChEBISearchResult,
+    compound_data: dict[str, Any] | None = None,
+    closure: ChEBIClosureIndex | None = None,
+) -> dict[str, Any]:
     """Convert ChEBI result to enrichment dict.
 
     Args:
         result: ChEBI search result
         compound_data: Optional full compound data from get_compound_by_id
+        closure: Optional ChEBI closure index; if it knows the compound, roles
+            (including those inherited from ancestors) are taken from it
     """
     data: dict[str, Any] = {
         "name": result.name or result.ascii_name,
@@ -126,6 +146,13 @@ def chebi_to_dict(result: ChEBISearchResult, compound_data: dict[str, Any] | Non
             if chemical_roles:
                 data["chemical_roles"] = chemical_roles
 
+    if closure is not None and result.chebi_id in closure:
+        biological_roles, chemical_roles = closure.classify_roles(result.chebi_id)
+        if biological_roles:
+            data["biological_roles"] = biological_roles
+        if chemical_roles:
+            data["chemical_roles"] = chemical_roles
+
     return data
 
 
@@ -247,13 +274,441 @@ def determine_biolink_category(sources_data: dict[str, dict[str, Any]]) -> str:
     return "biolink:SmallMolecule"
 
 
+# Client error codes of failed requests (network errors, throttling, server errors), as
+# opposed to lookups that found nothing; numeric codes are HTTP statuses (429 and 5xx fail)
+REQUEST_FAILURE_CODES = frozenset(
+    {
+        "REQUEST_ERROR",
+        "HTTP_ERROR",
+        "UNKNOWN",
+        "NO_VALID_RESULTS",  # PubChem found CIDs but fetching their properties failed
+        "PUGREST.ServerBusy",
+        "PUGREST.Timeout",
+        "PUGREST.ServerError",
+    }
+)
+
+
+def is_request_failure(result: Any) -> bool:
+    """Whether a client result is an error from a failed request rather than a genuine miss."""
+    code = getattr(result, "error_code", None)
+    if not isinstance(code, str):
+        return False
+    return code in REQUEST_FAILURE_CODES or (code.isdigit() and (code == "429" or int(code) >= 500))
+
+
+def _error_text(result: Any) -> str:
+    return f"{result.error_code}: {result.error_message}"
+
+
+@dataclass(frozen=True)
+class SourceFailure:
+    """A source query that failed (network error, throttling, server error).
+
+    Attributes:
+        source: Source queried, e.g. "PubChem (by name)"
+        message: Error description
+        ids: CURIEs that could not be fetched (empty for queries by name)
+    """
+
+    source: str
+    message: str
+    ids: tuple[str, ...] = ()
+
+
+class IncompleteEnrichmentError(Exception):
+    """Some of an ingredient's source queries failed; its data may be partial.
+
+    Attributes:
+        failures: The failed queries
+        sources_data: Data from the queries that succeeded
+    """
+
+    def __init__(self, name: str, failures: list[SourceFailure], sources_data: dict[str, dict[str, Any]]):
+        details = "; ".join(f"{failure.source}: {failure.message}" for failure in failures)
+        super().__init__(f"{len(failures)} source queries failed for {name!r}: {details}")
+        self.failures = failures
+        self.sources_data = sources_data
+
+
+# Source data found, IDs queried and queries failed by one source query
+SourceResults = tuple[dict[str, dict[str, Any]], set[str], list[SourceFailure]]
+
+
+class OutputBuffer:
+    """Collects click.echo-style progress output to be echoed later, in order."""
+
+    def __init__(self) -> None:
+        self.lines: list[tuple[str, bool]] = []
+
+    def echo(self, message: str = "", nl: bool = True) -> None:
+        """Buffer a line of progress output (click.echo-compatible)."""
+        self.lines.append((message, nl))
+
+    def flush(self, echo: Callable[..., Any] = click.echo) -> None:
+        """Echo the buffered output and clear the buffer."""
+        for message, nl in self.lines:
+            echo(message, nl=nl)
+        self.lines.clear()
+
+
+def run_source_queries(
+    queries: list[Callable[[Callable[..., Any]], SourceResults]], echo: Callable[..., Any]
+) -> SourceResults:
+    """Run independent source queries concurrently.
+
+    Each query is called with its own echo function and returns the source
+    data it found, the IDs it queried and its failures. The queries run on
+    one thread each, so a phase takes as long as its slowest source rather
+    than the sum of them. Their output is buffered and echoed, and their
+    results merged, in list order, so the log and the source order match a
+    sequential run.
+
+    Args:
+        queries: Source queries, e.g. partial(_pubchem_by_name, client, name)
+        echo: Progress output function
+
+    Returns:
+        Merged source data, queried IDs and failures
+    """
+    if len(queries) <= 1:
+        results = [query(echo) for query in queries]
+    else:
+        buffers = [OutputBuffer() for _ in queries]
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = [executor.submit(query, buffer.echo) for query, buffer in zip(queries, buffers, strict=True)]
+            results = [future.result() for future in futures]
+        for buffer in buffers:
+            buffer.flush(echo)
+
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    failures: list[SourceFailure] = []
+    for found, queried, failed in results:
+        sources_data.update(found)
+        queried_ids |= queried
+        failures.extend(failed)
+    return sources_data, queried_ids, failures
+
+
+def _pubchem_by_name(pubchem_client: PubChemClient, name: str, echo: Callable[..., Any]) -> SourceResults:
+    """Phase 1: query PubChem by name."""
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    failures: list[SourceFailure] = []
+    echo("    → PubChem (by name): ", nl=False)
+    try:
+        results = pubchem_client.get_compounds_by_name(name)
+        if isinstance(results, list) and results:
+            echo(f"Found {len(results)} compound(s)")
+            result = results[0]
+            sources_data["pubchem_name"] = pubchem_to_dict(result, name)
+
+            # Extract synonyms (optional - continue without if fetch fails)
+            try:
+                synonyms = pubchem_client.get_synonyms(result.CID)
+                if isinstance(synonyms, list):
+                    sources_data["pubchem_name"]["synonyms"] = synonyms
+            except Exception as e:
+                logger.debug(
+                    "Failed to fetch PubChem synonyms for CID %s: %s",
+                    getattr(result, "CID", "unknown"),
+                    e,
+                )  # Synonyms are optional; continue enrichment
+
+            # Mark as queried
+            queried_ids.add(f"PUBCHEM.COMPOUND:{result.CID}")
+        elif is_request_failure(results):
+            echo(f"ERROR: {_error_text(results)}")
+            failures.append(SourceFailure("PubChem (by name)", _error_text(results)))
+        else:
+            echo("No results")
+    except Exception as e:
+        echo(f"ERROR: {e}")
+        failures.append(SourceFailure("PubChem (by name)", str(e)))
+    return sources_data, queried_ids, failures
+
+
+def _chebi_by_name(
+    chebi_client: ChEBIClient,
+    name: str,
+    chebi_closure: ChEBIClosureIndex | None,
+    echo: Callable[..., Any],
+) -> SourceResults:
+    """Phase 1: query ChEBI by name."""
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    failures: list[SourceFailure] = []
+    echo("    → ChEBI (by name): ", nl=False)
+    try:
+        chebi_result = chebi_client.search_exact(name)
+        if isinstance(chebi_result, ChEBISearchResult):
+            echo(f"Found {chebi_result.chebi_id}")
+            try:
+                compound = chebi_client.get_compound(chebi_result.chebi_id)
+                if is_request_failure(compound):
+                    failures.append(SourceFailure("ChEBI (compound)", _error_text(compound)))
+                compound_dict = compound.to_dict() if isinstance(compound, ChEBICompound) else None
+                sources_data["chebi_name"] = chebi_to_dict(chebi_result, compound_dict, chebi_closure)
+                queried_ids.add(chebi_result.chebi_id)
+            except Exception as e:
+                # Compound details failed; use search result without full compound data
+                failures.append(SourceFailure("ChEBI (compound)", str(e)))
+                sources_data["chebi_name"] = chebi_to_dict(chebi_result, None, chebi_closure)
+                queried_ids.add(chebi_result.chebi_id)
+        elif is_request_failure(chebi_result):
+            echo(f"ERROR: {_error_text(chebi_result)}")
+            failures.append(SourceFailure("ChEBI (by name)", _error_text(chebi_result)))
+        else:
+            echo("No exact match")
+    except Exception as e:
+        echo(f"ERROR: {e}")
+        failures.append(SourceFailure("ChEBI (by name)", str(e)))
+    return sources_data, queried_ids, failures
+
+
+def _cas_by_name(cas_client: Any, name: str, echo: Callable[..., Any]) -> SourceResults:
+    """Phase 1: query CAS by name."""
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    failures: list[SourceFailure] = []
+    echo("    → CAS (by name): ", nl=False)
+    try:
+        cas_results = cas_client.search_by_name(name)
+        if isinstance(cas_results, list) and cas_results:
+            cas_result = cas_results[0]
+            echo(f"Found {cas_result.rn} (mixture={cas_result.is_mixture})")
+            sources_data["cas_name"] = cas_to_dict(cas_result, name)
+            queried_ids.add(f"CAS:{cas_result.rn}")
+        elif is_request_failure(cas_results):
+            echo(f"ERROR: {_error_text(cas_results)}")
+            failures.append(SourceFailure("CAS (by name)", _error_text(cas_results)))
+        else:
+            echo("No results")
+    except Exception as e:
+        echo(f"ERROR: {e}")
+        failures.append(SourceFailure("CAS (by name)", str(e)))
+    return sources_data, queried_ids, failures
+
+
+def _chebi_by_ids(
+    chebi_client: ChEBIClient,
+    chebi_ids: list[str],
+    chebi_closure: ChEBIClosureIndex | None,
+    echo: Callable[..., Any],
+) -> SourceResults:
+    """Phase 2: fetch discovered ChEBI IDs."""
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    failures: list[SourceFailure] = []
+    echo(f"        → ChEBI: {len(chebi_ids)} IDs ", nl=False)
+    successes = 0
+    try:
+        # Deduplicated and fetched concurrently under the shared rate limit
+        compounds = chebi_client.get_compounds_batch(chebi_ids)
+    except Exception as e:
+        compounds = {}  # Skip failed IDs; continue spidering remaining identifiers
+        failures.append(SourceFailure("ChEBI (by ID)", str(e), tuple(chebi_ids)))
+    failed = [(chebi_id, c) for chebi_id, c in compounds.items() if is_request_failure(c)]
+    if failed:
+        failures.append(SourceFailure("ChEBI (by ID)", _error_text(failed[0][1]), tuple(c for c, _ in failed)))
+    for chebi_id, compound in compounds.items():
+        if isinstance(compound, ChEBICompound):
+            compound_dict = compound.to_dict()
+            # Create a search result for chebi_to_dict
+            search_result = ChEBISearchResult(
+                chebi_id=chebi_id,
+                name=compound.name or "",
+                ascii_name=compound.ascii_name or "",
+                definition=compound.definition or "",
+                stars=compound.stars or 0,
+                formula=compound.formula or "",
+                mass=compound.mass or 0.0,
+                score=0.0,
+            )
+            sources_data[f"chebi_{chebi_id}"] = chebi_to_dict(search_result, compound_dict, chebi_closure)
+            queried_ids.add(chebi_id)
+            successes += 1
+    echo(_fetch_summary(successes, failures))
+    return sources_data, queried_ids, failures
+
+
+def _pubchem_by_ids(
+    pubchem_client: PubChemClient,
+    pubchem_ids: list[str],
+    name: str,
+    echo: Callable[..., Any],
+) -> SourceResults:
+    """Phase 2: fetch discovered PubChem CIDs."""
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    failures: list[SourceFailure] = []
+    echo(f"        → PubChem: {len(pubchem_ids)} CIDs ", nl=False)
+    successes = 0
+    try:
+        # Bulk requests: one property table and one synonym list per chunk of CIDs
+        cids = {int(pc_id.split(":")[1]): pc_id for pc_id in pubchem_ids if pc_id.split(":")[1].isdigit()}
+        results = pubchem_client.get_compounds_by_cids(list(cids))
+        failed = [(cid, result) for cid, result in results.items() if is_request_failure(result)]
+        if failed:
+            failures.append(
+                SourceFailure("PubChem (by CID)", _error_text(failed[0][1]), tuple(cids[cid] for cid, _ in failed))
+            )
+        compounds = {cid: compound for cid, compound in results.items() if isinstance(compound, CompoundResult)}
+
+        # Synonyms are optional; continue enrichment without them if the fetch fails
+        try:
+            synonyms_by_cid = pubchem_client.get_synonyms_many(list(compounds)) if compounds else {}
+        except Exception as e:
+            logger.debug(f"Failed to fetch PubChem synonyms for {len(compounds)} CIDs: {e}")
+            synonyms_by_cid = {}
+
+        for cid, compound in compounds.items():
+            sources_data[f"pubchem_{cid}"] = pubchem_to_dict(compound, name)
+            synonyms = synonyms_by_cid.get(cid)
+            if isinstance(synonyms, list):
+                sources_data[f"pubchem_{cid}"]["synonyms"] = synonyms
+            queried_ids.add(cids[cid])
+            successes += 1
+    except Exception as e:
+        # Skip failed IDs; continue spidering remaining identifiers
+        failures.append(SourceFailure("PubChem (by CID)", str(e), tuple(pubchem_ids)))
+    echo(_fetch_summary(successes, failures))
+    return sources_data, queried_ids, failures
+
+
+def _cas_by_rns(cas_client: Any, cas_ids: list[str], name: str, echo: Callable[..., Any]) -> SourceResults:
+    """Phase 2: fetch discovered CAS RNs (concurrently, under the shared rate limit)."""
+    sources_data: dict[str, dict[str, Any]] = {}
+    queried_ids: set[str] = set()
+    echo(f"        → CAS: {len(cas_ids)} RNs ", nl=False)
+
+    def lookup(cas_id: str) -> Any:
+        try:
+            return cas_client.get_by_rn(cas_id.split(":")[1])
+        except Exception as e:
+            return e  # Skip failed IDs; continue spidering remaining identifiers
+
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_MAX_WORKERS, len(cas_ids)))) as executor:
+        results = list(executor.map(lookup, cas_ids))
+
+    successes = 0
+    failed: list[tuple[str, str]] = []
+    for cas_id, result in zip(cas_ids, results, strict=True):
+        if isinstance(result, CASResult):
+            sources_data[f"cas_{cas_id.split(':')[1]}"] = cas_to_dict(result, name)
+            queried_ids.add(cas_id)
+            successes += 1
+        elif isinstance(result, Exception):
+            failed.append((cas_id, str(result)))
+        elif is_request_failure(result):
+            failed.append((cas_id, _error_text(result)))
+    failures = [SourceFailure("CAS (by RN)", failed[0][1], tuple(cas_id for cas_id, _ in failed))] if failed else []
+    echo(_fetch_summary(successes, failures))
+    return sources_data, queried_ids, failures
+
+
+def _fetch_summary(successes: int, failures: list[SourceFailure]) -> str:
+    failed = sum(len(failure.ids) for failure in failures)
+    return f"({successes} succeeded, {failed} failed)" if failed else f"({successes} succeeded)"
+
+
+def discover_by_name(
+    name: str,
+    pubchem_client: PubChemClient | None,
+    chebi_client: ChEBIClient | None,
+    cas_client: Any | None,
+    chebi_closure: ChEBIClosureIndex | None = None,
+    echo: Callable[..., Any] = click.echo,
+) -> SourceResults:
+    """Phase 1: query every enabled source by name, concurrently.
+
+    Returns:
+        Source data found, the IDs it was found under and the failed queries
+    """
+    queries: list[Callable[[Callable[..., Any]], SourceResults]] = []
+    if pubchem_client:
+        queries.append(partial(_pubchem_by_name, pubchem_client, name))
+    if chebi_client:
+        queries.append(partial(_chebi_by_name, chebi_client, name, chebi_closure))
+    if cas_client:
+        queries.append(partial(_cas_by_name, cas_client, name))
+    return run_source_queries(queries, echo)
+
+
+def query_discovered_ids(
+    ids_to_query: Iterable[str],
+    name: str,
+    pubchem_client: PubChemClient | None,
+    chebi_client: ChEBIClient | None,
+    cas_client: Any | None,
+    chebi_closure: ChEBIClosureIndex | None = None,
+    echo: Callable[..., Any] = click.echo,
+) -> SourceResults:
+    """Phase 2: fetch discovered IDs from their sources, concurrently.
+
+    ChEBI IDs and PubChem CIDs are fetched in bulk, CAS RNs on a small pool.
+
+    Args:
+        ids_to_query: CURIEs to fetch (CHEBI:, PUBCHEM.COMPOUND: and CAS: are used)
+        name: Ingredient name, the fallback record name for PubChem and CAS
+        pubchem_client: PubChem API client
+        chebi_client: ChEBI API client
+        cas_client: CAS API client
+        chebi_closure: Optional ChEBI closure index for offline role classification
+        echo: Progress output function
+
+    Returns:
+        Source data keyed by source_key() of each fetched ID, the IDs fetched and the failed fetches
+    """
+    ids_to_query = list(ids_to_query)
+    queries: list[Callable[[Callable[..., Any]], SourceResults]] = []
+    chebi_ids = [id for id in ids_to_query if id.startswith("CHEBI:")]
+    if chebi_ids and chebi_client:
+        queries.append(partial(_chebi_by_ids, chebi_client, chebi_ids, chebi_closure))
+    pubchem_ids = [id for id in ids_to_query if id.startswith("PUBCHEM.COMPOUND:")]
+    if pubchem_ids and pubchem_client:
+        queries.append(partial(_pubchem_by_ids, pubchem_client, pubchem_ids, name))
+    cas_ids = [id for id in ids_to_query if id.startswith("CAS:")]
+    if cas_ids and cas_client:
+        queries.append(partial(_cas_by_rns, cas_client, cas_ids, name))
+    return run_source_queries(queries, echo)
+
+
+def source_key(curie: str) -> str:
+    """Key under which query_discovered_ids() stores the data fetched for a CURIE."""
+    prefix, _, local_id = curie.partition(":")
+    if prefix == "PUBCHEM.COMPOUND":
+        return f"pubchem_{int(local_id)}"
+    if prefix == "CAS":
+        return f"cas_{local_id}"
+    return f"chebi_{curie}"
+
+
+def consolidate_sources(sources_data: dict[str, dict[str, Any]], echo: Callable[..., Any] = click.echo) -> None:
+    """Phase 3: add merged synonyms and the biolink category to ``sources_data``."""
+    # Merge synonyms across all sources
+    all_synonyms = merge_synonyms(sources_data)
+    if all_synonyms:
+        # Add merged synonyms to a consolidated record
+        sources_data["_consolidated_synonyms"] = {"synonyms": all_synonyms}
+        echo(f"    Total unique synonyms: {len(all_synonyms)}")
+
+    # Determine biolink category
+    category = determine_biolink_category(sources_data)
+    sources_data["_consolidated_category"] = {"biolink_category": category}
+    echo(f"    Biolink category: {category}")
+
+
 def spider_enrich_ingredient(
     name: str,
     pubchem_client: PubChemClient | None,
     chebi_client: ChEBIClient | None,
     cas_client: Any | None,  # CASClient type
-    node_norm_client: NodeNormalizationClient,
+    node_norm_client: NodeNormalizationClient | None,
     max_iterations: int = 5,
+    chebi_closure: ChEBIClosureIndex | None = None,
+    echo: Callable[..., Any] = click.echo,
 ) -> dict[str, dict[str, Any]]:
     """Enrich ingredient using iterative spidering.
 
@@ -261,98 +716,50 @@ def spider_enrich_ingredient(
     Phase 2: Iteratively normalize IDs and query discovered sources
     Phase 3: Consolidate synonyms and determine biolink category
 
+    Within phases 1 and 2 the sources are independent, so they are queried
+    concurrently (see run_source_queries()); each phase waits only for its
+    slowest source.
+
+    A query that finds nothing is not an error. A query whose request fails
+    (network error, throttling, server error; see is_request_failure()) is:
+    spidering continues with the other sources, then IncompleteEnrichmentError
+    is raised carrying the partial data, so the ingredient can be retried.
+
     Args:
         name: Ingredient name to enrich
         pubchem_client: PubChem API client
         chebi_client: ChEBI API client
         cas_client: CAS API client
-        node_norm_client: Node Normalization client
+        node_norm_client: Node Normalization client (None: skip Phase 2)
         max_iterations: Maximum spider iterations (safety limit)
+        chebi_closure: Optional ChEBI closure index for offline role classification
+        echo: Progress output function (default: click.echo)
 
     Returns:
         Dict mapping source name to enrichment data
-    """
-    sources_data: dict[str, dict[str, Any]] = {}
-
-    # Track queried IDs to prevent re-querying (infinite loop prevention)
-    queried_ids: set[str] = set()
 
+    Raises:
+        IncompleteEnrichmentError: If any source query failed
+    """
     iteration = 0
 
     # Phase 1: Initial discovery by name
-    click.echo("  Phase 1: Initial discovery by name")
-
-    # Query PubChem by name
-    if pubchem_client:
-        click.echo("    → PubChem (by name): ", nl=False)
-        try:
-            results = pubchem_client.get_compounds_by_name(name)
-            if isinstance(results, list) and results:
-                click.echo(f"Found {len(results)} compound(s)")
-                result = results[0]
-                sources_data["pubchem_name"] = pubchem_to_dict(result, name)
-
-                # Extract synonyms (optional - continue without if fetch fails)
-                try:
-                    synonyms = pubchem_client.get_synonyms(result.CID)
-                    if isinstance(synonyms, list):
-                        sources_data["pubchem_name"]["synonyms"] = synonyms
-                except Exception as e:
-                    logger.debug(
-                        "Failed to fetch PubChem synonyms for CID %s: %s",
-                        getattr(result, "CID", "unknown"),
-                        e,
-                    )  # Synonyms are optional; continue enrichment
-
-                # Mark as queried
-                queried_ids.add(f"PUBCHEM.COMPOUND:{result.CID}")
-            else:
-                click.echo("No results")
-        except Exception as e:
-            click.echo(f"ERROR: {e}")
+    echo("  Phase 1: Initial discovery by name")
 
-    # Query ChEBI by name
-    if chebi_client:
-        click.echo("    → ChEBI (by name): ", nl=False)
-        try:
-            chebi_result = chebi_client.search_exact(name)
-            if isinstance(chebi_result, ChEBISearchResult):
-                click.echo(f"Found {chebi_result.chebi_id}")
-                try:
-                    compound = chebi_client.get_compound(chebi_result.chebi_id)
-                    compound_dict = compound.to_dict() if isinstance(compound, ChEBICompound) else None
-                    sources_data["chebi_name"] = chebi_to_dict(chebi_result, compound_dict)
-                    queried_ids.add(chebi_result.chebi_id)
-                except Exception:
-                    # Compound details failed; use search result without full compound data
-                    sources_data["chebi_name"] = chebi_to_dict(chebi_result, None)
-                    queried_ids.add(chebi_result.chebi_id)
-            else:
-                click.echo("No exact match")
-        except Exception as e:
-            click.echo(f"ERROR: {e}")
-
-    # Query CAS by name
-    if cas_client:
-        click.echo("    → CAS (by name): ", nl=False)
-        try:
-            cas_results = cas_client.search_by_name(name)
-            if isinstance(cas_results, list) and cas_results:
-                cas_result = cas_results[0]
-                click.echo(f"Found {cas_result.rn} (mixture={cas_result.is_mixture})")
-                sources_data["cas_name"] = cas_to_dict(cas_result, name)
-                queried_ids.add(f"CAS:{cas_result.rn}")
-            else:
-                click.echo("No results")
-        except Exception as e:
-            click.echo(f"ERROR: {e}")
+    # Track queried IDs to prevent re-querying (infinite loop prevention)
+    sources_data, queried_ids, failures = discover_by_name(
+        name, pubchem_client, chebi_client, cas_client, chebi_closure, echo
+    )
 
-    # Phase 2: Spider loop
-    click.echo(f"  Phase 2: Iterative spidering (max {max_iterations} iterations)")
+    # Phase 2: Spider loop (IDs are discovered through Node Normalization)
+    if node_norm_client is None:
+        echo("  Phase 2: Skipped (Node Normalization disabled)")
+    else:
+        echo(f"  Phase 2: Iterative spidering (max {max_iterations} iterations)")
 
-    while iteration < max_iterations:
+    while node_norm_client is not None and iteration < max_iterations:
         iteration += 1
-        click.echo(f"    Iteration {iteration}:")
+        echo(f"    Iteration {iteration}:")
 
         # Collect all CURIEs from current data
         all_curies = set()
@@ -363,20 +770,26 @@ def spider_enrich_ingredient(
         new_ids = all_curies - queried_ids
 
         if not new_ids:
-            click.echo("      No new IDs discovered, stopping spider")
+            echo("      No new IDs discovered, stopping spider")
             break
 
-        click.echo(f"      Found {len(new_ids)} new IDs to normalize")
+        echo(f"      Found {len(new_ids)} new IDs to normalize")
 
         # Normalize all new IDs in batch
         try:
             norm_results = node_norm_client.normalize_batch(list(new_ids))
         except Exception as e:
-            click.echo(f"      ERROR normalizing IDs: {e}")
+            echo(f"      ERROR normalizing IDs: {e}")
+            failures.append(SourceFailure("Node Normalization", str(e), tuple(sorted(new_ids))))
             break
 
         new_discoveries = set()
 
+        failed = sorted(curie for curie, result in norm_results.items() if is_request_failure(result))
+        if failed:
+            message = _error_text(norm_results[failed[0]])
+            failures.append(SourceFailure("Node Normalization", message, tuple(failed)))
+
         for curie, norm_result in norm_results.items():
             if not isinstance(norm_result, NormalizedNode):
                 continue
@@ -402,103 +815,416 @@ def spider_enrich_ingredient(
         ids_to_query = new_discoveries - queried_ids
 
         if not ids_to_query:
-            click.echo("      No new API queries needed")
+            echo("      No new API queries needed")
             continue
 
-        click.echo(f"      Querying {len(ids_to_query)} IDs from APIs")
-
-        # Query ChEBI IDs
-        chebi_ids = [id for id in ids_to_query if id.startswith("CHEBI:")]
-        if chebi_ids and chebi_client:
-            click.echo(f"        → ChEBI: {len(chebi_ids)} IDs ", nl=False)
-            successes = 0
-            for chebi_id in chebi_ids:
-                try:
-                    compound = chebi_client.get_compound(chebi_id)
-                    if isinstance(compound, ChEBICompound):
-                        compound_dict = compound.to_dict()
-                        # Create a search result for chebi_to_dict
-                        search_result = ChEBISearchResult(
-                            chebi_id=chebi_id,
-                            name=compound.name or "",
-                            ascii_name=compound.ascii_name or "",
-                            definition=compound.definition or "",
-                            stars=compound.stars or 0,
-                            formula=compound.formula or "",
-                            mass=compound.mass or 0.0,
-                            score=0.0,
-                        )
-                        sources_data[f"chebi_{chebi_id}"] = chebi_to_dict(search_result, compound_dict)
-                        queried_ids.add(chebi_id)
-                        successes += 1
-                except Exception:
-                    pass  # Skip failed IDs; continue spidering remaining identifiers
-            click.echo(f"({successes} succeeded)")
-
-        # Query PubChem CIDs
-        pubchem_ids = [id for id in ids_to_query if id.startswith("PUBCHEM.COMPOUND:")]
-        if pubchem_ids and pubchem_client:
-            click.echo(f"        → PubChem: {len(pubchem_ids)} CIDs ", nl=False)
-            successes = 0
-            for pc_id in pubchem_ids:
-                try:
-                    cid = int(pc_id.split(":")[1])
-                    result = pubchem_client.get_compound_by_cid(cid)  # type: ignore[assignment]
-                    if isinstance(result, CompoundResult):
-                        sources_data[f"pubchem_{cid}"] = pubchem_to_dict(result, name)
-
-                        # Get synonyms (optional - continue without if fetch fails)
-                        try:
-                            synonyms = pubchem_client.get_synonyms(cid)
-                            if isinstance(synonyms, list):
-                                sources_data[f"pubchem_{cid}"]["synonyms"] = synonyms
-                        except Exception:
-                            pass  # Synonyms are optional; continue enrichment without them
-
-                        queried_ids.add(pc_id)
-                        successes += 1
-                except Exception:
-                    pass  # Skip failed IDs; continue spidering remaining identifiers
-            click.echo(f"({successes} succeeded)")
-
-        # Query CAS RNs
-        cas_ids = [id for id in ids_to_query if id.startswith("CAS:")]
-        if cas_ids and cas_client:
-            click.echo(f"        → CAS: {len(cas_ids)} RNs ", nl=False)
-            successes = 0
-            for cas_id in cas_ids:
-                try:
-                    rn = cas_id.split(":")[1]
-                    result = cas_client.get_by_rn(rn)
-                    if isinstance(result, CASResult):
-                        sources_data[f"cas_{rn}"] = cas_to_dict(result, name)
-                        queried_ids.add(cas_id)
-                        successes += 1
-                except Exception:
-                    pass  # Skip failed IDs; continue spidering remaining identifiers
-            click.echo(f"({successes} succeeded)")
+        echo(f"      Querying {len(ids_to_query)} IDs from APIs")
+
+        found, queried, failed_fetches = query_discovered_ids(
+            ids_to_query, name, pubchem_client, chebi_client, cas_client, chebi_closure, echo
+        )
+        sources_data.update(found)
+        queried_ids |= queried
+        failures.extend(failed_fetches)
 
     if iteration >= max_iterations:
-        click.echo(f"      Reached maximum iterations ({max_iterations}), stopping")
+        echo(f"      Reached maximum iterations ({max_iterations}), stopping")
 
     # Phase 3: Consolidate
-    click.echo("  Phase 3: Consolidation")
-    click.echo(f"    Total sources: {len(sources_data)}")
-    click.echo(f"    Total IDs queried: {len(queried_ids)}")
+    echo("  Phase 3: Consolidation")
+    echo(f"    Total sources: {len(sources_data)}")
+    echo(f"    Total IDs queried: {len(queried_ids)}")
+    consolidate_sources(sources_data, echo)
+
+    if failures:
+        echo(f"    Incomplete: {len(failures)} source queries failed")
+        raise IncompleteEnrichmentError(name, failures, sources_data)
+    return sources_data
 
-    # Merge synonyms across all sources
-    all_synonyms = merge_synonyms(sources_data)
-    if all_synonyms:
-        # Add merged synonyms to a consolidated record
-        sources_data["_consolidated_synonyms"] = {"synonyms": all_synonyms}
-        click.echo(f"    Total unique synonyms: {len(all_synonyms)}")
 
-    # Determine biolink category
-    category = determine_biolink_category(sources_data)
-    sources_data["_consolidated_category"] = {"biolink_category": category}
-    click.echo(f"    Biolink category: {category}")
+@dataclass
+class EnrichmentOutcome:
+    """Result of enriching one ingredient.
 
-    return sources_data
+    Attributes:
+        name: Ingredient name
+        sources_data: Spider results (partial if some source queries failed, None if enrichment raised)
+        error: Exception raised during enrichment (IncompleteEnrichmentError if source queries failed)
+        output: Buffered progress output of a concurrent run
+        api_calls: API calls made to enrich the ingredient, None if not measured (see iter_enrichments)
+    """
+
+    name: str
+    sources_data: dict[str, dict[str, Any]] | None = None
+    error: Exception | None = None
+    output: OutputBuffer = field(default_factory=OutputBuffer)
+    api_calls: int | None = None
+
+
+def spider_enrich_corpus(
+    names: list[str],
+    pubchem_client: PubChemClient | None,
+    chebi_client: ChEBIClient | None,
+    cas_client: Any | None,  # CASClient type
+    node_norm_client: NodeNormalizationClient | None,
+    max_iterations: int = 5,
+    chebi_closure: ChEBIClosureIndex | None = None,
+    workers: int = 1,
+    echo: Callable[..., Any] = click.echo,
+) -> list[EnrichmentOutcome]:
+    """Enrich many ingredients, spidering their identifiers together.
+
+    Phase 1 queries every ingredient by name, as spider_enrich_ingredient()
+    does (``workers`` ingredients at a time). Phase 2 then runs once for the
+    whole corpus: each iteration collects every ingredient's unqueried
+    CURIEs into one global frontier, normalizes the CURIEs not seen before
+    in a single normalize_batch() call, fetches the discovered IDs not seen
+    before with one bulk query per source, and fans the results back out to
+    every ingredient that reached them. A CURIE shared by many ingredients
+    (a counter-ion, a common parent) is normalized and fetched once, so API
+    calls scale with distinct IDs rather than ingredients x IDs. IDs that
+    could not be fetched are not retried in later iterations.
+
+    Failed queries are attributed to the ingredients that needed them: the
+    outcome of such an ingredient carries an IncompleteEnrichmentError (its
+    ``sources_data`` is the partial data), as spider_enrich_ingredient()
+    would raise.
+
+    Args:
+        names: Ingredient names
+        pubchem_client: PubChem API client
+        chebi_client: ChEBI API client
+        cas_client: CAS API client
+        node_norm_client: Node Normalization client (None: skip Phase 2)
+        max_iterations: Maximum spider iterations (safety limit)
+        chebi_closure: Optional ChEBI closure index for offline role classification
+        workers: Ingredients queried concurrently in Phase 1
+        echo: Progress output function (default: click.echo)
+
+    Returns:
+        Per-ingredient outcomes (source data as from spider_enrich_ingredient), in input order
+    """
+    total = len(names)
+
+    # Phase 1: Initial discovery by name, per ingredient
+    echo(f"Phase 1: Initial discovery by name ({total} ingredients)")
+
+    def discover(name: str) -> tuple[OutputBuffer, SourceResults]:
+        buffer = OutputBuffer()
+        return buffer, discover_by_name(name, pubchem_client, chebi_client, cas_client, chebi_closure, buffer.echo)
+
+    corpus_data: list[dict[str, dict[str, Any]]] = []
+    corpus_queried: list[set[str]] = []
+    corpus_failures: list[list[SourceFailure]] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = executor.map(discover, names)
+        for idx, (name, (buffer, (found, queried, failed))) in enumerate(zip(names, results, strict=True), 1):
+            echo(f"\n[{idx}/{total}] {name}")
+            buffer.flush(echo)
+            corpus_data.append(found)
+            corpus_queried.append(queried)
+            corpus_failures.append(failed)
+
+    # Phase 2: Spider loop over the global frontier (IDs are discovered through Node Normalization)
+    if node_norm_client is None:
+        echo("\nPhase 2: Skipped (Node Normalization disabled)")
+    else:
+        echo(f"\nPhase 2: Corpus spidering (max {max_iterations} iterations)")
+
+    normalized: dict[str, NormalizedNode | None] = {}  # CURIE -> result (None: not normalizable)
+    attempted: set[str] = set()  # IDs already fetched from the APIs
+    fetched: dict[str, dict[str, Any]] = {}  # source_key() -> data of successful fetches
+    norm_failures: dict[str, str] = {}  # CURIE -> error of a failed normalization request
+    failed_fetches: dict[str, SourceFailure] = {}  # CURIE -> failed fetch
+
+    iteration = 0
+    while node_norm_client is not None and iteration < max_iterations:
+        iteration += 1
+        echo(f"  Iteration {iteration}:")
+        resolved_before = sum(map(len, corpus_queried))
+
+        # Each ingredient's unqueried CURIEs
+        new_ids_by_ingredient = []
+        for sources_data, queried_ids in zip(corpus_data, corpus_queried, strict=True):
+            all_curies = set()
+            for data in sources_data.values():
+                all_curies.update(extract_all_curies(data))
+            new_ids_by_ingredient.append(all_curies - queried_ids)
+
+        frontier = set().union(*new_ids_by_ingredient)
+        if not frontier:
+            echo("    No new IDs discovered, stopping spider")
+            break
+
+        # Normalize the CURIEs never seen before, all in one batch
+        unseen = sorted(frontier - normalized.keys())
+        echo(f"    Found {len(frontier)} new IDs ({len(unseen)} not seen before) to normalize")
+        if unseen:
+            try:
+                norm_results = node_norm_client.normalize_batch(unseen)
+            except Exception as e:
+                echo(f"    ERROR normalizing IDs: {e}")
+                for new_ids, failures in zip(new_ids_by_ingredient, corpus_failures, strict=True):
+                    if new_ids & set(unseen):
+                        failures.append(SourceFailure("Node Normalization", str(e), tuple(sorted(new_ids))))
+                break
+            for curie in unseen:
+                norm_result = norm_results.get(curie)
+                normalized[curie] = norm_result if isinstance(norm_result, NormalizedNode) else None
+                if is_request_failure(norm_result):
+                    norm_failures[curie] = _error_text(norm_result)
+
+        # Fan normalizations out; collect the IDs each ingredient discovered
+        ids_to_query_by_ingredient = []
+        for sources_data, queried_ids, new_ids, failures in zip(
+            corpus_data, corpus_queried, new_ids_by_ingredient, corpus_failures, strict=True
+        ):
+            unnormalized = sorted(new_ids & norm_failures.keys())
+            if unnormalized:
+                message = norm_failures[unnormalized[0]]
+                failures.append(SourceFailure("Node Normalization", message, tuple(unnormalized)))
+            new_discoveries = set()
+            for curie in sorted(new_ids):
+                norm_result = normalized.get(curie)
+                if norm_result is None:
+                    continue
+                queried_ids.add(curie)
+                sources_data[f"node_norm_{curie}"] = node_norm_to_dict(norm_result)
+                for prefix, id_list in (norm_result.equivalent_ids or {}).items():
+                    if isinstance(id_list, list):
+                        for id_val in id_list:
+                            # Construct full CURIE
+                            new_discoveries.add(str(id_val) if ":" in str(id_val) else f"{prefix}:{id_val}")
+            ids_to_query_by_ingredient.append(new_discoveries - queried_ids)
+
+        # Fetch the IDs never fetched before, with one bulk query per source
+        to_fetch = set().union(*ids_to_query_by_ingredient) - attempted
+        if to_fetch:
+            echo(f"    Querying {len(to_fetch)} IDs from APIs")
+            # The ingredient name only names records lacking one; fan-out fills it in
+            found, _, fetch_failures = query_discovered_ids(
+                sorted(to_fetch), "", pubchem_client, chebi_client, cas_client, chebi_closure, echo
+            )
+            attempted |= to_fetch
+            fetched.update(found)
+            for failure in fetch_failures:
+                failed_fetches.update(dict.fromkeys(failure.ids, failure))
+        elif not any(ids_to_query_by_ingredient):
+            echo("    No new API queries needed")
+
+        for name, sources_data, queried_ids, ids_to_query, failures in zip(
+            names, corpus_data, corpus_queried, ids_to_query_by_ingredient, corpus_failures, strict=True
+        ):
+            for failure in dict.fromkeys(
+                failed_fetches[curie] for curie in sorted(ids_to_query & failed_fetches.keys())
+            ):
+                ids = tuple(sorted(ids_to_query & set(failure.ids)))
+                failures.append(SourceFailure(failure.source, failure.message, ids))
+            for curie in sorted(ids_to_query):
+                key = source_key(curie)
+                if key not in fetched:
+                    continue
+                data = {**fetched[key]}
+                if not data.get("name") and not key.startswith("chebi_"):
+                    data["name"] = name
+                sources_data[key] = data
+                queried_ids.add(curie)
+
+        # CURIEs that cannot be normalized or fetched stay in the frontier; stop once nothing resolves
+        if sum(map(len, corpus_queried)) == resolved_before:
+            echo("    No new IDs resolved, stopping spider")
+            break
+
+    if iteration >= max_iterations:
+        echo(f"    Reached maximum iterations ({max_iterations}), stopping")
+    echo(f"    Normalized {len(normalized)} distinct IDs, fetched {len(attempted)} distinct IDs")
+
+    # Phase 3: Consolidate each ingredient
+    echo("\nPhase 3: Consolidation")
+    outcomes = []
+    for name, sources_data, failures in zip(names, corpus_data, corpus_failures, strict=True):
+        consolidate_sources(sources_data, echo=OutputBuffer().echo)
+        error = IncompleteEnrichmentError(name, failures, sources_data) if failures else None
+        outcomes.append(EnrichmentOutcome(name, sources_data, error))
+    echo(f"  Consolidated {total} ingredients")
+    incomplete = sum(1 for outcome in outcomes if outcome.error is not None)
+    if incomplete:
+        echo(f"  Incomplete: {incomplete} ingredients had failed source queries")
+
+    return outcomes
+
+
+def _enrich(enrich: Callable[..., dict[str, dict[str, Any]]], name: str, buffered: bool) -> EnrichmentOutcome:
+    """Run one enrichment, capturing its result or exception."""
+    outcome = EnrichmentOutcome(name)
+    try:
+        outcome.sources_data = enrich(name=name, echo=outcome.output.echo if buffered else click.echo)
+    except IncompleteEnrichmentError as e:
+        outcome.sources_data = e.sources_data
+        outcome.error = e
+    except Exception as e:
+        outcome.error = e
+    return outcome
+
+
+def iter_enrichments(
+    names: list[str],
+    enrich: Callable[..., dict[str, dict[str, Any]]],
+    workers: int = 1,
+) -> Iterator[EnrichmentOutcome]:
+    """Enrich ingredients, yielding the outcomes in input order.
+
+    With one worker, ingredients are enriched one after another and progress
+    is echoed as it happens. With more, up to ``workers`` ingredients are
+    enriched concurrently on a thread pool; each one's progress output is
+    buffered and echoed when its outcome is yielded, so the console log (and
+    whatever the caller writes per outcome) is identical to a serial run.
+    API clients are shared between the threads; per-service rate limits are
+    enforced by the process-wide per-host rate limiters.
+
+    With one worker, each outcome's ``api_calls`` is the number of API
+    requests its enrichment sent (see MetricsRegistry.total_calls(); response
+    cache hits are not counted). Concurrent ingredients' requests cannot be
+    told apart, so with more workers it is left None.
+
+    Args:
+        names: Ingredient names
+        enrich: Called as ``enrich(name=..., echo=...)`` (see spider_enrich_ingredient)
+        workers: Number of ingredients enriched concurrently
+
+    Yields:
+        One EnrichmentOutcome per name
+    """
+    total = len(names)
+
+    if workers <= 1:
+        metrics = get_metrics()
+        for idx, name in enumerate(names, 1):
+            click.echo(f"\n[{idx}/{total}] Processing: {name}")
+            calls = metrics.total_calls()
+            outcome = _enrich(enrich, name, buffered=False)
+            outcome.api_calls = metrics.total_calls() - calls
+            yield outcome
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_enrich, enrich, name, True) for name in names]
+        for idx, (name, future) in enumerate(zip(names, futures, strict=True), 1):
+            click.echo(f"\n[{idx}/{total}] Processing: {name}")
+            outcome = future.result()
+            outcome.output.flush()
+            yield outcome
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def pending_rows(
+    rows: list[dict[str, str]],
+    statuses: Mapping[tuple[str, str], str],
+    retry_failed: bool = False,
+) -> list[dict[str, str]]:
+    """Select the input rows a resumed run still has to enrich.
+
+    Args:
+        rows: Input rows (with an "ingredient_name" column)
+        statuses: Journal status per (ingredient name, row hash), see EnrichmentJournal.statuses()
+        retry_failed: Select only rows whose last run failed; otherwise every row not completed
+
+    Returns:
+        Selected rows, in input order
+    """
+
+    def status(row: dict[str, str]) -> str | None:
+        return statuses.get((row["ingredient_name"], row_hash(row)))
+
+    if retry_failed:
+        return [row for row in rows if status(row) == FAILED]
+    return [row for row in rows if status(row) != COMPLETED]
+
+
+def split_incremental(
+    rows: list[dict[str, str]],
+    lookup: Callable[[str, str], JournalEntry | None],
+    last_enriched: Mapping[str, datetime],
+    max_age: timedelta,
+    now: datetime | None = None,
+) -> tuple[list[dict[str, str]], list[JournalEntry]]:
+    """Split input rows into those an incremental run re-enriches and those up to date.
+
+    A row is up to date if the journal records it (same name and row hash,
+    so the input is unchanged) as completed with data, and the store's
+    ``last_enriched`` for the ingredient is within ``max_age``. Ingredients
+    that found nothing are always re-enriched, as are rows whose stored
+    records are missing (e.g., a new store).
+
+    Args:
+        rows: Input rows (with an "ingredient_name" column)
+        lookup: Journal lookup by (name, row hash), see EnrichmentJournal.get()
+        last_enriched: Oldest last_enriched per ingredient, see EnrichmentStore.last_enriched_by_query()
+        max_age: Time after which an ingredient is stale
+        now: Current time (naive local time, like last_enriched; default: now)
+
+    Returns:
+        Tuple of (rows to enrich in input order, journal entries of the up-to-date rows)
+    """
+    cutoff = (now or datetime.now()) - max_age
+    stale: list[dict[str, str]] = []
+    up_to_date: list[JournalEntry] = []
+    for row in rows:
+        name = row["ingredient_name"]
+        entry = lookup(name, row_hash(row))
+        enriched = last_enriched.get(name)
+        if entry is not None and entry.status == COMPLETED and entry.sources_data and enriched and enriched >= cutoff:
+            up_to_date.append(entry)
+        else:
+            stale.append(row)
+    return stale, up_to_date
+
+
+def store_sources_data(store: EnrichmentStore, name: str, sources_data: dict[str, dict[str, Any]]) -> None:
+    """Upsert every source's data for an ingredient, with provenance.
+
+    Args:
+        store: Enrichment store
+        name: Ingredient name (recorded as the query)
+        sources_data: Spider results (see spider_enrich_ingredient)
+    """
+    # Merge all fields from all sources
+    merged_data: dict[str, Any] = {}
+
+    for source, data in sources_data.items():
+        # Skip internal consolidation records during merging
+        if source.startswith("_consolidated"):
+            continue
+
+        for key, value in data.items():
+            if value is not None and key not in merged_data:
+                merged_data[key] = value
+
+    # Add consolidated synonyms to merged_data
+    if "_consolidated_synonyms" in sources_data:
+        merged_synonyms = sources_data["_consolidated_synonyms"].get("synonyms")
+        if merged_synonyms:
+            merged_data["synonyms"] = merged_synonyms
+
+    # Upsert for each source to track provenance
+    for source, data in sources_data.items():
+        # Skip internal consolidation records
+        if source.startswith("_consolidated"):
+            continue
+
+        data_with_keys = {**data}
+        # Add composite key fields from merged data
+        if "inchikey" not in data_with_keys and merged_data.get("inchikey"):
+            data_with_keys["inchikey"] = merged_data["inchikey"]
+        if "cas_rn" not in data_with_keys and merged_data.get("cas_rn"):
+            data_with_keys["cas_rn"] = merged_data["cas_rn"]
+        # Add consolidated synonyms to each record
+        if "synonyms" not in data_with_keys and merged_data.get("synonyms"):
+            data_with_keys["synonyms"] = merged_data["synonyms"]
+
+        store.upsert_ingredient(data_with_keys, source=source, query=name)
 
 
 @click.command()
@@ -574,6 +1300,98 @@ def spider_enrich_ingredient(
     default=5,
     help="Maximum spider iterations for iterative enrichment (default: 5)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Ingredients enriched concurrently (output and store contents match a serial run)",
+)
+@click.option(
+    "--corpus",
+    is_flag=True,
+    help="Spider all ingredients' identifiers together, fetching each shared ID once",
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_JOURNAL,
+    help="SQLite progress journal recording each ingredient's outcome",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip ingredients the journal records as completed",
+)
+@click.option(
+    "--retry-failed",
+    is_flag=True,
+    help="Process only ingredients the journal records as failed",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip ingredients whose input is unchanged and that were enriched within --ttl-days",
+)
+@click.option(
+    "--ttl-days",
+    type=click.FloatRange(min=0),
+    default=30.0,
+    help="Days before an incremental run re-enriches an unchanged ingredient (default: 30)",
+)
+@click.option(
+    "--http-cache",
+    "http_cache_path",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_HTTP_CACHE,
+    help="SQLite file caching API responses between runs",
+)
+@click.option(
+    "--cache-ttl-days",
+    type=float,
+    default=30.0,
+    help="Days before a cached API response is re-fetched (default: 30)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable the API response cache",
+)
+@click.option(
+    "--chebi-db",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Local ChEBI DuckDB file (see load_chebi_duckdb); answers ChEBI lookups offline",
+)
+@click.option(
+    "--chebi-closure",
+    "chebi_closure_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="ChEBI closure index (see load_chebi_duckdb); classifies roles including inherited ones",
+)
+@click.option(
+    "--metrics-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write API request metrics to this file on exit (.prom/.txt: Prometheus text, otherwise JSON)",
+)
+@click.option(
+    "--cassette",
+    "cassette_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Record API exchanges to, or replay them from, this cassette directory (see --cassette-mode)",
+)
+@click.option(
+    "--cassette-mode",
+    type=click.Choice(CASSETTE_MODES),
+    default="replay",
+    show_default=True,
+    help="record: capture every API response; replay: answer from the cassette without network access",
+)
 def main(
     input_file: Path,
     store_path: Path,
@@ -587,6 +1405,21 @@ def main(
     no_cas: bool,
     no_node_norm: bool,
     max_spider_iterations: int,
+    workers: int,
+    corpus: bool,
+    journal_path: Path,
+    resume: bool,
+    retry_failed: bool,
+    incremental: bool,
+    ttl_days: float,
+    http_cache_path: Path,
+    cache_ttl_days: float,
+    no_cache: bool,
+    chebi_db: Path | None,
+    chebi_closure_path: Path | None,
+    metrics_out: Path | None,
+    cassette_path: Path | None,
+    cassette_mode: CassetteMode,
 ) -> None:
     """Multi-source enrichment pipeline with EnrichmentStore.
 
@@ -600,23 +1433,43 @@ def main(
         # Test with first 5 ingredients
         uv run python -m cmm_ai_automation.scripts.enrich_to_store --limit 5 --verbose
 
+        # Enrich 8 ingredients at a time
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --workers 8
+
+        # Spider the whole corpus at once (API calls scale with distinct IDs)
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --corpus --workers 8
+
+        # Continue an interrupted run, then retry the ingredients that failed
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --resume
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --retry-failed
+
+        # Re-enrich only new, edited, and stale (older than 90 days) ingredients
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --incremental --ttl-days 90
+
         # Enrich and export to KGX
         uv run python -m cmm_ai_automation.scripts.enrich_to_store --export-kgx
+
+        # Record a run, then replay it offline (e.g., to time pipeline overhead)
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --cassette cassettes/enrich --cassette-mode record
+        uv run python -m cmm_ai_automation.scripts.enrich_to_store --cassette cassettes/enrich
     """
     setup_logging(verbose)
 
+    if metrics_out is not None:
+        # Runs however the command exits
+        click.get_current_context().call_on_close(partial(get_metrics().write, metrics_out))
+
+    if cassette_path is not None:
+        set_default_cassette(Cassette(cassette_path, mode=cassette_mode))
+        click.get_current_context().call_on_close(partial(set_default_cassette, None))
+        click.echo(f"API cassette ({cassette_mode}): {cassette_path}")
+
     # Read input ingredients
     click.echo(f"Reading ingredients from: {input_file}")
     with input_file.open(newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f, delimiter="\t")
         ingredients = list(reader)
 
-    if limit:
-        ingredients = ingredients[:limit]
-        click.echo(f"Limited to first {limit} ingredients")
-
-    click.echo(f"Found {len(ingredients)} ingredients to process")
-
     # Validate required columns
     if ingredients:
         required_columns = ["ingredient_name"]
@@ -625,6 +1478,34 @@ def main(
             click.echo(f"ERROR: Missing required columns: {', '.join(missing)}")
             sys.exit(1)
 
+    # Record each ingredient's outcome; skip finished work when resuming
+    journal = None
+    skipped = 0
+    up_to_date: list[JournalEntry] = []
+    if not dry_run or resume or retry_failed or incremental:
+        journal = EnrichmentJournal(journal_path)
+        click.echo(f"Progress journal: {journal_path}")
+    if journal is not None and (resume or retry_failed):
+        pending = pending_rows(ingredients, journal.statuses(), retry_failed=retry_failed)
+        skipped = len(ingredients) - len(pending)
+        ingredients = pending
+        kind = "not failed" if retry_failed else "completed"
+        click.echo(f"Skipping {skipped} ingredients the journal records as {kind}")
+    if journal is not None and incremental:
+        last_enriched: dict[str, datetime] = {}
+        if store_path.exists():
+            existing = EnrichmentStore(store_path=store_path)
+            last_enriched = existing.last_enriched_by_query()
+            existing.close()
+        ingredients, up_to_date = split_incremental(ingredients, journal.get, last_enriched, timedelta(days=ttl_days))
+        click.echo(f"Skipping {len(up_to_date)} unchanged ingredients enriched within {ttl_days:g} days")
+
+    if limit:
+        ingredients = ingredients[:limit]
+        click.echo(f"Limited to first {limit} ingredients")
+
+    click.echo(f"Found {len(ingredients)} ingredients to process")
+
     if dry_run:
         click.echo("\n[DRY RUN] Would enrich ingredients:")
         for ing in ingredients:
@@ -638,6 +1519,8 @@ def main(
                 click.echo("    → CAS: search by name")
             if not no_node_norm:
                 click.echo("    → Node Normalization: resolve IDs")
+        if journal is not None:
+            journal.close()
         return
 
     # Initialize store
@@ -678,11 +1561,24 @@ def main(
         collection.delete_where({"id": "DUMMY|0-00-0"})
         click.echo("Schema initialized")
 
+    # Share one response cache between all API clients
+    http_cache = None
+    if not no_cache:
+        http_cache = ResponseCache(http_cache_path, ttl=cache_ttl_days * 24 * 3600)
+        set_default_cache(http_cache)
+        click.echo(f"API response cache: {http_cache_path}")
+
+    # Each worker may run a batch of requests to one host; keep those connections pooled
+    pool_maxsize = workers * BATCH_MAX_WORKERS
+    if pool_maxsize > get_session_config().pool_maxsize:
+        configure_sessions(SessionConfig(pool_maxsize=pool_maxsize))
+
     # Initialize API clients
     pubchem_client = PubChemClient() if not no_pubchem else None
-    chebi_client = ChEBIClient() if not no_chebi else None
+    chebi_client = ChEBIClient(local_db=chebi_db) if not no_chebi else None
     cas_client = get_cas_client() if not no_cas else None
     node_norm_client = NodeNormalizationClient() if not no_node_norm else None
+    chebi_closure = ChEBIClosureIndex.load(chebi_closure_path) if chebi_closure_path else None
 
     if cas_client:
         click.echo("CAS Common Chemistry API enabled")
@@ -699,23 +1595,37 @@ def main(
         "errors": 0,
     }
 
-    # Process each ingredient
-    for idx, ing in enumerate(ingredients, 1):
-        name = ing["ingredient_name"]
-        click.echo(f"\n[{idx}/{len(ingredients)}] Processing: {name}")
-
+    # Use spider enrichment to iteratively discover and query all related IDs
+    spider_options: dict[str, Any] = {
+        "pubchem_client": pubchem_client if not no_pubchem else None,
+        "chebi_client": chebi_client if not no_chebi else None,
+        "cas_client": cas_client if not no_cas else None,
+        "node_norm_client": node_norm_client,
+        "max_iterations": max_spider_iterations,
+        "chebi_closure": chebi_closure,
+    }
+    names = [ing["ingredient_name"] for ing in ingredients]
+    outcomes: Iterable[EnrichmentOutcome]
+    if corpus:
+        click.echo("\nCorpus mode: spidering all ingredients' identifiers together")
+        # Shared IDs are fetched once for the whole corpus, so API calls are not measured per ingredient
+        outcomes = spider_enrich_corpus(names, workers=workers, **spider_options)
+    else:
+        if workers > 1:
+            click.echo(f"Enriching up to {workers} ingredients concurrently")
+        outcomes = iter_enrichments(names, partial(spider_enrich_ingredient, **spider_options), workers=workers)
+
+    # Process each ingredient; this loop is the store's (and journal's) only writer, in input order
+    row_hashes = [row_hash(ing) for ing in ingredients]
+    for outcome, key in zip(outcomes, row_hashes, strict=True):
+        name = outcome.name
         stats["processed"] += 1
 
         try:
-            # Use spider enrichment to iteratively discover and query all related IDs
-            sources_data = spider_enrich_ingredient(
-                name=name,
-                pubchem_client=pubchem_client if not no_pubchem else None,
-                chebi_client=chebi_client if not no_chebi else None,
-                cas_client=cas_client if not no_cas else None,
-                node_norm_client=node_norm_client,  # type: ignore[arg-type]
-                max_iterations=max_spider_iterations,
-            )
+            error = outcome.error
+            if error is not None and not isinstance(error, IncompleteEnrichmentError):
+                raise error
+            sources_data = outcome.sources_data or {}
 
             # Update stats based on sources found
             if any(k.startswith("pubchem") for k in sources_data):
@@ -729,46 +1639,21 @@ def main(
 
             # Store all source data with provenance
             if sources_data:
-                # Merge all fields from all sources
-                merged_data: dict[str, Any] = {}
-
-                for source, data in sources_data.items():
-                    # Skip internal consolidation records during merging
-                    if source.startswith("_consolidated"):
-                        continue
-
-                    for key, value in data.items():
-                        if value is not None and key not in merged_data:
-                            merged_data[key] = value
-
-                # Add consolidated synonyms to merged_data
-                if "_consolidated_synonyms" in sources_data:
-                    merged_synonyms = sources_data["_consolidated_synonyms"].get("synonyms")
-                    if merged_synonyms:
-                        merged_data["synonyms"] = merged_synonyms
-
-                # Upsert for each source to track provenance
-                for source, data in sources_data.items():
-                    # Skip internal consolidation records
-                    if source.startswith("_consolidated"):
-                        continue
-
-                    data_with_keys = {**data}
-                    # Add composite key fields from merged data
-                    if "inchikey" not in data_with_keys and merged_data.get("inchikey"):
-                        data_with_keys["inchikey"] = merged_data["inchikey"]
-                    if "cas_rn" not in data_with_keys and merged_data.get("cas_rn"):
-                        data_with_keys["cas_rn"] = merged_data["cas_rn"]
-                    # Add consolidated synonyms to each record
-                    if "synonyms" not in data_with_keys and merged_data.get("synonyms"):
-                        data_with_keys["synonyms"] = merged_data["synonyms"]
-
-                    store.upsert_ingredient(data_with_keys, source=source, query=name)
+                store_sources_data(store, name, sources_data)
+
+            # Keep what the successful queries found, but journal the ingredient as failed for --retry-failed
+            if error is not None:
+                raise error
+
+            if journal is not None:
+                journal.record_completed(name, key, sources_data, api_calls=outcome.api_calls)
 
         except Exception as e:
             click.echo(f"  ERROR during enrichment: {e}")
             logger.debug(f"Enrichment error for {name}", exc_info=True)
             stats["errors"] += 1
+            if journal is not None:
+                journal.record_failed(name, key, e, outcome.sources_data, api_calls=outcome.api_calls)
 
     # Print statistics
     click.echo("\n" + "=" * 60)
@@ -780,6 +1665,19 @@ def main(
     click.echo(f"  CAS successes:            {stats['cas_success']}")
     click.echo(f"  Node Norm successes:      {stats['node_norm_success']}")
     click.echo(f"  Errors encountered:       {stats['errors']}")
+    if resume or retry_failed:
+        click.echo(f"  Skipped (journal):        {skipped}")
+    if incremental:
+        # Estimated from the requests the skipped ingredients sent when last enriched
+        unmeasured = sum(1 for entry in up_to_date if entry.api_calls is None)
+        avoided_calls = sum(entry.api_calls or 0 for entry in up_to_date)
+        click.echo(f"  Up to date (skipped):     {len(up_to_date)}")
+        click.echo(
+            f"  API calls avoided:        {avoided_calls}"
+            + (f" (+ {unmeasured} ingredients not measured: concurrent or corpus runs)" if unmeasured else "")
+        )
+    if http_cache is not None:
+        click.echo(f"  API cache hits/misses:    {http_cache.hits}/{http_cache.misses}")
 
     # Get store statistics
     store_stats = store.get_stats()
@@ -806,6 +1704,11 @@ def main(
         click.echo(f"  Edges: {output_path}_edges.tsv")
 
     store.close()
+    if journal is not None:
+        journal.close()
+    if http_cache is not None:
+        set_default_cache(None)
+        http_cache.close()
 
     if stats["errors"] > 0:
         click.echo(f"\n⚠ Completed with {stats['errors']} error(s)")
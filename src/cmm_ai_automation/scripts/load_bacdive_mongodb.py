@@ -39,6 +39,8 @@ from pymongo import MongoClient
 from pymongo.collection import Collection
 from tqdm import tqdm  # type: ignore[import-untyped]
 
+from cmm_ai_automation.clients.session import get_shared_session
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -72,7 +74,7 @@ def sparql_query(query: str, max_retries: int = 3) -> list[dict[str, Any]]:
     """
     for attempt in range(max_retries):
         try:
-            response = requests.get(
+            response = get_shared_session().get(
                 SPARQL_ENDPOINT,
                 params={"query": query},
                 headers={"Accept": "application/sparql-results+json"},
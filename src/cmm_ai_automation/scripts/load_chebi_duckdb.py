@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Build the local ChEBI DuckDB database from the ChEBI flat files.
+
+Download the tab-delimited release files (compounds, names, relation,
+database_accession, chemical_data; gzipped is fine) from
+https://ftp.ebi.ac.uk/pub/databases/chebi/Flat_file_tab_delimited/
+into one directory, then:
+
+Usage:
+    uv run python -m cmm_ai_automation.scripts.load_chebi_duckdb downloads/chebi
+
+The result can be passed to ChEBIClient(local_db=...), OLSClient(local_db=...)
+or enrich_to_store --chebi-db. A ChEBI closure index (ancestors and inherited
+roles, for enrich_to_store --chebi-closure) is written next to it, computed
+from the loaded relations or from chebi.obo if --obo is given.
+"""
+
+import logging
+from pathlib import Path
+
+import click
+
+from cmm_ai_automation.clients.chebi_closure import ChEBIClosureIndex
+from cmm_ai_automation.clients.chebi_local import ChEBILocalBackend
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DEFAULT_DB = PROJECT_ROOT / "data" / "chebi.duckdb"
+DEFAULT_CLOSURE = PROJECT_ROOT / "data" / "chebi_closure.bin"
+
+
+@click.command()
+@click.argument("source_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_DB,
+    help="DuckDB file to create (replaced if it exists)",
+)
+@click.option(
+    "--closure-output",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_CLOSURE,
+    help="ChEBI closure index file to create",
+)
+@click.option(
+    "--obo",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Build the closure from chebi.obo(.gz) instead of the flat file relations",
+)
+def main(source_dir: Path, output: Path, closure_output: Path, obo: Path | None) -> None:
+    """Load ChEBI flat files from SOURCE_DIR into a DuckDB file."""
+    backend = ChEBILocalBackend.build(source_dir, output)
+    backend.close()
+    click.echo(f"Wrote {output}")
+
+    closure = ChEBIClosureIndex.from_obo(obo) if obo else ChEBIClosureIndex.from_duckdb(output)
+    closure.save(closure_output)
+    click.echo(f"Wrote {closure_output} ({len(closure)} terms)")
+
+
+if __name__ == "__main__":
+    main()
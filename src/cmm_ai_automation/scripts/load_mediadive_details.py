@@ -24,13 +24,16 @@ Options:
 
 import argparse
 import logging
-import time
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 from pymongo import MongoClient
 from pymongo.collection import Collection
 
+from cmm_ai_automation.clients.rate_limit import get_rate_limiter
+from cmm_ai_automation.clients.session import get_shared_session
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -53,8 +56,10 @@ def fetch_detail(endpoint: str) -> dict[str, Any] | None:
     """
     url = f"{BASE_URL}/{endpoint}"
 
+    # Shares the MediaDive host budget with MediaDiveClient
+    get_rate_limiter(urlsplit(BASE_URL).netloc, REQUEST_DELAY).acquire()
     try:
-        response = requests.get(url, timeout=30)
+        response = get_shared_session().get(url, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -120,8 +125,6 @@ def fetch_and_store_details(
             target_collection.insert_one(doc)
             success_count += 1
 
-        time.sleep(REQUEST_DELAY)
-
     logger.info(f"  Completed: {success_count}/{total} records fetched")
     return success_count
 
@@ -173,8 +176,6 @@ def fetch_medium_strains_and_collect(
                     if isinstance(strain, dict) and "id" in strain:
                         strain_ids.add(strain["id"])
 
-        time.sleep(REQUEST_DELAY)
-
     logger.info(f"  Completed: {success_count}/{total} media processed")
     logger.info(f"  Found {len(strain_ids)} unique strains")
     return strain_ids
@@ -219,8 +220,6 @@ def fetch_strains_by_id(
             db.strains.insert_one(doc)
             success_count += 1
 
-        time.sleep(REQUEST_DELAY)
-
     logger.info(f"  Completed: {success_count}/{total} strains fetched")
     return success_count
 
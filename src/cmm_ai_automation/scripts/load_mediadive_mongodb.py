@@ -15,10 +15,11 @@ Requires:
 import logging
 from typing import Any
 
-import requests
 from pymongo import MongoClient
 from pymongo.collection import Collection
 
+from cmm_ai_automation.clients.session import get_shared_session
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ def fetch_endpoint(endpoint: str, params: dict[str, Any] | None = None) -> list[
     url = f"{BASE_URL}/{endpoint}"
     logger.info(f"Fetching {url}")
 
-    response = requests.get(url, params=params, timeout=60)
+    response = get_shared_session().get(url, params=params, timeout=60)
     response.raise_for_status()
 
     data = response.json()
@@ -117,7 +118,7 @@ def main() -> None:
 
     # Fetch and store stats
     logger.info("\n=== Stats ===")
-    stats_response = requests.get(f"{BASE_URL}/stats", timeout=30)
+    stats_response = get_shared_session().get(f"{BASE_URL}/stats", timeout=30)
     stats_response.raise_for_status()
     stats_data = stats_response.json()
     if stats_data.get("status") == 200:
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Build the local NCBI Taxonomy index from the taxdump files.
+
+Download taxdump.tar.gz from https://ftp.ncbi.nlm.nih.gov/pub/taxonomy/
+(or unpack it into a directory), then:
+
+Usage:
+    uv run python -m cmm_ai_automation.scripts.load_ncbi_taxdump downloads/taxdump.tar.gz
+
+The result can be passed to strains_kgx_from_curies --taxdump-index or
+validate_sheets --taxdump-index, or set programmatically with
+cmm_ai_automation.strains.ncbi.set_taxonomy_backend(NcbiTaxonomy.load(path)).
+"""
+
+import logging
+from pathlib import Path
+
+import click
+
+from cmm_ai_automation.strains.taxdump import NcbiTaxonomy
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DEFAULT_INDEX = PROJECT_ROOT / "data" / "ncbi_taxonomy.bin"
+
+
+@click.command()
+@click.argument("taxdump", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_INDEX,
+    help="Taxonomy index file to create (replaced if it exists)",
+)
+def main(taxdump: Path, output: Path) -> None:
+    """Compile TAXDUMP (taxdump.tar.gz or a directory of .dmp files) into an index."""
+    taxonomy = NcbiTaxonomy.build(taxdump)
+    taxonomy.save(output)
+    click.echo(f"Wrote {output} ({len(taxonomy)} taxa)")
+
+
+if __name__ == "__main__":
+    main()
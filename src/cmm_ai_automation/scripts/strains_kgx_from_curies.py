@@ -40,6 +40,7 @@ import random
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +48,8 @@ import click
 from kgx.sink import TsvSink
 from kgx.transformer import Transformer
 
+from cmm_ai_automation.clients.cassette import CASSETTE_MODES, Cassette, CassetteMode, set_default_cassette
+from cmm_ai_automation.clients.metrics import get_metrics
 from cmm_ai_automation.strains.bacdive import (
     extract_bacdive_data,
     get_bacdive_collection,
@@ -57,7 +60,11 @@ from cmm_ai_automation.strains.ncbi import (
     extract_xrefs_from_linkouts,
     fetch_ncbi_batch,
     fetch_ncbi_linkouts,
+    set_ncbi_cache,
+    set_taxonomy_backend,
 )
+from cmm_ai_automation.strains.ncbi_cache import NcbiCache
+from cmm_ai_automation.strains.taxdump import NcbiTaxonomy
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -728,6 +735,32 @@ def export_kgx(results: list[StrainResult], output_dir: Path) -> tuple[int, int,
     default=None,
     help="MongoDB collection name for BacDive lookups (default: strains)",
 )
+@click.option(
+    "--taxdump-index",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Answer NCBI Taxonomy lookups from a local taxdump index (see load_ncbi_taxdump)",
+)
+@click.option(
+    "--metrics-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write API request metrics to this file on exit (.prom/.txt: Prometheus text, otherwise JSON)",
+)
+@click.option(
+    "--cassette",
+    "cassette_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Record NCBI exchanges to, or replay them from, this cassette directory (see --cassette-mode)",
+)
+@click.option(
+    "--cassette-mode",
+    type=click.Choice(CASSETTE_MODES),
+    default="replay",
+    show_default=True,
+    help="record: capture every NCBI response; replay: answer from the cassette without network access",
+)
 def main(
     input_path: Path,
     id_field: str,
@@ -740,6 +773,10 @@ def main(
     dry_run: bool,
     database: str | None,
     collection: str | None,
+    taxdump_index: Path | None,
+    metrics_out: Path | None,
+    cassette_path: Path | None,
+    cassette_mode: CassetteMode,
 ) -> None:
     """Generate KGX nodes and edges for strains from CURIEs.
 
@@ -758,6 +795,25 @@ def main(
     if seed is not None:
         random.seed(seed)
 
+    if metrics_out is not None:
+        # Runs however the command exits
+        click.get_current_context().call_on_close(partial(get_metrics().write, metrics_out))
+
+    if cassette_path is not None:
+        # A fresh in-memory result cache sends every NCBI lookup through the
+        # cassette, so recorded and replayed runs make the same requests
+        set_ncbi_cache(NcbiCache(Path(":memory:")))
+        set_default_cassette(Cassette(cassette_path, mode=cassette_mode))
+        ctx = click.get_current_context()
+        ctx.call_on_close(partial(set_default_cassette, None))
+        ctx.call_on_close(partial(set_ncbi_cache, None))
+        click.echo(f"NCBI cassette ({cassette_mode}): {cassette_path}")
+
+    if taxdump_index is not None:
+        taxonomy = NcbiTaxonomy.load(taxdump_index)
+        set_taxonomy_backend(taxonomy)
+        click.echo(f"Using local NCBI taxonomy {taxdump_index} ({len(taxonomy)} taxa)")
+
     # Initialize BacDive MongoDB collection (cached for efficiency)
     global _bacdive_collection
     db_name = database or "bacdive"
@@ -81,6 +81,12 @@ DEFAULT_SHEETS_DIR = PROJECT_ROOT / "data" / "private"
     is_flag=True,
     help="Enable debug logging",
 )
+@click.option(
+    "--taxdump-index",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Check NCBITaxon IDs against a local taxdump index instead of Entrez",
+)
 def main(
     sheets_dir: Path,
     sheet: str | None,
@@ -89,6 +95,7 @@ def main(
     output: Path | None,
     verbose: bool,
     debug: bool,
+    taxdump_index: Path | None,
 ) -> None:
     """Validate sheet data against authoritative sources.
 
@@ -104,6 +111,12 @@ def main(
     if debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if taxdump_index is not None:
+        from cmm_ai_automation.strains.ncbi import set_taxonomy_backend
+        from cmm_ai_automation.strains.taxdump import NcbiTaxonomy
+
+        set_taxonomy_backend(NcbiTaxonomy.load(taxdump_index))
+
     # Validate a specific row
     if row is not None:
         if sheet is None:
@@ -1,9 +1,11 @@
 """Enrichment store module for CMM AI Automation.
 
 Provides linkml-store backed data management with entity resolution
-using (InChIKey, CAS-RN) composite keys.
+using (InChIKey, CAS-RN) composite keys, and a progress journal for
+resumable enrichment runs.
 """
 
+from cmm_ai_automation.store.enrichment_journal import EnrichmentJournal, JournalEntry, row_hash
 from cmm_ai_automation.store.enrichment_store import (
     AUTHORITATIVE_SOURCES,
     EnrichmentStore,
@@ -13,7 +15,10 @@ from cmm_ai_automation.store.enrichment_store import (
 
 __all__ = [
     "AUTHORITATIVE_SOURCES",
+    "EnrichmentJournal",
     "EnrichmentStore",
+    "JournalEntry",
     "generate_composite_key",
     "parse_composite_key",
+    "row_hash",
 ]
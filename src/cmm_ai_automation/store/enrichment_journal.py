@@ -0,0 +1,177 @@
+"""Durable progress journal for enrichment runs.
+
+Records, per input ingredient, whether its enrichment completed or failed,
+together with a JSON snapshot of its ``sources_data``. Entries are keyed by
+ingredient name and a hash of the whole input row, so editing a row in the
+input file makes it pending again. Each outcome is committed as soon as it
+is recorded (SQLite, WAL mode), so a run that dies halfway leaves a journal
+of everything finished before the crash.
+
+Example:
+    >>> journal = EnrichmentJournal(Path("data/enrichment_journal.sqlite"))
+    >>> key = row_hash({"ingredient_name": "glucose"})
+    >>> journal.record_completed("glucose", key, {"pubchem_name": {"pubchem_cid": 5793}})
+    >>> journal.get("glucose", key).status
+    'completed'
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+JournalStatus = Literal["completed", "failed"]
+COMPLETED: JournalStatus = "completed"
+FAILED: JournalStatus = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingredients (
+    name TEXT NOT NULL,
+    row_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    sources_data TEXT,
+    error TEXT,
+    updated REAL NOT NULL,
+    api_calls INTEGER,
+    PRIMARY KEY (name, row_hash)
+) WITHOUT ROWID;
+"""
+
+
+def row_hash(row: Mapping[str, Any]) -> str:
+    """Hash an input row (column order does not matter)."""
+    encoded = json.dumps(dict(row), sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class JournalEntry:
+    """Recorded outcome of one ingredient.
+
+    Attributes:
+        name: Ingredient name
+        row_hash: Hash of the input row (see row_hash())
+        status: "completed" or "failed"
+        sources_data: Snapshot of the spider results (may be None for failures)
+        error: Error message of a failure
+        updated: When the outcome was recorded (Unix time)
+        api_calls: API calls made to enrich the ingredient, if measured
+    """
+
+    name: str
+    row_hash: str
+    status: JournalStatus
+    sources_data: dict[str, dict[str, Any]] | None
+    error: str | None
+    updated: float
+    api_calls: int | None = None
+
+
+class EnrichmentJournal:
+    """SQLite-backed journal of enrichment outcomes.
+
+    Thread-safe; one connection is shared behind a lock.
+    """
+
+    def __init__(self, path: Path):
+        """Open (or create) a journal file.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(ingredients)")}
+        if "api_calls" not in columns:  # journals written before API calls were recorded
+            self._conn.execute("ALTER TABLE ingredients ADD COLUMN api_calls INTEGER")
+        self._conn.commit()
+
+    def get(self, name: str, row_hash: str) -> JournalEntry | None:
+        """Look up the recorded outcome of an input row, or None if it has none."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, row_hash, status, sources_data, error, updated, api_calls FROM ingredients "
+                "WHERE name = ? AND row_hash = ?",
+                (name, row_hash),
+            ).fetchone()
+        return _entry(row) if row is not None else None
+
+    def statuses(self) -> dict[tuple[str, str], JournalStatus]:
+        """Get the status of every recorded row, keyed by (name, row hash)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, row_hash, status FROM ingredients").fetchall()
+        return {(name, key): status for name, key, status in rows}
+
+    def record_completed(
+        self,
+        name: str,
+        row_hash: str,
+        sources_data: dict[str, dict[str, Any]],
+        api_calls: int | None = None,
+    ) -> None:
+        """Record that an input row was enriched and stored."""
+        self._record(name, row_hash, COMPLETED, sources_data, None, api_calls)
+
+    def record_failed(
+        self,
+        name: str,
+        row_hash: str,
+        error: BaseException | str,
+        sources_data: dict[str, dict[str, Any]] | None = None,
+        api_calls: int | None = None,
+    ) -> None:
+        """Record that enriching (or storing) an input row failed."""
+        self._record(name, row_hash, FAILED, sources_data, str(error), api_calls)
+
+    def _record(
+        self,
+        name: str,
+        row_hash: str,
+        status: JournalStatus,
+        sources_data: dict[str, dict[str, Any]] | None,
+        error: str | None,
+        api_calls: int | None,
+    ) -> None:
+        data = json.dumps(sources_data, ensure_ascii=False, default=str) if sources_data is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingredients (name, row_hash, status, sources_data, error, updated, api_calls) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, row_hash, status, data, error, time.time(), api_calls),
+            )
+            self._conn.commit()
+
+    def counts(self) -> dict[str, int]:
+        """Number of recorded rows per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM ingredients GROUP BY status").fetchall()
+        return {COMPLETED: 0, FAILED: 0, **dict(rows)}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _entry(row: tuple[Any, ...]) -> JournalEntry:
+    name, key, status, data, error, updated, api_calls = row
+    return JournalEntry(
+        name=name,
+        row_hash=key,
+        status=status,
+        sources_data=json.loads(data) if data is not None else None,
+        error=error,
+        updated=updated,
+        api_calls=api_calls,
+    )
@@ -14,6 +14,7 @@ References:
     - KGX format: https://github.com/biolink/kgx
 """
 
+import json
 import logging
 import re
 from datetime import datetime
@@ -111,6 +112,26 @@ def score_name_quality(name: str) -> int:
     return score
 
 
+def parse_source_records(raw: Any) -> list[dict[str, Any]]:
+    """Parse a record's source_records (dicts in memory, JSON strings from DuckDB).
+
+    Malformed entries are skipped.
+    """
+    sources: list[dict[str, Any]] = []
+    for item in raw or []:
+        if isinstance(item, dict):
+            sources.append(item)
+        elif isinstance(item, str):
+            # Try to parse JSON strings (from DuckDB text storage)
+            try:
+                parsed = json.loads(item)
+                if isinstance(parsed, dict):
+                    sources.append(parsed)
+            except (json.JSONDecodeError, TypeError):
+                pass  # Skip malformed JSON strings; continue with valid sources
+    return sources
+
+
 def select_display_name(record: dict[str, Any]) -> str:
     """Select the best display name for an ingredient record.
 
@@ -126,26 +147,11 @@ def select_display_name(record: dict[str, Any]) -> str:
     Returns:
         Best display name for the record
     """
-    import json
-
     candidates: list[tuple[str, int]] = []  # (name, priority_bonus)
 
     # Get source records - check both _sources (in-memory) and source_records (from DB)
-    sources_raw = record.get("_sources") or record.get("source_records") or []
-
     # Parse JSON strings if needed (DuckDB stores them as JSON strings in a list)
-    sources: list[dict[str, Any]] = []
-    for item in sources_raw:
-        if isinstance(item, dict):
-            sources.append(item)
-        elif isinstance(item, str):
-            # Try to parse JSON strings (from DuckDB text storage)
-            try:
-                parsed = json.loads(item)
-                if isinstance(parsed, dict):
-                    sources.append(parsed)
-            except (json.JSONDecodeError, TypeError):
-                pass  # Skip malformed JSON strings; continue with valid sources
+    sources = parse_source_records(record.get("_sources") or record.get("source_records"))
 
     # Extract query names from sources
     query_names = set()
@@ -628,6 +634,33 @@ class EnrichmentStore:
             if r.get("conflicts") and any(c.get("resolution") == "unresolved" for c in r.get("conflicts", []))
         ]
 
+    def last_enriched_by_query(self) -> dict[str, datetime]:
+        """Get when the records of each query were last enriched.
+
+        A query's data may be spread over several records (one per resolved
+        entity); the oldest of their ``last_enriched`` timestamps is returned,
+        so a query counts as fresh only if all of its records are.
+
+        Returns:
+            Dict mapping source query (e.g., ingredient name) to its oldest last_enriched
+        """
+        collection = self._get_collection()
+        oldest: dict[str, datetime] = {}
+        for record in collection.find({}).rows or []:
+            enriched = record.get("last_enriched")
+            if isinstance(enriched, str):
+                try:
+                    enriched = datetime.fromisoformat(enriched)
+                except ValueError:
+                    continue
+            if not isinstance(enriched, datetime):
+                continue
+            for source_record in parse_source_records(record.get("source_records")):
+                query = source_record.get("source_query")
+                if isinstance(query, str) and (query not in oldest or enriched < oldest[query]):
+                    oldest[query] = enriched
+        return oldest
+
     def get_stats(self) -> dict[str, Any]:
         """Get statistics about the enrichment store.
 
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from pymongo.collection import Collection
 
     from cmm_ai_automation.strains.models import StrainRecord
+    from cmm_ai_automation.strains.ncbi import BatchProgressCallback, NcbiBatchProgress
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +77,10 @@ def generate_query_variants(
     return unique_queries
 
 
-def enrich_strains_with_ncbi(records: list[StrainRecord]) -> tuple[int, int, int, int, int]:
+def enrich_strains_with_ncbi(
+    records: list[StrainRecord],
+    progress: BatchProgressCallback | None = None,
+) -> tuple[int, int, int, int, int]:
     """Enrich strain records with NCBI Taxonomy data using batch API.
 
     Fetches synonyms, lineage (species/parent taxon), rank, and external linkouts
@@ -84,6 +88,7 @@ def enrich_strains_with_ncbi(records: list[StrainRecord]) -> tuple[int, int, int
 
     Args:
         records: List of strain records to enrich
+        progress: Called with an NcbiBatchProgress after each NCBI request batch
 
     Returns:
         Tuple of (synonym_enriched, species_enriched, parent_enriched, linkout_enriched, total_with_taxon)
@@ -111,11 +116,11 @@ def enrich_strains_with_ncbi(records: list[StrainRecord]) -> tuple[int, int, int
 
     # Batch fetch taxonomy data
     logger.info(f"Fetching NCBI taxonomy data for {len(taxon_ids)} taxa in batches...")
-    ncbi_data_map = fetch_ncbi_batch(taxon_ids)
+    ncbi_data_map = fetch_ncbi_batch(taxon_ids, progress=progress)
 
     # Batch fetch linkouts
     logger.info(f"Fetching NCBI linkouts for {len(taxon_ids)} taxa...")
-    linkouts_map = fetch_ncbi_linkouts(taxon_ids)
+    linkouts_map = fetch_ncbi_linkouts(taxon_ids, progress=progress)
 
     # Apply enrichment
     synonym_enriched = 0
@@ -341,7 +346,8 @@ class IterativeEnrichmentPipeline:
         before_synonyms = sum(len(r.synonyms) for r in self.records)
         before_xrefs = sum(len(r.xrefs) for r in self.records)
 
-        syn, species, parent, linkout, total = enrich_strains_with_ncbi(self.records)
+        progress = self._report_ncbi_batch if self.verbose else None
+        syn, species, parent, linkout, total = enrich_strains_with_ncbi(self.records, progress=progress)
 
         stats.records_processed = total
         stats.records_enriched = syn + species + parent + linkout
@@ -366,6 +372,14 @@ class IterativeEnrichmentPipeline:
         click.echo(f"  New BacDive IDs (from linkouts): +{stats.new_bacdive_ids}\n")
         self.round_stats.append(("NCBI Taxonomy", stats))
 
+    @staticmethod
+    def _report_ncbi_batch(report: NcbiBatchProgress) -> None:
+        """Print one line per finished NCBI request batch (verbose mode)."""
+        click.echo(
+            f"    {report.kind} batch {report.completed}/{report.total}: "
+            f"{report.found}/{report.requested} taxa in {report.latency:.2f}s"
+        )
+
     def _round_4_bacdive_from_linkouts(self) -> None:
         """Round 4: BacDive second pass using IDs from NCBI linkouts."""
         click.echo("Round 4: BacDive enrichment (second pass - from NCBI linkouts)")
@@ -6,24 +6,50 @@ the Entrez E-utilities API.
 Supports NCBI API key via NCBI_API_KEY environment variable to increase
 rate limit from 3 requests/second to 10 requests/second.
 
-Implements file-based caching to avoid redundant API calls.
+Parsed results are cached in a single SQLite file (see
+:mod:`cmm_ai_automation.strains.ncbi_cache`) to avoid redundant API calls;
+batch functions look up a whole batch in one query and only send cache
+misses to Entrez. Taxonomy
+lookups can instead be answered offline from a compiled taxdump index; see
+set_taxonomy_backend() and :mod:`cmm_ai_automation.strains.taxdump`.
 """
 
 from __future__ import annotations
 
-import hashlib
-import json
+import io
 import logging
 import os
 import re
+import sqlite3
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, TypedDict, cast
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 import requests
 from dotenv import load_dotenv
 
+from cmm_ai_automation.clients.base import build_response
+from cmm_ai_automation.clients.cassette import Cassette, CassetteMiss, get_default_cassette
+from cmm_ai_automation.clients.metrics import endpoint_label, get_metrics
+from cmm_ai_automation.clients.rate_limit import (
+    THROTTLE_STATUS_CODES,
+    backoff_delay,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from cmm_ai_automation.clients.session import get_shared_session
+from cmm_ai_automation.strains.ncbi_cache import NcbiCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from cmm_ai_automation.strains.taxdump import NcbiTaxonomy
+
 # Load environment variables
 load_dotenv()
 
@@ -37,9 +63,31 @@ NCBI_REQUEST_TIMEOUT = 10  # seconds
 # API key for higher rate limits (10 req/sec with key vs 3 req/sec without)
 NCBI_API_KEY = os.getenv("NCBI_API_KEY")
 
+# E-utilities host, shared rate limit bucket for all NCBI requests in the process
+NCBI_EUTILS_HOST = "eutils.ncbi.nlm.nih.gov"
+NCBI_EUTILS_BASE = f"https://{NCBI_EUTILS_HOST}/entrez/eutils"
+
+# Client label for E-utilities requests in the metrics registry
+METRICS_CLIENT = "ncbi"
+NCBI_MIN_INTERVAL = 0.1 if NCBI_API_KEY else 1 / 3  # seconds between requests
+# Requests kept in flight by batch fetches; enough to hide latency at the rate limit
+NCBI_MAX_WORKERS = 10 if NCBI_API_KEY else 3
+
+# Linkouts and Entrez links rarely change; refetch them after this many seconds
+NCBI_LINK_CACHE_TTL = 90 * 24 * 3600.0
+
+# Databases reported by fetch_ncbi_entrez_links()
+ENTREZ_LINK_TARGET_DBS = frozenset({"assembly", "bioproject", "biosample", "nuccore", "genome"})
+
 # Cache directory for NCBI responses (project-relative for portability)
 CACHE_DIR = Path(__file__).parent.parent.parent.parent / "cache" / "ncbi"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Single-file cache of parsed results; older versions wrote one JSON file per
+# key under CACHE_DIR/<cache_type>/, which get_ncbi_cache() imports once
+CACHE_DB = CACHE_DIR / "ncbi_cache.sqlite"
+
+_ncbi_cache: NcbiCache | None = None
+_ncbi_cache_lock = threading.Lock()
 
 
 class NcbiTaxonData(TypedDict):
@@ -56,6 +104,28 @@ class NcbiTaxonData(TypedDict):
     parent_taxon_id: str  # Immediate parent taxon from lineage
 
 
+# Local taxdump index consulted before Entrez, if one is set
+_taxonomy_backend: NcbiTaxonomy | None = None
+
+
+def set_taxonomy_backend(taxonomy: NcbiTaxonomy | None) -> None:
+    """Answer fetch_ncbi_synonyms() and fetch_ncbi_batch() from a local taxdump index.
+
+    Taxa missing from the index (e.g. added after the dump was taken) still
+    go to Entrez.
+
+    Args:
+        taxonomy: NcbiTaxonomy to use, or None to always query Entrez
+    """
+    global _taxonomy_backend
+    _taxonomy_backend = taxonomy
+
+
+def get_taxonomy_backend() -> NcbiTaxonomy | None:
+    """Return the local taxdump index set with set_taxonomy_backend(), if any."""
+    return _taxonomy_backend
+
+
 class NcbiLinkout(TypedDict):
     """External linkout from NCBI."""
 
@@ -64,25 +134,57 @@ class NcbiLinkout(TypedDict):
     name: str
 
 
-def _get_cache_path(cache_type: str, key: str) -> Path:
-    """Get cache file path for a given cache type and key.
+@dataclass
+class NcbiBatchProgress:
+    """Progress report for one finished batch of a batch fetch.
+
+    Attributes:
+        kind: What is being fetched ("synonyms", "linkouts" or "entrez_links")
+        completed: Batches finished so far
+        total: Batches sent to Entrez (cache hits are not counted)
+        requested: Taxon IDs in this batch
+        found: Results parsed from this batch
+        latency: Seconds from starting the batch to having its results
+    """
+
+    kind: str
+    completed: int
+    total: int
+    requested: int
+    found: int
+    latency: float
+
+
+BatchProgressCallback = Callable[[NcbiBatchProgress], None]
+
+
+def set_ncbi_cache(cache: NcbiCache | None) -> None:
+    """Use ``cache`` for parsed NCBI results.
 
     Args:
-        cache_type: Type of cache (e.g., "synonyms", "linkouts")
-        key: Unique key for the cached item (e.g., taxon ID)
+        cache: NcbiCache to use, or None to reopen the default CACHE_DB on next use
+    """
+    global _ncbi_cache
+    with _ncbi_cache_lock:
+        _ncbi_cache = cache
 
-    Returns:
-        Path to cache file
+
+def get_ncbi_cache() -> NcbiCache:
+    """Return the NCBI result cache, opening CACHE_DB on first use.
+
+    The first open imports any per-key JSON files left in CACHE_DIR by
+    earlier versions of this module.
     """
-    # Create hash of key to handle special characters
-    key_hash = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
-    cache_subdir = CACHE_DIR / cache_type
-    cache_subdir.mkdir(exist_ok=True)
-    return cache_subdir / f"{key_hash}.json"
+    global _ncbi_cache
+    with _ncbi_cache_lock:
+        if _ncbi_cache is None:
+            _ncbi_cache = NcbiCache(CACHE_DB)
+            _ncbi_cache.migrate_directory(CACHE_DIR)
+        return _ncbi_cache
 
 
 def _load_from_cache(cache_type: str, key: str) -> dict[str, Any] | list[Any] | None:
-    """Load data from cache file if it exists.
+    """Load data from the cache if present.
 
     Args:
         cache_type: Type of cache (e.g., "synonyms", "linkouts")
@@ -91,30 +193,55 @@ def _load_from_cache(cache_type: str, key: str) -> dict[str, Any] | list[Any] |
     Returns:
         Cached data (dict or list) or None if not cached
     """
-    cache_path = _get_cache_path(cache_type, key)
-    if cache_path.exists():
-        try:
-            with cache_path.open() as f:
-                return json.load(f)  # type: ignore[return-value, no-any-return]
-        except (json.JSONDecodeError, OSError) as e:
-            logger.debug(f"Failed to load cache for {cache_type}:{key}: {e}")
-    return None
+    return _load_many_from_cache(cache_type, [key]).get(key)
+
+
+def _load_many_from_cache(cache_type: str, keys: list[str], max_age: float | None = None) -> dict[str, Any]:
+    """Load cached data for many keys in one query.
+
+    Args:
+        cache_type: Type of cache (e.g., "synonyms", "linkouts")
+        keys: Unique keys for the cached items
+        max_age: Treat entries older than this many seconds as misses (None: any age)
+
+    Returns:
+        Dictionary of cached key -> data; misses are omitted
+    """
+    try:
+        found = get_ncbi_cache().get_many(cache_type, keys, max_age=max_age)
+    except sqlite3.Error as e:
+        logger.debug(f"Failed to load cache for {cache_type}: {e}")
+        found = {}
+    get_metrics().record_cache(
+        METRICS_CLIENT, NCBI_EUTILS_HOST, f"cache:{cache_type}", hits=len(found), misses=len(keys) - len(found)
+    )
+    return found
 
 
 def _save_to_cache(cache_type: str, key: str, data: dict[str, Any] | list[Any]) -> None:
-    """Save data to cache file.
+    """Save data to the cache.
 
     Args:
         cache_type: Type of cache (e.g., "synonyms", "linkouts")
         key: Unique key for the cached item
         data: Data to cache (dict or list)
     """
-    cache_path = _get_cache_path(cache_type, key)
+    _save_many_to_cache(cache_type, {key: data})
+
+
+def _save_many_to_cache(cache_type: str, items: dict[str, Any]) -> None:
+    """Save data for many keys in one transaction.
+
+    Args:
+        cache_type: Type of cache (e.g., "synonyms", "linkouts")
+        items: Unique key -> data (dict or list)
+    """
+    if not items:
+        return
     try:
-        with cache_path.open("w") as f:
-            json.dump(data, f)
-    except (OSError, TypeError) as e:
-        logger.debug(f"Failed to save cache for {cache_type}:{key}: {e}")
+        get_ncbi_cache().put_many(cache_type, items)
+    except (sqlite3.Error, TypeError) as e:
+        logger.debug(f"Failed to save cache for {cache_type}: {e}")
 
 
 def _make_request(
@@ -124,52 +251,93 @@ def _make_request(
 ) -> requests.Response | None:
     """Make NCBI API request with retry logic and API key support.
 
+    Throttled (429/503) requests are retried with jittered exponential
+    backoff, honouring Retry-After, and slow down the shared E-utilities
+    rate limiter until responses are healthy again.
+
+    When a cassette is set (see set_default_cassette()), responses are
+    recorded to it, or replayed from it without any network access. The
+    API key is never part of a recording.
+
     Args:
         url: API endpoint URL
         params: Query parameters
-        max_retries: Maximum number of retry attempts for rate limiting
+        max_retries: Maximum number of attempts while rate limited
 
     Returns:
         Response object or None if all retries failed
     """
+    cassette = get_default_cassette()
+    if cassette is not None and cassette.replaying:
+        return _replay(cassette, url, params)
+
     # Add API key if available (increases rate limit from 3 to 10 req/sec)
-    if NCBI_API_KEY:
-        params = {**params, "api_key": NCBI_API_KEY}
+    request_params = {**params, "api_key": NCBI_API_KEY} if NCBI_API_KEY else params
 
+    limiter = get_rate_limiter(NCBI_EUTILS_HOST, NCBI_MIN_INTERVAL)
+    metrics = get_metrics()
+    labels = (METRICS_CLIENT, NCBI_EUTILS_HOST, endpoint_label(url, NCBI_EUTILS_BASE))
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, timeout=NCBI_REQUEST_TIMEOUT)
-
-            if response.status_code == 429:
-                # Rate limited - wait and retry with exponential backoff
-                wait_time = 2**attempt  # 1, 2, 4 seconds
-                logger.warning(f"Rate limited (429), waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+            waited = limiter.acquire()
+            if waited:
+                metrics.record_rate_limit_wait(*labels, waited)
+            started = time.monotonic()
+            response = get_shared_session().get(url, params=request_params, timeout=NCBI_REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            metrics.record_error(*labels, e)
+            logger.debug(f"Request error fetching from NCBI: {e}")
+            return None
+        metrics.record_response(*labels, response.status_code, len(response.content), time.monotonic() - started)
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            limiter.record_throttle(retry_after)
+            if attempt + 1 < max_retries:
+                metrics.record_retry(*labels)
+                wait_time = backoff_delay(attempt, retry_after)
+                logger.warning(
+                    f"Rate limited ({response.status_code}), waiting {wait_time:.1f}s "
+                    f"before retry {attempt + 1}/{max_retries}"
+                )
                 time.sleep(wait_time)
-                continue
+            continue
 
+        limiter.record_success()
+        if cassette is not None:
+            cassette.record("GET", url, response, params)
+        try:
             response.raise_for_status()
-            return response
-
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 429:
-                wait_time = 2**attempt
-                logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
-                time.sleep(wait_time)
-                continue
             logger.debug(f"HTTP error fetching from NCBI: {e}")
             return None
-        except requests.RequestException as e:
-            logger.debug(f"Request error fetching from NCBI: {e}")
-            return None
+        return response
 
     logger.warning(f"Failed to fetch from NCBI after {max_retries} retries (rate limited)")
     return None
 
 
+def _replay(cassette: Cassette, url: str, params: dict) -> requests.Response | None:
+    """Answer an E-utilities request from a replayed cassette, like _make_request()."""
+    try:
+        recorded = cassette.replay("GET", url, params)
+    except CassetteMiss as e:
+        logger.debug(str(e))
+        return None
+    response = build_response(recorded.url, recorded.status_code, recorded.content, recorded.headers)
+    try:
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        logger.debug(f"HTTP error fetching from NCBI: {e}")
+        return None
+    return response
+
+
 def fetch_ncbi_synonyms(taxon_id: int | str) -> NcbiTaxonData:
     """Fetch synonyms, related names, rank, and lineage from NCBI Taxonomy.
 
-    Uses file-based caching to avoid redundant API calls.
+    Uses the local taxdump index if one is set, and the NCBI result cache
+    to avoid redundant API calls.
 
     Args:
         taxon_id: NCBI Taxonomy ID (integer or string)
@@ -182,6 +350,11 @@ def fetch_ncbi_synonyms(taxon_id: int | str) -> NcbiTaxonData:
     """
     taxon_id_str = str(taxon_id)
 
+    if _taxonomy_backend is not None:
+        local = _taxonomy_backend.get(taxon_id)
+        if local is not None:
+            return local
+
     result: NcbiTaxonData = {
         "scientific_name": "",
         "synonyms": [],
@@ -285,254 +458,411 @@ def fetch_ncbi_synonyms(taxon_id: int | str) -> NcbiTaxonData:
     return result
 
 
-def fetch_ncbi_batch(taxon_ids: list[str], batch_size: int = 50) -> dict[str, NcbiTaxonData]:
+def fetch_ncbi_batch(
+    taxon_ids: list[str],
+    batch_size: int = 50,
+    max_workers: int = NCBI_MAX_WORKERS,
+    progress: BatchProgressCallback | None = None,
+) -> dict[str, NcbiTaxonData]:
     """Fetch NCBI Taxonomy data for multiple taxa in batch.
 
+    Collects iter_ncbi_batch() into a dictionary.
+
     Args:
         taxon_ids: List of NCBI Taxonomy IDs
         batch_size: Number of IDs per request (default 50)
+        max_workers: Maximum number of requests in flight
+        progress: Called with an NcbiBatchProgress after each Entrez batch
 
     Returns:
         Dictionary mapping taxon_id -> NcbiTaxonData
     """
-    results: dict[str, NcbiTaxonData] = {}
+    return dict(iter_ncbi_batch(taxon_ids, batch_size=batch_size, max_workers=max_workers, progress=progress))
+
+
+def iter_ncbi_batch(
+    taxon_ids: Iterable[str],
+    batch_size: int = 50,
+    max_workers: int = NCBI_MAX_WORKERS,
+    progress: BatchProgressCallback | None = None,
+) -> Iterator[tuple[str, NcbiTaxonData]]:
+    """Yield (taxon_id, NcbiTaxonData) for multiple taxa as results arrive.
+
+    Taxa found in the local taxdump index (if one is set) are answered from
+    it. The rest are looked up in the NCBI result cache (shared with
+    fetch_ncbi_synonyms()) in one query; those are yielded first. Cache
+    misses are fetched from Entrez in batches, with up to ``max_workers``
+    requests in flight so throughput is bounded by the shared E-utilities
+    rate limit rather than by request latency. Each batch is yielded (and
+    cached) as soon as its response has been parsed, so results do not come
+    back in input order. Taxa NCBI does not return are omitted.
 
-    # Process in batches
-    for i in range(0, len(taxon_ids), batch_size):
-        batch = taxon_ids[i : i + batch_size]
-        ids_param = ",".join(batch)
+    Args:
+        taxon_ids: NCBI Taxonomy IDs
+        batch_size: Number of IDs per request (default 50)
+        max_workers: Maximum number of requests in flight
+        progress: Called with an NcbiBatchProgress after each Entrez batch
 
+    Yields:
+        (taxon_id, NcbiTaxonData) pairs, keyed by the TaxId NCBI reports
+    """
+    remaining = list(dict.fromkeys(taxon_ids))
+    if _taxonomy_backend is not None:
+        yield from _taxonomy_backend.get_many(remaining).items()
+        remaining = [taxon_id for taxon_id in remaining if taxon_id not in _taxonomy_backend]
+
+    yield from _iter_batches("synonyms", remaining, batch_size, max_workers, _fetch_taxon_batch, progress)
+
+
+def _iter_batches(
+    cache_type: str,
+    taxon_ids: list[str],
+    batch_size: int,
+    max_workers: int,
+    fetch_batch: Callable[[list[str]], dict[str, Any]],
+    progress: BatchProgressCallback | None = None,
+    max_age: float | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """Serve ``taxon_ids`` from the cache, then fetch the misses in concurrent batches.
+
+    Cache hits are yielded first. Batches run on up to ``max_workers``
+    threads (pacing comes from the shared E-utilities rate limiter); each is
+    cached and yielded as soon as ``fetch_batch`` returns.
+    """
+    cached = _load_many_from_cache(cache_type, taxon_ids, max_age=max_age)
+    if cached:
+        logger.debug(f"Using cached NCBI {cache_type} for {len(cached)} of {len(taxon_ids)} taxa")
+        yield from cached.items()
+    uncached_ids = [taxon_id for taxon_id in taxon_ids if taxon_id not in cached]
+    if not uncached_ids:
+        return
+
+    def timed_fetch(batch: list[str]) -> tuple[list[str], dict[str, Any], float]:
+        start = time.monotonic()
+        fetched = fetch_batch(batch)
+        return batch, fetched, time.monotonic() - start
+
+    batches = [uncached_ids[i : i + batch_size] for i in range(0, len(uncached_ids), batch_size)]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+        futures = [executor.submit(timed_fetch, batch) for batch in batches]
         try:
-            response = _make_request(
-                NCBI_EFETCH_URL,
-                params={"db": "taxonomy", "id": ids_param, "retmode": "xml"},
-            )
-            if response is None:
-                logger.warning(f"Failed to fetch NCBI batch starting at {i}")
-                continue
+            for completed, future in enumerate(as_completed(futures), start=1):
+                batch, fetched, latency = future.result()
+                _save_many_to_cache(cache_type, fetched)
+                if progress is not None:
+                    progress(NcbiBatchProgress(cache_type, completed, len(batches), len(batch), len(fetched), latency))
+                yield from fetched.items()
+        finally:
+            # If the caller stops early, don't send the batches that haven't started
+            for future in futures:
+                future.cancel()
+
+
+def _fetch_taxon_batch(batch: list[str]) -> dict[str, NcbiTaxonData]:
+    """Fetch and parse one efetch batch; failures are logged and yield no data."""
+    fetched: dict[str, NcbiTaxonData] = {}
+    try:
+        response = _make_request(
+            NCBI_EFETCH_URL,
+            params={"db": "taxonomy", "id": ",".join(batch), "retmode": "xml"},
+        )
+        if response is None:
+            logger.warning(f"Failed to fetch NCBI batch starting at {batch[0]}")
+            return fetched
+        for taxon in _iter_taxa(response.content):
+            parsed = _parse_taxon(taxon)
+            if parsed is not None:
+                taxid, data = parsed
+                fetched[taxid] = data
+    except (requests.RequestException, ET.ParseError) as e:
+        logger.warning(f"Failed to fetch NCBI batch starting at {batch[0]}: {e}")
+    return fetched
+
+
+def _iter_taxa(content: bytes) -> Iterator[ET.Element]:
+    """Stream the top-level Taxon elements of an efetch TaxaSet.
+
+    Each element is complete when yielded and is cleared afterwards, so
+    memory stays bounded by one taxon rather than the whole response.
+    """
+    root: ET.Element | None = None
+    depth = 0
+    for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        # Direct children of TaxaSet only; LineageEx nests Taxon elements too
+        if depth == 1 and elem.tag == "Taxon" and root is not None:
+            yield elem
+            root.clear()
+
+
+def _parse_taxon(taxon: ET.Element) -> tuple[str, NcbiTaxonData] | None:
+    """Extract (taxid, NcbiTaxonData) from an efetch Taxon element."""
+    taxid_elem = taxon.find("TaxId")
+    if taxid_elem is None or not taxid_elem.text:
+        return None
+
+    taxid = taxid_elem.text
+    data: NcbiTaxonData = {
+        "scientific_name": "",
+        "synonyms": [],
+        "equivalent_names": [],
+        "includes": [],
+        "misspellings": [],
+        "authority": [],
+        "rank": "",
+        "species_taxon_id": "",
+        "parent_taxon_id": "",
+    }
 
-            root = ET.fromstring(response.content)
+    # Extract rank
+    rank_elem = taxon.find("Rank")
+    if rank_elem is not None and rank_elem.text:
+        data["rank"] = rank_elem.text
+
+    # Extract parent taxon ID
+    parent_elem = taxon.find("ParentTaxId")
+    if parent_elem is not None and parent_elem.text:
+        data["parent_taxon_id"] = parent_elem.text
+
+    # Extract scientific name
+    sci_name_elem = taxon.find("ScientificName")
+    if sci_name_elem is not None and sci_name_elem.text:
+        data["scientific_name"] = sci_name_elem.text
+
+    # Extract species from lineage
+    lineage_ex = taxon.find("LineageEx")
+    if lineage_ex is not None:
+        for ancestor in lineage_ex.findall("Taxon"):
+            ancestor_rank = ancestor.find("Rank")
+            ancestor_id = ancestor.find("TaxId")
+            if (
+                ancestor_rank is not None
+                and ancestor_rank.text == "species"
+                and ancestor_id is not None
+                and ancestor_id.text
+            ):
+                data["species_taxon_id"] = ancestor_id.text
+                break
+
+    # If taxon is species level, use its own ID
+    if not data["species_taxon_id"] and data["rank"] == "species":
+        data["species_taxon_id"] = taxid
+
+    # Extract synonyms from OtherNames
+    other_names = taxon.find("OtherNames")
+    if other_names is not None:
+        for syn in other_names.findall("Synonym"):
+            if syn.text:
+                data["synonyms"].append(syn.text)
+        for equiv in other_names.findall("EquivalentName"):
+            if equiv.text:
+                data["equivalent_names"].append(equiv.text)
+        for incl in other_names.findall("Includes"):
+            if incl.text:
+                data["includes"].append(incl.text)
+        for name_elem in other_names.findall("Name"):
+            class_cde = name_elem.find("ClassCDE")
+            disp_name = name_elem.find("DispName")
+            if class_cde is not None and disp_name is not None and disp_name.text:
+                if class_cde.text == "misspelling":
+                    data["misspellings"].append(disp_name.text)
+                elif class_cde.text == "authority":
+                    data["authority"].append(disp_name.text)
+
+    return taxid, data
 
-            # Parse each Taxon element (direct children of TaxaSet)
-            for taxon in root.findall("Taxon"):
-                taxid_elem = taxon.find("TaxId")
-                if taxid_elem is None or not taxid_elem.text:
-                    continue
-
-                taxid = taxid_elem.text
-                data: NcbiTaxonData = {
-                    "scientific_name": "",
-                    "synonyms": [],
-                    "equivalent_names": [],
-                    "includes": [],
-                    "misspellings": [],
-                    "authority": [],
-                    "rank": "",
-                    "species_taxon_id": "",
-                    "parent_taxon_id": "",
-                }
-
-                # Extract rank
-                rank_elem = taxon.find("Rank")
-                if rank_elem is not None and rank_elem.text:
-                    data["rank"] = rank_elem.text
-
-                # Extract parent taxon ID
-                parent_elem = taxon.find("ParentTaxId")
-                if parent_elem is not None and parent_elem.text:
-                    data["parent_taxon_id"] = parent_elem.text
-
-                # Extract scientific name
-                sci_name_elem = taxon.find("ScientificName")
-                if sci_name_elem is not None and sci_name_elem.text:
-                    data["scientific_name"] = sci_name_elem.text
-
-                # Extract species from lineage
-                lineage_ex = taxon.find("LineageEx")
-                if lineage_ex is not None:
-                    for ancestor in lineage_ex.findall("Taxon"):
-                        ancestor_rank = ancestor.find("Rank")
-                        ancestor_id = ancestor.find("TaxId")
-                        if (
-                            ancestor_rank is not None
-                            and ancestor_rank.text == "species"
-                            and ancestor_id is not None
-                            and ancestor_id.text
-                        ):
-                            data["species_taxon_id"] = ancestor_id.text
-                            break
-
-                # If taxon is species level, use its own ID
-                if not data["species_taxon_id"] and data["rank"] == "species":
-                    data["species_taxon_id"] = taxid
-
-                # Extract synonyms from OtherNames
-                other_names = taxon.find("OtherNames")
-                if other_names is not None:
-                    for syn in other_names.findall("Synonym"):
-                        if syn.text:
-                            data["synonyms"].append(syn.text)
-                    for equiv in other_names.findall("EquivalentName"):
-                        if equiv.text:
-                            data["equivalent_names"].append(equiv.text)
-                    for incl in other_names.findall("Includes"):
-                        if incl.text:
-                            data["includes"].append(incl.text)
-                    for name_elem in other_names.findall("Name"):
-                        class_cde = name_elem.find("ClassCDE")
-                        disp_name = name_elem.find("DispName")
-                        if class_cde is not None and disp_name is not None and disp_name.text:
-                            if class_cde.text == "misspelling":
-                                data["misspellings"].append(disp_name.text)
-                            elif class_cde.text == "authority":
-                                data["authority"].append(disp_name.text)
-
-                results[taxid] = data
-
-            # Small delay between batches to be nice to NCBI
-            if i + batch_size < len(taxon_ids):
-                time.sleep(0.5)
-
-        except (requests.RequestException, ET.ParseError) as e:
-            logger.warning(f"Failed to fetch NCBI batch starting at {i}: {e}")
-
-    return results
-
-
-def fetch_ncbi_linkouts(taxon_ids: list[str], batch_size: int = 20) -> dict[str, list[NcbiLinkout]]:
+
+def fetch_ncbi_linkouts(
+    taxon_ids: list[str],
+    batch_size: int = 20,
+    max_workers: int = NCBI_MAX_WORKERS,
+    progress: BatchProgressCallback | None = None,
+) -> dict[str, list[NcbiLinkout]]:
     """Fetch external linkouts from NCBI for multiple taxa.
 
     Uses the elink API with cmd=llinkslib to get external database links
-    like BacDive, BioCyc, LPSN, etc.
-
-    Uses file-based caching to avoid redundant API calls.
+    like BacDive, BioCyc, LPSN, etc. Collects iter_ncbi_linkouts() into a
+    dictionary.
 
     Args:
         taxon_ids: List of NCBI Taxonomy IDs
         batch_size: Number of IDs per request (default 20, smaller for elink)
+        max_workers: Maximum number of requests in flight
+        progress: Called with an NcbiBatchProgress after each Entrez batch
 
     Returns:
         Dictionary mapping taxon_id -> list of NcbiLinkout
     """
-    results: dict[str, list[NcbiLinkout]] = {}
-
-    # Check cache for each taxon ID
-    uncached_ids = []
-    for taxon_id in taxon_ids:
-        cached = _load_from_cache("linkouts", taxon_id)
-        if cached is not None:
-            logger.debug(f"Using cached NCBI linkouts for {taxon_id}")
-            results[taxon_id] = cached  # type: ignore
-        else:
-            uncached_ids.append(taxon_id)
-
-    # Fetch uncached IDs in batches
-    for i in range(0, len(uncached_ids), batch_size):
-        batch = uncached_ids[i : i + batch_size]
-        ids_param = ",".join(batch)
+    return dict(iter_ncbi_linkouts(taxon_ids, batch_size=batch_size, max_workers=max_workers, progress=progress))
 
-        try:
-            response = _make_request(
-                NCBI_ELINK_URL,
-                params={"dbfrom": "taxonomy", "id": ids_param, "cmd": "llinkslib"},
-                max_retries=3,
-            )
-            if response is None:
+
+def iter_ncbi_linkouts(
+    taxon_ids: Iterable[str],
+    batch_size: int = 20,
+    max_workers: int = NCBI_MAX_WORKERS,
+    progress: BatchProgressCallback | None = None,
+) -> Iterator[tuple[str, list[NcbiLinkout]]]:
+    """Yield (taxon_id, linkouts) for multiple taxa as results arrive.
+
+    Cached linkouts younger than NCBI_LINK_CACHE_TTL are looked up for the
+    whole list in one query and yielded first; cache misses are fetched in
+    concurrent batches and yielded per batch.
+
+    Args:
+        taxon_ids: NCBI Taxonomy IDs
+        batch_size: Number of IDs per request (default 20, smaller for elink)
+        max_workers: Maximum number of requests in flight
+        progress: Called with an NcbiBatchProgress after each Entrez batch
+
+    Yields:
+        (taxon_id, list of NcbiLinkout) pairs
+    """
+    yield from _iter_batches(
+        "linkouts",
+        list(dict.fromkeys(taxon_ids)),
+        batch_size,
+        max_workers,
+        _fetch_linkout_batch,
+        progress,
+        max_age=NCBI_LINK_CACHE_TTL,
+    )
+
+
+def _fetch_linkout_batch(batch: list[str]) -> dict[str, list[NcbiLinkout]]:
+    """Fetch and parse one llinkslib batch; failures are logged and yield no data."""
+    fetched: dict[str, list[NcbiLinkout]] = {}
+    try:
+        response = _make_request(
+            NCBI_ELINK_URL,
+            params={"dbfrom": "taxonomy", "id": ",".join(batch), "cmd": "llinkslib"},
+            max_retries=3,
+        )
+        if response is None:
+            return fetched
+
+        root = ET.fromstring(response.content)
+
+        # Parse each IdUrlSet
+        for id_url_set in root.findall(".//IdUrlSet"):
+            id_elem = id_url_set.find("Id")
+            if id_elem is None or not id_elem.text:
                 continue
 
-            root = ET.fromstring(response.content)
+            taxid = id_elem.text
+            linkouts: list[NcbiLinkout] = []
 
-            # Parse each IdUrlSet
-            for id_url_set in root.findall(".//IdUrlSet"):
-                id_elem = id_url_set.find("Id")
-                if id_elem is None or not id_elem.text:
-                    continue
-
-                taxid = id_elem.text
-                linkouts: list[NcbiLinkout] = []
-
-                for obj_url in id_url_set.findall("ObjUrl"):
-                    url_elem = obj_url.find("Url")
-                    name_elem = obj_url.find("LinkName")
-                    provider_elem = obj_url.find("Provider/Name")
-
-                    if url_elem is not None and url_elem.text:
-                        url = url_elem.text
-                        # Skip placeholder URLs
-                        if "&base.url;" in url:
-                            continue
-
-                        linkout: NcbiLinkout = {
-                            "provider": provider_elem.text or "" if provider_elem is not None else "",
-                            "url": url,
-                            "name": name_elem.text or "" if name_elem is not None else "",
-                        }
-                        linkouts.append(linkout)
-
-                results[taxid] = linkouts
-                # Save each taxon's linkouts to cache
-                _save_to_cache("linkouts", taxid, linkouts)
-
-            # Rate limit between batches
-            if i + batch_size < len(uncached_ids):
-                time.sleep(0.5)
+            for obj_url in id_url_set.findall("ObjUrl"):
+                url_elem = obj_url.find("Url")
+                name_elem = obj_url.find("LinkName")
+                provider_elem = obj_url.find("Provider/Name")
 
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse NCBI linkouts batch starting at {i}: {e}")
+                if url_elem is not None and url_elem.text:
+                    url = url_elem.text
+                    # Skip placeholder URLs
+                    if "&base.url;" in url:
+                        continue
+
+                    linkout: NcbiLinkout = {
+                        "provider": provider_elem.text or "" if provider_elem is not None else "",
+                        "url": url,
+                        "name": name_elem.text or "" if name_elem is not None else "",
+                    }
+                    linkouts.append(linkout)
+
+            fetched[taxid] = linkouts
+
+    except ET.ParseError as e:
+        logger.warning(f"Failed to parse NCBI linkouts batch starting at {batch[0]}: {e}")
 
-    return results
+    return fetched
 
 
-def fetch_ncbi_entrez_links(taxon_ids: list[str], batch_size: int = 50) -> dict[str, dict[str, list[str]]]:
+def fetch_ncbi_entrez_links(
+    taxon_ids: list[str],
+    batch_size: int = 50,
+    max_workers: int = NCBI_MAX_WORKERS,
+    progress: BatchProgressCallback | None = None,
+) -> dict[str, dict[str, list[str]]]:
     """Fetch Entrez links to other NCBI databases for multiple taxa.
 
-    Uses the elink API with cmd=acheck to find links to Assembly, BioProject, etc.
+    Uses the elink API with cmd=acheck to find links to Assembly, BioProject,
+    etc. Collects iter_ncbi_entrez_links() into a dictionary.
 
     Args:
         taxon_ids: List of NCBI Taxonomy IDs
-        batch_size: Number of IDs per request
+        batch_size: Number of IDs per worker batch
+        max_workers: Maximum number of requests in flight
+        progress: Called with an NcbiBatchProgress after each batch
 
     Returns:
         Dictionary mapping taxon_id -> {db_name: [linked_ids]}
     """
-    results: dict[str, dict[str, list[str]]] = {}
+    return dict(iter_ncbi_entrez_links(taxon_ids, batch_size=batch_size, max_workers=max_workers, progress=progress))
 
-    # Databases we're interested in
-    target_dbs = {"assembly", "bioproject", "biosample", "nuccore", "genome"}
 
-    for i in range(0, len(taxon_ids), batch_size):
-        batch = taxon_ids[i : i + batch_size]
+def iter_ncbi_entrez_links(
+    taxon_ids: Iterable[str],
+    batch_size: int = 50,
+    max_workers: int = NCBI_MAX_WORKERS,
+    progress: BatchProgressCallback | None = None,
+) -> Iterator[tuple[str, dict[str, list[str]]]]:
+    """Yield (taxon_id, {db_name: [linked_ids]}) for multiple taxa as results arrive.
 
-        for taxid in batch:
-            if taxid in results:
-                continue
+    acheck is queried one taxon per request (a comma-separated ID list would
+    merge the taxa's links), so a batch here is a group of requests run by
+    one worker. Results are cached with NCBI_LINK_CACHE_TTL like linkouts.
 
-            try:
-                response = _make_request(
-                    NCBI_ELINK_URL,
-                    params={"dbfrom": "taxonomy", "id": taxid, "cmd": "acheck"},
-                )
-                if response is None:
-                    continue
+    Args:
+        taxon_ids: NCBI Taxonomy IDs
+        batch_size: Number of IDs per worker batch
+        max_workers: Maximum number of requests in flight
+        progress: Called with an NcbiBatchProgress after each batch
 
-                root = ET.fromstring(response.content)
-                links: dict[str, list[str]] = {}
+    Yields:
+        (taxon_id, {db_name: [linked_ids]}) pairs
+    """
+    yield from _iter_batches(
+        "entrez_links",
+        list(dict.fromkeys(taxon_ids)),
+        batch_size,
+        max_workers,
+        _fetch_entrez_link_batch,
+        progress,
+        max_age=NCBI_LINK_CACHE_TTL,
+    )
+
+
+def _fetch_entrez_link_batch(batch: list[str]) -> dict[str, dict[str, list[str]]]:
+    """Run acheck for each taxon of a batch; failures are logged and skipped."""
+    fetched: dict[str, dict[str, list[str]]] = {}
+    for taxid in batch:
+        try:
+            response = _make_request(
+                NCBI_ELINK_URL,
+                params={"dbfrom": "taxonomy", "id": taxid, "cmd": "acheck"},
+            )
+            if response is None:
+                continue
 
-                for link_info in root.findall(".//LinkInfo"):
-                    db_to = link_info.find("DbTo")
-                    if db_to is not None and db_to.text in target_dbs and db_to.text not in links:
-                        links[db_to.text] = []
+            root = ET.fromstring(response.content)
+            links: dict[str, list[str]] = {}
 
-                results[taxid] = links
+            for link_info in root.findall(".//LinkInfo"):
+                db_to = link_info.find("DbTo")
+                if db_to is not None and db_to.text in ENTREZ_LINK_TARGET_DBS and db_to.text not in links:
+                    links[db_to.text] = []
 
-            except ET.ParseError as e:
-                logger.debug(f"Failed to parse Entrez links for {taxid}: {e}")
+            fetched[taxid] = links
 
-        # Rate limit between batches
-        if i + batch_size < len(taxon_ids):
-            time.sleep(0.3)
+        except ET.ParseError as e:
+            logger.debug(f"Failed to parse Entrez links for {taxid}: {e}")
 
-    return results
+    return fetched
 
 
 def extract_xrefs_from_linkouts(linkouts: list[NcbiLinkout]) -> list[str]:
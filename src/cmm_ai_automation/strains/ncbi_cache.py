@@ -0,0 +1,192 @@
+"""Single-file cache for parsed NCBI Entrez results.
+
+Parsed results (taxon data, linkouts, ...) are stored as JSON in one SQLite
+file, keyed by cache type and the MD5 of the lookup key. Batch lookups read
+and write many keys per statement, so a warm run over a large strain list
+costs a handful of queries instead of one file open per taxon.
+
+The key hashing matches the previous layout of one file per key at
+``<cache_dir>/<cache_type>/<md5(key)>.json``, so migrate_directory() can
+import an existing cache directory without knowing the original keys.
+
+Example:
+    >>> cache = NcbiCache(Path("cache/ncbi/ncbi_cache.sqlite"))
+    >>> cache.put_many("linkouts", {"408": [], "272630": []})
+    >>> cache.get_many("linkouts", ["408", "999"])
+    {'408': []}
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Keys per SELECT ... IN (...) statement, below SQLite's host parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache_type TEXT NOT NULL,
+    key_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (cache_type, key_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS migrations (
+    source TEXT PRIMARY KEY,
+    entries INTEGER NOT NULL,
+    migrated REAL NOT NULL
+);
+"""
+
+
+def cache_key_hash(key: str) -> str:
+    """Hash a lookup key the way the per-file cache named its files."""
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+class NcbiCache:
+    """SQLite-backed store of JSON values keyed by (cache type, key).
+
+    Thread-safe; one connection is shared behind a lock.
+    """
+
+    def __init__(self, path: Path):
+        """Open (or create) a cache file.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, cache_type: str, key: str, max_age: float | None = None) -> Any | None:
+        """Look up one cached value, or None on a miss."""
+        return self.get_many(cache_type, [key], max_age=max_age).get(key)
+
+    def get_many(self, cache_type: str, keys: Iterable[str], max_age: float | None = None) -> dict[str, Any]:
+        """Look up many keys at once.
+
+        Args:
+            cache_type: Type of cache (e.g., "synonyms", "linkouts")
+            keys: Lookup keys (e.g., taxon IDs)
+            max_age: Ignore entries stored more than this many seconds ago (None: any age)
+
+        Returns:
+            Dictionary of the keys that were cached -> value; misses are omitted
+        """
+        by_hash = {cache_key_hash(key): key for key in keys}
+        hashes = list(by_hash)
+        oldest = time.time() - max_age if max_age is not None else float("-inf")
+        results: dict[str, Any] = {}
+        with self._lock:
+            for i in range(0, len(hashes), _QUERY_CHUNK_SIZE):
+                chunk = hashes[i : i + _QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT key_hash, data FROM entries "
+                    f"WHERE cache_type = ? AND created >= ? AND key_hash IN ({placeholders})",
+                    (cache_type, oldest, *chunk),
+                ).fetchall()
+                for key_hash, data in rows:
+                    try:
+                        results[by_hash[key_hash]] = json.loads(data)
+                    except json.JSONDecodeError as e:
+                        logger.debug(f"Ignoring corrupt cache entry {cache_type}:{by_hash[key_hash]}: {e}")
+        return results
+
+    def put(self, cache_type: str, key: str, data: Any) -> None:
+        """Store one value (replacing any previous one)."""
+        self.put_many(cache_type, {key: data})
+
+    def put_many(self, cache_type: str, items: Mapping[str, Any]) -> None:
+        """Store many values in one transaction.
+
+        Args:
+            cache_type: Type of cache (e.g., "synonyms", "linkouts")
+            items: Lookup key -> JSON-serializable value
+        """
+        now = time.time()
+        rows = [(cache_type, cache_key_hash(key), json.dumps(data), now) for key, data in items.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (cache_type, key_hash, data, created) VALUES (?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def migrate_directory(self, directory: Path) -> int:
+        """Import a per-file cache directory (``<directory>/<cache_type>/<md5>.json``).
+
+        Runs once per directory; later calls return 0. Entries already in the
+        database win over the files. The files are left in place.
+
+        Args:
+            directory: Root of the old file cache
+
+        Returns:
+            Number of entries imported
+        """
+        source = str(directory.resolve())
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM migrations WHERE source = ?", (source,)).fetchone():
+                return 0
+
+        imported = 0
+        now = time.time()
+        type_dirs = sorted(p for p in directory.iterdir() if p.is_dir()) if directory.is_dir() else []
+        for type_dir in type_dirs:
+            rows = []
+            for file_path in type_dir.glob("*.json"):
+                try:
+                    data = file_path.read_text()
+                    json.loads(data)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.debug(f"Skipping unreadable cache file {file_path}: {e}")
+                    continue
+                rows.append((type_dir.name, file_path.stem, data, file_path.stat().st_mtime))
+            with self._lock:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entries (cache_type, key_hash, data, created) VALUES (?, ?, ?, ?)", rows
+                )
+                imported += self._conn.total_changes - before
+                self._conn.commit()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO migrations (source, entries, migrated) VALUES (?, ?, ?)", (source, imported, now)
+            )
+            self._conn.commit()
+        if imported:
+            logger.info(f"Migrated {imported} NCBI cache files from {directory} into {self.path}")
+        return imported
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return count
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,380 @@
+"""Local NCBI Taxonomy engine built from the taxdump files.
+
+Answers the same questions as the Entrez efetch path in
+:mod:`cmm_ai_automation.strains.ncbi` (rank, parent, species ancestor and
+names) without any network calls. ``nodes.dmp``, ``names.dmp`` and
+``merged.dmp`` are compiled once into flat arrays indexed by taxon ID:
+
+    parents        parents[taxid] is the parent taxon (the root is its own parent)
+    ranks          ranks[taxid] indexes the rank table; 0 means "no such taxon"
+    name_offsets   names of taxid are entries name_offsets[taxid]:name_offsets[taxid + 1]
+    name_classes   name class code of each entry
+    text_offsets   UTF-8 text of entry i is blob[text_offsets[i]:text_offsets[i + 1]]
+    merged_old     sorted taxon IDs retired by merged.dmp
+    merged_new     the taxon each of them was merged into
+
+Saved indexes are memory-mapped, so loading takes milliseconds and the pages
+are shared between processes. A species-ancestor query walks the parent
+array, i.e. it is O(depth).
+
+Example:
+    >>> taxonomy = NcbiTaxonomy.build(Path("downloads/taxdump.tar.gz"))
+    >>> taxonomy.save(Path("data/ncbi_taxonomy.bin"))
+    >>> taxonomy = NcbiTaxonomy.load(Path("data/ncbi_taxonomy.bin"))
+    >>> taxonomy.get("NCBITaxon:408")["species_taxon_id"]
+    '408'
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import mmap
+import struct
+import sys
+import tarfile
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+
+    from cmm_ai_automation.strains.ncbi import NcbiTaxonData
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"NCBITAX1"
+# magic, byte order flag, then array size, taxon count, name entries, merged IDs, blob and rank table sizes
+_HEADER = struct.Struct("<8sI6I")
+
+# names.dmp classes kept in the index, in code order (code 0 is unused).
+# The Entrez path reports exactly these: ScientificName, Synonym,
+# EquivalentName, Includes and Name elements with ClassCDE misspelling/authority.
+NAME_CLASSES = ("scientific name", "synonym", "equivalent name", "includes", "misspelling", "authority")
+_CLASS_CODES = {name_class: code for code, name_class in enumerate(NAME_CLASSES, start=1)}
+
+# Guards the parent walk against corrupt (cyclic) dumps; real lineages are < 100 deep
+_MAX_DEPTH = 1024
+
+
+class NcbiTaxonomy:
+    """NCBI Taxonomy lookups backed by arrays compiled from taxdump.
+
+    Build with build(), persist with save(), reopen with load(). Taxon IDs
+    may be given as 562, "562" or "NCBITaxon:562"; IDs retired by a merge
+    resolve to the taxon they were merged into.
+    """
+
+    def __init__(
+        self,
+        parents: Sequence[int],
+        ranks: Sequence[int],
+        rank_names: Sequence[str],
+        name_offsets: Sequence[int],
+        name_classes: Sequence[int],
+        text_offsets: Sequence[int],
+        blob: bytes | memoryview,
+        merged_old: Sequence[int],
+        merged_new: Sequence[int],
+        size: int | None = None,
+    ):
+        """Wrap prebuilt arrays (use build() or load())."""
+        self._parents = parents
+        self._ranks = ranks
+        self._rank_names = list(rank_names)
+        self._name_offsets = name_offsets
+        self._name_classes = name_classes
+        self._text_offsets = text_offsets
+        self._blob = blob
+        self._merged_old = merged_old
+        self._merged_new = merged_new
+        self._size = size if size is not None else sum(1 for code in ranks if code)
+        self._mmap: mmap.mmap | None = None
+        self._views: list[memoryview] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def build(cls, taxdump: Path) -> NcbiTaxonomy:
+        """Compile nodes.dmp, names.dmp and merged.dmp.
+
+        Args:
+            taxdump: Directory holding the .dmp files, or taxdump.tar.gz itself
+
+        Returns:
+            In-memory taxonomy
+
+        Raises:
+            FileNotFoundError: If nodes.dmp or names.dmp is missing
+        """
+        rank_codes: dict[str, int] = {"": 0}
+        node_ids, node_parents, node_ranks = array("i"), array("i"), array("B")
+        with _open_dump(taxdump, "nodes.dmp") as lines:
+            for line in lines:
+                fields = line.split("\t|\t")
+                node_ids.append(int(fields[0]))
+                node_parents.append(int(fields[1]))
+                node_ranks.append(rank_codes.setdefault(fields[2], len(rank_codes)))
+
+        size = max(node_ids, default=0) + 1
+        parents = array("i", bytes(4 * size))
+        ranks = array("B", bytes(size))
+        for taxid, parent, rank in zip(node_ids, node_parents, node_ranks, strict=True):
+            parents[taxid] = parent
+            ranks[taxid] = rank
+
+        entries: list[tuple[int, int, str]] = []
+        with _open_dump(taxdump, "names.dmp") as lines:
+            for line in lines:
+                fields = line.split("\t|\t")
+                code = _CLASS_CODES.get(fields[3].removesuffix("\t|\n").removesuffix("\t|"))
+                taxid = int(fields[0])
+                if code is not None and 0 < taxid < size and ranks[taxid]:
+                    entries.append((taxid, code, fields[1]))
+        # Stable sort keeps the file order of names within a taxon
+        entries.sort(key=itemgetter(0))
+
+        name_offsets = array("i", bytes(4 * (size + 1)))
+        name_classes, text_offsets, blob = array("B"), array("i", [0]), bytearray()
+        for taxid, code, name in entries:
+            name_offsets[taxid + 1] += 1
+            name_classes.append(code)
+            blob += name.encode("utf-8")
+            text_offsets.append(len(blob))
+        running = 0
+        for i in range(1, size + 1):
+            running += name_offsets[i]
+            name_offsets[i] = running
+
+        merged: list[tuple[int, int]] = []
+        try:
+            with _open_dump(taxdump, "merged.dmp") as lines:
+                for line in lines:
+                    old, new = line.split("\t|\t")[:2]
+                    merged.append((int(old), int(new.removesuffix("\t|\n").removesuffix("\t|"))))
+        except FileNotFoundError:
+            logger.warning(f"No merged.dmp in {taxdump}; retired taxon IDs will not resolve")
+        merged.sort()
+
+        rank_names = sorted(rank_codes, key=rank_codes.__getitem__)
+        taxonomy = cls(
+            parents,
+            ranks,
+            rank_names,
+            name_offsets,
+            name_classes,
+            text_offsets,
+            bytes(blob),
+            array("i", (old for old, _ in merged)),
+            array("i", (new for _, new in merged)),
+        )
+        logger.info(f"Built NCBI taxonomy: {len(taxonomy)} taxa, {len(entries)} names, {len(merged)} merged IDs")
+        return taxonomy
+
+    def save(self, path: Path) -> None:
+        """Write the taxonomy as a single binary file for load()."""
+        rank_table = "\n".join(self._rank_names[1:]).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    sys.byteorder == "little",
+                    len(self._parents),
+                    self._size,
+                    len(self._name_classes),
+                    len(self._merged_old),
+                    len(self._blob),
+                    len(rank_table),
+                )
+            )
+            # int32 arrays first so the byte arrays after them cannot break alignment
+            for values in (self._parents, self._name_offsets, self._text_offsets, self._merged_old, self._merged_new):
+                array("i", values).tofile(f)
+            array("B", self._ranks).tofile(f)
+            array("B", self._name_classes).tofile(f)
+            f.write(self._blob)
+            f.write(rank_table)
+
+    @classmethod
+    def load(cls, path: Path) -> NcbiTaxonomy:
+        """Memory-map a taxonomy written by save()."""
+        with path.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, little_endian, size, n_taxa, n_entries, n_merged, blob_size, rank_table_size = _HEADER.unpack_from(
+            mapped
+        )
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not an NCBI taxonomy index")
+        if bool(little_endian) != (sys.byteorder == "little"):
+            raise ValueError(f"{path} was written on a machine with different byte order; rebuild it")
+
+        body = memoryview(mapped)[_HEADER.size :]
+        int_count = size + (size + 1) + (n_entries + 1) + 2 * n_merged
+        ints = body[: 4 * int_count].cast("i")
+        int_arrays = []
+        start = 0
+        for length in (size, size + 1, n_entries + 1, n_merged, n_merged):
+            int_arrays.append(ints[start : start + length])
+            start += length
+        parents, name_offsets, text_offsets, merged_old, merged_new = int_arrays
+
+        start = 4 * int_count
+        ranks = body[start : start + size]
+        name_classes = body[start + size : start + size + n_entries]
+        start += size + n_entries
+        blob = body[start : start + blob_size]
+        rank_table = bytes(body[start + blob_size : start + blob_size + rank_table_size]).decode("utf-8")
+        rank_names = ["", *rank_table.split("\n")] if rank_table else [""]
+
+        taxonomy = cls(
+            parents,
+            ranks,
+            rank_names,
+            name_offsets,
+            name_classes,
+            text_offsets,
+            blob,
+            merged_old,
+            merged_new,
+            size=n_taxa,  # counting ranks would touch every page
+        )
+        taxonomy._mmap = mapped
+        taxonomy._views = [*int_arrays, ints, ranks, name_classes, blob, body]
+        return taxonomy
+
+    def resolve(self, taxon_id: str | int) -> int | None:
+        """Current taxon ID for ``taxon_id`` (following merges), or None if unknown."""
+        taxid = _to_taxid(taxon_id)
+        if 0 < taxid < len(self._ranks) and self._ranks[taxid]:
+            return taxid
+        i = bisect_left(self._merged_old, taxid)
+        if i < len(self._merged_old) and self._merged_old[i] == taxid:
+            return self._merged_new[i]
+        return None
+
+    def rank(self, taxon_id: str | int) -> str:
+        """Rank of a taxon ("species", "strain", "no rank", ...), or "" if unknown."""
+        taxid = self.resolve(taxon_id)
+        return "" if taxid is None else self._rank_names[self._ranks[taxid]]
+
+    def lineage(self, taxon_id: str | int) -> list[int]:
+        """Ancestors of a taxon from its parent up to the root (excluding the taxon itself)."""
+        taxid = self.resolve(taxon_id)
+        ancestors: list[int] = []
+        if taxid is None:
+            return ancestors
+        for _ in range(_MAX_DEPTH):
+            parent = self._parents[taxid]
+            if parent == taxid or not self._ranks[parent]:
+                break
+            ancestors.append(parent)
+            taxid = parent
+        return ancestors
+
+    def species_taxon_id(self, taxon_id: str | int) -> str:
+        """Species-level taxon of a taxon, as the Entrez path reports it.
+
+        Returns the species ancestor for taxa below species, the taxon itself
+        for species, and "" for taxa above species (or unknown IDs).
+        """
+        taxid = self.resolve(taxon_id)
+        if taxid is None:
+            return ""
+        species = ""
+        # Entrez takes the first species in LineageEx (root first), i.e. the last one on the way up
+        for ancestor in self.lineage(taxid):
+            if self._rank_names[self._ranks[ancestor]] == "species":
+                species = str(ancestor)
+        if not species and self._rank_names[self._ranks[taxid]] == "species":
+            species = str(taxid)
+        return species
+
+    def get(self, taxon_id: str | int) -> NcbiTaxonData | None:
+        """Taxon data in the same shape as fetch_ncbi_synonyms() returns it, or None if unknown."""
+        taxid = self.resolve(taxon_id)
+        if taxid is None:
+            return None
+
+        names: dict[str, list[str]] = {name_class: [] for name_class in NAME_CLASSES}
+        blob, text_offsets = self._blob, self._text_offsets
+        for i in range(self._name_offsets[taxid], self._name_offsets[taxid + 1]):
+            text = bytes(blob[text_offsets[i] : text_offsets[i + 1]]).decode("utf-8")
+            names[NAME_CLASSES[self._name_classes[i] - 1]].append(text)
+
+        parent = self._parents[taxid]
+        return {
+            "scientific_name": names["scientific name"][0] if names["scientific name"] else "",
+            "synonyms": names["synonym"],
+            "equivalent_names": names["equivalent name"],
+            "includes": names["includes"],
+            "misspellings": names["misspelling"],
+            "authority": names["authority"],
+            "rank": self._rank_names[self._ranks[taxid]],
+            "species_taxon_id": self.species_taxon_id(taxid),
+            # efetch reports ParentTaxId 0 for the root
+            "parent_taxon_id": "0" if parent == taxid else str(parent),
+        }
+
+    def get_many(self, taxon_ids: Iterable[str | int]) -> dict[str, NcbiTaxonData]:
+        """Taxon data for several taxa, keyed like fetch_ncbi_batch() (by current taxon ID).
+
+        Unknown IDs are omitted.
+        """
+        results: dict[str, NcbiTaxonData] = {}
+        for taxon_id in taxon_ids:
+            taxid = self.resolve(taxon_id)
+            if taxid is not None and str(taxid) not in results:
+                data = self.get(taxid)
+                if data is not None:
+                    results[str(taxid)] = data
+        return results
+
+    def __contains__(self, taxon_id: object) -> bool:
+        if not isinstance(taxon_id, str | int):
+            return False
+        return self.resolve(taxon_id) is not None
+
+    def close(self) -> None:
+        """Release the memory map of a loaded taxonomy."""
+        if self._mmap is not None:
+            # Views into the map must be released before it can be closed
+            for view in self._views:
+                view.release()
+            self._views = []
+            self._mmap.close()
+            self._mmap = None
+
+
+def _to_taxid(taxon_id: str | int) -> int:
+    if isinstance(taxon_id, int):
+        return taxon_id
+    numeric = taxon_id.strip().rsplit(":", 1)[-1]
+    return int(numeric) if numeric.isdigit() else -1
+
+
+@contextmanager
+def _open_dump(taxdump: Path, file_name: str) -> Iterator[Iterator[str]]:
+    """Open one .dmp file from a taxdump directory or taxdump.tar.gz as text lines."""
+    if taxdump.is_dir():
+        path = taxdump / file_name
+        if not path.exists():
+            raise FileNotFoundError(f"Missing taxdump file: {path}")
+        with path.open(encoding="utf-8") as f:
+            yield iter(f)
+        return
+
+    with tarfile.open(taxdump, "r:*") as archive:
+        try:
+            member = archive.extractfile(file_name)
+        except KeyError:
+            member = None
+        if member is None:
+            raise FileNotFoundError(f"Missing taxdump file: {file_name} in {taxdump}")
+        with io.TextIOWrapper(member, encoding="utf-8") as f:
+            yield iter(f)
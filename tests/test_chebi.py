@@ -1,6 +1,10 @@
 """Tests for ChEBI 2.0 REST API client."""
 
+import threading
+from typing import Any
+
 import pytest
+import requests
 
 from cmm_ai_automation.clients.chebi import (
     ChEBIClient,
@@ -194,3 +198,63 @@ class TestChEBIClient:
 
         cas_numbers = compound.get_cas_numbers()
         assert cas_numbers == ["50-99-7"]  # deduped
+
+
+class TestCompoundsBatch:
+    """Unit tests for get_compounds_batch()."""
+
+    @staticmethod
+    def _fake_compound(url: str) -> dict[str, Any]:
+        chebi_numeric = url.rstrip("/").rsplit("/", 1)[1]
+        return {"chebi_accession": f"CHEBI:{chebi_numeric}", "name": f"compound {chebi_numeric}"}
+
+    def test_ids_are_normalized_and_deduplicated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that equivalent ID spellings cost a single request."""
+        client = ChEBIClient()
+        urls: list[str] = []
+        lock = threading.Lock()
+
+        def fake_get_json(url: str, _params: Any = None) -> dict[str, Any]:
+            with lock:
+                urls.append(url)
+            return self._fake_compound(url)
+
+        monkeypatch.setattr(client, "_get_json", fake_get_json)
+        results = client.get_compounds_batch(["CHEBI:17634", "17634", 17634, "chebi:15377", "CHEBI:16236"])
+
+        assert list(results) == ["CHEBI:17634", "CHEBI:15377", "CHEBI:16236"]
+        assert sorted(urls) == sorted(f"{client.BASE_URL}/public/compound/{n}/" for n in ("17634", "15377", "16236"))
+        assert all(isinstance(r, ChEBICompound) for r in results.values())
+
+    def test_lookups_run_concurrently(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the batch keeps several requests in flight."""
+        client = ChEBIClient(rate_limit_delay=0)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_get_json(url: str, _params: Any = None) -> dict[str, Any]:
+            barrier.wait()  # deadlocks (and times out) if requests are serialized
+            return self._fake_compound(url)
+
+        monkeypatch.setattr(client, "_get_json", fake_get_json)
+        results = client.get_compounds_batch(["CHEBI:1", "CHEBI:2"], max_workers=2)
+
+        assert all(isinstance(r, ChEBICompound) for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_aget_compounds_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the async batch keeps per-ID errors alongside successes."""
+        client = ChEBIClient()
+
+        async def fake_aget_json(url: str, _params: Any = None) -> dict[str, Any]:
+            if "/404/" in url:
+                raise requests.ConnectionError("boom")
+            return self._fake_compound(url)
+
+        monkeypatch.setattr(client, "aget_json", fake_aget_json)
+        results = await client.aget_compounds_batch(["CHEBI:17634", "404", "17634"])
+
+        assert list(results) == ["CHEBI:17634", "CHEBI:404"]
+        assert isinstance(results["CHEBI:17634"], ChEBICompound)
+        error = results["CHEBI:404"]
+        assert isinstance(error, ChEBILookupError)
+        assert error.error_code == "REQUEST_ERROR"
@@ -0,0 +1,122 @@
+"""Tests for the ChEBI ancestor/role closure index."""
+
+import gzip
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from cmm_ai_automation.clients.chebi_closure import BIOLOGICAL_ROLE_ID, ChEBIClosureIndex
+
+# D-glucose (17634) is_a glucose (17925) is_a aldohexose (33917); aldohexose has
+# the role "fundamental metabolite" (78675), a biological role via metabolite (25212).
+IS_A = [(17634, 17925), (17925, 33917), (78675, 25212), (25212, 24432)]
+HAS_ROLE = [(33917, 78675)]
+
+OBO = """format-version: 1.2
+ontology: chebi
+
+[Term]
+id: CHEBI:17634
+name: D-glucose
+is_a: CHEBI:17925 ! glucose
+
+[Term]
+id: CHEBI:17925
+name: glucose
+is_a: CHEBI:33917 ! aldohexose
+
+[Term]
+id: CHEBI:33917
+name: aldohexose
+relationship: has_role CHEBI:78675 ! fundamental metabolite
+
+[Term]
+id: CHEBI:78675
+name: fundamental metabolite
+is_a: CHEBI:25212 ! metabolite
+
+[Term]
+id: CHEBI:25212
+name: metabolite
+is_a: CHEBI:24432 ! biological role
+
+[Term]
+id: CHEBI:99999
+name: obsolete thing
+is_obsolete: true
+is_a: CHEBI:17634
+
+[Typedef]
+id: has_role
+is_a: RO:0000087
+"""
+
+
+@pytest.fixture
+def index() -> ChEBIClosureIndex:
+    return ChEBIClosureIndex.from_edges(IS_A, HAS_ROLE)
+
+
+class TestChEBIClosureIndex:
+    """Tests for closure queries."""
+
+    def test_ancestors(self, index: ChEBIClosureIndex) -> None:
+        assert index.ancestors("CHEBI:17634") == ["CHEBI:17925", "CHEBI:33917"]
+        assert index.ancestors(24432) == []
+        assert index.ancestors("CHEBI:1") == []
+
+    def test_is_descendant_of(self, index: ChEBIClosureIndex) -> None:
+        assert index.is_descendant_of("CHEBI:17634", "CHEBI:33917")
+        assert index.is_descendant_of("78675", BIOLOGICAL_ROLE_ID)
+        assert not index.is_descendant_of("CHEBI:33917", "CHEBI:17634")
+        assert not index.is_descendant_of("CHEBI:17634", "CHEBI:17634")
+
+    def test_roles_are_inherited(self, index: ChEBIClosureIndex) -> None:
+        assert index.roles_of("CHEBI:17634") == ["CHEBI:78675"]
+        assert index.classify_roles("CHEBI:17634") == (["CHEBI:78675"], [])
+
+    def test_cycles_terminate(self) -> None:
+        index = ChEBIClosureIndex.from_edges([(1, 2), (2, 3), (3, 1)], [])
+        assert index.ancestors(1) == ["CHEBI:2", "CHEBI:3"]
+
+    def test_save_and_load(self, index: ChEBIClosureIndex, tmp_path: Path) -> None:
+        path = tmp_path / "closure.bin"
+        index.save(path)
+        loaded = ChEBIClosureIndex.load(path)
+        try:
+            assert len(loaded) == len(index)
+            assert "CHEBI:17634" in loaded
+            for node in ("CHEBI:17634", "CHEBI:78675", "CHEBI:24432"):
+                assert loaded.ancestors(node) == index.ancestors(node)
+                assert loaded.roles_of(node) == index.roles_of(node)
+        finally:
+            loaded.close()
+
+    def test_load_rejects_other_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "closure.bin"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            ChEBIClosureIndex.load(path)
+
+
+class TestBuildSources:
+    """Tests for building from chebi.obo and from the local ChEBI database."""
+
+    def test_from_obo(self, tmp_path: Path, index: ChEBIClosureIndex) -> None:
+        obo_path = tmp_path / "chebi.obo.gz"
+        with gzip.open(obo_path, "wt", encoding="utf-8") as f:
+            f.write(OBO)
+        from_obo = ChEBIClosureIndex.from_obo(obo_path)
+        assert from_obo.ancestors("CHEBI:17634") == index.ancestors("CHEBI:17634")
+        assert from_obo.roles_of("CHEBI:17634") == ["CHEBI:78675"]
+        assert "CHEBI:99999" not in from_obo
+
+    def test_from_duckdb(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "chebi.duckdb"
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("CREATE TABLE relations (subject_id INTEGER, type VARCHAR, object_id INTEGER)")
+            conn.executemany("INSERT INTO relations VALUES (?, 'is a', ?)", IS_A)
+            conn.executemany("INSERT INTO relations VALUES (?, 'has role', ?)", HAS_ROLE)
+        from_db = ChEBIClosureIndex.from_duckdb(db_path)
+        assert from_db.classify_roles("CHEBI:17634") == (["CHEBI:78675"], [])
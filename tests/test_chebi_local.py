@@ -0,0 +1,168 @@
+"""Tests for the local ChEBI DuckDB backend."""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from cmm_ai_automation.clients.chebi import ChEBIClient, ChEBICompound, ChEBILookupError, ChEBISearchResult
+from cmm_ai_automation.clients.chebi_local import ChEBILocalBackend
+from cmm_ai_automation.clients.ols import ChEBITerm, OLSClient, OLSLookupError
+
+GLUCOSE_SMILES = "OC[C@H]1OC(O)[C@H](O)[C@@H](O)[C@@H]1O"
+GLUCOSE_INCHI = "InChI=1S/C6H12O6/c7-1-2-3(8)4(9)5(10)6(11)12-2/h2-11H,1H2/t2-,3-,4+,5-,6?/m1/s1"
+GLUCOSE_INCHIKEY = "WQZGKKKJIJFFOK-GASJEMHNSA-N"
+
+# A miniature release in the tab-delimited flat file layout. CHEBI:4167 is a
+# secondary ID of D-glucose; "fundamental metabolite" is a biological role
+# through two is_a steps.
+FLAT_FILES = {
+    "compounds.tsv": [
+        "ID\tSTATUS\tCHEBI_ACCESSION\tSOURCE\tPARENT_ID\tNAME\tDEFINITION\tMODIFIED_ON\tCREATED_BY\tSTAR",
+        "17634\tC\tCHEBI:17634\tKEGG COMPOUND\tnull\tD-glucose\tA glucose with D-configuration.\t2020\tchebi\t3",
+        "4167\tC\tCHEBI:4167\tKEGG COMPOUND\t17634\tD-Glucose\tnull\t2020\tchebi\t3",
+        "17925\tC\tCHEBI:17925\tKEGG COMPOUND\tnull\tglucose\tnull\t2020\tchebi\t3",
+        "78675\tC\tCHEBI:78675\tChEBI\tnull\tfundamental metabolite\tnull\t2020\tchebi\t3",
+        "25212\tC\tCHEBI:25212\tChEBI\tnull\tmetabolite\tnull\t2020\tchebi\t3",
+        "24432\tC\tCHEBI:24432\tChEBI\tnull\tbiological role\tnull\t2020\tchebi\t3",
+    ],
+    "names.tsv": [
+        "ID\tCOMPOUND_ID\tTYPE\tSOURCE\tNAME\tADAPTED\tLANGUAGE",
+        "1\t17634\tSYNONYM\tChEBI\tdextrose\tF\ten",
+        '2\t17634\tSYNONYM\tChEBI\t"grape sugar\tF\ten',
+    ],
+    "relation.tsv": [
+        "ID\tTYPE\tINIT_ID\tFINAL_ID\tSTATUS",
+        "1\tis_a\t17925\t17634\tC",
+        "2\thas_role\t78675\t17634\tC",
+        "3\tis_a\t25212\t78675\tC",
+        "4\tis_a\t24432\t25212\tC",
+    ],
+    "database_accession.tsv": [
+        "ID\tCOMPOUND_ID\tACCESSION_NUMBER\tTYPE\tSOURCE",
+        "1\t17634\t50-99-7\tCAS Registry Number\tNIST Chemistry WebBook",
+        "2\t17634\tC00031\tKEGG COMPOUND accession\tKEGG COMPOUND",
+    ],
+    "chemical_data.tsv": [
+        "ID\tCOMPOUND_ID\tSOURCE\tTYPE\tCHEMICAL_DATA",
+        "1\t17634\tChEBI\tFORMULA\tC6H12O6",
+        "2\t17634\tKEGG COMPOUND\tMASS\t180.15",
+        "3\t17634\tChEBI\tMASS\t180.156",
+        "4\t17634\tChEBI\tCHARGE\t0",
+        "5\t17634\tChEBI\tMONOISOTOPIC MASS\t180.06339",
+    ],
+    "structures.tsv": [
+        "ID\tCOMPOUND_ID\tSTRUCTURE\tTYPE\tDIMENSION\tDEFAULT_STRUCTURE\tAUTOGEN_STRUCTURE",
+        f"1\t17634\t{GLUCOSE_SMILES}\tSMILES\t1D\tY\tN",
+        f"2\t17634\t{GLUCOSE_INCHI}\tInChI\t1D\tY\tN",
+        f"3\t17634\t{GLUCOSE_INCHIKEY}\tInChIKey\t1D\tY\tN",
+        "4\t17634\tOCC1OC(O)C(O)C(O)C1O\tSMILES\t1D\tN\tY",
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def chebi_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    source_dir = tmp_path_factory.mktemp("chebi")
+    for file_name, lines in FLAT_FILES.items():
+        content = "\n".join(lines) + "\n"
+        if file_name == "names.tsv":
+            with gzip.open(source_dir / f"{file_name}.gz", "wt", encoding="utf-8") as f:
+                f.write(content)
+        else:
+            (source_dir / file_name).write_text(content, encoding="utf-8")
+    db_path = source_dir / "chebi.duckdb"
+    ChEBILocalBackend.build(source_dir, db_path).close()
+    return db_path
+
+
+class TestChEBILocalBackend:
+    """Tests for ChEBILocalBackend."""
+
+    @pytest.fixture
+    def backend(self, chebi_db: Path) -> ChEBILocalBackend:
+        return ChEBILocalBackend(chebi_db)
+
+    def test_get_compound(self, backend: ChEBILocalBackend) -> None:
+        compound = backend.get_compound("CHEBI:17634")
+        assert isinstance(compound, ChEBICompound)
+        assert compound.ascii_name == "D-glucose"
+        assert compound.stars == 3
+        assert compound.formula == "C6H12O6"
+        assert compound.mass == 180.156  # ChEBI-sourced value preferred
+        assert compound.charge == 0
+        assert compound.smiles == GLUCOSE_SMILES  # the default structure wins
+        assert compound.inchikey == GLUCOSE_INCHIKEY
+        assert sorted(compound.synonyms) == ['"grape sugar', "dextrose"]
+        assert compound.secondary_ids == ["CHEBI:4167"]
+        assert compound.get_cas_numbers() == ["50-99-7"]
+        assert [r.target_chebi_id for r in compound.parents] == ["CHEBI:17925"]
+        assert [r.target_name for r in compound.has_roles] == ["fundamental metabolite"]
+
+    def test_secondary_id_resolves_to_primary(self, backend: ChEBILocalBackend) -> None:
+        compound = backend.get_compound(4167)
+        assert isinstance(compound, ChEBICompound)
+        assert compound.chebi_id == "CHEBI:17634"
+
+    def test_unknown_id(self, backend: ChEBILocalBackend) -> None:
+        result = backend.get_compound("CHEBI:999999999")
+        assert isinstance(result, ChEBILookupError)
+        assert result.error_code == "NOT_FOUND"
+
+    def test_roles_are_classified_through_ancestors(self, backend: ChEBILocalBackend) -> None:
+        roles = backend.get_roles("CHEBI:17634")
+        assert isinstance(roles, list)
+        assert [(r.chebi_id, r.is_biological_role, r.is_chemical_role) for r in roles] == [("CHEBI:78675", True, False)]
+
+    def test_search_exact(self, backend: ChEBILocalBackend) -> None:
+        result = backend.search_exact("d-GLUCOSE")
+        assert isinstance(result, ChEBISearchResult)
+        assert result.chebi_id == "CHEBI:17634"  # the secondary ID's name is not matched
+        assert result.formula == "C6H12O6"
+        assert backend.search_exact("unobtainium") is None
+
+    def test_missing_flat_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            ChEBILocalBackend.build(tmp_path, tmp_path / "chebi.duckdb")
+
+
+class TestLocalClients:
+    """ChEBIClient and OLSClient answer from the local database when given one."""
+
+    def test_chebi_client(self, chebi_db: Path) -> None:
+        client = ChEBIClient(local_db=chebi_db)
+        client.BASE_URL = "http://127.0.0.1:9"  # any network call would fail
+        assert isinstance(client.get_compound("17634"), ChEBICompound)
+        assert isinstance(client.search_exact("glucose"), ChEBISearchResult)
+        assert list(client.get_compounds_batch(["17634", "CHEBI:4167"])) == ["CHEBI:17634", "CHEBI:4167"]
+
+    def test_ols_client(self, chebi_db: Path) -> None:
+        client = OLSClient(local_db=chebi_db)
+        client.BASE_URL = "http://127.0.0.1:9"
+        term = client.get_chebi_term("CHEBI:17634")
+        assert isinstance(term, ChEBITerm)
+        assert term.label == "D-glucose"
+        assert term.has_role == ["CHEBI:78675"]
+        assert term.xrefs["CAS"] == ["CAS:50-99-7"]
+        assert (term.inchikey, term.inchi, term.smiles) == (GLUCOSE_INCHIKEY, GLUCOSE_INCHI, GLUCOSE_SMILES)
+        assert client.get_chebi_parents("CHEBI:17634") == ["CHEBI:17925"]
+        missing = client.get_chebi_parents("CHEBI:1")
+        assert isinstance(missing, OLSLookupError)
+        assert missing.error_code == "NOT_FOUND"
+
+    def test_structures_match_rest_api(self, chebi_db: Path) -> None:
+        rest = ChEBIClient()._parse_compound(
+            {
+                "chebi_accession": "CHEBI:17634",
+                "name": "D-glucose",
+                "default_structure": {
+                    "smiles": GLUCOSE_SMILES,
+                    "standard_inchi": GLUCOSE_INCHI,
+                    "standard_inchi_key": GLUCOSE_INCHIKEY,
+                },
+            }
+        )
+        local = ChEBIClient(local_db=chebi_db).get_compound("CHEBI:17634")
+        assert isinstance(local, ChEBICompound)
+        assert (local.inchikey, local.inchi, local.smiles) == (rest.inchikey, rest.inchi, rest.smiles)
+        assert rest.inchikey == GLUCOSE_INCHIKEY
@@ -0,0 +1,324 @@
+"""Tests for the async engine in HTTPClientBase.
+
+These tests run against a local aiohttp server, so they need no network access.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cmm_ai_automation.clients.base import HTTPClientBase, build_response
+from cmm_ai_automation.clients.pubchem import CompoundResult, LookupError, PubChemClient
+from cmm_ai_automation.clients.single_flight import SingleFlight
+
+
+class _State:
+    """Records what the local server observed."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.request_times: list[float] = []
+
+
+def _make_app(state: _State) -> web.Application:
+    async def echo(request: web.Request) -> web.Response:
+        state.request_times.append(time.monotonic())
+        state.in_flight += 1
+        state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        await asyncio.sleep(0.05)
+        state.in_flight -= 1
+        return web.json_response(
+            {
+                "query": [[k, v] for k, v in request.query.items()],
+                "user_agent": request.headers.get("User-Agent"),
+                "api_key": request.headers.get("X-API-KEY"),
+            }
+        )
+
+    async def post(request: web.Request) -> web.Response:
+        return web.json_response({"received": await request.json()})
+
+    async def missing(_request: web.Request) -> web.Response:
+        return web.json_response({"Fault": {"Code": "PUGREST.NotFound", "Message": "No CID found"}}, status=404)
+
+    async def throttled(_request: web.Request) -> web.Response:
+        state.request_times.append(time.monotonic())
+        if len(state.request_times) <= 2:
+            return web.json_response({"error": "slow down"}, status=429, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True})
+
+    async def pubchem_properties(request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "PropertyTable": {
+                    "Properties": [
+                        {
+                            "CID": int(request.match_info["cid"]),
+                            "Title": "Glucose",
+                            "MolecularFormula": "C6H12O6",
+                            "MolecularWeight": "180.16",
+                            "InChIKey": "WQZGKKKJIJFFOK-GASJEMHNSA-N",
+                        }
+                    ]
+                }
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/echo", echo)
+    app.router.add_post("/post", post)
+    app.router.add_get("/missing", missing)
+    app.router.add_get("/throttled", throttled)
+    app.router.add_get(r"/compound/cid/{cid:\d+}/property/{props}/JSON", pubchem_properties)
+    return app
+
+
+@pytest.fixture
+def state() -> _State:
+    return _State()
+
+
+@pytest_asyncio.fixture
+async def server(state: _State) -> AsyncIterator[TestServer]:
+    test_server = TestServer(_make_app(state))
+    await test_server.start_server()
+    yield test_server
+    await test_server.close()
+
+
+class TestBuildResponse:
+    """Tests for build_response()."""
+
+    def test_json_and_headers(self) -> None:
+        response = build_response("http://x/y", 200, b'{"a": 1}', {"Content-Type": "application/json"})
+        assert response.json() == {"a": 1}
+        assert response.headers["content-type"] == "application/json"
+        assert response.ok
+
+    def test_raise_for_status(self) -> None:
+        response = build_response("http://x/y", 503, b"", reason="Service Unavailable")
+        with pytest.raises(requests.HTTPError):
+            response.raise_for_status()
+
+
+class TestAsyncRequests:
+    """Tests for aget_json/apost_json."""
+
+    @pytest.mark.asyncio
+    async def test_aget_json_params_and_headers(self, server: TestServer) -> None:
+        async with HTTPClientBase(rate_limit_delay=0, headers={"X-API-KEY": "k"}) as client:
+            data = await client.aget_json(str(server.make_url("/echo")), [("curie", "A:1"), ("flag", True)])
+        assert data["query"] == [["curie", "A:1"], ["flag", "true"]]
+        assert data["user_agent"].startswith("cmm-ai-automation")
+        assert data["api_key"] == "k"
+
+    @pytest.mark.asyncio
+    async def test_apost_json(self, server: TestServer) -> None:
+        async with HTTPClientBase(rate_limit_delay=0) as client:
+            data = await client.apost_json(str(server.make_url("/post")), json_data={"curies": ["A:1"]})
+        assert data == {"received": {"curies": ["A:1"]}}
+
+    @pytest.mark.asyncio
+    async def test_http_error_matches_sync_exception(self, server: TestServer) -> None:
+        async with HTTPClientBase(rate_limit_delay=0) as client:
+            with pytest.raises(requests.HTTPError) as exc_info:
+                await client.aget_json(str(server.make_url("/missing")))
+        assert exc_info.value.response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_connection_error(self) -> None:
+        async with HTTPClientBase(rate_limit_delay=0, timeout=2) as client:
+            with pytest.raises(requests.ConnectionError):
+                await client.aget_json("http://127.0.0.1:9/unreachable")
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_limit(self, server: TestServer, state: _State) -> None:
+        url = str(server.make_url("/echo"))
+        async with HTTPClientBase(rate_limit_delay=0, max_concurrency=3) as client:
+            await asyncio.gather(*(client.aget_json(url, {"i": i}) for i in range(12)))
+        assert len(state.request_times) == 12
+        assert state.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spacing(self, server: TestServer, state: _State) -> None:
+        url = str(server.make_url("/echo"))
+        async with HTTPClientBase(rate_limit_delay=0.05, max_concurrency=8) as client:
+            await asyncio.gather(*(client.aget_json(url, {"i": i}) for i in range(5)))
+        gaps = [b - a for a, b in zip(state.request_times, state.request_times[1:], strict=False)]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    def test_reusable_across_event_loops(self) -> None:
+        """The client can be driven by successive asyncio.run() calls."""
+        client = HTTPClientBase(rate_limit_delay=0)
+
+        async def fetch() -> None:
+            with pytest.raises(requests.RequestException):
+                await client.aget_json("http://127.0.0.1:9/unreachable")
+
+        asyncio.run(fetch())
+        asyncio.run(fetch())
+        asyncio.run(client.aclose())
+
+
+class TestSingleFlight:
+    """Identical concurrent requests share one in-flight request."""
+
+    def test_threads_share_one_call(self) -> None:
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = 0
+
+        def slow() -> int:
+            nonlocal calls
+            calls += 1
+            started.set()
+            release.wait(5)
+            return 42
+
+        results: list[int] = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        while flight.saved < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert results == [42, 42, 42, 42]
+        assert calls == 1
+        assert (flight.calls, flight.saved) == (1, 3)
+        assert flight.do("k", lambda: 7) == 7  # finished calls are not reused
+
+    def test_exception_is_shared(self) -> None:
+        flight = SingleFlight()
+
+        async def run() -> list[BaseException | None]:
+            async def fail() -> None:
+                await asyncio.sleep(0.02)
+                raise requests.ConnectionError("boom")
+
+            return await asyncio.gather(*(flight.ado("k", fail) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, requests.ConnectionError) for r in results)
+        assert flight.saved == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        async def slow() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.ado("k", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.ado("k", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "done"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_async_requests_coalesced(self, server: TestServer, state: _State) -> None:
+        url = str(server.make_url("/echo"))
+        flight = SingleFlight()
+        async with HTTPClientBase(rate_limit_delay=0, single_flight=flight) as client:
+            results = await asyncio.gather(*(client.aget_json(url, {"curie": "A:1"}) for _ in range(5)))
+        assert len(state.request_times) == 1
+        assert all(result == results[0] for result in results)
+        assert flight.saved == 4
+
+    def test_sync_and_async_callers_share(self, state: _State) -> None:
+        """A thread joins a request an asyncio task already has in flight."""
+
+        async def run() -> None:
+            test_server = TestServer(_make_app(state))
+            await test_server.start_server()
+            url = str(test_server.make_url("/echo"))
+            flight = SingleFlight()
+            async with HTTPClientBase(rate_limit_delay=0, single_flight=flight) as client:
+                task = asyncio.ensure_future(client.aget_json(url))
+                while not state.request_times:
+                    await asyncio.sleep(0.001)
+                sync_result, async_result = await asyncio.gather(asyncio.to_thread(client._get_json, url), task)
+            await test_server.close()
+            assert sync_result == async_result
+            assert flight.saved == 1
+
+        asyncio.run(run())
+        assert len(state.request_times) == 1
+
+
+class TestThrottling:
+    """429/503 responses are retried and slow the host down."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("cmm_ai_automation.clients.base.backoff_delay", lambda *_, **__: 0.0)
+
+    @pytest.mark.asyncio
+    async def test_async_retries_throttled_request(self, server: TestServer, state: _State) -> None:
+        url = str(server.make_url("/throttled"))
+        async with HTTPClientBase(rate_limit_delay=0) as client:
+            assert await client.aget_json(url) == {"ok": True}
+            assert client._rate_limiter(url).interval > 0  # slowed down by the 429s
+        assert len(state.request_times) == 3
+
+    def test_sync_retries_throttled_request(self, state: _State) -> None:
+        async def run() -> None:
+            test_server = TestServer(_make_app(state))
+            await test_server.start_server()
+            client = HTTPClientBase(rate_limit_delay=0)
+            try:
+                data = await asyncio.to_thread(client._get_json, str(test_server.make_url("/throttled")))
+            finally:
+                client.close()
+                await test_server.close()
+            assert data == {"ok": True}
+
+        asyncio.run(run())
+        assert len(state.request_times) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, server: TestServer, state: _State) -> None:
+        async with HTTPClientBase(rate_limit_delay=0, max_retries=1) as client:
+            with pytest.raises(requests.HTTPError) as exc_info:
+                await client.aget_json(str(server.make_url("/throttled")))
+        assert exc_info.value.response.status_code == 429
+        assert len(state.request_times) == 2
+
+
+class TestAsyncClientMethods:
+    """Async client methods share parsing and error handling with the sync ones."""
+
+    @pytest.mark.asyncio
+    async def test_pubchem_aget_compound_by_cid(self, server: TestServer) -> None:
+        async with PubChemClient(rate_limit_delay=0) as client:
+            client.BASE_URL = str(server.make_url("")).rstrip("/")
+            results = await asyncio.gather(*(client.aget_compound_by_cid(cid) for cid in (5793, 5794)))
+        assert all(isinstance(r, CompoundResult) for r in results)
+        assert [r.CID for r in results if isinstance(r, CompoundResult)] == [5793, 5794]
+
+    @pytest.mark.asyncio
+    async def test_pubchem_async_error_is_lookup_error(self, server: TestServer) -> None:
+        async with PubChemClient(rate_limit_delay=0) as client:
+            client.BASE_URL = str(server.make_url("/missing")).rstrip("/")
+            result = await client.aget_compound_by_cid(1)
+        assert isinstance(result, LookupError)
@@ -0,0 +1,181 @@
+"""Tests for the persistent HTTP response cache."""
+
+import asyncio
+import sqlite3
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cmm_ai_automation.clients.base import HTTPClientBase
+from cmm_ai_automation.clients.cache import ResponseCache, make_cache_key, set_default_cache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    return ResponseCache(tmp_path / "http_cache.sqlite")
+
+
+class TestMakeCacheKey:
+    """Tests for request key canonicalization."""
+
+    def test_param_order_and_url_query_are_canonical(self) -> None:
+        a = make_cache_key("GET", "https://x.org/a?b=2", {"a": 1})
+        b = make_cache_key("get", "https://x.org/a", [("a", "1"), ("b", "2")])
+        assert a == b
+
+    def test_bool_params_match_api_spelling(self) -> None:
+        assert make_cache_key("GET", "https://x.org/a", {"f": True}) == make_cache_key("GET", "https://x.org/a?f=true")
+
+    def test_body_is_part_of_key(self) -> None:
+        a = make_cache_key("POST", "https://x.org/a", json_data={"curies": ["A:1"]})
+        b = make_cache_key("POST", "https://x.org/a", json_data={"curies": ["A:2"]})
+        c = make_cache_key("POST", "https://x.org/a", data={"cid": "1"})
+        assert len({a, b, c}) == 3
+
+    def test_json_key_order_is_ignored(self) -> None:
+        a = make_cache_key("POST", "https://x.org/a", json_data={"x": 1, "y": 2})
+        b = make_cache_key("POST", "https://x.org/a", json_data={"y": 2, "x": 1})
+        assert a == b
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage policy."""
+
+    def test_round_trip(self, cache: ResponseCache) -> None:
+        assert cache.put("k", "GET", "https://x.org/a", 200, {"Content-Type": "application/json"}, b"{}")
+        hit = cache.get("k")
+        assert hit is not None
+        assert hit.status_code == 200
+        assert hit.content == b"{}"
+        assert hit.headers == {"Content-Type": "application/json"}
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.sqlite"
+        ResponseCache(path).put("k", "GET", "u", 200, {}, b"x")
+        assert ResponseCache(path).get("k") is not None
+
+    def test_errors_and_pending_results_are_not_cached(self, cache: ResponseCache) -> None:
+        assert not cache.put("k", "GET", "u", 500, {}, b"")
+        assert not cache.put("k", "GET", "u", 429, {}, b"")
+        assert not cache.put("k", "GET", "u", 202, {}, b"")  # result not ready yet
+        assert cache.get("k") is None
+
+    def test_negative_results_use_negative_ttl(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "c.sqlite", ttl=None, negative_ttl=0.05)
+        cache.put("ok", "GET", "u", 200, {}, b"x")
+        cache.put("missing", "GET", "u", 404, {}, b"")
+        assert cache.get("missing") is not None
+        time.sleep(0.1)
+        assert cache.get("missing") is None
+        assert cache.get("ok") is not None
+
+    def test_negative_caching_can_be_disabled(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "c.sqlite", negative_ttl=0)
+        assert not cache.put("missing", "GET", "u", 404, {}, b"")
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "c.sqlite", max_bytes=250, access_resolution=0)
+        for key in ("a", "b"):
+            cache.put(key, "GET", "u", 200, {}, b"x" * 100)
+            time.sleep(0.01)
+        cache.get("a")  # "b" is now least recently used
+        time.sleep(0.01)
+        cache.put("c", "GET", "u", 200, {}, b"x" * 100)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert len(cache) == 2
+
+    def test_hits_batch_access_time_writes(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.sqlite"
+        cache = ResponseCache(path, access_resolution=0)
+        cache.put("k", "GET", "u", 200, {}, b"x")
+        with sqlite3.connect(path) as conn:
+            stored = conn.execute("SELECT accessed FROM responses").fetchone()[0]
+        time.sleep(0.01)
+        for _ in range(3):
+            assert cache.get("k") is not None
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT accessed FROM responses").fetchone()[0] == stored  # queued, not written
+        cache.close()
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT accessed FROM responses").fetchone()[0] > stored
+
+    def test_size_is_tracked_without_scanning(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.sqlite"
+        cache = ResponseCache(path, max_bytes=250, negative_ttl=0.05)
+        cache.put("a", "GET", "u", 200, {}, b"x" * 100)
+        cache.put("a", "GET", "u", 200, {}, b"x" * 50)  # replaced
+        cache.put("gone", "GET", "u", 404, {}, b"x" * 20)
+        time.sleep(0.1)
+        assert cache.get("gone") is None  # expired and deleted
+        cache.put("b", "GET", "u", 200, {}, b"x" * 150)
+        assert cache._size == 200
+        cache.put("c", "GET", "u", 200, {}, b"x" * 100)  # evicts "a"
+        assert (cache._size, len(cache)) == (250, 2)
+        cache.close()
+        assert ResponseCache(path)._size == 250
+
+
+class TestClientCaching:
+    """HTTPClientBase serves repeated requests from the cache."""
+
+    @pytest_asyncio.fixture
+    async def server(self) -> AsyncIterator[tuple[TestServer, list[str]]]:
+        seen: list[str] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            seen.append(request.path_qs)
+            status = int(request.query.get("status", "200"))
+            return web.json_response({"n": len(seen)}, status=status)
+
+        app = web.Application()
+        app.router.add_route("*", "/item", handler)
+        test_server = TestServer(app)
+        await test_server.start_server()
+        yield test_server, seen
+        await test_server.close()
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_hit_cache(self, server: tuple[TestServer, list[str]], cache: ResponseCache) -> None:
+        test_server, seen = server
+        url = str(test_server.make_url("/item"))
+        async with HTTPClientBase(rate_limit_delay=0, cache=cache) as client:
+            first = await client.aget_json(url, {"q": "glucose"})
+            second = await client.aget_json(url, {"q": "glucose"})
+            # The sync path shares the same entries
+            third = await asyncio.to_thread(client._get_json, url, {"q": "glucose"})
+            posted = await client.apost_json(url, json_data={"q": "glucose"})
+            posted_again = await asyncio.to_thread(client._post_json, url, None, {"q": "glucose"})
+        assert first == second == third == {"n": 1}
+        assert posted == posted_again == {"n": 2}
+        assert len(seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_404_still_raises(self, server: tuple[TestServer, list[str]], cache: ResponseCache) -> None:
+        test_server, seen = server
+        url = str(test_server.make_url("/item"))
+        # max_retries=0: count requests, not throttling retries
+        async with HTTPClientBase(rate_limit_delay=0, cache=cache, max_retries=0) as client:
+            for _ in range(2):
+                with pytest.raises(requests.HTTPError):
+                    await client.aget_json(url, {"status": 404})
+            for _ in range(2):
+                with pytest.raises(requests.HTTPError):
+                    await client.aget_json(url, {"status": 503})
+        assert len(seen) == 3
+
+    def test_default_cache(self, cache: ResponseCache) -> None:
+        set_default_cache(cache)
+        try:
+            assert HTTPClientBase().cache is cache
+        finally:
+            set_default_cache(None)
+        assert HTTPClientBase().cache is None
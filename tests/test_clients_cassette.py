@@ -0,0 +1,127 @@
+"""Tests for cassette record/replay."""
+
+import asyncio
+import gzip
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cmm_ai_automation.clients.base import HTTPClientBase, build_response
+from cmm_ai_automation.clients.cache import ResponseCache, make_cache_key
+from cmm_ai_automation.clients.cassette import Cassette, CassetteMiss
+
+URL = "https://api.example.org/items/1"
+
+
+class TestCassette:
+    """Tests for Cassette."""
+
+    def test_record_then_replay(self, tmp_path: Path) -> None:
+        response = build_response(
+            URL, 200, b'{"id": 1}', {"Content-Type": "application/json", "Set-Cookie": "session=secret"}
+        )
+        recorder = Cassette(tmp_path, mode="record")
+        recorder.record("GET", URL, response, {"q": "x"})
+        recorder.record("GET", URL, response, {"q": "x"})  # unchanged: not rewritten
+        assert (recorder.recorded, len(recorder)) == (1, 1)
+
+        key = make_cache_key("GET", URL, {"q": "x"})
+        with gzip.open(tmp_path / key[:2] / f"{key}.json.gz") as f:
+            stored = json.loads(f.read())
+        assert stored["headers"] == {"Content-Type": "application/json"}
+
+        player = Cassette(tmp_path)
+        replayed = player.replay("GET", f"{URL}?q=x")  # same key as params={"q": "x"}
+        assert (replayed.status_code, replayed.content) == (200, b'{"id": 1}')
+        with pytest.raises(CassetteMiss):
+            player.replay("GET", URL, {"q": "y"})
+        assert (player.replayed, player.misses) == (1, 1)
+
+    def test_binary_bodies_and_deterministic_files(self, tmp_path: Path) -> None:
+        body = bytes(range(256))
+        for directory in (tmp_path / "a", tmp_path / "b"):
+            Cassette(directory, mode="record").record("POST", URL, build_response(URL, 200, body), data={"k": "v"})
+        [file_a] = (tmp_path / "a").glob("*/*.json.gz")
+        [file_b] = (tmp_path / "b").glob("*/*.json.gz")
+        assert file_a.read_bytes() == file_b.read_bytes()
+        assert Cassette(tmp_path / "a").replay("POST", URL, data={"k": "v"}).content == body
+
+    def test_unknown_mode(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown cassette mode"):
+            Cassette(tmp_path, mode="rewind")  # type: ignore[arg-type]
+
+
+class TestClientRecordReplay:
+    """HTTPClientBase records exchanges and replays them without network access."""
+
+    @pytest_asyncio.fixture
+    async def server(self) -> AsyncIterator[TestServer]:
+        async def item(request: web.Request) -> web.Response:
+            item_id = request.match_info["item_id"]
+            if item_id == "missing":
+                return web.json_response({"error": "not found"}, status=404)
+            return web.json_response({"id": item_id, "q": request.query.get("q")})
+
+        app = web.Application()
+        app.router.add_get("/items/{item_id}", item)
+        test_server = TestServer(app)
+        await test_server.start_server()
+        yield test_server
+        await test_server.close()
+
+    @pytest.mark.asyncio
+    async def test_async_record_then_replay_offline(self, server: TestServer, tmp_path: Path) -> None:
+        url = str(server.make_url("/items/1"))
+        missing = str(server.make_url("/items/missing"))
+        async with HTTPClientBase(rate_limit_delay=0, cassette=Cassette(tmp_path, mode="record")) as client:
+            recorded = await client.aget_json(url, {"q": "a"})
+            with pytest.raises(requests.HTTPError):
+                await client.aget_json(missing)
+        await server.close()
+
+        player = Cassette(tmp_path)
+        async with HTTPClientBase(rate_limit_delay=0, cassette=player) as client:
+            assert await client.aget_json(url, {"q": "a"}) == recorded == {"id": "1", "q": "a"}
+            with pytest.raises(requests.HTTPError) as exc_info:
+                await client.aget_json(missing)
+            assert exc_info.value.response.status_code == 404
+            with pytest.raises(CassetteMiss):
+                await client.aget_json(url, {"q": "b"})
+        # Sync requests share the recordings
+        with HTTPClientBase(rate_limit_delay=0, cassette=player) as client:
+            assert client._get_json(url, {"q": "a"}) == recorded
+        assert (player.replayed, player.misses) == (3, 1)
+
+    def test_cache_hits_are_recorded(self, tmp_path: Path) -> None:
+        async def item(request: web.Request) -> web.Response:
+            return web.json_response({"id": request.match_info["item_id"]})
+
+        async def run() -> None:
+            app = web.Application()
+            app.router.add_get("/items/{item_id}", item)
+            test_server = TestServer(app)
+            await test_server.start_server()
+            url = str(test_server.make_url("/items/7"))
+            cache = ResponseCache(tmp_path / "cache.sqlite")
+            try:
+                warm = HTTPClientBase(rate_limit_delay=0, cache=cache)
+                await asyncio.to_thread(warm._get_json, url)
+                warm.close()
+                recorder = Cassette(tmp_path / "cassette", mode="record")
+                client = HTTPClientBase(rate_limit_delay=0, cache=cache, cassette=recorder)
+                await asyncio.to_thread(client._get_json, url)
+                client.close()
+            finally:
+                cache.close()
+                await test_server.close()
+            assert cache.hits == 1
+            assert recorder.recorded == 1
+
+        asyncio.run(run())
+        assert len(Cassette(tmp_path / "cassette")) == 1
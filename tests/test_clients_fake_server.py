@@ -0,0 +1,192 @@
+"""Tests for the fake API server and the clients' base_url override."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp.test_utils import TestServer
+
+from cmm_ai_automation.clients.chebi import ChEBIClient, ChEBICompound
+from cmm_ai_automation.clients.fake_server import FakeApiServer, FakeCompound, FaultConfig, _cas_rn
+from cmm_ai_automation.clients.mediadive import IngredientResult, MediaDiveClient, MediaDiveLookupError
+from cmm_ai_automation.clients.node_normalization import NodeNormalizationClient, NormalizedNode
+from cmm_ai_automation.clients.ols import ChEBITerm, OLSClient
+from cmm_ai_automation.clients.pubchem import CompoundResult, LookupError, PubChemClient
+
+
+async def _start(server: FakeApiServer) -> TestServer:
+    test_server = TestServer(server.make_app())
+    await test_server.start_server()
+    return test_server
+
+
+def _urls(test_server: TestServer) -> dict[str, str]:
+    return FakeApiServer.base_urls(str(test_server.make_url("")))
+
+
+class TestFakeCompound:
+    """Tests for synthetic compounds."""
+
+    def test_synthesize_is_deterministic(self) -> None:
+        glucose = FakeCompound.synthesize("glucose")
+        assert FakeCompound.synthesize("Glucose").cid == glucose.cid
+        assert FakeCompound.synthesize("sucrose").cid != glucose.cid
+        explicit = FakeCompound.synthesize("x", cid=5, chebi_id=7)
+        assert (explicit.cid, explicit.chebi_id) == (5, 7)
+
+    def test_cas_check_digit(self) -> None:
+        assert _cas_rn(5099) == "50-99-7"  # D-glucose
+        assert _cas_rn(773218) == "7732-18-5"  # water
+
+
+class TestClientsAgainstFakeServer:
+    """Each client resolves the same synthetic compound through its own URL shapes."""
+
+    @pytest_asyncio.fixture
+    async def fake(self) -> AsyncIterator[tuple[FakeApiServer, dict[str, str]]]:
+        server = FakeApiServer(FaultConfig(missing=frozenset({"unobtainium", "999"})))
+        test_server = await _start(server)
+        yield server, _urls(test_server)
+        await test_server.close()
+
+    @pytest.mark.asyncio
+    async def test_pubchem(self, fake: tuple[FakeApiServer, dict[str, str]]) -> None:
+        server, urls = fake
+        expected = FakeCompound.synthesize("glucose")
+        async with PubChemClient(rate_limit_delay=0, base_url=urls["pubchem"]) as client:
+            assert urls["pubchem"] == client.BASE_URL
+            assert await client.aget_cids_by_name("glucose") == [expected.cid]
+            compound = await client.aget_compound_by_name("glucose")
+            assert isinstance(compound, CompoundResult)
+            assert (compound.CID, compound.InChIKey, compound.MolecularWeight) == (
+                expected.cid,
+                expected.inchikey,
+                expected.mass,
+            )
+            bulk = await client.aget_compounds_by_cids([expected.cid, 42])
+            assert isinstance(bulk[42], CompoundResult)
+            assert await client.aget_xrefs(expected.cid) == {
+                "CAS": expected.cas_rn,
+                "ChEBI": f"CHEBI:{expected.chebi_id}",
+                "Wikidata": f"Q{expected.cid}",
+            }
+            missing = await client.aget_cids_by_name("unobtainium")
+            assert isinstance(missing, LookupError)
+            assert missing.error_code == "PUGREST.NotFound"
+        assert server.request_counts["pubchem"] == 5
+
+    @pytest.mark.asyncio
+    async def test_chebi_and_ols(self, fake: tuple[FakeApiServer, dict[str, str]]) -> None:
+        _, urls = fake
+        expected = FakeCompound.synthesize("glycine")
+        async with ChEBIClient(rate_limit_delay=0, base_url=urls["chebi"]) as chebi:
+            hit = await chebi.asearch_exact("glycine")
+            assert hit is not None and not isinstance(hit, Exception)
+            assert hit.chebi_id == f"CHEBI:{expected.chebi_id}"
+            compound = await chebi.aget_compound(hit.chebi_id)
+            assert isinstance(compound, ChEBICompound)
+            assert compound.name == "glycine"
+            assert compound.get_cas_numbers() == [expected.cas_rn]
+        async with OLSClient(rate_limit_delay=0, base_url=urls["ols"]) as ols:
+            term = await ols.aget_chebi_term(expected.chebi_id)
+            assert isinstance(term, ChEBITerm)
+            assert (term.label, term.inchikey) == ("glycine", expected.inchikey)
+            assert await ols.aget_chebi_parents(expected.chebi_id) == ["CHEBI:24431"]
+            [doc] = await ols.asearch_chebi("glycine")
+            assert doc.short_form == f"CHEBI_{expected.chebi_id}"
+
+    @pytest.mark.asyncio
+    async def test_nodenorm(self, fake: tuple[FakeApiServer, dict[str, str]]) -> None:
+        _, urls = fake
+        expected = FakeCompound.synthesize("compound 5793", cid=5793)
+        async with NodeNormalizationClient(rate_limit_delay=0, base_url=urls["nodenorm"]) as client:
+            node = await client.anormalize("PUBCHEM.COMPOUND:5793")
+            assert isinstance(node, NormalizedNode)
+            assert node.canonical_id == f"CHEBI:{expected.chebi_id}"
+            results = await client.anormalize_batch([f"CAS:{expected.cas_rn}", "MESH:D005947"])
+        assert isinstance(results[f"CAS:{expected.cas_rn}"], NormalizedNode)
+        assert not isinstance(results["MESH:D005947"], NormalizedNode)
+
+    @pytest.mark.asyncio
+    async def test_mediadive(self, fake: tuple[FakeApiServer, dict[str, str]]) -> None:
+        _, urls = fake
+        async with MediaDiveClient(rate_limit_delay=0, base_url=urls["mediadive"]) as client:
+            ingredient = await client.aget_ingredient(17)
+            assert isinstance(ingredient, IngredientResult)
+            assert ingredient.name == "ingredient 17"
+            missing = await client.aget_ingredient(999)
+            assert isinstance(missing, MediaDiveLookupError)
+            assert missing.error_code == "NOT_FOUND"
+            solution = await client.aget_solution(3)
+            assert not isinstance(solution, MediaDiveLookupError)
+            assert [item.compound_id for item in solution.recipe] == [3, 4]
+
+    def test_sync_client(self) -> None:
+        async def run() -> list[int] | LookupError:
+            test_server = await _start(FakeApiServer())
+            client = PubChemClient(rate_limit_delay=0, base_url=_urls(test_server)["pubchem"])
+            try:
+                return await asyncio.to_thread(client.get_cids_by_name, "glucose")
+            finally:
+                client.close()
+                await test_server.close()
+
+        assert asyncio.run(run()) == [FakeCompound.synthesize("glucose").cid]
+
+
+class TestFaultInjection:
+    """Latency, errors and throttling."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("cmm_ai_automation.clients.base.backoff_delay", lambda *_, **__: 0.0)
+
+    @pytest.mark.asyncio
+    async def test_throttled_requests_are_retried(self) -> None:
+        server = FakeApiServer(FaultConfig(throttle_rate=0.3, retry_after=None, seed=7))
+        test_server = await _start(server)
+        try:
+            async with MediaDiveClient(rate_limit_delay=0, base_url=_urls(test_server)["mediadive"]) as client:
+                results = await asyncio.gather(*(client.aget_ingredient(i) for i in range(1, 6)))
+        finally:
+            await test_server.close()
+        assert all(isinstance(result, IngredientResult) for result in results)
+        assert server.status_counts[429] > 0
+        assert server.status_counts[200] == 5
+        assert server.request_counts["mediadive"] == 5 + server.status_counts[429]
+
+    @pytest.mark.asyncio
+    async def test_errors_and_latency(self) -> None:
+        server = FakeApiServer(FaultConfig(error_rate=1.0, latency=0.05))
+        test_server = await _start(server)
+        try:
+            async with PubChemClient(rate_limit_delay=0, base_url=_urls(test_server)["pubchem"]) as client:
+                started = asyncio.get_running_loop().time()
+                result = await client.aget_cids_by_name("glucose")
+                elapsed = asyncio.get_running_loop().time() - started
+        finally:
+            await test_server.close()
+        assert isinstance(result, LookupError)
+        assert server.status_counts == {500: 1}
+        assert elapsed >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_recorded_responses(tmp_path: Path) -> None:
+    """Recorded responses replace the synthetic ones."""
+    recorded = tmp_path / "responses.json"
+    body = {"status": 200, "data": {"id": 1, "name": "Peptone", "CAS-RN": "73049-73-7", "complex_compound": 1}}
+    recorded.write_text(json.dumps([{"path": "/mediadive/rest/ingredient/1", "body": body}]), encoding="utf-8")
+    server = FakeApiServer()
+    assert server.load_responses(recorded) == 1
+    test_server = await _start(server)
+    try:
+        async with MediaDiveClient(rate_limit_delay=0, base_url=_urls(test_server)["mediadive"]) as client:
+            ingredient = await client.aget_ingredient(1)
+    finally:
+        await test_server.close()
+    assert isinstance(ingredient, IngredientResult)
+    assert (ingredient.name, ingredient.cas_rn, ingredient.is_complex) == ("Peptone", "73049-73-7", True)
@@ -0,0 +1,76 @@
+"""Tests for the append-only JSONL cache."""
+
+import json
+from pathlib import Path
+
+from cmm_ai_automation.clients.jsonl_cache import JsonlCache
+
+
+def _lines(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJsonlCache:
+    """Tests for JsonlCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.jsonl"
+        with JsonlCache(path) as cache:
+            cache["ingredient:1"] = {"id": 1, "name": "Peptone"}
+            cache["ingredient:2"] = {"id": 2}
+            del cache["ingredient:2"]
+            cache["ingredient:1"] = {"id": 1, "name": "Peptone", "CAS-RN": "73049-73-7"}
+
+        with JsonlCache(path) as reloaded:
+            assert dict(reloaded) == {"ingredient:1": {"id": 1, "name": "Peptone", "CAS-RN": "73049-73-7"}}
+
+    def test_writes_are_appended_immediately(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.jsonl"
+        cache = JsonlCache(path)
+        cache["a"] = 1
+        assert _lines(path) == [{"k": "a", "v": 1}]
+        cache["b"] = 2
+        assert _lines(path) == [{"k": "a", "v": 1}, {"k": "b", "v": 2}]
+        cache.close()
+
+    def test_loads_lazily(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.jsonl"
+        path.write_text('{"k":"a","v":1}\n', encoding="utf-8")
+        cache = JsonlCache(path)
+        assert cache._data is None
+        assert cache["a"] == 1
+        assert cache._data == {"a": 1}
+
+    def test_torn_last_line(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.jsonl"
+        path.write_text('{"k":"a","v":1}\n{"k":"b","v":', encoding="utf-8")
+        with JsonlCache(path) as cache:
+            assert dict(cache) == {"a": 1}
+            cache["c"] = 3
+        with JsonlCache(path) as reloaded:
+            assert dict(reloaded) == {"a": 1, "c": 3}
+
+    def test_compaction(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.jsonl"
+        cache = JsonlCache(path, compact_min_stale=3)
+        cache["keep"] = 0
+        for i in range(5):
+            cache["counter"] = i
+        cache.close()  # waits for the background compaction
+
+        assert len(_lines(path)) < 6
+        assert not path.with_name("cache.jsonl.compact").exists()
+        with JsonlCache(path) as reloaded:
+            assert dict(reloaded) == {"keep": 0, "counter": 4}
+
+    def test_explicit_compact(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.jsonl"
+        with JsonlCache(path) as cache:
+            cache["a"] = 1
+            cache["a"] = 2
+            cache["b"] = 1
+            del cache["b"]
+            cache.compact()
+            assert _lines(path) == [{"k": "a", "v": 2}]
+            cache["c"] = 3
+        assert _lines(path) == [{"k": "a", "v": 2}, {"k": "c", "v": 3}]
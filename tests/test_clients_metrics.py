@@ -0,0 +1,156 @@
+"""Tests for the request metrics registry."""
+
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from click.testing import CliRunner
+
+from cmm_ai_automation.clients.base import HTTPClientBase
+from cmm_ai_automation.clients.cache import ResponseCache
+from cmm_ai_automation.clients.metrics import Histogram, MetricsRegistry, endpoint_label, get_metrics
+
+
+class TestEndpointLabel:
+    """Tests for endpoint_label()."""
+
+    def test_relative_to_base_url(self) -> None:
+        base = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+        assert endpoint_label(f"{base}/compound/name/glucose/cids/JSON", base) == "compound/name"
+        assert endpoint_label("https://mediadive.dsmz.de/rest/ingredient/17", "https://mediadive.dsmz.de/rest") == (
+            "ingredient/{id}"
+        )
+
+    def test_base_path_stripped_only_at_segment_boundary(self) -> None:
+        base = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+        view = "https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/compound/5793/JSON"
+        assert endpoint_label(view, base) == "rest/pug_view"
+        assert endpoint_label(base, base) == "/"
+
+    def test_without_base_url(self) -> None:
+        assert endpoint_label("https://www.ebi.ac.uk/ols4/api/search?q=x") == "ols4/api"
+        assert endpoint_label("https://example.org") == "/"
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observe_and_quantiles(self) -> None:
+        histogram = Histogram()
+        for value in (0.005, 0.03, 0.03, 0.2, 45.0):
+            histogram.observe(value)
+        assert histogram.count == 5
+        assert histogram.total == pytest.approx(45.265)
+        assert histogram.quantile(0.5) == 0.05
+        assert histogram.quantile(1.0) == float("inf")
+        assert Histogram().quantile(0.5) is None
+
+
+class TestMetricsRegistry:
+    """Tests for recording and rendering."""
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        registry = MetricsRegistry()
+        labels = ("PubChemClient", "pubchem.ncbi.nlm.nih.gov", "compound/name")
+        registry.record_response(*labels, 200, 1000, 0.2)
+        registry.record_response(*labels, 404, 50, 0.1)
+        registry.record_error(*labels, requests.Timeout("slow"))
+        registry.record_retry(*labels)
+        registry.record_rate_limit_wait(*labels, 0.5)
+        registry.record_cache(*labels, hits=3, misses=1)
+        return registry
+
+    def test_to_dict(self, registry: MetricsRegistry) -> None:
+        data = registry.to_dict()
+        [endpoint] = data["endpoints"]
+        assert endpoint["requests"] == 2
+        assert endpoint["status_codes"] == {"200": 1, "404": 1}
+        assert endpoint["response_bytes"] == 1050
+        assert endpoint["errors"] == {"Timeout": 1}
+        assert endpoint["cache_hit_ratio"] == 0.75
+        assert endpoint["latency_seconds"]["count"] == 2
+        assert data["clients"]["PubChemClient"]["requests"] == 2
+        assert data["clients"]["PubChemClient"]["rate_limit_wait_seconds"] == 0.5
+
+    def test_total_calls(self, registry: MetricsRegistry) -> None:
+        # 2 responses + 1 failed request; the 3 cache hits sent nothing
+        assert registry.total_calls() == 3
+
+    def test_to_prometheus(self, registry: MetricsRegistry) -> None:
+        text = registry.to_prometheus()
+        labels = 'client="PubChemClient",host="pubchem.ncbi.nlm.nih.gov",endpoint="compound/name"'
+        assert "# TYPE cmm_http_requests_total counter" in text
+        assert f'cmm_http_requests_total{{{labels},status="404"}} 1' in text
+        assert f'cmm_http_cache_lookups_total{{{labels},result="hit"}} 3' in text
+        assert f'cmm_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"cmm_http_request_duration_seconds_count{{{labels}}} 2" in text
+
+    def test_write_picks_format_from_suffix(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        registry.write(tmp_path / "metrics.json")
+        registry.write(tmp_path / "metrics.prom")
+        assert json.loads((tmp_path / "metrics.json").read_text())["endpoints"]
+        assert (tmp_path / "metrics.prom").read_text().startswith("# TYPE")
+
+
+class TestClientInstrumentation:
+    """HTTPClientBase records its requests."""
+
+    @pytest_asyncio.fixture
+    async def server(self) -> AsyncIterator[TestServer]:
+        async def item(request: web.Request) -> web.Response:
+            return web.json_response({"id": request.match_info["item_id"]})
+
+        app = web.Application()
+        app.router.add_get("/items/{item_id}", item)
+        test_server = TestServer(app)
+        await test_server.start_server()
+        yield test_server
+        await test_server.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_and_cache_are_recorded(self, server: TestServer, tmp_path: Path) -> None:
+        registry = MetricsRegistry()
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        async with HTTPClientBase(rate_limit_delay=0, cache=cache, metrics=registry) as client:
+            client.BASE_URL = str(server.make_url(""))
+            await client.aget_json(str(server.make_url("/items/1")))
+            await client.aget_json(str(server.make_url("/items/1")))
+            await client.aget_json(str(server.make_url("/items/2")))
+        cache.close()
+
+        [series] = registry.series()
+        assert (series.client, series.endpoint) == ("HTTPClientBase", "items/{id}")
+        assert series.status_codes == {200: 2}
+        assert (series.cache_hits, series.cache_misses) == (1, 2)
+        assert series.response_bytes > 0
+        assert series.latency.count == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_recorded(self) -> None:
+        registry = MetricsRegistry()
+        async with HTTPClientBase(rate_limit_delay=0, timeout=2, metrics=registry) as client:
+            with pytest.raises(requests.ConnectionError):
+                await client.aget_json("http://127.0.0.1:9/unreachable")
+        [series] = registry.series()
+        assert series.errors == {"ConnectionError": 1}
+
+
+def test_metrics_out_option(tmp_path: Path) -> None:
+    """CLI runs dump the process-wide registry on exit."""
+    from cmm_ai_automation.scripts.enrich_ingredients import main
+
+    get_metrics().record_response("PubChemClient", "pubchem.ncbi.nlm.nih.gov", "compound/name", 200, 10, 0.1)
+    input_file = tmp_path / "ingredients.tsv"
+    input_file.write_text("ingredient_name\nglucose\n", encoding="utf-8")
+    metrics_out = tmp_path / "metrics.json"
+
+    result = CliRunner().invoke(main, ["-i", str(input_file), "--dry-run", "--metrics-out", str(metrics_out)])
+
+    assert result.exit_code == 0, result.output
+    assert "PubChemClient" in json.loads(metrics_out.read_text())["clients"]
@@ -0,0 +1,202 @@
+"""Tests for the shared per-host token bucket rate limiter."""
+
+import threading
+import time
+from collections.abc import Iterator
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+
+from cmm_ai_automation.clients.base import HTTPClientBase
+from cmm_ai_automation.clients.rate_limit import (
+    FileLockTokenBucket,
+    TokenBucket,
+    backoff_delay,
+    configure_rate_limits,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry() -> Iterator[None]:
+    configure_rate_limits(lock_dir=None)
+    yield
+    configure_rate_limits(lock_dir=None)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_reservations_are_spaced(self) -> None:
+        bucket = TokenBucket(interval=1.0)
+        waits = [bucket.reserve() for _ in range(3)]
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(1.0, abs=0.05)
+        assert waits[2] == pytest.approx(2.0, abs=0.05)
+
+    def test_burst_allows_back_to_back_requests(self) -> None:
+        bucket = TokenBucket(interval=1.0, burst=3)
+        waits = [bucket.reserve() for _ in range(4)]
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(1.0, abs=0.05)
+
+    def test_zero_interval_disables_limiting(self) -> None:
+        bucket = TokenBucket(interval=0)
+        assert all(bucket.reserve() == 0 for _ in range(100))
+
+    def test_threads_share_budget(self) -> None:
+        bucket = TokenBucket(interval=0.02)
+        times: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(3):
+                bucket.acquire()
+                with lock:
+                    times.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        times.sort()
+        assert len(times) == 12
+        assert times[-1] - times[0] >= 11 * 0.02 * 0.9
+
+    @pytest.mark.asyncio
+    async def test_aacquire(self) -> None:
+        bucket = TokenBucket(interval=0.02)
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.aacquire()
+        assert time.monotonic() - start >= 3 * 0.02 * 0.9
+
+
+class TestAdaptiveRate:
+    """Tests for AIMD adjustment and the retry schedule."""
+
+    def test_throttle_doubles_interval_and_success_recovers(self) -> None:
+        bucket = TokenBucket(interval=0.2)
+        bucket.record_throttle()
+        bucket.record_throttle()
+        assert bucket.interval == pytest.approx(0.8)
+        for _ in range(100):
+            bucket.record_success()
+        assert bucket.interval == 0.2  # never faster than configured
+
+    def test_additive_increase_is_gradual(self) -> None:
+        bucket = TokenBucket(interval=0.2)
+        bucket.record_throttle()
+        bucket.record_success()
+        assert 0.2 < bucket.interval < 0.4
+
+    def test_unlimited_host_is_throttled_then_released(self) -> None:
+        bucket = TokenBucket(interval=0)
+        bucket.record_throttle()
+        assert bucket.interval > 0
+        for _ in range(1000):
+            bucket.record_success()
+        assert bucket.interval == 0
+
+    def test_retry_after_holds_all_callers(self) -> None:
+        bucket = TokenBucket(interval=0.1)
+        bucket.record_throttle(retry_after=5)
+        assert bucket.reserve() == pytest.approx(5.0, abs=0.05)
+
+    def test_retry_after_shared_between_processes(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "host.json"
+        first = FileLockTokenBucket(interval=0.1, state_file=state_file)
+        second = FileLockTokenBucket(interval=0.1, state_file=state_file)
+        first.record_throttle(retry_after=5)
+        assert second.reserve() == pytest.approx(5.0, abs=0.1)
+
+    def test_interval_shared_between_processes(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "host.json"
+        first = FileLockTokenBucket(interval=0.2, state_file=state_file)
+        second = FileLockTokenBucket(interval=0.2, state_file=state_file)
+        first.record_throttle()
+        second.reserve()
+        assert second.interval == pytest.approx(0.4)
+        second.record_success()
+        first.reserve()
+        assert 0.2 < first.interval == second.interval < 0.4
+
+    def test_parse_retry_after(self) -> None:
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+        assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_backoff_delay(self) -> None:
+        delays = [backoff_delay(3, base=1.0, cap=5.0) for _ in range(200)]
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 1  # jittered
+        assert backoff_delay(0, retry_after=10) >= 10
+
+
+class TestFileLockTokenBucket:
+    """Tests for the cross-process file-locked backend."""
+
+    def test_buckets_share_state_file(self, tmp_path: Path) -> None:
+        # Two bucket objects stand in for two processes sharing a host
+        state_file = tmp_path / "host.json"
+        first = FileLockTokenBucket(interval=1.0, state_file=state_file)
+        second = FileLockTokenBucket(interval=1.0, state_file=state_file)
+        assert first.reserve() == 0
+        assert second.reserve() == pytest.approx(1.0, abs=0.05)
+        assert first.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_corrupt_state_file_is_reset(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "host.json"
+        state_file.write_text("not json")
+        bucket = FileLockTokenBucket(interval=1.0, state_file=state_file)
+        assert bucket.reserve() == 0
+
+    @pytest.mark.asyncio
+    async def test_aacquire_takes_file_lock_off_the_event_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bucket = FileLockTokenBucket(interval=0.01, state_file=tmp_path / "host.json")
+        reserve = bucket.reserve
+        threads: list[int] = []
+
+        def recording_reserve() -> float:
+            threads.append(threading.get_ident())
+            return reserve()
+
+        monkeypatch.setattr(bucket, "reserve", recording_reserve)
+        assert await bucket.aacquire() == 0
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+
+class TestRegistry:
+    """Tests for get_rate_limiter() and configure_rate_limits()."""
+
+    def test_same_host_shares_bucket(self) -> None:
+        assert get_rate_limiter("a.example.org", 0.2) is get_rate_limiter("a.example.org", 0.2)
+        assert get_rate_limiter("a.example.org", 0.2) is not get_rate_limiter("b.example.org", 0.2)
+
+    def test_most_conservative_interval_wins(self) -> None:
+        bucket = get_rate_limiter("a.example.org", 0.2)
+        get_rate_limiter("a.example.org", 0.5)
+        get_rate_limiter("a.example.org", 0.1)
+        assert bucket.interval == 0.5
+
+    def test_lock_dir_selects_file_backend(self, tmp_path: Path) -> None:
+        configure_rate_limits(lock_dir=tmp_path)
+        bucket = get_rate_limiter("127.0.0.1:8080", 0.2)
+        assert isinstance(bucket, FileLockTokenBucket)
+        assert bucket.state_file == tmp_path / "127.0.0.1_8080.json"
+
+    def test_clients_on_same_host_share_bucket(self) -> None:
+        first = HTTPClientBase(rate_limit_delay=0.2)
+        second = HTTPClientBase(rate_limit_delay=0.3)
+        url = "https://api.example.org/items/1"
+        assert first._rate_limiter(url) is second._rate_limiter(url)
+        assert first._rate_limiter(url).interval == 0.3
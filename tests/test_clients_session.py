@@ -0,0 +1,67 @@
+"""Tests for the shared session factory."""
+
+from collections.abc import Iterator
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from cmm_ai_automation.clients.base import HTTPClientBase
+from cmm_ai_automation.clients.session import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_USER_AGENT,
+    SessionConfig,
+    configure_sessions,
+    get_session_config,
+    get_shared_session,
+    make_session,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_config() -> Iterator[None]:
+    previous = get_session_config()
+    yield
+    configure_sessions(previous)
+
+
+def _adapter(session: object, url: str = "https://example.org/") -> HTTPAdapter:
+    adapter = session.get_adapter(url)  # type: ignore[attr-defined]
+    assert isinstance(adapter, HTTPAdapter)
+    return adapter
+
+
+class TestMakeSession:
+    """Tests for make_session()."""
+
+    def test_pools_and_headers(self) -> None:
+        session = make_session({"X-API-KEY": "k", "User-Agent": "custom"})
+        for url in ("https://example.org/", "http://example.org/"):
+            assert _adapter(session, url)._pool_maxsize == DEFAULT_POOL_MAXSIZE  # type: ignore[attr-defined]
+        assert session.headers["Accept-Encoding"] == "gzip, deflate"
+        assert session.headers["Connection"] == "keep-alive"
+        assert (session.headers["X-API-KEY"], session.headers["User-Agent"]) == ("k", "custom")
+
+    def test_explicit_config(self) -> None:
+        adapter = _adapter(make_session(config=SessionConfig(pool_connections=2, pool_maxsize=4, pool_block=True)))
+        assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (2, 4, True)  # type: ignore[attr-defined]
+
+
+class TestSharedSession:
+    """Tests for the process-wide session."""
+
+    def test_reused_until_reconfigured(self) -> None:
+        shared = get_shared_session()
+        assert get_shared_session() is shared
+        assert shared.headers["User-Agent"] == DEFAULT_USER_AGENT
+
+        configure_sessions(SessionConfig(pool_maxsize=64))
+        rebuilt = get_shared_session()
+        assert rebuilt is not shared
+        assert _adapter(rebuilt)._pool_maxsize == 64  # type: ignore[attr-defined]
+
+    def test_clients_use_configured_pools(self) -> None:
+        configure_sessions(SessionConfig(pool_maxsize=3))
+        with HTTPClientBase(headers={"X-Test": "1"}) as client:
+            assert _adapter(client._session)._pool_maxsize == 3  # type: ignore[attr-defined]
+            assert client._session.headers["Accept"] == "application/json"
+            assert client._session.headers["X-Test"] == "1"
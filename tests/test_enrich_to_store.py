@@ -1,6 +1,35 @@
 """Tests for the enrich_to_store module."""
 
-from cmm_ai_automation.scripts.enrich_to_store import normalize_inchikey
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from cmm_ai_automation.clients.cas import CASLookupError, CASResult
+from cmm_ai_automation.clients.node_normalization import NormalizedNode
+from cmm_ai_automation.clients.pubchem import CompoundResult
+from cmm_ai_automation.clients.pubchem import LookupError as PubChemLookupError
+from cmm_ai_automation.scripts import enrich_to_store
+from cmm_ai_automation.scripts.enrich_to_store import (
+    IncompleteEnrichmentError,
+    OutputBuffer,
+    SourceResults,
+    is_request_failure,
+    iter_enrichments,
+    normalize_inchikey,
+    pending_rows,
+    run_source_queries,
+    spider_enrich_corpus,
+    spider_enrich_ingredient,
+    split_incremental,
+)
+from cmm_ai_automation.store.enrichment_journal import EnrichmentJournal, JournalEntry, row_hash
 
 
 class TestNormalizeInchikey:
@@ -33,3 +62,413 @@ class TestNormalizeInchikey:
     def test_normalize_empty_string(self) -> None:
         """Empty string should return None."""
         assert normalize_inchikey("") is None
+
+
+NAMES = ["ing1", "ing2", "bad3", "ing4"]
+
+
+def _fake_enrich(name: str, echo: Callable[..., Any]) -> dict[str, dict[str, Any]]:
+    """Stand-in for spider_enrich_ingredient: later names finish first."""
+    echo(f"  start {name}")
+    time.sleep(0.01 * (5 - int(name[-1])))
+    if name == "bad3":
+        raise ValueError("lookup failed")
+    echo("  → done: ", nl=False)
+    echo(name)
+    return {"source": {"name": name, "thread": threading.get_ident()}}
+
+
+class TestIterEnrichments:
+    """Concurrent enrichment yields the same outcomes and output as a serial run."""
+
+    def _run(self, capsys: pytest.CaptureFixture[str], workers: int) -> tuple[list[Any], str]:
+        outcomes = [
+            (o.name, o.sources_data and o.sources_data["source"]["name"], repr(o.error))
+            for o in iter_enrichments(NAMES, _fake_enrich, workers=workers)
+        ]
+        return outcomes, capsys.readouterr().out
+
+    def test_matches_serial_run(self, capsys: pytest.CaptureFixture[str]) -> None:
+        serial = self._run(capsys, workers=1)
+        concurrent = self._run(capsys, workers=4)
+        assert concurrent == serial
+        outcomes, output = serial
+        assert [name for name, _, _ in outcomes] == NAMES
+        assert outcomes[2] == ("bad3", None, repr(ValueError("lookup failed")))
+        assert "[2/4] Processing: ing2\n  start ing2\n  → done: ing2\n" in output
+
+    def test_runs_concurrently(self) -> None:
+        threads = {
+            outcome.sources_data["source"]["thread"]
+            for outcome in iter_enrichments(["a1", "a2", "a3"], _fake_enrich, workers=3)
+            if outcome.sources_data
+        }
+        assert threading.get_ident() not in threads
+        assert len(threads) > 1
+
+    def test_api_calls_measured_only_when_serial(self) -> None:
+        assert [o.api_calls for o in iter_enrichments(NAMES, _fake_enrich, workers=1)] == [0, 0, 0, 0]
+        assert [o.api_calls for o in iter_enrichments(NAMES, _fake_enrich, workers=4)] == [None] * 4
+
+
+def _slow_query(source: str, delay: float) -> Callable[[Callable[..., Any]], SourceResults]:
+    def query(echo: Callable[..., Any]) -> SourceResults:
+        echo(f"    → {source}: ", nl=False)
+        time.sleep(delay)
+        echo("done")
+        return {source: {"name": source}}, {f"{source}:1"}, []
+
+    return query
+
+
+class TestRunSourceQueries:
+    """Independent source queries run concurrently but report in order."""
+
+    def test_waits_for_slowest_only(self) -> None:
+        out = OutputBuffer()
+        started = time.monotonic()
+        sources_data, queried_ids, failures = run_source_queries(
+            [_slow_query("pubchem", 0.2), _slow_query("chebi", 0.1), _slow_query("cas", 0.2)], out.echo
+        )
+        assert time.monotonic() - started < 0.45
+        assert list(sources_data) == ["pubchem", "chebi", "cas"]
+        assert queried_ids == {"pubchem:1", "chebi:1", "cas:1"}
+        assert failures == []
+        assert "".join(message + ("\n" if nl else "") for message, nl in out.lines) == (
+            "    → pubchem: done\n    → chebi: done\n    → cas: done\n"
+        )
+
+    def test_no_queries(self) -> None:
+        assert run_source_queries([], OutputBuffer().echo) == ({}, set(), [])
+
+
+_REQUEST_ERROR = PubChemLookupError(name_queried="x", error_code="REQUEST_ERROR", error_message="Connection refused")
+
+
+class TestIsRequestFailure:
+    """Failed requests are told apart from lookups that found nothing."""
+
+    def test_codes(self) -> None:
+        def error(code: str) -> CASLookupError:
+            return CASLookupError(name_queried="x", error_code=code, error_message="")
+
+        assert is_request_failure(_REQUEST_ERROR)
+        assert all(is_request_failure(error(code)) for code in ("429", "503", "HTTP_ERROR", "PUGREST.ServerBusy"))
+        assert not any(is_request_failure(error(code)) for code in ("404", "400", "NOT_FOUND", "PUGREST.NotFound"))
+        assert not is_request_failure(None)
+        assert not is_request_failure([])
+
+
+class TestSpiderEnrichIngredient:
+    """Phase 1 queries the sources by name concurrently."""
+
+    def test_phase1_sources_overlap(self) -> None:
+        def slow(result: Any) -> Callable[..., Any]:
+            def call(*_: Any) -> Any:
+                time.sleep(0.2)
+                return result
+
+            return call
+
+        compound = CompoundResult(
+            CID=5793, name_queried="glucose", Title="glucose", InChIKey="WQZGKKKJIJFFOK-GASJEMHNSA-N"
+        )
+        cas = CASResult(rn="50-99-7", name="D-Glucose", name_queried="glucose", is_mixture=False)
+        pubchem_client = SimpleNamespace(get_compounds_by_name=slow([compound]), get_synonyms=slow(["dextrose"]))
+        chebi_client = SimpleNamespace(search_exact=slow(None))
+        cas_client = SimpleNamespace(search_by_name=slow([cas]))
+        node_norm_client = SimpleNamespace(normalize_batch=lambda _curies: {})
+
+        out = OutputBuffer()
+        started = time.monotonic()
+        sources_data = spider_enrich_ingredient(
+            "glucose",
+            pubchem_client,  # type: ignore[arg-type]
+            chebi_client,  # type: ignore[arg-type]
+            cas_client,
+            node_norm_client,  # type: ignore[arg-type]
+            echo=out.echo,
+        )
+        # PubChem (name + synonyms) is the slowest source: 0.4s, not 0.8s
+        assert time.monotonic() - started < 0.7
+        assert list(sources_data)[:2] == ["pubchem_name", "cas_name"]
+        assert sources_data["pubchem_name"]["synonyms"] == ["dextrose"]
+        assert sources_data["_consolidated_category"] == {"biolink_category": "biolink:SmallMolecule"}
+        log = [message for message, _ in out.lines]
+        assert log.index("    → PubChem (by name): ") < log.index("    → ChEBI (by name): ")
+        assert log[log.index("    → ChEBI (by name): ") + 1] == "No exact match"
+
+    def test_request_failures_raise_with_partial_data(self) -> None:
+        cas = CASResult(rn="50-99-7", name="D-Glucose", name_queried="glucose", is_mixture=False)
+        out = OutputBuffer()
+        with pytest.raises(IncompleteEnrichmentError) as exc_info:
+            spider_enrich_ingredient(
+                "glucose",
+                SimpleNamespace(get_compounds_by_name=lambda _name: _REQUEST_ERROR),  # type: ignore[arg-type]
+                SimpleNamespace(search_exact=lambda _name: None),  # type: ignore[arg-type]
+                SimpleNamespace(search_by_name=lambda _name: [cas]),
+                None,
+                echo=out.echo,
+            )
+        assert [f.source for f in exc_info.value.failures] == ["PubChem (by name)"]
+        assert "cas_name" in exc_info.value.sources_data
+        assert "ERROR: REQUEST_ERROR: Connection refused" in [message for message, _ in out.lines]
+
+
+_INCHIKEYS: dict[str | int, str] = {"a": "KEY-A", "b": "KEY-B", 100: "KEY-C"}
+
+
+class _CorpusFakes:
+    """PubChem and Node Normalization stand-ins: both ingredients lead to CID 100."""
+
+    def __init__(self) -> None:
+        self.normalized: list[list[str]] = []
+        self.fetched: list[list[int]] = []
+        self.pubchem = SimpleNamespace(
+            get_compounds_by_name=lambda name: [
+                CompoundResult(CID=ord(name), name_queried=name, Title=name, InChIKey=_INCHIKEYS[name])
+            ],
+            get_synonyms=lambda _cid: [],
+            get_compounds_by_cids=self.get_compounds_by_cids,
+            get_synonyms_many=lambda cids: {cid: ["shared"] for cid in cids},
+        )
+        self.node_norm = SimpleNamespace(normalize_batch=self.normalize_batch)
+
+    def get_compounds_by_cids(self, cids: list[int]) -> dict[int, CompoundResult]:
+        self.fetched.append(sorted(cids))
+        return {cid: CompoundResult(CID=cid, name_queried="", InChIKey=_INCHIKEYS[cid]) for cid in cids}
+
+    def normalize_batch(self, curies: list[str]) -> dict[str, NormalizedNode]:
+        self.normalized.append(sorted(curies))
+        return {
+            curie: NormalizedNode(
+                canonical_id="PUBCHEM.COMPOUND:100",
+                canonical_label=None,
+                query_id=curie,
+                equivalent_ids={"PUBCHEM.COMPOUND": ["PUBCHEM.COMPOUND:100"]},
+            )
+            for curie in curies
+            if curie.startswith("INCHIKEY:")
+        }
+
+    def spider_options(self) -> dict[str, Any]:
+        return {
+            "pubchem_client": self.pubchem,
+            "chebi_client": None,
+            "cas_client": None,
+            "node_norm_client": self.node_norm,
+        }
+
+
+class TestSpiderEnrichCorpus:
+    """Corpus mode normalizes and fetches each distinct ID once."""
+
+    def test_shared_ids_fetched_once(self) -> None:
+        fakes = _CorpusFakes()
+        corpus = spider_enrich_corpus(["a", "b"], echo=OutputBuffer().echo, workers=2, **fakes.spider_options())
+
+        assert fakes.normalized == [["INCHIKEY:KEY-A", "INCHIKEY:KEY-B"], ["INCHIKEY:KEY-C"]]
+        assert fakes.fetched == [[100]]
+        # The shared record fans out to both, named after each ingredient
+        assert [outcome.sources_data["pubchem_100"]["name"] for outcome in corpus] == ["a", "b"]
+        assert corpus[0].sources_data["pubchem_100"] is not corpus[1].sources_data["pubchem_100"]
+
+    def test_matches_per_ingredient_spider(self) -> None:
+        corpus = spider_enrich_corpus(["a", "b"], echo=OutputBuffer().echo, **_CorpusFakes().spider_options())
+        for name, outcome in zip(["a", "b"], corpus, strict=True):
+            alone = spider_enrich_ingredient(name, echo=OutputBuffer().echo, **_CorpusFakes().spider_options())
+            assert (outcome.name, outcome.sources_data, outcome.error) == (name, alone, None)
+
+    def test_failed_fetch_marks_only_ingredients_needing_it(self) -> None:
+        fakes = _CorpusFakes()
+        fakes.pubchem.get_compounds_by_cids = lambda cids: dict.fromkeys(cids, _REQUEST_ERROR)
+        fakes.pubchem.get_compounds_by_name = lambda name: (
+            [CompoundResult(CID=ord(name), name_queried=name, Title=name, InChIKey=_INCHIKEYS[name])]
+            if name == "a"
+            else PubChemLookupError(name_queried=name, error_code="PUGREST.NotFound", error_message="none")
+        )
+        a, b = spider_enrich_corpus(["a", "b"], echo=OutputBuffer().echo, **fakes.spider_options())
+
+        assert isinstance(a.error, IncompleteEnrichmentError)
+        assert [(f.source, f.ids) for f in a.error.failures] == [("PubChem (by CID)", ("PUBCHEM.COMPOUND:100",))]
+        assert a.sources_data is not None and "pubchem_name" in a.sources_data
+        assert (b.error, b.sources_data) == (
+            None,
+            {"_consolidated_category": {"biolink_category": "biolink:SmallMolecule"}},
+        )
+
+
+class _FakeStore:
+    """EnrichmentStore stand-in recording upserts."""
+
+    def __init__(self, store_path: Path) -> None:
+        self.store_path = store_path
+        self.upserts: list[tuple[str | None, str, dict[str, Any]]] = []
+
+    def upsert_ingredient(self, data: dict[str, Any], source: str, query: str | None = None) -> str:
+        self.upserts.append((query, source, data))
+        return "key"
+
+    def _get_collection(self) -> Any:
+        return SimpleNamespace(delete_where=lambda _where: None)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "total_ingredients": 0,
+            "with_chebi_id": 0,
+            "with_pubchem_cid": 0,
+            "with_cas_rn": 0,
+            "with_inchikey": 0,
+            "with_biological_roles": 0,
+            "with_conflicts": 0,
+            "coverage_chebi": 0.0,
+            "coverage_pubchem": 0.0,
+            "coverage_cas": 0.0,
+        }
+
+    def close(self) -> None:
+        pass
+
+
+class TestMainJournal:
+    """Runs of main() journal each ingredient; request failures are retried with --retry-failed."""
+
+    def test_request_errors_are_retried(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        online = {"glucose": False}
+        compound = CompoundResult(CID=5793, name_queried="glucose", Title="glucose")
+
+        def get_compounds_by_name(name: str) -> Any:
+            if name == "glucose" and not online["glucose"]:
+                return _REQUEST_ERROR
+            return [compound] if name == "glucose" else PubChemLookupError(name, "PUGREST.NotFound", "none")
+
+        pubchem = SimpleNamespace(get_compounds_by_name=get_compounds_by_name, get_synonyms=lambda _cid: [])
+        cas = CASResult(rn="50-99-7", name="D-Glucose", name_queried="glucose", is_mixture=False)
+        stores: list[_FakeStore] = []
+
+        def open_store(store_path: Path) -> _FakeStore:
+            stores.append(_FakeStore(store_path))
+            return stores[-1]
+
+        monkeypatch.setattr(enrich_to_store, "EnrichmentStore", open_store)
+        monkeypatch.setattr(enrich_to_store, "PubChemClient", lambda: pubchem)
+        monkeypatch.setattr(
+            enrich_to_store,
+            "get_cas_client",
+            lambda: SimpleNamespace(search_by_name=lambda name: [cas] if name == "glucose" else []),
+        )
+        monkeypatch.setattr(
+            enrich_to_store, "NodeNormalizationClient", lambda: SimpleNamespace(normalize_batch=lambda _c: {})
+        )
+
+        input_file = tmp_path / "ingredients.tsv"
+        input_file.write_text("ingredient_name\nglucose\nunobtainium\n", encoding="utf-8")
+        journal_path = tmp_path / "journal.sqlite"
+        args = ["-i", str(input_file), "-s", str(tmp_path / "store.duckdb"), "--journal", str(journal_path)]
+        args += ["--no-chebi", "--no-cache"]
+
+        result = CliRunner().invoke(enrich_to_store.main, args)
+        assert result.exit_code == 1
+        assert "REQUEST_ERROR: Connection refused" in result.output
+        # What the other sources found is stored all the same
+        assert [(query, source) for query, source, _ in stores[0].upserts][-1:] == [("glucose", "cas_name")]
+        journal = EnrichmentJournal(journal_path)
+        statuses = {name: status for (name, _), status in journal.statuses().items()}
+        assert statuses == {"glucose": "failed", "unobtainium": "completed"}  # not found is not a failure
+        journal.close()
+
+        online["glucose"] = True
+        result = CliRunner().invoke(enrich_to_store.main, [*args, "--retry-failed"])
+        assert result.exit_code == 0, result.output
+        assert "[1/1] Processing: glucose" in result.output
+        journal = EnrichmentJournal(journal_path)
+        assert set(journal.statuses().values()) == {"completed"}
+        journal.close()
+
+    def test_no_node_norm_skips_spidering(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        compound = CompoundResult(
+            CID=5793, name_queried="glucose", Title="glucose", InChIKey="WQZGKKKJIJFFOK-GASJEMHNSA-N"
+        )
+        pubchem = SimpleNamespace(get_compounds_by_name=lambda _name: [compound], get_synonyms=lambda _cid: [])
+        monkeypatch.setattr(enrich_to_store, "EnrichmentStore", _FakeStore)
+        monkeypatch.setattr(enrich_to_store, "PubChemClient", lambda: pubchem)
+
+        input_file = tmp_path / "ingredients.tsv"
+        input_file.write_text("ingredient_name\nglucose\n", encoding="utf-8")
+        journal_path = tmp_path / "journal.sqlite"
+        args = ["-i", str(input_file), "-s", str(tmp_path / "store.duckdb"), "--journal", str(journal_path)]
+        args += ["--no-chebi", "--no-cas", "--no-cache", "--no-node-norm"]
+
+        result = CliRunner().invoke(enrich_to_store.main, args)
+        assert result.exit_code == 0, result.output
+        assert "Phase 2: Skipped (Node Normalization disabled)" in result.output
+        journal = EnrichmentJournal(journal_path)
+        assert set(journal.statuses().values()) == {"completed"}
+        journal.close()
+
+
+class TestPendingRows:
+    """Resuming selects rows by their journal status."""
+
+    def test_resume_and_retry_failed(self) -> None:
+        rows = [
+            {"ingredient_name": "glucose", "unit": "g"},
+            {"ingredient_name": "water", "unit": "ml"},
+            {"ingredient_name": "NaCl", "unit": "g"},
+            {"ingredient_name": "peptone", "unit": "g"},
+        ]
+        edited = {"ingredient_name": "NaCl", "unit": "mg"}
+        statuses = {
+            ("glucose", row_hash(rows[0])): "completed",
+            ("water", row_hash(rows[1])): "failed",
+            ("NaCl", row_hash(edited)): "completed",  # the row changed since: pending again
+        }
+        assert pending_rows(rows, statuses) == rows[1:]
+        assert pending_rows(rows, statuses, retry_failed=True) == [rows[1]]
+
+
+class TestSplitIncremental:
+    """Incremental runs re-enrich new, changed, and stale rows only."""
+
+    def test_selects_new_changed_and_stale(self) -> None:
+        now = datetime(2026, 6, 1, 12, 0)
+        recently = now - timedelta(days=2)
+        rows = [
+            {"ingredient_name": "glucose", "unit": "g"},  # fresh
+            {"ingredient_name": "water", "unit": "ml"},  # stale
+            {"ingredient_name": "NaCl", "unit": "g"},  # edited since
+            {"ingredient_name": "peptone", "unit": "g"},  # failed
+            {"ingredient_name": "agar", "unit": "g"},  # new
+            {"ingredient_name": "unobtainium", "unit": "g"},  # found nothing
+            {"ingredient_name": "biotin", "unit": "mg"},  # store lost its records
+        ]
+        found = {"pubchem_name": {"pubchem_cid": 1}}
+
+        def entry(row: dict[str, str], status: str = "completed", **kwargs: Any) -> JournalEntry:
+            fields: dict[str, Any] = {"sources_data": found, "error": None, "updated": recently.timestamp()}
+            fields.update(kwargs)
+            return JournalEntry(row["ingredient_name"], row_hash(row), status, **fields)  # type: ignore[arg-type]
+
+        entries = [
+            entry(rows[0], api_calls=7),
+            entry(rows[1], api_calls=5),
+            entry({"ingredient_name": "NaCl", "unit": "mg"}),
+            entry(rows[3], "failed"),
+            entry(rows[5], sources_data={}, api_calls=3),
+            entry(rows[6]),
+        ]
+        journal = {(e.name, e.row_hash): e for e in entries}
+        last_enriched = {"glucose": recently, "water": now - timedelta(days=40), "NaCl": recently, "peptone": recently}
+
+        stale, up_to_date = split_incremental(
+            rows, lambda name, key: journal.get((name, key)), last_enriched, timedelta(days=30), now=now
+        )
+        assert [row["ingredient_name"] for row in stale] == [
+            "water",
+            "NaCl",
+            "peptone",
+            "agar",
+            "unobtainium",
+            "biotin",
+        ]
+        assert [(e.name, e.api_calls) for e in up_to_date] == [("glucose", 7)]
@@ -0,0 +1,68 @@
+"""Tests for the enrichment progress journal."""
+
+import sqlite3
+from pathlib import Path
+
+from cmm_ai_automation.store.enrichment_journal import EnrichmentJournal, row_hash
+
+
+class TestRowHash:
+    """Tests for row_hash()."""
+
+    def test_ignores_column_order(self) -> None:
+        assert row_hash({"a": "1", "b": "2"}) == row_hash({"b": "2", "a": "1"})
+        assert row_hash({"a": "1", "b": "2"}) != row_hash({"a": "1", "b": "3"})
+
+
+class TestEnrichmentJournal:
+    """Tests for EnrichmentJournal."""
+
+    def test_outcomes_survive_reopening(self, tmp_path: Path) -> None:
+        path = tmp_path / "journal.sqlite"
+        sources_data = {"pubchem_name": {"pubchem_cid": 5793, "synonyms": ["dextrose"]}}
+        journal = EnrichmentJournal(path)
+        journal.record_completed("glucose", "h1", sources_data)
+        journal.record_failed("water", "h2", ValueError("rate limited"))
+        journal.close()
+
+        journal = EnrichmentJournal(path)
+        completed = journal.get("glucose", "h1")
+        assert completed is not None
+        assert (completed.status, completed.sources_data, completed.error) == ("completed", sources_data, None)
+        failed = journal.get("water", "h2")
+        assert failed is not None
+        assert (failed.status, failed.sources_data, failed.error) == ("failed", None, "rate limited")
+        assert journal.get("glucose", "other-row") is None
+        assert journal.statuses() == {("glucose", "h1"): "completed", ("water", "h2"): "failed"}
+        journal.close()
+
+    def test_retry_replaces_failure(self, tmp_path: Path) -> None:
+        journal = EnrichmentJournal(tmp_path / "journal.sqlite")
+        journal.record_failed("water", "h2", "timeout", {"cas_name": {"cas_rn": "7732-18-5"}})
+        assert journal.counts() == {"completed": 0, "failed": 1}
+        journal.record_completed("water", "h2", {})
+        assert journal.counts() == {"completed": 1, "failed": 0}
+        journal.close()
+
+    def test_api_calls(self, tmp_path: Path) -> None:
+        path = tmp_path / "journal.sqlite"
+        # A journal written before API calls were recorded
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE ingredients (name TEXT NOT NULL, row_hash TEXT NOT NULL, status TEXT NOT NULL, "
+            "sources_data TEXT, error TEXT, updated REAL NOT NULL, PRIMARY KEY (name, row_hash)) WITHOUT ROWID"
+        )
+        conn.execute("INSERT INTO ingredients VALUES ('agar', 'h0', 'completed', '{}', NULL, 0)")
+        conn.commit()
+        conn.close()
+
+        journal = EnrichmentJournal(path)
+        journal.record_completed("glucose", "h1", {}, api_calls=12)
+        journal.record_failed("water", "h2", "timeout", api_calls=3)
+        calls = {}
+        for name, key in journal.statuses():
+            entry = journal.get(name, key)
+            assert entry is not None
+            calls[name] = entry.api_calls
+        assert calls == {"agar": None, "glucose": 12, "water": 3}
+        journal.close()
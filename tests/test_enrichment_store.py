@@ -6,6 +6,7 @@ and KGX export functionality.
 
 import tempfile
 from collections.abc import Generator
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -424,6 +425,21 @@ class TestEnrichmentStoreIntegration:
         assert stats["with_chebi_id"] == 2
         assert stats["with_inchikey"] == 2
 
+    @pytest.mark.integration
+    def test_last_enriched_by_query(self, temp_store: EnrichmentStore) -> None:
+        """Test that each query reports when its records were last enriched."""
+        before = datetime.now()
+        temp_store.upsert_ingredient(
+            {"inchikey": "WQZGKKKJIJFFOK-GASJEMHNSA-N", "cas_rn": "50-99-7"}, source="pubchem", query="glucose"
+        )
+        temp_store.upsert_ingredient(
+            {"inchikey": "CSNNHWWHGAXBCP-UHFFFAOYSA-L", "cas_rn": "7487-88-9"}, source="chebi", query="MgSO4"
+        )
+
+        last_enriched = temp_store.last_enriched_by_query()
+        assert set(last_enriched) == {"glucose", "MgSO4"}
+        assert all(before <= enriched <= datetime.now() for enriched in last_enriched.values())
+
 
 class TestKGXExportLogic:
     """Tests for KGX export logic without requiring KGX library."""
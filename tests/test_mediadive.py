@@ -4,8 +4,11 @@ import tempfile
 from pathlib import Path
 
 import pytest
+import requests
 
+from cmm_ai_automation.clients.base import build_response
 from cmm_ai_automation.clients.mediadive import (
+    BASE_URL,
     IngredientResult,
     MediaDiveClient,
     MediaDiveLookupError,
@@ -110,6 +113,23 @@ class TestMediaDiveClient:
         assert d["mediadive_formula"] == "C10H12FeN2O8"
         assert d["mediadive_is_complex"] == "false"
 
+    def test_uncached_lookup_uses_base_request(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A record-cache miss goes through HTTPClientBase's request path."""
+        body = b'{"status": 200, "data": {"id": 1, "name": "Peptone", "CAS-RN": "73049-73-7"}}'
+        requested: list[str] = []
+
+        def fake_request(method: str, url: str, **_: object) -> requests.Response:
+            requested.append(f"{method} {url}")
+            return build_response(url, 200, body, {"Content-Type": "application/json"})
+
+        with MediaDiveClient(rate_limit_delay=0) as client:
+            monkeypatch.setattr(client._session, "request", fake_request)
+            result = client.get_ingredient(1)
+
+        assert isinstance(result, IngredientResult)
+        assert result.name == "Peptone"
+        assert requested == [f"GET {BASE_URL}/ingredient/1"]
+
 
 class TestMediaDiveCaching:
     """Tests for MediaDive client caching."""
@@ -159,6 +179,30 @@ class TestMediaDiveCaching:
             assert isinstance(result2, IngredientResult)
             assert result1.name == result2.name
 
+    def test_jsonl_cache_persists_without_save(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A .jsonl cache writes each fetched record immediately."""
+        requested: list[str] = []
+
+        def fake_get_json(url: str) -> dict[str, object]:
+            requested.append(url)
+            return {"status": 200, "data": {"id": 1, "name": "Peptone", "CAS-RN": "73049-73-7"}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = Path(tmpdir) / "test_cache.jsonl"
+
+            with MediaDiveClient(cache_file=cache_file) as client:
+                monkeypatch.setattr(client, "_get_json", fake_get_json)
+                assert isinstance(client.get_ingredient(1), IngredientResult)
+                assert cache_file.exists()
+
+            with MediaDiveClient(cache_file=cache_file) as client2:
+                monkeypatch.setattr(client2, "_get_json", fake_get_json)
+                result = client2.get_ingredient(1)
+                assert isinstance(result, IngredientResult)
+                assert result.name == "Peptone"
+
+            assert len(requested) == 1
+
 
 class TestKnownIngredients:
     """Tests for known ingredient/solution lookups."""
@@ -1,6 +1,10 @@
 """Tests for NodeNormalization client."""
 
+import threading
+from typing import Any
+
 import pytest
+import requests
 
 from cmm_ai_automation.clients.node_normalization import (
     NodeNormalizationClient,
@@ -159,3 +163,77 @@ class TestNodeNormalizationClient:
         """Test batch normalization with empty list."""
         results = client.normalize_batch([])
         assert results == {}
+
+
+def _fake_nodes(curies: list[str]) -> dict[str, Any]:
+    """Build a get_normalized_nodes response; CURIEs ending in ":0" are unknown."""
+    return {
+        c: None if c.endswith(":0") else {"id": {"identifier": c}, "equivalent_identifiers": [{"identifier": c}]}
+        for c in curies
+    }
+
+
+class TestNormalizeBatch:
+    """Unit tests for chunked, memoized normalize_batch()."""
+
+    def test_chunked_posts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that CURIEs are deduplicated and POSTed in chunks."""
+        client = NodeNormalizationClient()
+        bodies: list[list[str]] = []
+        lock = threading.Lock()
+
+        def fake_post_json(_url: str, _data: Any = None, json_data: Any = None) -> dict[str, Any]:
+            with lock:
+                bodies.append(json_data["curies"])
+            return _fake_nodes(json_data["curies"])
+
+        monkeypatch.setattr(client, "_post_json", fake_post_json)
+        curies = ["CHEBI:1", "CHEBI:2", "CHEBI:1", "CHEBI:3", "CHEBI:0", "CHEBI:5"]
+        results = client.normalize_batch(curies, chunk_size=2)
+
+        assert sorted(bodies) == [["CHEBI:1", "CHEBI:2"], ["CHEBI:3", "CHEBI:0"], ["CHEBI:5"]]
+        assert list(results) == ["CHEBI:1", "CHEBI:2", "CHEBI:3", "CHEBI:0", "CHEBI:5"]
+        assert isinstance(results["CHEBI:5"], NormalizedNode)
+        not_found = results["CHEBI:0"]
+        assert isinstance(not_found, NormalizationError)
+        assert not_found.error_code == "NOT_FOUND"
+
+    def test_results_are_memoized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that successes and NOT_FOUND are memoized but request failures are retried."""
+        client = NodeNormalizationClient()
+        requested: list[str] = []
+
+        def fake_post_json(_url: str, _data: Any = None, json_data: Any = None) -> dict[str, Any]:
+            requested.extend(json_data["curies"])
+            if "CHEBI:9" in json_data["curies"]:
+                raise requests.ConnectionError("boom")
+            return _fake_nodes(json_data["curies"])
+
+        monkeypatch.setattr(client, "_post_json", fake_post_json)
+        client.normalize_batch(["CHEBI:1", "CHEBI:0"])
+        first = client.normalize_batch(["CHEBI:9"])
+        second = client.normalize_batch(["CHEBI:1", "CHEBI:0", "CHEBI:9"], chunk_size=1)
+
+        assert requested == ["CHEBI:1", "CHEBI:0", "CHEBI:9", "CHEBI:9"]
+        error = first["CHEBI:9"]
+        assert isinstance(error, NormalizationError)
+        assert error.error_code == "REQUEST_ERROR"
+        assert list(second) == ["CHEBI:1", "CHEBI:0", "CHEBI:9"]
+
+    @pytest.mark.asyncio
+    async def test_anormalize_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the async batch shares the chunking and memo."""
+        client = NodeNormalizationClient()
+        bodies: list[list[str]] = []
+
+        async def fake_apost_json(_url: str, _data: Any = None, json_data: Any = None) -> dict[str, Any]:
+            bodies.append(json_data["curies"])
+            return _fake_nodes(json_data["curies"])
+
+        monkeypatch.setattr(client, "apost_json", fake_apost_json)
+        results = await client.anormalize_batch(["CHEBI:1", "CHEBI:2", "CHEBI:3"], chunk_size=2)
+        again = await client.anormalize_batch(["CHEBI:3", "CHEBI:4"])
+
+        assert bodies == [["CHEBI:1", "CHEBI:2"], ["CHEBI:3"], ["CHEBI:4"]]
+        assert len(results) == 3
+        assert list(again) == ["CHEBI:3", "CHEBI:4"]
@@ -1,11 +1,16 @@
 """Tests for PubChem client."""
 
+from typing import Any
+
 import pytest
 
+from cmm_ai_automation.clients import pubchem
 from cmm_ai_automation.clients.pubchem import (
     CompoundResult,
     LookupError,
     PubChemClient,
+    _parse_property_table,
+    _parse_synonym_table,
     _to_float,
 )
 
@@ -59,6 +64,51 @@ class TestPubChemClient:
         synonyms_lower = [s.lower() for s in result]
         assert any("glucose" in s for s in synonyms_lower)
 
+    @pytest.mark.integration
+    def test_get_compounds_by_cids(self, client: PubChemClient) -> None:
+        """Test bulk lookup of several CIDs, including one that does not exist."""
+        result = client.get_compounds_by_cids([5793, 962, 5793, 999999999])
+
+        assert set(result) == {5793, 962, 999999999}
+        glucose = result[5793]
+        assert isinstance(glucose, CompoundResult)
+        assert glucose.MolecularFormula == "C6H12O6"
+        assert glucose.name_queried == "CID:5793"
+        assert isinstance(result[962], CompoundResult)
+        assert isinstance(result[999999999], LookupError)
+
+    @pytest.mark.integration
+    def test_get_synonyms_many(self, client: PubChemClient) -> None:
+        """Test bulk synonym lookup."""
+        result = client.get_synonyms_many([5793, 962])
+
+        assert set(result) == {5793, 962}
+        glucose = result[5793]
+        assert isinstance(glucose, list)
+        assert any("glucose" in s.lower() for s in glucose)
+
+    @pytest.mark.integration
+    def test_get_cids_by_names(self, client: PubChemClient) -> None:
+        """Test resolving several names, where one fails without failing the batch."""
+        result = client.get_cids_by_names(["glucose", "xyznotarealcompound123", "glucose"])
+
+        assert list(result) == ["glucose", "xyznotarealcompound123"]
+        glucose = result["glucose"]
+        assert isinstance(glucose, list)
+        assert 5793 in glucose
+        assert isinstance(result["xyznotarealcompound123"], LookupError)
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_aget_cids_by_names(self, client: PubChemClient) -> None:
+        """Test concurrent name resolution, including a name with a slash."""
+        async with client:
+            result = await client.aget_cids_by_names(["glucose", "sodium chloride", "Fe(III)/EDTA"])
+
+        assert set(result) == {"glucose", "sodium chloride", "Fe(III)/EDTA"}
+        assert isinstance(result["glucose"], list)
+        assert isinstance(result["sodium chloride"], list)
+
     @pytest.mark.integration
     def test_complex_compound_name(self, client: PubChemClient) -> None:
         """Test looking up a compound with a complex name."""
@@ -87,6 +137,77 @@ class TestPubChemClient:
         assert d["CanonicalSMILES"] is None  # Not set
 
 
+class TestBulkLookups:
+    """Unit tests for bulk CID requests."""
+
+    def test_cids_are_deduplicated_and_chunked(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that CIDs are sent in POST bodies of at most CID_CHUNK_SIZE."""
+        monkeypatch.setattr(pubchem, "CID_CHUNK_SIZE", 2)
+        client = PubChemClient()
+        bodies: list[str] = []
+
+        def fake_post_json(_url: str, data: dict[str, Any] | None = None, **_: Any) -> dict[str, Any]:
+            assert data is not None
+            bodies.append(data["cid"])
+            cids = [int(c) for c in data["cid"].split(",")]
+            return {"PropertyTable": {"Properties": [{"CID": c, "Title": f"c{c}"} for c in cids]}}
+
+        monkeypatch.setattr(client, "_post_json", fake_post_json)
+        result = client.get_compounds_by_cids([1, 2, 1, 3, 4, 5])
+
+        assert bodies == ["1,2", "3,4", "5"]
+        assert list(result) == [1, 2, 3, 4, 5]
+
+    def test_listkey_response_is_polled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a Waiting/ListKey answer is polled until the result is ready."""
+        monkeypatch.setattr(pubchem, "LISTKEY_POLL_DELAY", 0)
+        client = PubChemClient()
+        polls: list[str] = []
+
+        def fake_post_json(*_: Any, **__: Any) -> dict[str, Any]:
+            return {"Waiting": {"ListKey": "123", "Message": "Your request is running"}}
+
+        def fake_get_json(url: str, _params: Any = None) -> dict[str, Any]:
+            polls.append(url)
+            if len(polls) < 3:
+                return {"Waiting": {"ListKey": "123"}}
+            return {"IdentifierList": {"CID": [5793]}}
+
+        monkeypatch.setattr(client, "_post_json", fake_post_json)
+        monkeypatch.setattr(client, "_get_json", fake_get_json)
+
+        assert client.get_cids_by_name("glucose") == [5793]
+        assert polls == [f"{client.BASE_URL}/compound/listkey/123/cids/JSON"] * 3
+
+    def test_listkey_gives_up_after_max_polls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a result that never becomes ready is reported as a LookupError."""
+        monkeypatch.setattr(pubchem, "LISTKEY_POLL_DELAY", 0)
+        monkeypatch.setattr(pubchem, "LISTKEY_MAX_POLLS", 2)
+        client = PubChemClient()
+        waiting = {"Waiting": {"ListKey": "123"}}
+        monkeypatch.setattr(client, "_post_json", lambda *_, **__: waiting)
+        monkeypatch.setattr(client, "_get_json", lambda *_, **__: waiting)
+
+        result = client.get_cids_by_names(["glucose"])["glucose"]
+        assert isinstance(result, LookupError)
+        assert result.error_code == "REQUEST_ERROR"
+
+    def test_parse_property_table_marks_missing_cids(self) -> None:
+        """Test that CIDs absent from the response become NOT_FOUND errors."""
+        data = {"PropertyTable": {"Properties": [{"CID": 5793, "MolecularFormula": "C6H12O6"}]}}
+        result = _parse_property_table([5793, 1], data)
+
+        assert isinstance(result[5793], CompoundResult)
+        missing = result[1]
+        assert isinstance(missing, LookupError)
+        assert missing.error_code == "NOT_FOUND"
+
+    def test_parse_synonym_table(self) -> None:
+        """Test that CIDs without synonyms map to an empty list."""
+        data = {"InformationList": {"Information": [{"CID": 5793, "Synonym": ["glucose"]}, {"CID": 2}]}}
+        assert _parse_synonym_table([5793, 2, 3], data) == {5793: ["glucose"], 2: [], 3: []}
+
+
 class TestToFloat:
     """Unit tests for _to_float helper function."""
 
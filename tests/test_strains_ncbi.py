@@ -1,6 +1,32 @@
 """Tests for NCBI utility functions."""
 
-from cmm_ai_automation.strains.ncbi import NcbiLinkout, extract_xrefs_from_linkouts
+import gzip
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from cmm_ai_automation.clients.cassette import Cassette, set_default_cassette
+from cmm_ai_automation.clients.rate_limit import TokenBucket
+from cmm_ai_automation.strains import ncbi
+from cmm_ai_automation.strains.ncbi import (
+    NcbiBatchProgress,
+    NcbiLinkout,
+    _iter_taxa,
+    _make_request,
+    _parse_taxon,
+    extract_xrefs_from_linkouts,
+    fetch_ncbi_batch,
+    fetch_ncbi_entrez_links,
+    fetch_ncbi_linkouts,
+    iter_ncbi_batch,
+    iter_ncbi_entrez_links,
+    set_ncbi_cache,
+)
+from cmm_ai_automation.strains.ncbi_cache import NcbiCache
 
 
 class TestExtractXrefsFromLinkouts:
@@ -250,3 +276,191 @@ class TestExtractXrefsFromLinkouts:
             xrefs = extract_xrefs_from_linkouts(linkouts)
 
             assert f"biocyc:GCF_{gcf_id}" in xrefs
+
+
+TAXA_SET_XML = b"""<?xml version="1.0" ?>
+<TaxaSet>
+<Taxon>
+    <TaxId>272630</TaxId>
+    <ScientificName>Methylorubrum extorquens AM1</ScientificName>
+    <OtherNames>
+        <EquivalentName>Methylobacterium extorquens AM1</EquivalentName>
+    </OtherNames>
+    <ParentTaxId>408</ParentTaxId>
+    <Rank>strain</Rank>
+    <LineageEx>
+        <Taxon><TaxId>2</TaxId><ScientificName>Bacteria</ScientificName><Rank>superkingdom</Rank></Taxon>
+        <Taxon><TaxId>408</TaxId><ScientificName>Methylorubrum extorquens</ScientificName><Rank>species</Rank></Taxon>
+    </LineageEx>
+</Taxon>
+<Taxon>
+    <TaxId>408</TaxId>
+    <ScientificName>Methylorubrum extorquens</ScientificName>
+    <ParentTaxId>2282523</ParentTaxId>
+    <Rank>species</Rank>
+</Taxon>
+</TaxaSet>
+"""
+
+
+class TestIterNcbiBatch:
+    """Tests for streaming, pipelined efetch batches."""
+
+    @pytest.fixture(autouse=True)
+    def use_cache(self, tmp_path: Path) -> Iterator[None]:
+        set_ncbi_cache(NcbiCache(tmp_path / "ncbi_cache.sqlite"))
+        yield
+        set_ncbi_cache(None)
+
+    def test_streaming_parser_skips_lineage_taxa(self) -> None:
+        parsed = [_parse_taxon(taxon) for taxon in _iter_taxa(TAXA_SET_XML)]
+        assert [p[0] for p in parsed if p] == ["272630", "408"]
+        strain = parsed[0][1] if parsed[0] else None
+        assert strain is not None
+        assert strain["species_taxon_id"] == "408"
+        assert strain["equivalent_names"] == ["Methylobacterium extorquens AM1"]
+
+    def test_batches_are_pipelined_and_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        requested: list[str] = []
+
+        def fake_request(_url: str, params: dict[str, str], **__: Any) -> SimpleNamespace:
+            requested.append(params["id"])
+            barrier.wait()  # both batches must be in flight at once
+            return SimpleNamespace(content=TAXA_SET_XML)
+
+        monkeypatch.setattr(ncbi, "_make_request", fake_request)
+        results = dict(iter_ncbi_batch(["272630", "408"], batch_size=1, max_workers=2))
+        assert sorted(requested) == ["272630", "408"]
+        assert set(results) == {"272630", "408"}
+
+        # A second pass is served from the cache
+        monkeypatch.setattr(ncbi, "_make_request", lambda *_, **__: pytest.fail("unexpected request"))
+        assert fetch_ncbi_batch(["408", "272630"]) == results
+
+
+LINKOUTS_XML = b"""<?xml version="1.0" ?>
+<eLinkResult><LinkSet><IdUrlList>
+<IdUrlSet><Id>408</Id>
+    <ObjUrl><Url>https://bacdive.dsmz.de/strain/7040</Url><LinkName>BacDive</LinkName>
+    <Provider><Name>BacDive</Name></Provider></ObjUrl>
+</IdUrlSet>
+</IdUrlList></LinkSet></eLinkResult>
+"""
+
+ACHECK_XML = b"""<?xml version="1.0" ?>
+<eLinkResult><LinkSet><IdCheckList><IdLinkSet><Id>408</Id>
+    <LinkInfo><DbTo>assembly</DbTo></LinkInfo>
+    <LinkInfo><DbTo>pubmed</DbTo></LinkInfo>
+</IdLinkSet></IdCheckList></LinkSet></eLinkResult>
+"""
+
+
+class TestLinkFetches:
+    """Tests for concurrent, cached linkout and Entrez link fetches."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self, tmp_path: Path) -> Iterator[NcbiCache]:
+        cache = NcbiCache(tmp_path / "ncbi_cache.sqlite")
+        set_ncbi_cache(cache)
+        yield cache
+        set_ncbi_cache(None)
+
+    def test_linkouts_report_progress_and_are_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        requested: list[str] = []
+
+        def fake_request(_url: str, params: dict[str, str], **__: Any) -> SimpleNamespace:
+            requested.append(params["id"])
+            barrier.wait()
+            return SimpleNamespace(content=LINKOUTS_XML if params["id"] == "408" else b"<eLinkResult/>")
+
+        monkeypatch.setattr(ncbi, "_make_request", fake_request)
+        reports: list[NcbiBatchProgress] = []
+        results = fetch_ncbi_linkouts(["408", "562"], batch_size=1, max_workers=2, progress=reports.append)
+        assert results == {
+            "408": [{"provider": "BacDive", "url": "https://bacdive.dsmz.de/strain/7040", "name": "BacDive"}]
+        }
+        assert sorted(requested) == ["408", "562"]
+        assert sorted((r.completed, r.total) for r in reports) == [(1, 2), (2, 2)]
+        assert sorted(r.found for r in reports) == [0, 1]
+        assert all(r.kind == "linkouts" and r.latency >= 0 for r in reports)
+
+        requested.clear()
+        monkeypatch.setattr(ncbi, "_make_request", lambda *_, **__: None)
+        assert fetch_ncbi_linkouts(["408"]) == results
+
+    def test_stale_linkouts_are_refetched(self, cache: NcbiCache, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache.put("linkouts", "408", [])
+        monkeypatch.setattr(ncbi, "NCBI_LINK_CACHE_TTL", -1.0)
+        monkeypatch.setattr(ncbi, "_make_request", lambda *_, **__: SimpleNamespace(content=LINKOUTS_XML))
+        assert len(fetch_ncbi_linkouts(["408"])["408"]) == 1
+
+    def test_entrez_links(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        requested: list[str] = []
+
+        def fake_request(_url: str, params: dict[str, str], **__: Any) -> SimpleNamespace:
+            requested.append(params["id"])
+            return SimpleNamespace(content=ACHECK_XML)
+
+        monkeypatch.setattr(ncbi, "_make_request", fake_request)
+        assert dict(iter_ncbi_entrez_links(["408", "408"])) == {"408": {"assembly": []}}
+        assert fetch_ncbi_entrez_links(["408"]) == {"408": {"assembly": []}}
+        assert requested == ["408"]
+
+
+class TestMakeRequest:
+    """_make_request() backs off on throttling responses."""
+
+    def test_retries_after_429(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        responses = [
+            SimpleNamespace(status_code=429, headers={"Retry-After": "2"}, content=b""),
+            SimpleNamespace(status_code=200, headers={}, content=b"<x/>", raise_for_status=lambda: None),
+        ]
+        sleeps: list[float] = []
+        monkeypatch.setattr(ncbi, "get_shared_session", lambda: SimpleNamespace(get=lambda *_, **__: responses.pop(0)))
+        monkeypatch.setattr(ncbi.time, "sleep", sleeps.append)
+        monkeypatch.setattr(ncbi, "get_rate_limiter", lambda *_: TokenBucket(0))
+
+        response = _make_request(ncbi.NCBI_EFETCH_URL, {"id": "408"})
+        assert response is not None and response.status_code == 200
+        assert sleeps[0] >= 2  # Retry-After is a lower bound for the backoff
+
+    def test_gives_up_when_always_throttled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+
+        def throttled(*_: Any, **__: Any) -> SimpleNamespace:
+            calls.append("get")
+            return SimpleNamespace(status_code=503, headers={}, content=b"")
+
+        monkeypatch.setattr(ncbi, "get_shared_session", lambda: SimpleNamespace(get=throttled))
+        monkeypatch.setattr(ncbi.time, "sleep", lambda _: None)
+        monkeypatch.setattr(ncbi, "get_rate_limiter", lambda *_: TokenBucket(0))
+
+        assert _make_request(ncbi.NCBI_EFETCH_URL, {"id": "408"}, max_retries=3) is None
+        assert len(calls) == 3
+
+    def test_record_and_replay_without_api_key(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        sent: list[dict[str, str]] = []
+
+        def get(_url: str, params: dict[str, str], **__: Any) -> SimpleNamespace:
+            sent.append(params)
+            return SimpleNamespace(status_code=200, headers={}, content=b"<x/>", raise_for_status=lambda: None)
+
+        monkeypatch.setattr(ncbi, "NCBI_API_KEY", "secret")
+        monkeypatch.setattr(ncbi, "get_shared_session", lambda: SimpleNamespace(get=get))
+        monkeypatch.setattr(ncbi, "get_rate_limiter", lambda *_: TokenBucket(0))
+        try:
+            set_default_cassette(Cassette(tmp_path, mode="record"))
+            _make_request(ncbi.NCBI_EFETCH_URL, {"id": "408"})
+            set_default_cassette(Cassette(tmp_path, mode="replay"))
+            replayed = _make_request(ncbi.NCBI_EFETCH_URL, {"id": "408"})
+            not_recorded = _make_request(ncbi.NCBI_EFETCH_URL, {"id": "409"})
+        finally:
+            set_default_cassette(None)
+
+        assert replayed is not None and replayed.content == b"<x/>"
+        assert not_recorded is None
+        assert sent == [{"id": "408", "api_key": "secret"}]  # replay never hit the network
+        [recording] = tmp_path.glob("*/*.json.gz")
+        assert b"secret" not in gzip.decompress(recording.read_bytes())
@@ -0,0 +1,81 @@
+"""Tests for the single-file NCBI result cache."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cmm_ai_automation.strains import ncbi
+from cmm_ai_automation.strains.ncbi import fetch_ncbi_batch, fetch_ncbi_linkouts, set_ncbi_cache
+from cmm_ai_automation.strains.ncbi_cache import NcbiCache, cache_key_hash
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[NcbiCache]:
+    cache = NcbiCache(tmp_path / "ncbi_cache.sqlite")
+    yield cache
+    cache.close()
+
+
+class TestNcbiCache:
+    """Tests for NcbiCache storage."""
+
+    def test_round_trip(self, cache: NcbiCache) -> None:
+        cache.put("linkouts", "408", [{"provider": "BacDive", "url": "u", "name": "n"}])
+        assert cache.get("linkouts", "408") == [{"provider": "BacDive", "url": "u", "name": "n"}]
+        assert cache.get("synonyms", "408") is None  # cache types are separate
+
+    def test_get_many_spans_query_chunks(self, cache: NcbiCache) -> None:
+        cache.put_many("synonyms", {str(i): {"rank": "species"} for i in range(1200)})
+        found = cache.get_many("synonyms", [str(i) for i in range(0, 1300, 2)])
+        assert len(found) == 600
+        assert found["1198"] == {"rank": "species"}
+        assert len(cache) == 1200
+
+    def test_migrate_directory(self, cache: NcbiCache, tmp_path: Path) -> None:
+        legacy = tmp_path / "legacy"
+        (legacy / "linkouts").mkdir(parents=True)
+        (legacy / "linkouts" / f"{cache_key_hash('408')}.json").write_text(json.dumps([]))
+        (legacy / "synonyms").mkdir()
+        (legacy / "synonyms" / f"{cache_key_hash('408')}.json").write_text(json.dumps({"rank": "species"}))
+        (legacy / "synonyms" / "broken.json").write_text("{")
+        cache.put("synonyms", "408", {"rank": "strain"})  # existing entries win
+
+        assert cache.migrate_directory(legacy) == 1
+        assert cache.get_many("linkouts", ["408"]) == {"408": []}
+        assert cache.get("synonyms", "408") == {"rank": "strain"}
+        assert cache.migrate_directory(legacy) == 0  # one-shot
+
+
+class TestBatchCaching:
+    """fetch_ncbi_batch() and fetch_ncbi_linkouts() only send cache misses to Entrez."""
+
+    @pytest.fixture(autouse=True)
+    def use_cache(self, cache: NcbiCache) -> Iterator[None]:
+        set_ncbi_cache(cache)
+        yield
+        set_ncbi_cache(None)
+
+    @pytest.fixture
+    def requested(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        requested: list[str] = []
+
+        def fake_request(_url: str, params: dict[str, str], **__: Any) -> None:
+            requested.append(params["id"])
+
+        monkeypatch.setattr(ncbi, "_make_request", fake_request)
+        return requested
+
+    def test_linkouts(self, cache: NcbiCache, requested: list[str]) -> None:
+        cache.put_many("linkouts", {"408": [], "272630": []})
+        results = fetch_ncbi_linkouts(["408", "562", "272630", "562"])
+        assert results == {"408": [], "272630": []}
+        assert requested == ["562"]
+
+    def test_taxon_data(self, cache: NcbiCache, requested: list[str]) -> None:
+        cache.put("synonyms", "408", {"scientific_name": "Methylorubrum extorquens"})
+        results = fetch_ncbi_batch(["408", "562"])
+        assert results == {"408": {"scientific_name": "Methylorubrum extorquens"}}
+        assert requested == ["562"]
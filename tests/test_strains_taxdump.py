@@ -0,0 +1,164 @@
+"""Tests for the local NCBI Taxonomy engine built from taxdump."""
+
+import tarfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cmm_ai_automation.strains import ncbi
+from cmm_ai_automation.strains.ncbi import fetch_ncbi_batch, fetch_ncbi_synonyms, set_ncbi_cache, set_taxonomy_backend
+from cmm_ai_automation.strains.ncbi_cache import NcbiCache
+from cmm_ai_automation.strains.taxdump import NcbiTaxonomy
+
+# root > Bacteria > Methylorubrum > M. extorquens > strain AM1 > an unranked isolate;
+# 999999 was merged into 408.
+NODES = [
+    (1, 1, "no rank"),
+    (2, 1, "superkingdom"),
+    (2282523, 2, "genus"),
+    (408, 2282523, "species"),
+    (272630, 408, "strain"),
+    (1001, 272630, "no rank"),
+]
+NAMES = [
+    (1, "root", "scientific name"),
+    (2, "Bacteria", "scientific name"),
+    (2282523, "Methylorubrum", "scientific name"),
+    (408, "Methylorubrum extorquens", "scientific name"),
+    (408, "Methylobacterium extorquens", "synonym"),
+    (408, "Methylobacterium extorquens (Urakami and Komagata 1984) Bousfield and Green 1985", "authority"),
+    (408, "Methylobacterium extorquum", "misspelling"),
+    (408, "pink-pigmented facultative methylotroph", "genbank common name"),
+    (272630, "Methylorubrum extorquens AM1", "scientific name"),
+    (272630, "Methylobacterium extorquens AM1", "equivalent name"),
+    (272630, "Pseudomonas sp. AM1", "includes"),
+    (1001, "Methylorubrum extorquens isolate X", "scientific name"),
+]
+MERGED = [(999999, 408)]
+
+
+def _write_taxdump(directory: Path) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "nodes.dmp").write_text(
+        "".join(f"{taxid}\t|\t{parent}\t|\t{rank}\t|\t\t|\t0\t|\n" for taxid, parent, rank in NODES),
+        encoding="utf-8",
+    )
+    (directory / "names.dmp").write_text(
+        "".join(f"{taxid}\t|\t{name}\t|\t\t|\t{name_class}\t|\n" for taxid, name, name_class in NAMES),
+        encoding="utf-8",
+    )
+    (directory / "merged.dmp").write_text(
+        "".join(f"{old}\t|\t{new}\t|\n" for old, new in MERGED),
+        encoding="utf-8",
+    )
+    return directory
+
+
+@pytest.fixture
+def taxonomy(tmp_path: Path) -> NcbiTaxonomy:
+    return NcbiTaxonomy.build(_write_taxdump(tmp_path / "taxdump"))
+
+
+class TestNcbiTaxonomy:
+    """Tests for taxonomy queries."""
+
+    def test_species(self, taxonomy: NcbiTaxonomy) -> None:
+        assert taxonomy.get("408") == {
+            "scientific_name": "Methylorubrum extorquens",
+            "synonyms": ["Methylobacterium extorquens"],
+            "equivalent_names": [],
+            "includes": [],
+            "misspellings": ["Methylobacterium extorquum"],
+            "authority": ["Methylobacterium extorquens (Urakami and Komagata 1984) Bousfield and Green 1985"],
+            "rank": "species",
+            "species_taxon_id": "408",
+            "parent_taxon_id": "2282523",
+        }
+
+    def test_strain(self, taxonomy: NcbiTaxonomy) -> None:
+        data = taxonomy.get("NCBITaxon:272630")
+        assert data is not None
+        assert data["rank"] == "strain"
+        assert data["equivalent_names"] == ["Methylobacterium extorquens AM1"]
+        assert data["includes"] == ["Pseudomonas sp. AM1"]
+        assert data["species_taxon_id"] == "408"
+        assert data["parent_taxon_id"] == "408"
+
+    def test_species_ancestor(self, taxonomy: NcbiTaxonomy) -> None:
+        assert taxonomy.species_taxon_id(1001) == "408"
+        assert taxonomy.species_taxon_id(2282523) == ""
+        assert taxonomy.lineage(1001) == [272630, 408, 2282523, 2, 1]
+
+    def test_root(self, taxonomy: NcbiTaxonomy) -> None:
+        data = taxonomy.get(1)
+        assert data is not None
+        assert data["parent_taxon_id"] == "0"
+        assert taxonomy.lineage(1) == []
+
+    def test_merged_and_unknown_ids(self, taxonomy: NcbiTaxonomy) -> None:
+        assert taxonomy.resolve(999999) == 408
+        assert taxonomy.get("999999") == taxonomy.get("408")
+        assert taxonomy.get("12345") is None
+        assert "12345" not in taxonomy
+        assert list(taxonomy.get_many(["999999", "408", "12345", "272630"])) == ["408", "272630"]
+
+    def test_save_and_load(self, taxonomy: NcbiTaxonomy, tmp_path: Path) -> None:
+        path = tmp_path / "ncbi_taxonomy.bin"
+        taxonomy.save(path)
+        loaded = NcbiTaxonomy.load(path)
+        try:
+            assert len(loaded) == len(taxonomy) == len(NODES)
+            for taxid, _, _ in NODES:
+                assert loaded.get(taxid) == taxonomy.get(taxid)
+            assert loaded.resolve(999999) == 408
+        finally:
+            loaded.close()
+
+    def test_load_rejects_other_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "ncbi_taxonomy.bin"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            NcbiTaxonomy.load(path)
+
+    def test_build_from_tarball(self, taxonomy: NcbiTaxonomy, tmp_path: Path) -> None:
+        source = _write_taxdump(tmp_path / "unpacked")
+        tarball = tmp_path / "taxdump.tar.gz"
+        with tarfile.open(tarball, "w:gz") as archive:
+            for name in ("nodes.dmp", "names.dmp", "merged.dmp"):
+                archive.add(source / name, arcname=name)
+        assert NcbiTaxonomy.build(tarball).get(272630) == taxonomy.get(272630)
+
+    def test_missing_dump_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            NcbiTaxonomy.build(tmp_path)
+
+
+class TestTaxonomyBackend:
+    """fetch_ncbi_synonyms() and fetch_ncbi_batch() answer from the local index when one is set."""
+
+    @pytest.fixture(autouse=True)
+    def backend(self, taxonomy: NcbiTaxonomy, tmp_path: Path) -> Any:
+        set_taxonomy_backend(taxonomy)
+        set_ncbi_cache(NcbiCache(tmp_path / "ncbi_cache.sqlite"))
+        yield
+        set_taxonomy_backend(None)
+        set_ncbi_cache(None)
+
+    def test_synonyms_skip_entrez(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def no_network(*_: Any, **__: Any) -> None:
+            raise AssertionError("Entrez should not be called")
+
+        monkeypatch.setattr(ncbi, "_make_request", no_network)
+        assert fetch_ncbi_synonyms(272630)["species_taxon_id"] == "408"
+
+    def test_batch_fetches_only_unknown_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        requested: list[str] = []
+
+        def fake_request(_url: str, params: dict[str, str], **__: Any) -> None:
+            requested.append(params["id"])
+
+        monkeypatch.setattr(ncbi, "_make_request", fake_request)
+        results = fetch_ncbi_batch(["408", "12345", "272630"])
+        assert list(results) == ["408", "272630"]
+        assert requested == ["12345"]